@@ -0,0 +1,22 @@
+"""Benchmarks for Mind's hot paths.
+
+Measures latency percentiles and throughput of fusion, retrieval,
+memory creation, outcome recording and event publishing on a
+synthetic, seeded dataset, and compares them with the SLOs of the
+architecture document (docs/MIND_V5_TECHNICAL_ARCHITECTURE.md).
+
+Postgres benchmarks need a database with pgvector; event publishing
+runs against NATS when a URL is given and an in-memory JetStream
+otherwise. Results are written as JSON so runs can be compared.
+
+Real workloads can be captured from the retrieval and decision events
+(anonymized) and replayed against an API at the captured rate, a
+multiple of it or max speed (benchmarks.traffic, benchmarks.replay).
+
+Run them with:
+    PYTHONPATH=src python -m benchmarks run --scale small
+    PYTHONPATH=src python -m benchmarks run --postgres-url postgresql+asyncpg://...
+    PYTHONPATH=src python -m benchmarks capture --source database --last 3600
+    PYTHONPATH=src python -m benchmarks replay capture.jsonl --target http://api:8000 --speed 5x
+    PYTHONPATH=src python -m benchmarks compare before.json after.json
+"""
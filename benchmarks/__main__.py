@@ -0,0 +1,359 @@
+"""Command line for benchmarks, traffic capture and replay, and comparisons."""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import subprocess
+import sys
+from dataclasses import asdict, replace
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from typing import Any, Awaitable, Callable
+
+import httpx
+from sqlalchemy.engine import make_url
+
+from benchmarks import suites, traffic
+from benchmarks.compare import compare, format_rows
+from benchmarks.data import SCALES, generate
+from benchmarks.replay import replay
+from benchmarks.slo import SLOS
+from benchmarks.standins import HashEmbedder, InMemoryNatsClient
+from benchmarks.stats import Measurement
+from mind.infrastructure.nats.client import NatsClient
+from mind.infrastructure.postgres.database import Database
+from mind.observability.logging import configure_logging
+
+RESULTS_DIR = Path(__file__).parent / "results"
+CAPTURES_DIR = Path(__file__).parent / "captures"
+
+Benchmark = Callable[[suites.BenchmarkContext], Awaitable[Measurement]]
+
+# Name -> (benchmark, needs Postgres); Postgres ones run in this order
+BENCHMARKS: dict[str, tuple[Benchmark, bool]] = {
+    "fusion": (suites.bench_fusion, False),
+    "memory_create": (suites.bench_memory_create, True),
+    "retrieval": (suites.bench_retrieval, True),
+    "observe_outcome": (suites.bench_observe_outcome, True),
+    "event_publisher": (suites.bench_event_publisher, False),
+    "pipelined_event_publisher": (suites.bench_pipelined_event_publisher, False),
+}
+
+
+def _redacted(url: str | None) -> str | None:
+    return make_url(url).render_as_string(hide_password=True) if url else None
+
+
+def _git_commit() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=Path(__file__).parent,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def _selected(names: list[str] | None) -> list[str]:
+    """Benchmarks to run, in order; memory_create loads the Postgres dataset."""
+    chosen = set(names or BENCHMARKS)
+    if any(BENCHMARKS[name][1] for name in chosen):
+        chosen.add("memory_create")
+    return [name for name in BENCHMARKS if name in chosen]
+
+
+async def run(args: argparse.Namespace) -> dict[str, Any]:
+    """Run the selected benchmarks and build the results document."""
+    scale = SCALES[args.scale]
+    overrides = {
+        key: getattr(args, key)
+        for key in ("users", "memories_per_user", "queries", "events")
+        if getattr(args, key) is not None
+    }
+    scale = replace(scale, **overrides)
+
+    ctx = suites.BenchmarkContext(
+        data=generate(scale, seed=args.seed),
+        embedder=HashEmbedder(),
+        concurrency=args.concurrency,
+    )
+    if args.postgres_url:
+        ctx.database = Database(args.postgres_url)
+    if args.nats_url:
+        ctx.nats_client = NatsClient(args.nats_url)
+        await ctx.nats_client.connect()
+    else:
+        ctx.nats_client = InMemoryNatsClient()
+
+    results: dict[str, Any] = {}
+    try:
+        for name in _selected(args.benchmarks):
+            benchmark, needs_postgres = BENCHMARKS[name]
+            if needs_postgres and ctx.database is None:
+                results[name] = {"skipped": "no --postgres-url"}
+                continue
+
+            print(f"running {name} ...", file=sys.stderr)
+            summary = (await benchmark(ctx)).summary()
+            slo = SLOS.get(name)
+            summary["slo"] = slo.check(summary) if slo else None
+            results[name] = summary
+    finally:
+        if ctx.database is not None:
+            await ctx.database.close()
+        await ctx.nats_client.close()
+
+    return {
+        "run": {
+            "started_at": args.started_at,
+            "git_commit": _git_commit(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpus": os.cpu_count(),
+            "seed": args.seed,
+            "scale": {"name": args.scale, **asdict(scale)},
+            "concurrency": args.concurrency,
+            "log_level": args.log_level,
+            "postgres": _redacted(args.postgres_url),
+            "nats": args.nats_url or "in-memory",
+        },
+        "benchmarks": results,
+    }
+
+
+def _print_summary(document: dict[str, Any]) -> None:
+    print(f"{'benchmark':<28} {'ops/s':>10} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9}  SLO")
+    for name, result in document["benchmarks"].items():
+        if result.get("skipped"):
+            print(f"{name:<28} skipped ({result['skipped']})")
+            continue
+        latency = result["latency_ms"]
+        slo = result["slo"]
+        verdict = "-" if slo is None else ("met" if slo["met"] else "MISSED")
+        print(
+            f"{name:<28} {result['throughput_per_second'] or 0:>10.1f} {latency['p50']:>9.3f} "
+            f"{latency['p95']:>9.3f} {latency['p99']:>9.3f}  {verdict}"
+        )
+
+
+def _write_results(document: dict[str, Any], output: Path | None, started_at: datetime) -> None:
+    output = output or RESULTS_DIR / (
+        f"{started_at:%Y%m%dT%H%M%SZ}-{document['run']['git_commit'] or 'unknown'}.json"
+    )
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(document, indent=2) + "\n")
+
+    _print_summary(document)
+    print(f"results written to {output}")
+
+
+def _run_command(args: argparse.Namespace) -> int:
+    configure_logging(level=args.log_level, format="console")
+    started_at = datetime.now(UTC)
+    args.started_at = started_at.isoformat()
+
+    document = asyncio.run(run(args))
+    _write_results(document, args.output, started_at)
+    return 0
+
+
+async def capture(args: argparse.Namespace) -> tuple[dict[str, Any], list]:
+    """Capture the requested window; returns the file header and requests."""
+    end = args.end or datetime.now(UTC)
+    start = args.start or end - timedelta(seconds=args.last)
+    anonymizer = traffic.Anonymizer()
+
+    if args.source == "database":
+        database = Database(args.postgres_url)
+        try:
+            requests = await traffic.capture_from_database(database, start, end, anonymizer)
+        finally:
+            await database.close()
+    else:
+        client = NatsClient(args.nats_url)
+        await client.connect()
+        try:
+            requests = await traffic.capture_from_jetstream(client, start, end, anonymizer)
+        finally:
+            await client.close()
+
+    header = {
+        "source": args.source,
+        "start": start.isoformat(),
+        "end": end.isoformat(),
+        "duration_seconds": (end - start).total_seconds(),
+        "captured_at": datetime.now(UTC).isoformat(),
+    }
+    return header, requests
+
+
+def _capture_command(args: argparse.Namespace) -> int:
+    configure_logging(level=args.log_level, format="console")
+    header, requests = asyncio.run(capture(args))
+    output = args.output or CAPTURES_DIR / f"{datetime.now(UTC):%Y%m%dT%H%M%SZ}.jsonl"
+    traffic.write_capture(output, header, requests)
+    print(f"captured {len(requests)} requests to {output}")
+    return 0
+
+
+async def replay_capture(args: argparse.Namespace) -> dict[str, Any]:
+    """Replay a capture file and build the results document."""
+    header, requests = traffic.read_capture(args.capture)
+    if args.kinds:
+        requests = [request for request in requests if request.kind in args.kinds]
+    if args.expand_samples:
+        requests = traffic.expand_samples(requests, seed=args.seed)
+    if args.target_users:
+        user_ids = [line.strip() for line in args.target_users.read_text().splitlines()]
+        traffic.remap_users(requests, [user_id for user_id in user_ids if user_id])
+
+    headers = dict(header_arg.split(":", 1) for header_arg in args.header)
+    async with httpx.AsyncClient(
+        base_url=args.target,
+        headers={name.strip(): value.strip() for name, value in headers.items()},
+        timeout=args.timeout,
+        limits=httpx.Limits(max_connections=args.max_in_flight),
+    ) as client:
+        results = await replay(requests, client, args.speed, args.max_in_flight)
+
+    benchmarks: dict[str, Any] = {}
+    for kind, result in sorted(results.items()):
+        name = f"replay_{kind}"
+        summary = result.summary()
+        slo = SLOS.get(name)
+        summary["slo"] = slo.check(summary) if slo else None
+        benchmarks[name] = summary
+
+    return {
+        "run": {
+            "started_at": args.started_at,
+            "git_commit": _git_commit(),
+            "capture": str(args.capture),
+            "capture_window": {key: header.get(key) for key in ("source", "start", "end")},
+            "target": args.target,
+            "speed": args.speed or "max",
+            "max_in_flight": args.max_in_flight,
+            "expand_samples": args.expand_samples,
+            "requests": len(requests),
+        },
+        "benchmarks": benchmarks,
+    }
+
+
+def _replay_command(args: argparse.Namespace) -> int:
+    configure_logging(level="WARNING", format="console")
+    started_at = datetime.now(UTC)
+    args.started_at = started_at.isoformat()
+
+    document = asyncio.run(replay_capture(args))
+    _write_results(document, args.output, started_at)
+    return 0
+
+
+def _speed(value: str) -> float | None:
+    """A speed-up factor such as 1, 2.5 or 10x, or "max"."""
+    if value == "max":
+        return None
+    speed = float(value.removesuffix("x"))
+    if speed <= 0:
+        raise argparse.ArgumentTypeError("speed must be positive")
+    return speed
+
+
+def _timestamp(value: str) -> datetime:
+    at = datetime.fromisoformat(value)
+    return at if at.tzinfo else at.replace(tzinfo=UTC)
+
+
+def _compare_command(args: argparse.Namespace) -> int:
+    baseline = json.loads(args.baseline.read_text())
+    current = json.loads(args.current.read_text())
+    rows = compare(baseline, current, args.threshold)
+    print(format_rows(rows))
+    return 1 if any(row["regression"] for row in rows) else 0
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Entry point: `python -m benchmarks {run,capture,replay,compare}`."""
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description=__doc__)
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="Run benchmarks and write a results file")
+    run_parser.add_argument("--scale", choices=sorted(SCALES), default="small")
+    run_parser.add_argument("--seed", type=int, default=42)
+    run_parser.add_argument("--users", type=int)
+    run_parser.add_argument("--memories-per-user", type=int)
+    run_parser.add_argument("--queries", type=int)
+    run_parser.add_argument("--events", type=int)
+    run_parser.add_argument("--concurrency", type=int, default=8)
+    run_parser.add_argument(
+        "--benchmarks", nargs="+", choices=list(BENCHMARKS), help="Default: all"
+    )
+    run_parser.add_argument(
+        "--postgres-url", help="postgresql+asyncpg:// URL; Postgres benchmarks are skipped without"
+    )
+    run_parser.add_argument("--nats-url", help="NATS URL; an in-memory JetStream is used without")
+    run_parser.add_argument("--log-level", default="WARNING")
+    run_parser.add_argument("--output", type=Path, help="Default: benchmarks/results/")
+    run_parser.set_defaults(handler=_run_command)
+
+    capture_parser = commands.add_parser(
+        "capture", help="Export an anonymized window of retrieval and decision traffic"
+    )
+    capture_parser.add_argument("--source", choices=("database", "jetstream"), default="database")
+    capture_parser.add_argument("--start", type=_timestamp, help="ISO time; default: end - last")
+    capture_parser.add_argument("--end", type=_timestamp, help="ISO time; default: now")
+    capture_parser.add_argument("--last", type=float, default=3600, help="Window length (s)")
+    capture_parser.add_argument("--postgres-url", help="Default: settings")
+    capture_parser.add_argument("--nats-url", help="Default: settings")
+    capture_parser.add_argument("--log-level", default="WARNING")
+    capture_parser.add_argument("--output", type=Path, help="Default: benchmarks/captures/")
+    capture_parser.set_defaults(handler=_capture_command)
+
+    replay_parser = commands.add_parser(
+        "replay", help="Replay a capture against an API and write a results file"
+    )
+    replay_parser.add_argument("capture", type=Path)
+    replay_parser.add_argument("--target", default="http://localhost:8000", help="API base URL")
+    replay_parser.add_argument(
+        "--speed", type=_speed, default=1.0, help="Arrival speed-up (1, 10x, ...) or max"
+    )
+    replay_parser.add_argument("--max-in-flight", type=int, default=1000)
+    replay_parser.add_argument("--timeout", type=float, default=10.0)
+    replay_parser.add_argument(
+        "--header", action="append", default=[], help="'Name: value', repeatable"
+    )
+    replay_parser.add_argument("--kinds", nargs="+", choices=list(traffic.PATHS))
+    replay_parser.add_argument(
+        "--expand-samples",
+        action="store_true",
+        help="Replay sampled retrievals as the traffic they stand for",
+    )
+    replay_parser.add_argument(
+        "--target-users", type=Path, help="File of user IDs in the target, one per line"
+    )
+    replay_parser.add_argument("--seed", type=int, default=42)
+    replay_parser.add_argument("--output", type=Path, help="Default: benchmarks/results/")
+    replay_parser.set_defaults(handler=_replay_command)
+
+    compare_parser = commands.add_parser(
+        "compare", help="Compare two results files; exits 1 on regression"
+    )
+    compare_parser.add_argument("baseline", type=Path)
+    compare_parser.add_argument("current", type=Path)
+    compare_parser.add_argument(
+        "--threshold", type=float, default=0.1, help="Relative slowdown that fails (0.1 = 10%%)"
+    )
+    compare_parser.set_defaults(handler=_compare_command)
+
+    args = parser.parse_args(argv)
+    return args.handler(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
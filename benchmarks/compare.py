@@ -0,0 +1,71 @@
+"""Regression comparison of two result files."""
+
+from typing import Any
+
+# Lower is better for latencies, higher for throughput
+_LATENCY_KEYS = ("p50", "p95", "p99")
+
+
+def compare(
+    baseline: dict[str, Any],
+    current: dict[str, Any],
+    threshold: float = 0.1,
+) -> list[dict[str, Any]]:
+    """Relative changes of the benchmarks present in both results.
+
+    Args:
+        baseline: Results of the earlier run
+        current: Results of the later run
+        threshold: Relative slowdown counted as a regression (0.1 = 10%)
+
+    Returns:
+        One row per benchmark and metric, with `regression` set when
+        the change is worse than the threshold
+    """
+    rows = []
+    for name, before in baseline["benchmarks"].items():
+        after = current["benchmarks"].get(name)
+        if after is None or before.get("skipped") or after.get("skipped"):
+            continue
+
+        metrics = [
+            (f"{key}_ms", before["latency_ms"][key], after["latency_ms"][key], False)
+            for key in _LATENCY_KEYS
+        ]
+        metrics.append(
+            (
+                "throughput_per_second",
+                before["throughput_per_second"],
+                after["throughput_per_second"],
+                True,
+            )
+        )
+
+        for metric, old, new, higher_is_better in metrics:
+            if not old or new is None:
+                continue
+            change = (new - old) / old
+            worse = -change if higher_is_better else change
+            rows.append(
+                {
+                    "benchmark": name,
+                    "metric": metric,
+                    "baseline": old,
+                    "current": new,
+                    "change": round(change, 4),
+                    "regression": worse > threshold,
+                }
+            )
+    return rows
+
+
+def format_rows(rows: list[dict[str, Any]]) -> str:
+    """Plain-text table of comparison rows."""
+    lines = [f"{'benchmark':<28} {'metric':<22} {'baseline':>12} {'current':>12} {'change':>8}"]
+    for row in rows:
+        flag = "  REGRESSION" if row["regression"] else ""
+        lines.append(
+            f"{row['benchmark']:<28} {row['metric']:<22} {row['baseline']:>12} "
+            f"{row['current']:>12} {row['change']:>+8.1%}{flag}"
+        )
+    return "\n".join(lines)
@@ -0,0 +1,152 @@
+"""Seeded synthetic dataset: users, memories, embeddings and queries."""
+
+import random
+from dataclasses import dataclass, field
+from datetime import UTC, datetime, timedelta
+from uuid import UUID
+
+from mind.core.memory.models import Memory, TemporalLevel
+
+_SUBJECTS = ("user", "team", "manager", "client", "partner", "assistant")
+_VERBS = ("prefers", "avoids", "asked about", "decided on", "struggled with", "enjoys")
+_TOPICS = (
+    "python", "rust", "typescript", "postgres", "kafka", "nats", "docker", "kubernetes",
+    "coffee", "tea", "running", "cycling", "chess", "jazz", "travel", "cooking",
+    "budget", "deadline", "hiring", "onboarding", "testing", "refactoring", "latency",
+    "security", "design", "meetings", "mornings", "evenings", "remote", "office",
+    "vacation", "reading", "podcasts", "mentoring", "review", "deployment", "metrics",
+    "pricing", "roadmap", "support",
+)  # fmt: skip
+_QUALIFIERS = ("usually", "lately", "on fridays", "for new projects", "at work", "at home")
+_CONTENT_TYPES = ("fact", "preference", "event", "goal", "observation")
+_LEVEL_WEIGHTS = (
+    (TemporalLevel.IMMEDIATE, 4),
+    (TemporalLevel.SITUATIONAL, 3),
+    (TemporalLevel.SEASONAL, 2),
+    (TemporalLevel.IDENTITY, 1),
+)
+
+
+@dataclass(frozen=True)
+class Scale:
+    """Size of a benchmark run."""
+
+    users: int
+    memories_per_user: int
+    creates: int  # Memories written through MemoryRepository.create; the rest are bulk-loaded
+    queries: int  # Retrievals
+    outcomes: int  # Decision traces given an outcome
+    events: int  # Published envelopes
+    fusion_list_size: int  # Candidates per ranked list in weighted_rrf
+
+
+SCALES: dict[str, Scale] = {
+    "tiny": Scale(
+        users=2,
+        memories_per_user=20,
+        creates=20,
+        queries=20,
+        outcomes=20,
+        events=500,
+        fusion_list_size=20,
+    ),
+    "small": Scale(
+        users=10,
+        memories_per_user=100,
+        creates=200,
+        queries=200,
+        outcomes=200,
+        events=5_000,
+        fusion_list_size=50,
+    ),
+    "medium": Scale(
+        users=50,
+        memories_per_user=1_000,
+        creates=1_000,
+        queries=1_000,
+        outcomes=1_000,
+        events=50_000,
+        fusion_list_size=100,
+    ),
+    "large": Scale(
+        users=200,
+        memories_per_user=5_000,
+        creates=2_000,
+        queries=5_000,
+        outcomes=5_000,
+        events=200_000,
+        fusion_list_size=200,
+    ),
+}
+
+
+@dataclass
+class SyntheticData:
+    """A reproducible dataset: the same seed and scale give the same data."""
+
+    seed: int
+    scale: Scale
+    user_ids: list[UUID] = field(default_factory=list)
+    memories: list[Memory] = field(default_factory=list)
+    queries: list[tuple[UUID, str]] = field(default_factory=list)  # (user_id, text)
+
+    def memories_by_user(self) -> dict[UUID, list[Memory]]:
+        """Memories grouped by user."""
+        grouped: dict[UUID, list[Memory]] = {user_id: [] for user_id in self.user_ids}
+        for memory in self.memories:
+            grouped[memory.user_id].append(memory)
+        return grouped
+
+
+def _uuid(rng: random.Random) -> UUID:
+    return UUID(int=rng.getrandbits(128), version=4)
+
+
+def _sentence(rng: random.Random) -> str:
+    topics = rng.sample(_TOPICS, 2)
+    return (
+        f"{rng.choice(_SUBJECTS)} {rng.choice(_VERBS)} {topics[0]} and {topics[1]} "
+        f"{rng.choice(_QUALIFIERS)}"
+    )
+
+
+def generate(scale: Scale, seed: int = 42, now: datetime | None = None) -> SyntheticData:
+    """Generate users with memories and retrieval queries.
+
+    Args:
+        scale: Dataset and run size
+        seed: Random seed; IDs and content depend only on it and the scale
+        now: Reference time for validity and age of the memories
+
+    Returns:
+        The dataset
+    """
+    rng = random.Random(seed)
+    now = now or datetime.now(UTC)
+    data = SyntheticData(seed=seed, scale=scale)
+    levels, weights = zip(*_LEVEL_WEIGHTS)
+
+    data.user_ids = [_uuid(rng) for _ in range(scale.users)]
+    for user_id in data.user_ids:
+        for _ in range(scale.memories_per_user):
+            created = now - timedelta(hours=rng.uniform(0, 24 * 90))
+            data.memories.append(
+                Memory(
+                    memory_id=_uuid(rng),
+                    user_id=user_id,
+                    content=_sentence(rng),
+                    content_type=rng.choice(_CONTENT_TYPES),
+                    temporal_level=rng.choices(levels, weights)[0],
+                    valid_from=created,
+                    valid_until=None,
+                    base_salience=round(rng.uniform(0.2, 1.0), 3),
+                    created_at=created,
+                    updated_at=created,
+                )
+            )
+
+    for _ in range(scale.queries):
+        topics = rng.sample(_TOPICS, rng.randint(1, 3))
+        data.queries.append((rng.choice(data.user_ids), " ".join(topics)))
+
+    return data
@@ -0,0 +1,119 @@
+"""Open-loop replay of a captured workload against an API.
+
+Requests are sent at their captured offsets divided by the speed-up,
+whether or not earlier ones have completed, so a slow target faces the
+same arrivals instead of throttling its own load. Latency is measured
+from when a request was due, not when it was sent, so time spent
+behind a saturated client counts against the target as well.
+
+At max speed the workload is sent as fast as `max_in_flight` requests
+at a time allow (closed loop), which measures peak throughput.
+"""
+
+import asyncio
+import time
+from dataclasses import dataclass, field
+from typing import Any
+
+import httpx
+
+from benchmarks.stats import Measurement, percentile
+from benchmarks.traffic import PATHS, CapturedRequest
+
+
+@dataclass
+class KindResult:
+    """Outcome of replaying one kind of request."""
+
+    measurement: Measurement = field(default_factory=Measurement)  # From due time
+    service_latencies: list[float] = field(default_factory=list)  # From send time
+    original_latencies_ms: list[float] = field(default_factory=list)  # As captured
+    statuses: dict[str, int] = field(default_factory=dict)
+    dropped: int = 0  # Not sent: max_in_flight reached
+
+    def summary(self) -> dict[str, Any]:
+        """Measurement summary with statuses and latency breakdowns."""
+        summary = self.measurement.summary()
+        summary["dropped"] = self.dropped
+        summary["statuses"] = dict(sorted(self.statuses.items()))
+        summary["service_latency_ms"] = _percentiles([s * 1000 for s in self.service_latencies])
+        summary["original_latency_ms"] = _percentiles(self.original_latencies_ms)
+        return summary
+
+
+def _percentiles(values: list[float]) -> dict[str, float | None]:
+    return {
+        name: None if (value := percentile(values, q)) is None else round(value, 3)
+        for name, q in (("p50", 50), ("p95", 95), ("p99", 99))
+    }
+
+
+async def replay(
+    requests: list[CapturedRequest],
+    client: httpx.AsyncClient,
+    speed: float | None = 1.0,
+    max_in_flight: int = 1000,
+) -> dict[str, KindResult]:
+    """Replay requests against the client's base URL.
+
+    Args:
+        requests: Captured requests, ordered by offset
+        client: HTTP client for the target API
+        speed: Speed-up of the captured arrival times; None for max speed
+        max_in_flight: Cap on concurrent requests; open-loop arrivals
+            beyond it are dropped and counted
+
+    Returns:
+        Results by request kind
+    """
+    results: dict[str, KindResult] = {}
+    in_flight: set[asyncio.Task] = set()
+    slots = asyncio.Semaphore(max_in_flight)
+
+    async def send(request: CapturedRequest, due: float, result: KindResult) -> None:
+        sent = time.perf_counter()
+        try:
+            response = await client.post(PATHS[request.kind], json=request.body)
+            status = str(response.status_code)
+            ok = response.status_code < 400
+        except httpx.HTTPError as e:
+            status = type(e).__name__
+            ok = False
+        finally:
+            if speed is None:
+                slots.release()
+        done = time.perf_counter()
+
+        result.measurement.latencies.append(done - due)
+        result.service_latencies.append(done - sent)
+        result.statuses[status] = result.statuses.get(status, 0) + 1
+        if not ok:
+            result.measurement.errors += 1
+
+    start = time.perf_counter()
+    for request in requests:
+        result = results.setdefault(request.kind, KindResult())
+        if request.original_latency_ms is not None:
+            result.original_latencies_ms.append(request.original_latency_ms)
+
+        if speed is None:
+            await slots.acquire()
+            due = time.perf_counter()
+        else:
+            due = start + request.offset / speed
+            delay = due - time.perf_counter()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            if len(in_flight) >= max_in_flight:
+                result.dropped += 1
+                continue
+
+        task = asyncio.create_task(send(request, due, result))
+        in_flight.add(task)
+        task.add_done_callback(in_flight.discard)
+
+    await asyncio.gather(*in_flight)
+    wall = time.perf_counter() - start
+    for result in results.values():
+        result.measurement.wall_seconds = wall
+    return results
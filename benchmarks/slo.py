@@ -0,0 +1,63 @@
+"""SLOs from the architecture document's Performance Targets (Phase 1)."""
+
+from dataclasses import dataclass, replace
+from typing import Any
+
+
+@dataclass(frozen=True)
+class SLO:
+    """Latency (milliseconds) and throughput targets of an operation."""
+
+    operation: str
+    p50_ms: float | None = None
+    p95_ms: float | None = None
+    p99_ms: float | None = None
+    throughput_per_second: float | None = None  # Sustained
+    max_error_rate: float = 0.01  # Latencies of a mostly failing run say nothing
+
+    def check(self, summary: dict[str, Any]) -> dict[str, Any]:
+        """Compare a benchmark summary with this SLO.
+
+        Returns:
+            The targets, whether each was met, and an overall verdict
+        """
+        latency = summary["latency_ms"]
+        checks: dict[str, bool] = {}
+        for name, target in (("p50", self.p50_ms), ("p95", self.p95_ms), ("p99", self.p99_ms)):
+            if target is not None and latency[name] is not None:
+                checks[name] = latency[name] <= target
+        if summary["error_rate"] is not None:
+            checks["errors"] = summary["error_rate"] <= self.max_error_rate
+        throughput = summary["throughput_per_second"]
+        if self.throughput_per_second is not None and throughput is not None:
+            checks["throughput"] = throughput >= self.throughput_per_second
+
+        return {
+            "operation": self.operation,
+            "targets": {
+                "p50_ms": self.p50_ms,
+                "p95_ms": self.p95_ms,
+                "p99_ms": self.p99_ms,
+                "throughput_per_second": self.throughput_per_second,
+                "max_error_rate": self.max_error_rate,
+            },
+            "checks": checks,
+            "met": all(checks.values()) if checks else None,
+        }
+
+
+CONTEXT_RETRIEVAL = SLO(
+    "Context retrieval", p50_ms=30, p95_ms=75, p99_ms=100, throughput_per_second=1_000
+)
+OUTCOME_RECORDING = SLO("Outcome recording", p50_ms=5, p95_ms=10, p99_ms=20)
+EVENT_INGESTION = SLO("Event ingestion", throughput_per_second=10_000)
+
+# Benchmark name -> SLO; benchmarks of parts of a path have none. Replays
+# run at the captured rate, so only their latency is held to the SLO.
+SLOS: dict[str, SLO] = {
+    "retrieval": CONTEXT_RETRIEVAL,
+    "replay_retrieve": replace(CONTEXT_RETRIEVAL, throughput_per_second=None),
+    "observe_outcome": OUTCOME_RECORDING,
+    "event_publisher": EVENT_INGESTION,
+    "pipelined_event_publisher": EVENT_INGESTION,
+}
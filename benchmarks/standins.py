@@ -0,0 +1,80 @@
+"""Offline stand-ins for the embedding API and NATS JetStream."""
+
+import asyncio
+import functools
+import hashlib
+import math
+import random
+import re
+
+from nats.js.api import PubAck
+
+from mind.config import get_settings
+from mind.core.errors import Result
+from mind.infrastructure.nats.client import NatsClient
+
+_TOKEN = re.compile(r"\w+")
+
+
+@functools.lru_cache(maxsize=8192)
+def _token_vector(token: str, dimensions: int) -> tuple[float, ...]:
+    seed = int.from_bytes(hashlib.sha256(token.encode()).digest()[:8], "big")
+    rng = random.Random(seed)
+    return tuple(rng.gauss(0.0, 1.0) for _ in range(dimensions))
+
+
+class HashEmbedder:
+    """Deterministic embedder: the normalized sum of hashed token vectors.
+
+    Texts sharing words get similar vectors, so vector search returns
+    meaningful neighbours, and the same text always embeds the same way
+    without network calls.
+    """
+
+    def __init__(self, dimensions: int | None = None):
+        self.dimensions = dimensions or get_settings().embedding_dimensions
+
+    def vector(self, text: str) -> list[float]:
+        """Embedding of a text."""
+        total = [0.0] * self.dimensions
+        for token in _TOKEN.findall(text.lower()):
+            for i, value in enumerate(_token_vector(token, self.dimensions)):
+                total[i] += value
+        norm = math.sqrt(sum(value * value for value in total)) or 1.0
+        return [value / norm for value in total]
+
+    async def embed(self, text: str) -> Result[list[float]]:
+        """Same interface as OpenAIEmbedder.embed."""
+        return Result.ok(self.vector(text))
+
+
+class InMemoryJetStream:
+    """JetStream stand-in that acks every publish immediately."""
+
+    def __init__(self, stream: str = NatsClient.STREAM_NAME):
+        self._stream = stream
+        self.sequence = 0
+        self.bytes_published = 0
+
+    def _ack(self, payload: bytes) -> PubAck:
+        self.sequence += 1
+        self.bytes_published += len(payload)
+        return PubAck(stream=self._stream, seq=self.sequence)
+
+    async def publish(self, subject, payload=b"", timeout=None, stream=None, headers=None):
+        return self._ack(payload)
+
+    async def publish_async(self, subject, payload=b"", wait_stall=None, headers=None):
+        future = asyncio.get_running_loop().create_future()
+        future.set_result(self._ack(payload))
+        return future
+
+
+class InMemoryNatsClient:
+    """NatsClient stand-in exposing an InMemoryJetStream."""
+
+    def __init__(self):
+        self.jetstream = InMemoryJetStream()
+
+    async def close(self) -> None:
+        pass
@@ -0,0 +1,108 @@
+"""Latency and throughput measurement."""
+
+import asyncio
+import math
+import time
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable
+
+
+@dataclass
+class Measurement:
+    """Latencies of one benchmark's operations."""
+
+    latencies: list[float] = field(default_factory=list)  # Seconds per operation
+    wall_seconds: float = 0.0
+    operations_per_call: int = 1  # Operations covered by one latency sample
+    errors: int = 0
+
+    def summary(self) -> dict[str, Any]:
+        """Throughput and latency percentiles (milliseconds)."""
+        calls = len(self.latencies)
+        operations = calls * self.operations_per_call
+        latencies_ms = [latency * 1000 for latency in self.latencies]
+        return {
+            "operations": operations,
+            "errors": self.errors,
+            "error_rate": round(self.errors / calls, 4) if calls else None,  # Per call
+            "wall_seconds": round(self.wall_seconds, 4),
+            "throughput_per_second": (
+                round(operations / self.wall_seconds, 1) if self.wall_seconds else None
+            ),
+            "latency_ms": {
+                "mean": _round(sum(latencies_ms) / len(latencies_ms) if latencies_ms else None),
+                "p50": _round(percentile(latencies_ms, 50)),
+                "p95": _round(percentile(latencies_ms, 95)),
+                "p99": _round(percentile(latencies_ms, 99)),
+                "max": _round(max(latencies_ms, default=None)),
+            },
+        }
+
+
+def percentile(values: list[float], q: float) -> float | None:
+    """Percentile with linear interpolation between closest ranks.
+
+    Args:
+        values: Samples, in any order
+        q: Percentile in [0, 100]
+
+    Returns:
+        The percentile, or None without samples
+    """
+    if not values:
+        return None
+    ordered = sorted(values)
+    position = (len(ordered) - 1) * q / 100
+    lower = math.floor(position)
+    upper = math.ceil(position)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+
+def _round(value: float | None) -> float | None:
+    return None if value is None else round(value, 3)
+
+
+async def measure(
+    operation: Callable[[int], Awaitable[bool]],
+    count: int,
+    concurrency: int = 1,
+    operations_per_call: int = 1,
+) -> Measurement:
+    """Time `count` calls of an async operation over `concurrency` workers.
+
+    Args:
+        operation: Called with the call index; returns False on failure
+        count: Number of calls
+        concurrency: Calls in flight at once
+        operations_per_call: Operations each call performs (e.g. batch size)
+
+    Returns:
+        Per-call latencies and the wall time of the whole run
+    """
+    result = Measurement(operations_per_call=operations_per_call)
+    indexes = iter(range(count))
+
+    async def worker() -> None:
+        for index in indexes:
+            start = time.perf_counter()
+            ok = await operation(index)
+            result.latencies.append(time.perf_counter() - start)
+            if not ok:
+                result.errors += 1
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(max(1, concurrency))))
+    result.wall_seconds = time.perf_counter() - start
+    return result
+
+
+def measure_sync(operation: Callable[[int], Any], count: int) -> Measurement:
+    """Time `count` sequential calls of a synchronous operation."""
+    result = Measurement()
+    start = time.perf_counter()
+    for index in range(count):
+        call_start = time.perf_counter()
+        operation(index)
+        result.latencies.append(time.perf_counter() - call_start)
+    result.wall_seconds = time.perf_counter() - start
+    return result
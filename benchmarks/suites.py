@@ -0,0 +1,279 @@
+"""The benchmarks and the dataset setup they share.
+
+Each benchmark returns a Measurement. Postgres benchmarks run in order
+on the same dataset: memory creation loads it, retrieval queries it and
+outcome recording adjusts its salience.
+"""
+
+import random
+from array import array
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy import text
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+
+from benchmarks.data import SyntheticData
+from benchmarks.standins import HashEmbedder
+from benchmarks.stats import Measurement, measure, measure_sync
+from mind.core.decision.models import DecisionTrace, Outcome, SalienceUpdate
+from mind.core.events.base import EventEnvelope
+from mind.core.events.memory import MemoryCreated
+from mind.core.memory.fusion import RankedMemory, weighted_rrf
+from mind.core.memory.models import Memory
+from mind.core.memory.retrieval import RetrievalRequest
+from mind.infrastructure.nats.publisher import EventPublisher, PipelinedEventPublisher
+from mind.infrastructure.postgres.database import Database
+from mind.infrastructure.postgres.models import Base, MemoryModel, UserModel
+from mind.infrastructure.postgres.repositories import DecisionRepository, MemoryRepository
+from mind.services.retrieval import RetrievalService
+
+_BULK_BATCH_SIZE = 500
+_FUSION_CALLS = 1_000
+_MEMORIES_PER_TRACE = 5
+_PUBLISH_BATCH_SIZE = 100
+
+
+@dataclass
+class BenchmarkContext:
+    """What the benchmarks run against."""
+
+    data: SyntheticData
+    embedder: HashEmbedder
+    concurrency: int = 8
+    database: Database | None = None
+    nats_client: Any = None  # NatsClient or InMemoryNatsClient
+
+
+# Fusion
+
+
+async def bench_fusion(ctx: BenchmarkContext) -> Measurement:
+    """weighted_rrf over one ranked list per retrieval source."""
+    rng = random.Random(ctx.data.seed)
+    size = min(ctx.data.scale.fusion_list_size, len(ctx.data.memories))
+    pool = ctx.data.memories[: size * 2]
+
+    inputs = []
+    for _ in range(_FUSION_CALLS):
+        ranked_lists = []
+        for source, weight in RetrievalService.WEIGHTS.items():
+            memories = rng.sample(pool, size)
+            ranked = [
+                RankedMemory(memory=memory, rank=rank, source=source, raw_score=1.0 / rank)
+                for rank, memory in enumerate(memories, start=1)
+            ]
+            ranked_lists.append((ranked, weight))
+        inputs.append(ranked_lists)
+
+    return measure_sync(lambda i: weighted_rrf(inputs[i], limit=10), len(inputs))
+
+
+# Postgres
+
+
+async def prepare_database(ctx: BenchmarkContext) -> None:
+    """Create the schema if needed and replace the dataset's rows.
+
+    Only rows of the dataset's users are touched, so a shared database
+    keeps its other data.
+    """
+    user_ids = ctx.data.user_ids
+    async with ctx.database.engine.begin() as conn:
+        await conn.execute(text('CREATE EXTENSION IF NOT EXISTS "vector"'))
+        await conn.run_sync(lambda sync_conn: Base.metadata.create_all(sync_conn, checkfirst=True))
+
+        for statement in (
+            """DELETE FROM salience_adjustments WHERE trace_id IN
+               (SELECT trace_id FROM decision_traces WHERE user_id = ANY(:ids))""",
+            "DELETE FROM decision_traces WHERE user_id = ANY(:ids)",
+            """DELETE FROM gardener_dirty_memories WHERE memory_id IN
+               (SELECT memory_id FROM memories WHERE user_id = ANY(:ids))""",
+            "DELETE FROM memories WHERE user_id = ANY(:ids)",
+            "DELETE FROM memories_archive WHERE user_id = ANY(:ids)",
+            "DELETE FROM events WHERE user_id = ANY(:ids)",
+        ):
+            await conn.execute(text(statement), {"ids": user_ids})
+
+        await conn.execute(
+            pg_insert(UserModel)
+            .values([{"user_id": user_id} for user_id in user_ids])
+            .on_conflict_do_nothing()
+        )
+
+
+def _split_creates(data: SyntheticData) -> tuple[list[Memory], list[Memory]]:
+    """Memories to create one by one (spread over users) and the rest."""
+    stride = max(1, len(data.memories) // max(1, data.scale.creates))
+    timed = data.memories[::stride][: data.scale.creates]
+    timed_ids = {memory.memory_id for memory in timed}
+    rest = [memory for memory in data.memories if memory.memory_id not in timed_ids]
+    return timed, rest
+
+
+async def _bulk_load(ctx: BenchmarkContext, memories: list[Memory]) -> None:
+    for start in range(0, len(memories), _BULK_BATCH_SIZE):
+        rows = [
+            {
+                "memory_id": memory.memory_id,
+                "user_id": memory.user_id,
+                "content": memory.content,
+                "content_type": memory.content_type,
+                "embedding": ctx.embedder.vector(memory.content),
+                "temporal_level": memory.temporal_level.value,
+                "valid_from": memory.valid_from,
+                "base_salience": memory.base_salience,
+                "created_at": memory.created_at,
+                "updated_at": memory.updated_at,
+            }
+            for memory in memories[start : start + _BULK_BATCH_SIZE]
+        ]
+        async with ctx.database.session() as session:
+            await session.execute(pg_insert(MemoryModel).values(rows))
+
+
+async def bench_memory_create(ctx: BenchmarkContext) -> Measurement:
+    """MemoryRepository.create, one memory per session, on a loaded table."""
+    await prepare_database(ctx)
+    timed, rest = _split_creates(ctx.data)
+    await _bulk_load(ctx, rest)
+
+    # Embeddings are computed up front so only the write is timed
+    embeddings = [array("d", ctx.embedder.vector(memory.content)) for memory in timed]
+
+    async def create(i: int) -> bool:
+        async with ctx.database.session() as session:
+            result = await MemoryRepository(session).create(timed[i], embeddings[i].tolist())
+        return result.is_ok
+
+    return await measure(create, len(timed), ctx.concurrency)
+
+
+async def bench_retrieval(ctx: BenchmarkContext) -> Measurement:
+    """RetrievalService.retrieve with the offline embedder (all sources)."""
+    queries = ctx.data.queries
+
+    async def retrieve(i: int) -> bool:
+        user_id, query = queries[i]
+        async with ctx.database.session() as session:
+            service = RetrievalService(session, embedder=ctx.embedder)
+            result = await service.retrieve(RetrievalRequest(user_id=user_id, query=query))
+        return result.is_ok
+
+    return await measure(retrieve, len(queries), ctx.concurrency)
+
+
+async def _create_traces(ctx: BenchmarkContext) -> list[UUID]:
+    rng = random.Random(ctx.data.seed + 1)
+    memories = ctx.data.memories_by_user()
+    trace_ids = []
+
+    async with ctx.database.session() as session:
+        repo = DecisionRepository(session)
+        for _ in range(ctx.data.scale.outcomes):
+            user_id = rng.choice(ctx.data.user_ids)
+            used = rng.sample(memories[user_id], min(_MEMORIES_PER_TRACE, len(memories[user_id])))
+            trace = DecisionTrace(
+                trace_id=UUID(int=rng.getrandbits(128), version=4),
+                user_id=user_id,
+                session_id=UUID(int=rng.getrandbits(128), version=4),
+                memory_ids=[memory.memory_id for memory in used],
+                memory_scores={str(memory.memory_id): rng.random() for memory in used},
+                decision_type="recommendation",
+                decision_summary="benchmark decision",
+                confidence=rng.random(),
+            )
+            result = await repo.create_trace(trace)
+            if result.is_ok:
+                trace_ids.append(trace.trace_id)
+
+    return trace_ids
+
+
+async def bench_observe_outcome(ctx: BenchmarkContext) -> Measurement:
+    """The POST /v1/decisions/outcome path: outcome plus salience updates."""
+    trace_ids = await _create_traces(ctx)
+    rng = random.Random(ctx.data.seed + 2)
+    qualities = [rng.uniform(-1.0, 1.0) for _ in trace_ids]
+
+    async def observe(i: int) -> bool:
+        outcome = Outcome(
+            trace_id=trace_ids[i],
+            quality=qualities[i],
+            signal="explicit_feedback",
+            observed_at=datetime.now(UTC),
+        )
+        async with ctx.database.session() as session:
+            decisions = DecisionRepository(session)
+            memories = MemoryRepository(session)
+
+            trace_result = await decisions.get_trace(outcome.trace_id)
+            if not trace_result.is_ok:
+                return False
+            scores = trace_result.value.memory_scores
+            total = sum(scores.values()) or 1.0
+            attributions = {memory_id: score / total for memory_id, score in scores.items()}
+
+            result = await decisions.record_outcome(outcome.trace_id, outcome, attributions)
+            if not result.is_ok:
+                return False
+            for memory_id, contribution in attributions.items():
+                update = SalienceUpdate.from_outcome(
+                    memory_id=UUID(memory_id),
+                    trace_id=outcome.trace_id,
+                    outcome=outcome,
+                    contribution=contribution,
+                )
+                await memories.update_salience(UUID(memory_id), update)
+        return True
+
+    return await measure(observe, len(trace_ids), ctx.concurrency)
+
+
+# Events
+
+
+def _envelopes(ctx: BenchmarkContext) -> list[EventEnvelope]:
+    memories = ctx.data.memories
+    envelopes = []
+    for i in range(ctx.data.scale.events):
+        memory = memories[i % len(memories)]
+        event = MemoryCreated(
+            memory_id=memory.memory_id,
+            content=memory.content,
+            content_type=memory.content_type,
+            temporal_level=memory.temporal_level,
+            base_salience=memory.base_salience,
+            valid_from=memory.valid_from,
+        )
+        envelopes.append(EventEnvelope.wrap(event=event, user_id=memory.user_id))
+    return envelopes
+
+
+async def bench_event_publisher(ctx: BenchmarkContext) -> Measurement:
+    """EventPublisher.publish, one awaited ack per event."""
+    publisher = EventPublisher(ctx.nats_client)
+    envelopes = _envelopes(ctx)
+
+    async def publish(i: int) -> bool:
+        return (await publisher.publish(envelopes[i])).is_ok
+
+    return await measure(publish, len(envelopes), ctx.concurrency)
+
+
+async def bench_pipelined_event_publisher(ctx: BenchmarkContext) -> Measurement:
+    """PipelinedEventPublisher.publish_batch; latency is per batch."""
+    publisher = PipelinedEventPublisher(ctx.nats_client)
+    envelopes = _envelopes(ctx)
+    batches = [
+        envelopes[start : start + _PUBLISH_BATCH_SIZE]
+        for start in range(0, len(envelopes) - _PUBLISH_BATCH_SIZE + 1, _PUBLISH_BATCH_SIZE)
+    ]
+
+    async def publish(i: int) -> bool:
+        results = await publisher.publish_batch(batches[i])
+        return all(result.is_ok for result in results)
+
+    return await measure(publish, len(batches), 1, operations_per_call=_PUBLISH_BATCH_SIZE)
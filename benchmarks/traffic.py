@@ -0,0 +1,294 @@
+"""Capture of real traffic from the event log, anonymized for replay.
+
+``memory.retrieval`` and ``decision.tracked`` events describe the API
+requests that caused them, so a time window of them is a workload:
+each event becomes the request body that would reproduce it, with its
+offset from the start of the window. Events are read from the events
+table or from JetStream.
+
+Captures are anonymized as they are read. User, session and memory
+IDs are replaced by keyed hashes, and every word of free text by
+a pseudoword of the same length. The key is random per capture and
+never written, so the same user or query stays the same within a
+capture (keeping per-user skew and repeated queries) but cannot be
+recovered from it.
+
+A capture file is JSON lines: a header, then one request per line.
+"""
+
+import asyncio
+import hashlib
+import hmac
+import json
+import os
+import random
+import re
+import string
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Iterable
+from uuid import UUID
+
+from nats.js.api import AckPolicy, ConsumerConfig, DeliverPolicy
+
+from mind.core.events import codec
+from mind.core.events.base import EventType
+from mind.infrastructure.nats.client import NatsClient
+from mind.infrastructure.postgres.database import Database
+from mind.infrastructure.postgres.repositories import EventRepository
+
+FORMAT = "mind-traffic/1"
+
+RETRIEVE = "retrieve"
+TRACK = "track"
+
+# Event type -> request kind, and the API path each kind replays to
+CAPTURED_EVENT_TYPES = {
+    EventType.MEMORY_RETRIEVAL: RETRIEVE,
+    EventType.DECISION_TRACKED: TRACK,
+}
+PATHS = {
+    RETRIEVE: "/v1/memories/retrieve",
+    TRACK: "/v1/decisions/track",
+}
+
+_DEFAULT_RETRIEVAL_LIMIT = 10  # RetrieveRequest default
+_PAGE_SIZE = 1000
+_WORD = re.compile(r"\w+")
+
+
+@dataclass
+class CapturedRequest:
+    """An API request reconstructed from an event."""
+
+    offset: float  # Seconds from the start of the window
+    kind: str
+    body: dict[str, Any]
+    weight: float = 1.0  # Requests this one stands for (retrievals are sampled)
+    original_latency_ms: float | None = None
+
+
+class Anonymizer:
+    """Replaces identifiers and words with stable keyed pseudonyms."""
+
+    def __init__(self, key: bytes | None = None):
+        self._key = key or os.urandom(32)
+        self._words: dict[str, str] = {}
+
+    def _digest(self, value: str) -> bytes:
+        return hmac.new(self._key, value.encode(), hashlib.sha256).digest()
+
+    def uuid(self, value: Any) -> str:
+        """Pseudonymous UUID for an identifier."""
+        return str(UUID(bytes=self._digest(str(value))[:16], version=4))
+
+    def text(self, value: str) -> str:
+        """The text with every word replaced by a same-length pseudoword."""
+        return _WORD.sub(lambda match: self._word(match.group()), value)
+
+    def _word(self, word: str) -> str:
+        pseudo = self._words.get(word)
+        if pseudo is None:
+            alphabet = string.digits if word.isdigit() else string.ascii_lowercase
+            digest = self._digest(word)
+            while len(digest) < len(word):
+                digest += self._digest(digest.hex())
+            pseudo = "".join(alphabet[b % len(alphabet)] for b in digest[: len(word)])
+            self._words[word] = pseudo
+        return pseudo
+
+
+def to_request(
+    event_type: EventType | str,
+    user_id: Any,
+    payload: dict[str, Any],
+    at: datetime,
+    start: datetime,
+    anonymizer: Anonymizer,
+) -> CapturedRequest | None:
+    """The anonymized request that produced an event, or None if not captured."""
+    kind = CAPTURED_EVENT_TYPES.get(EventType(event_type))
+    offset = (at - start).total_seconds()
+
+    if kind == RETRIEVE:
+        sample_rate = payload.get("sample_rate") or 1.0
+        return CapturedRequest(
+            offset=offset,
+            kind=kind,
+            body={
+                "user_id": anonymizer.uuid(user_id),
+                "query": anonymizer.text(payload["query"]),
+                "limit": max(_DEFAULT_RETRIEVAL_LIMIT, len(payload.get("memories", []))),
+            },
+            weight=1.0 / sample_rate,
+            original_latency_ms=payload.get("latency_ms"),
+        )
+
+    if kind == TRACK:
+        return CapturedRequest(
+            offset=offset,
+            kind=kind,
+            body={
+                "user_id": anonymizer.uuid(user_id),
+                "session_id": anonymizer.uuid(payload["session_id"]),
+                "memory_ids": [anonymizer.uuid(mid) for mid in payload.get("memory_ids", [])],
+                "memory_scores": {
+                    anonymizer.uuid(mid): score
+                    for mid, score in (payload.get("memory_scores") or {}).items()
+                },
+                "decision_type": payload["decision_type"],
+                "decision_summary": anonymizer.text(payload["decision_summary"]),
+                "confidence": payload["confidence"],
+                "alternatives_count": payload.get("alternatives_count", 0),
+            },
+        )
+
+    return None
+
+
+async def capture_from_database(
+    database: Database,
+    start: datetime,
+    end: datetime,
+    anonymizer: Anonymizer,
+) -> list[CapturedRequest]:
+    """Capture a window from the events table."""
+    event_types = [event_type.value for event_type in CAPTURED_EVENT_TYPES]
+    requests: list[CapturedRequest] = []
+    after = None
+
+    while True:
+        async with database.session() as session:
+            events = await EventRepository(session).get_window(
+                event_types, start, end, after=after, limit=_PAGE_SIZE
+            )
+        for event in events:
+            request = to_request(
+                event.event_type, event.user_id, event.payload, event.created_at, start, anonymizer
+            )
+            if request is not None:
+                requests.append(request)
+        if len(events) < _PAGE_SIZE:
+            return requests
+        after = (events[-1].created_at, events[-1].event_id)
+
+
+async def capture_from_jetstream(
+    client: NatsClient,
+    start: datetime,
+    end: datetime,
+    anonymizer: Anonymizer,
+    fetch_timeout: float = 2.0,
+) -> list[CapturedRequest]:
+    """Capture a window from the events stream.
+
+    Each event type is read by an ephemeral consumer starting at the
+    window, until it passes the end of the window or runs out.
+    """
+    requests: list[CapturedRequest] = []
+
+    for event_type in CAPTURED_EVENT_TYPES:
+        category, action = event_type.value.split(".", 1)
+        subscription = await client.jetstream.pull_subscribe(
+            subject=f"mind.{category}.{action}.*",
+            config=ConsumerConfig(
+                deliver_policy=DeliverPolicy.BY_START_TIME,
+                opt_start_time=start,
+                ack_policy=AckPolicy.NONE,
+                inactive_threshold=60,
+            ),
+        )
+        try:
+            done = False
+            while not done:
+                try:
+                    messages = await subscription.fetch(batch=_PAGE_SIZE, timeout=fetch_timeout)
+                except asyncio.TimeoutError:
+                    break
+                for msg in messages:
+                    envelope = codec.decode(msg.data, (msg.headers or {}).get("Content-Type"))
+                    if envelope.timestamp >= end:
+                        done = True
+                        break
+                    if envelope.timestamp < start:
+                        continue  # Stored just after the window started
+                    request = to_request(
+                        envelope.event_type,
+                        envelope.user_id,
+                        envelope.payload,
+                        envelope.timestamp,
+                        start,
+                        anonymizer,
+                    )
+                    if request is not None:
+                        requests.append(request)
+        finally:
+            await subscription.unsubscribe()
+
+    return sorted(requests, key=lambda request: request.offset)
+
+
+def write_capture(path: Path, header: dict[str, Any], requests: list[CapturedRequest]) -> None:
+    """Write a capture file."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    counts: dict[str, int] = {}
+    for request in requests:
+        counts[request.kind] = counts.get(request.kind, 0) + 1
+
+    with path.open("w") as f:
+        f.write(json.dumps({"format": FORMAT, **header, "counts": counts}) + "\n")
+        for request in requests:
+            f.write(json.dumps(asdict(request)) + "\n")
+
+
+def read_capture(path: Path) -> tuple[dict[str, Any], list[CapturedRequest]]:
+    """Read a capture file.
+
+    Raises:
+        ValueError: If the file is not a capture
+    """
+    with path.open() as f:
+        header = json.loads(f.readline())
+        if header.get("format") != FORMAT:
+            raise ValueError(f"{path} is not a {FORMAT} capture")
+        requests = [CapturedRequest(**json.loads(line)) for line in f if line.strip()]
+    return header, requests
+
+
+def expand_samples(requests: Iterable[CapturedRequest], seed: int = 0) -> list[CapturedRequest]:
+    """Stand each sampled request in for the requests it represents.
+
+    A request of weight w becomes about w copies, spread uniformly over
+    the gap to the next captured request of the same kind.
+    """
+    rng = random.Random(seed)
+    by_kind: dict[str, list[CapturedRequest]] = {}
+    for request in requests:
+        by_kind.setdefault(request.kind, []).append(request)
+
+    expanded: list[CapturedRequest] = []
+    for same_kind in by_kind.values():
+        same_kind.sort(key=lambda request: request.offset)
+        for i, request in enumerate(same_kind):
+            gap = same_kind[i + 1].offset - request.offset if i + 1 < len(same_kind) else 0.0
+            copies = int(request.weight) + (rng.random() < request.weight % 1)
+            for copy in range(copies):
+                offset = request.offset + (rng.uniform(0, gap) if copy else 0.0)
+                expanded.append(
+                    CapturedRequest(
+                        offset=offset,
+                        kind=request.kind,
+                        body=request.body,
+                        original_latency_ms=request.original_latency_ms,
+                    )
+                )
+
+    return sorted(expanded, key=lambda request: request.offset)
+
+
+def remap_users(requests: list[CapturedRequest], user_ids: list[str]) -> None:
+    """Point every captured user at one of the target's users, consistently."""
+    for request in requests:
+        pseudonym = UUID(request.body["user_id"])
+        request.body = {**request.body, "user_id": user_ids[pseudonym.int % len(user_ids)]}
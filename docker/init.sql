@@ -24,13 +24,42 @@ CREATE TABLE IF NOT EXISTS events (
     correlation_id UUID NOT NULL,
     causation_id UUID,
     version INT DEFAULT 1,
-    created_at TIMESTAMPTZ DEFAULT NOW()
+    created_at TIMESTAMPTZ DEFAULT NOW(),
+    position BIGINT GENERATED BY DEFAULT AS IDENTITY UNIQUE
 );
 
 CREATE INDEX IF NOT EXISTS idx_events_user_type ON events (user_id, event_type);
 CREATE INDEX IF NOT EXISTS idx_events_aggregate ON events (aggregate_id);
 CREATE INDEX IF NOT EXISTS idx_events_correlation ON events (correlation_id);
 CREATE INDEX IF NOT EXISTS idx_events_created ON events (created_at DESC);
+CREATE INDEX IF NOT EXISTS idx_events_aggregate_position ON events (aggregate_id, position);
+
+-- Aggregate snapshots (folded state up to a position in the event log)
+CREATE TABLE IF NOT EXISTS snapshots (
+    aggregate_id UUID NOT NULL,
+    version INT NOT NULL,
+    state JSONB NOT NULL DEFAULT '{}',
+    position BIGINT NOT NULL,
+    created_at TIMESTAMPTZ DEFAULT NOW(),
+    PRIMARY KEY (aggregate_id, version)
+);
+
+-- Projection checkpoints (last JetStream sequence written per partition)
+CREATE TABLE IF NOT EXISTS projection_checkpoints (
+    projector VARCHAR(100) NOT NULL,
+    partition VARCHAR(50) NOT NULL,
+    stream_sequence BIGINT NOT NULL DEFAULT 0,
+    updated_at TIMESTAMPTZ DEFAULT NOW(),
+    PRIMARY KEY (projector, partition)
+);
+
+-- Progress of local (non-Temporal) gardener jobs
+CREATE TABLE IF NOT EXISTS gardener_checkpoints (
+    job VARCHAR(50) PRIMARY KEY,
+    after_user_id UUID,
+    last_completed_at TIMESTAMPTZ,
+    updated_at TIMESTAMPTZ DEFAULT NOW()
+);
 
 -- Memories table (hierarchical temporal memory)
 CREATE TABLE IF NOT EXISTS memories (
@@ -48,6 +77,7 @@ CREATE TABLE IF NOT EXISTS memories (
     decision_count INT DEFAULT 0,
     positive_outcomes INT DEFAULT 0,
     negative_outcomes INT DEFAULT 0,
+    last_used_at TIMESTAMPTZ,  -- Latest retrieval or outcome, set by the dirty tracker
     promoted_from_level INT,
     promotion_timestamp TIMESTAMPTZ,
     created_at TIMESTAMPTZ DEFAULT NOW(),
@@ -56,12 +86,54 @@ CREATE TABLE IF NOT EXISTS memories (
 
 CREATE INDEX IF NOT EXISTS idx_memories_user_level ON memories (user_id, temporal_level);
 CREATE INDEX IF NOT EXISTS idx_memories_user_salience ON memories (user_id, (base_salience + outcome_adjustment) DESC);
+-- Expiration scan
+CREATE INDEX IF NOT EXISTS idx_memories_valid_until ON memories (valid_until)
+    WHERE valid_until IS NOT NULL;
+-- Promotion candidate scan; identity memories (level 4) are never promoted
+CREATE INDEX IF NOT EXISTS idx_memories_promotion ON memories (user_id, temporal_level, created_at)
+    INCLUDE (retrieval_count)
+    WHERE temporal_level < 4;
 
 -- Vector index (using ivfflat for pgvector)
 CREATE INDEX IF NOT EXISTS idx_memories_embedding ON memories
     USING ivfflat (embedding vector_cosine_ops)
     WITH (lists = 100);
 
+-- Expired memories moved out of the hot table by the gardener
+CREATE TABLE IF NOT EXISTS memories_archive (
+    memory_id UUID PRIMARY KEY,
+    user_id UUID NOT NULL,
+    content TEXT NOT NULL,
+    content_type VARCHAR(50) NOT NULL,
+    embedding VECTOR(1536),  -- NULL when dropped on archiving
+    temporal_level INT NOT NULL,
+    valid_from TIMESTAMPTZ NOT NULL,
+    valid_until TIMESTAMPTZ,
+    base_salience FLOAT,
+    outcome_adjustment FLOAT,
+    retrieval_count INT,
+    decision_count INT,
+    positive_outcomes INT,
+    negative_outcomes INT,
+    last_used_at TIMESTAMPTZ,
+    promoted_from_level INT,
+    promotion_timestamp TIMESTAMPTZ,
+    created_at TIMESTAMPTZ,
+    updated_at TIMESTAMPTZ,
+    archived_at TIMESTAMPTZ DEFAULT NOW()
+);
+
+CREATE INDEX IF NOT EXISTS idx_memories_archive_user ON memories_archive (user_id);
+
+-- Memories touched by events since they were last gardened
+CREATE TABLE IF NOT EXISTS gardener_dirty_memories (
+    memory_id UUID PRIMARY KEY,
+    marked_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    recheck_at TIMESTAMPTZ  -- Only too young to promote: when it will be old enough
+);
+
+CREATE INDEX IF NOT EXISTS idx_gardener_dirty_marked ON gardener_dirty_memories (marked_at);
+
 -- Decision traces table
 CREATE TABLE IF NOT EXISTS decision_traces (
     trace_id UUID PRIMARY KEY DEFAULT uuid_generate_v4(),
@@ -88,7 +160,7 @@ CREATE INDEX IF NOT EXISTS idx_traces_pending ON decision_traces (outcome_observ
 -- Salience adjustments log (for auditing)
 CREATE TABLE IF NOT EXISTS salience_adjustments (
     adjustment_id UUID PRIMARY KEY DEFAULT uuid_generate_v4(),
-    memory_id UUID NOT NULL REFERENCES memories(memory_id),
+    memory_id UUID NOT NULL,  -- No FK: the memory may be in memories_archive
     trace_id UUID NOT NULL REFERENCES decision_traces(trace_id),
     previous_adjustment FLOAT NOT NULL,
     new_adjustment FLOAT NOT NULL,
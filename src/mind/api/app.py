@@ -6,13 +6,21 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 import structlog
 
-from mind.config import get_settings
-from mind.api.routes import health, memories, decisions
+from mind.config import Settings, get_settings
+from mind.api.routes import health, memories, decisions, debug
 from mind.infrastructure.postgres.database import init_database, close_database
 from mind.infrastructure.nats.client import get_nats_client, close_nats_client
 from mind.infrastructure.embeddings.openai import close_embedder
+from mind.services.events import close_event_service, get_event_service
 from mind.observability.logging import configure_logging
 from mind.observability.metrics import MetricsMiddleware, metrics_endpoint
+from mind.observability.tracing import configure_tracing, instrument_fastapi, shutdown_tracing
+from mind.observability.tasks import (
+    TaskOwnerMiddleware,
+    close_loop_lag_monitor,
+    get_loop_lag_monitor,
+    install_task_tracking,
+)
 
 logger = structlog.get_logger()
 
@@ -40,19 +48,38 @@ async def lifespan(app: FastAPI):
         logger.warning("nats_connection_failed", error=str(e))
         # Continue without NATS - it's optional for basic API
 
+    # Start background event dispatch and retrieval summaries
+    get_event_service().start()
+
+    if _debug_endpoints_enabled(get_settings()):
+        install_task_tracking()
+        get_loop_lag_monitor().start()
+
     yield
 
     # Cleanup
     logger.info("app_stopping")
+    await close_loop_lag_monitor()
+    await close_event_service()  # Flush queued events while NATS is still up
     await close_embedder()
     await close_database()
     await close_nats_client()
+    shutdown_tracing()
     logger.info("app_stopped")
 
 
+def _debug_endpoints_enabled(settings: Settings) -> bool:
+    """Whether to mount the debug endpoints: enabled, and a token to guard them."""
+    return settings.debug_endpoints_enabled and settings.debug_endpoints_token is not None
+
+
 def create_app() -> FastAPI:
     """Create and configure the FastAPI application."""
     settings = get_settings()
+    debug_enabled = _debug_endpoints_enabled(settings)
+    if settings.debug_endpoints_enabled and not debug_enabled:
+        # Profiles and stacks expose internals; never serve them unauthenticated
+        logger.error("debug_endpoints_disabled_no_token")
 
     app = FastAPI(
         title="Mind v5 API",
@@ -64,7 +91,12 @@ def create_app() -> FastAPI:
     )
 
     # Middleware (order matters - first added = last executed)
-    app.add_middleware(MetricsMiddleware)
+    if debug_enabled:
+        app.add_middleware(TaskOwnerMiddleware)
+        # Profiles run for seconds; keep them out of the request metrics
+        app.add_middleware(MetricsMiddleware, skip_paths=("/metrics", "/debug/profile"))
+    else:
+        app.add_middleware(MetricsMiddleware)
 
     app.add_middleware(
         CORSMiddleware,
@@ -78,10 +110,16 @@ def create_app() -> FastAPI:
     app.include_router(health.router, tags=["health"])
     app.include_router(memories.router, prefix="/v1/memories", tags=["memories"])
     app.include_router(decisions.router, prefix="/v1/decisions", tags=["decisions"])
+    if debug_enabled:
+        app.include_router(debug.router, prefix="/debug", include_in_schema=False)
 
     # Metrics endpoint
     app.add_api_route("/metrics", metrics_endpoint, include_in_schema=False)
 
+    # Request spans, exported when an OTLP endpoint is configured
+    configure_tracing()
+    instrument_fastapi(app)
+
     return app
 
 
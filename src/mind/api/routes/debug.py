@@ -0,0 +1,125 @@
+"""Debug endpoints for diagnosing a live API process.
+
+Only mounted when `debug_endpoints_enabled` is set and a
+`debug_endpoints_token` is configured; requests must send the token as
+a bearer token.
+"""
+
+import hmac
+from typing import Literal
+
+import structlog
+from fastapi import APIRouter, Depends, Header, HTTPException, Query
+from fastapi.responses import PlainTextResponse
+from pydantic import BaseModel
+
+from mind.config import get_settings
+from mind.observability.profiling import profile_lock, profile_process
+from mind.observability.tasks import get_loop_lag_monitor, probe_loop_lag, task_snapshot
+
+logger = structlog.get_logger()
+
+
+async def require_debug_access(authorization: str | None = Header(default=None)) -> None:
+    """Check the bearer token; without a configured token nothing is allowed."""
+    token = get_settings().debug_endpoints_token
+    if token is None:
+        raise HTTPException(status_code=403, detail="Debug endpoints need a token")
+    expected = f"Bearer {token.get_secret_value()}"
+    if authorization is None or not hmac.compare_digest(authorization, expected):
+        raise HTTPException(status_code=401, detail="Invalid debug token")
+
+
+router = APIRouter(dependencies=[Depends(require_debug_access)])
+
+
+class ProfileResponse(BaseModel):
+    """Sampling profile of the process."""
+
+    duration_seconds: float
+    interval_seconds: float
+    samples: int
+    stacks: dict[str, int]  # Collapsed stack -> samples
+
+
+class TaskResponse(BaseModel):
+    """A pending asyncio task."""
+
+    name: str
+    coroutine: str
+    age_seconds: float | None  # None if created before tracking started
+    route: str | None  # Owning request, if any
+    stack: list[str]  # Innermost frame last
+
+
+class LoopLag(BaseModel):
+    """Event-loop lag in milliseconds."""
+
+    now_ms: float  # Callback delay measured for this request
+    window_seconds: float
+    last_ms: float | None
+    mean_ms: float | None
+    max_ms: float | None
+
+
+class TasksResponse(BaseModel):
+    """Pending asyncio tasks and event-loop lag."""
+
+    loop_lag: LoopLag
+    task_count: int
+    tasks: list[TaskResponse]
+
+
+@router.get("/profile", response_model=None)
+async def profile(
+    seconds: float = Query(default=10.0, gt=0),
+    all_threads: bool = Query(default=False, description="Sample every thread, not the loop's"),
+    format: Literal["collapsed", "json"] = Query(default="collapsed"),
+) -> PlainTextResponse | ProfileResponse:
+    """Profile the process with a sampling profiler.
+
+    Returns collapsed stacks ("frame;frame;frame count" lines), ready for
+    flamegraph.pl or speedscope, or the same counts as JSON.
+    """
+    settings = get_settings()
+    if seconds > settings.debug_profile_max_seconds:
+        raise HTTPException(
+            status_code=400,
+            detail=f"seconds must be at most {settings.debug_profile_max_seconds}",
+        )
+    if profile_lock.locked():
+        raise HTTPException(status_code=409, detail="A profile is already running")
+
+    async with profile_lock:
+        logger.info("debug_profile_started", seconds=seconds, all_threads=all_threads)
+        result = await profile_process(
+            seconds, interval=settings.debug_profile_interval, all_threads=all_threads
+        )
+        logger.info("debug_profile_finished", samples=result.samples)
+
+    if format == "json":
+        return ProfileResponse(
+            duration_seconds=round(result.duration, 3),
+            interval_seconds=result.interval,
+            samples=result.samples,
+            stacks=dict(result.stacks.most_common()),
+        )
+    return PlainTextResponse(result.collapsed())
+
+
+@router.get("/tasks", response_model=TasksResponse)
+async def tasks(
+    stack_limit: int = Query(default=20, ge=1, le=200),
+    route: str | None = Query(default=None, description="Only tasks whose route contains this"),
+) -> TasksResponse:
+    """Pending asyncio tasks, oldest first, with the event-loop lag."""
+    lag_now = await probe_loop_lag()
+    snapshot = task_snapshot(stack_limit=stack_limit)
+    if route is not None:
+        snapshot = [task for task in snapshot if route in (task["route"] or "")]
+
+    return TasksResponse(
+        loop_lag=LoopLag(now_ms=round(lag_now * 1000, 3), **get_loop_lag_monitor().stats()),
+        task_count=len(snapshot),
+        tasks=[TaskResponse(**task) for task in snapshot],
+    )
@@ -19,7 +19,7 @@ from mind.infrastructure.postgres.repositories import MemoryRepository
 from mind.infrastructure.embeddings.openai import get_embedder
 from mind.core.memory.models import Memory
 from mind.core.memory.retrieval import RetrievalRequest
-from mind.services.retrieval import RetrievalService
+from mind.services.retrieval import RetrievalService, retrieval_stage
 from mind.services.events import get_event_service
 from mind.observability.metrics import metrics
 
@@ -102,6 +102,7 @@ async def retrieve_memories(request: RetrieveRequest) -> RetrieveResponse:
         limit=request.limit,
         temporal_levels=request.temporal_levels,
         min_salience=request.min_salience,
+        include_expired=request.include_expired,
     )
 
     db = get_database()
@@ -135,18 +136,19 @@ async def retrieve_memories(request: RetrieveRequest) -> RetrieveResponse:
         )
 
         # Build response and event data while session is still active
-        response = RetrieveResponse(
-            retrieval_id=retrieval.retrieval_id,
-            memories=[
-                MemoryResponse.from_domain(sm.memory)
-                for sm in retrieval.memories
-            ],
-            scores={
-                str(sm.memory.memory_id): sm.final_score
-                for sm in retrieval.memories
-            },
-            latency_ms=retrieval.latency_ms,
-        )
+        with retrieval_stage("serialization"):
+            response = RetrieveResponse(
+                retrieval_id=retrieval.retrieval_id,
+                memories=[
+                    MemoryResponse.from_domain(sm.memory)
+                    for sm in retrieval.memories
+                ],
+                scores={
+                    str(sm.memory.memory_id): sm.final_score
+                    for sm in retrieval.memories
+                },
+                latency_ms=retrieval.latency_ms,
+            )
 
         # Capture event data for publishing after session closes
         event_data = {
@@ -162,13 +164,14 @@ async def retrieve_memories(request: RetrieveRequest) -> RetrieveResponse:
     # Publish retrieval event (fire-and-forget, outside session)
     try:
         event_service = get_event_service()
-        await event_service.publish_memory_retrieval(
-            user_id=request.user_id,
-            retrieval_id=event_data["retrieval_id"],
-            query=event_data["query"],
-            memories=event_data["memories"],
-            latency_ms=event_data["latency_ms"],
-        )
+        with retrieval_stage("publish"):
+            await event_service.publish_memory_retrieval(
+                user_id=request.user_id,
+                retrieval_id=event_data["retrieval_id"],
+                query=event_data["query"],
+                memories=event_data["memories"],
+                latency_ms=event_data["latency_ms"],
+            )
     except Exception as e:
         logger.warning("event_publish_failed", error=str(e), event_type="memory.retrieval")
 
@@ -81,6 +81,10 @@ class RetrieveRequest(BaseModel):
         le=1.0,
         description="Minimum effective salience",
     )
+    include_expired: bool = Field(
+        default=False,
+        description="Also search expired and archived memories",
+    )
 
 
 class RetrieveResponse(BaseModel):
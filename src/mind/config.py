@@ -49,6 +49,64 @@ class Settings(BaseSettings):
     nats_user: str | None = None
     nats_password: SecretStr | None = None
 
+    # Event publishing
+    event_codec: Literal["json", "msgpack"] = "json"  # Consumers accept both
+    event_publish_mode: Literal["serial", "pipelined"] = "serial"
+    event_publish_max_pending: int = 4000  # In-flight window for pipelined mode
+    event_publish_ack_timeout: float = 5.0  # Seconds to wait for a JetStream ack
+    event_publish_max_retries: int = 3  # Re-sends with the same Nats-Msg-Id
+
+    # memory.retrieval events: publish all, a sample, or per-user window summaries.
+    # Unpublished retrievals are held briefly and published in full if a
+    # decision trace later cites their memories.
+    event_retrieval_mode: Literal["full", "sampled", "windowed"] = "full"
+    event_retrieval_sample_rate: float = 0.1
+    event_retrieval_window_seconds: float = 60.0
+    event_retrieval_hold_seconds: float = 300.0
+    event_retrieval_hold_per_user: int = 32
+
+    # Background event dispatch
+    event_dispatch_background: bool = True  # Queue events instead of publishing inline
+    event_queue_size: int = 10_000
+    event_queue_batch_size: int = 100
+    event_queue_overflow: Literal["drop", "block", "spill"] = "drop"
+    event_queue_spill_path: str = "mind-events.spill.jsonl"
+
+    # Event consumers
+    event_consumer_lanes: int = 8  # Parallel lanes; ordering is kept per key
+    event_consumer_min_batch: int = 10
+    event_consumer_max_batch: int = 500
+    event_consumer_max_deliver: int = 5  # Attempts before a message is dead-lettered
+    event_consumer_retry_base: float = 1.0  # Seconds before the first retry
+    event_consumer_retry_max: float = 300.0  # Cap on the retry delay
+    event_consumer_handler_timeout: float = 30.0  # Seconds before a handler counts as failed
+
+    # Event log projector (NATS -> Postgres events table)
+    projector_batch_size: int = 500  # Messages per fetch and multi-row insert
+    projector_concurrency: int = 4  # Partitions writing to Postgres at once
+    projector_fetch_timeout: float = 1.0  # Seconds to wait for a batch to fill
+
+    # Aggregate snapshots
+    snapshot_event_threshold: int = 100  # Events since the last snapshot before a new one
+    snapshot_interval: float = 60.0  # Seconds between snapshotter runs
+    snapshot_batch_size: int = 500  # Aggregates snapshotted per transaction
+
+    # Event replay
+    replay_lanes: int = 16  # Parallel lanes; ordering is kept per user
+    replay_batch_size: int = 1000  # Messages per fetch
+    replay_flush_every: int = 50_000  # Events between sink flushes
+
+    # Salience decay of unused memories, applied at read time. Opt-in: with
+    # decay on, salience ranking is a per-user sort instead of an index scan
+    memory_decay_curve: Literal["none", "exponential", "linear", "power_law"] = "none"
+    memory_decay_half_life_hours: float = 720.0  # Hours without use to halve salience
+    memory_decay_min_factor: float = 0.1  # Decay keeps at least this fraction of salience
+
+    # Circuit breakers for external dependencies
+    circuit_breaker_failure_threshold: int = 5  # Consecutive failures before opening
+    circuit_breaker_recovery_timeout: float = 30.0  # Seconds before a probe is allowed
+    circuit_breaker_jitter: float = 0.2  # +/- fraction applied to the probe interval
+
     # Qdrant (optional, pgvector is default)
     qdrant_url: str | None = None
     qdrant_api_key: SecretStr | None = None
@@ -62,12 +120,41 @@ class Settings(BaseSettings):
     temporal_host: str = "localhost"
     temporal_port: int = 7233
     temporal_namespace: str = "default"
+    gardener_task_queue: str = "gardener"  # Queue this gardener worker polls
+    gardener_max_concurrent_workflow_tasks: int = 100
+    gardener_max_concurrent_activities: int = 100  # Light (event publishing) activities
+    gardener_db_max_concurrent_activities: int = 10  # DB-heavy activities, per worker
+    gardener_db_activities_per_second: float | None = None  # Per worker
+    gardener_db_task_queue_activities_per_second: float | None = None  # Across all workers
+    gardener_metrics_port: int | None = None  # Serve worker metrics on this port
+    gardener_dirty_batch_size: int = 500  # Events per fetch of the dirty-memory tracker
+    gardener_dirty_fetch_timeout: float = 1.0  # Seconds to wait for a tracker batch to fill
+
+    # Local gardener (asyncio scheduler, no Temporal)
+    gardener_local_promotion_interval: float = 3600.0  # Seconds between promotion passes
+    gardener_local_expiration_interval: float = 900.0  # Seconds between expiration passes
+    gardener_local_concurrency: int = 4  # Users promoted at once
+    gardener_local_page_size: int = 500  # Users per page (and checkpoint)
+
+    # Slow queries
+    db_slow_query_ms: float | None = 200.0  # Log statements slower than this (None: off)
+    db_slow_query_explain_sample_rate: float = 0.1  # Slow retrieval SELECTs to EXPLAIN
+    db_slow_query_explain_interval: float = 60.0  # Minimum seconds between captured plans
 
     # Observability
-    otel_exporter_otlp_endpoint: str | None = None
+    otel_exporter_otlp_endpoint: str | None = None  # Traces are exported when set
+    otel_service_name: str = "mind-api"
+    otel_traces_sample_ratio: float = 1.0  # Fraction of new traces recorded
     log_level: str = "INFO"
     log_format: Literal["json", "console"] = "console"
 
+    # Debug endpoints (/debug/profile, /debug/tasks) for diagnosing a live API process
+    debug_endpoints_enabled: bool = False  # Admin flag; the routes do not exist otherwise
+    debug_endpoints_token: SecretStr | None = None  # Bearer token; not mounted without one
+    debug_profile_max_seconds: float = 60.0  # Longest profile a request may ask for
+    debug_profile_interval: float = 0.005  # Seconds between stack samples
+    debug_loop_lag_interval: float = 0.5  # Seconds between event-loop lag probes
+
 
 @lru_cache
 def get_settings() -> Settings:
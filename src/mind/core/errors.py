@@ -28,12 +28,14 @@ class ErrorCode(Enum):
     EVENT_INVALID_TYPE = "EVENT_INVALID_TYPE"
     EVENT_PUBLISH_FAILED = "EVENT_PUBLISH_FAILED"
     EVENT_REPLAY_FAILED = "EVENT_REPLAY_FAILED"
+    EVENT_NOT_FOUND = "EVENT_NOT_FOUND"
 
     # Infrastructure errors (4xxx)
     DATABASE_ERROR = "DATABASE_ERROR"
     DATABASE_CONNECTION_FAILED = "DATABASE_CONNECTION_FAILED"
     NATS_CONNECTION_FAILED = "NATS_CONNECTION_FAILED"
     VECTOR_SEARCH_FAILED = "VECTOR_SEARCH_FAILED"
+    CIRCUIT_OPEN = "CIRCUIT_OPEN"
 
     # Validation errors (5xxx)
     VALIDATION_ERROR = "VALIDATION_ERROR"
@@ -1,10 +1,14 @@
 """Event definitions for Mind v5 event sourcing."""
 
 from mind.core.events.base import Event, EventEnvelope, EventType
+from mind.core.events.aggregate import AggregateState
 from mind.core.events.memory import (
+    MemoryConsolidated,
     MemoryCreated,
+    MemoryExpired,
     MemoryPromoted,
     MemoryRetrieval,
+    MemoryRetrievalSummarized,
     MemorySalienceAdjusted,
 )
 from mind.core.events.decision import (
@@ -16,9 +20,13 @@ __all__ = [
     "Event",
     "EventEnvelope",
     "EventType",
+    "AggregateState",
     "MemoryCreated",
+    "MemoryConsolidated",
+    "MemoryExpired",
     "MemoryPromoted",
     "MemoryRetrieval",
+    "MemoryRetrievalSummarized",
     "MemorySalienceAdjusted",
     "DecisionTracked",
     "OutcomeObserved",
@@ -0,0 +1,78 @@
+"""Aggregate state folded from events.
+
+An aggregate's state is rebuilt by applying its events in log order.
+A snapshot stores the folded state together with the log position of
+the last event it includes, so a read only has to apply the events
+after that position.
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Callable
+from uuid import UUID
+
+from mind.core.events.base import EventType
+
+Reducer = Callable[[dict[str, Any], dict[str, Any]], None]
+
+
+def _memory_created(state: dict[str, Any], payload: dict[str, Any]) -> None:
+    state.update(
+        memory_id=payload["memory_id"],
+        content_type=payload["content_type"],
+        temporal_level=payload["temporal_level"],
+        base_salience=payload.get("base_salience", 1.0),
+        valid_from=payload["valid_from"],
+        outcome_adjustment=0.0,
+    )
+
+
+def _memory_promoted(state: dict[str, Any], payload: dict[str, Any]) -> None:
+    state["promoted_from_level"] = payload["from_level"]
+    state["temporal_level"] = payload["to_level"]
+
+
+def _memory_salience_adjusted(state: dict[str, Any], payload: dict[str, Any]) -> None:
+    state["outcome_adjustment"] = payload["new_adjustment"]
+    state["adjustment_count"] = state.get("adjustment_count", 0) + 1
+
+
+def _memory_expired(state: dict[str, Any], payload: dict[str, Any]) -> None:
+    state["expired"] = True
+
+
+def _memory_consolidated(state: dict[str, Any], payload: dict[str, Any]) -> None:
+    state["merged_count"] = state.get("merged_count", 0) + len(payload["merged_ids"])
+
+
+# Event types without a reducer still advance the aggregate version
+REDUCERS: dict[EventType, Reducer] = {
+    EventType.MEMORY_CREATED: _memory_created,
+    EventType.MEMORY_PROMOTED: _memory_promoted,
+    EventType.MEMORY_SALIENCE_ADJUSTED: _memory_salience_adjusted,
+    EventType.MEMORY_EXPIRED: _memory_expired,
+    EventType.MEMORY_CONSOLIDATED: _memory_consolidated,
+}
+
+
+@dataclass
+class AggregateState:
+    """Folded state of one aggregate."""
+
+    aggregate_id: UUID
+    version: int = 0  # Number of events applied
+    state: dict[str, Any] = field(default_factory=dict)
+
+    position: int = 0  # Log position of the last applied event
+
+    def apply(
+        self,
+        position: int,
+        event_type: EventType | str,
+        payload: dict[str, Any],
+    ) -> None:
+        """Apply the next event of the aggregate."""
+        reducer = REDUCERS.get(EventType(event_type))
+        if reducer is not None:
+            reducer(self.state, payload)
+        self.version += 1
+        self.position = position
@@ -19,8 +19,10 @@ class EventType(str, Enum):
     MEMORY_CREATED = "memory.created"
     MEMORY_PROMOTED = "memory.promoted"
     MEMORY_RETRIEVAL = "memory.retrieval"
+    MEMORY_RETRIEVAL_SUMMARIZED = "memory.retrieval_summarized"
     MEMORY_SALIENCE_ADJUSTED = "memory.salience_adjusted"
     MEMORY_EXPIRED = "memory.expired"
+    MEMORY_CONSOLIDATED = "memory.consolidated"
 
     # Decision events
     DECISION_TRACKED = "decision.tracked"
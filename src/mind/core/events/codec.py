@@ -0,0 +1,211 @@
+"""Wire codecs for event envelopes.
+
+Two formats coexist, selected by the message Content-Type header:
+
+- application/json: orjson straight from the envelope fields. orjson
+  serializes UUIDs, datetimes and enums natively, so there is no
+  intermediate model_dump(mode="json") pass.
+- application/x-msgpack: a positional array with UUIDs packed as
+  16-byte binaries and timestamps as integer microseconds. The payload
+  is a nested orjson blob, so routing fields can be read without
+  decoding it and payload UUIDs/datetimes need no per-value hooks.
+
+Decoding hands raw values to pydantic's Rust validator in one call
+(model_validate_json for JSON, UUIDs straight from their 16 bytes for
+msgpack) rather than rebuilding each field in Python. The envelope's
+``version`` field selects the decoder for a msgpack layout, so new
+layouts can be added while old messages are still in the stream.
+
+Payload values decode to JSON-compatible types (UUIDs and datetimes as
+strings) with either codec, so handlers do not depend on the format.
+"""
+
+from dataclasses import dataclass, field
+from datetime import UTC, datetime, timedelta
+from typing import Any, Callable
+
+import msgpack
+import orjson
+
+from mind.core.events.base import EventEnvelope
+
+JSON_CONTENT_TYPE = "application/json"
+MSGPACK_CONTENT_TYPE = "application/x-msgpack"
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
+
+
+@dataclass(frozen=True, slots=True)
+class EnvelopeHeader:
+    """Routing fields of an envelope, decoded without the payload.
+
+    IDs are kept as their 128-bit integer value (``UUID.int``) rather
+    than UUID objects, which are comparatively expensive to build and
+    are not needed to pick a partition. Both codecs yield the same
+    integers, so a key maps to the same partition whatever its format.
+
+    The parsed message is kept in ``fields``, so decode_from_header can
+    build the envelope without parsing the bytes again.
+    """
+
+    version: int
+    event_type: str
+    user_key: int
+    aggregate_key: int
+    timestamp: datetime
+    fields: Any = field(repr=False, compare=False)
+
+
+def encode(envelope: EventEnvelope, content_type: str = JSON_CONTENT_TYPE) -> bytes:
+    """Encode an envelope for the given content type."""
+    if content_type == MSGPACK_CONTENT_TYPE:
+        return _encode_msgpack(envelope)
+    if content_type == JSON_CONTENT_TYPE:
+        return _encode_json(envelope)
+    raise ValueError(f"Unsupported event content type: {content_type}")
+
+
+def decode(data: bytes, content_type: str | None = None) -> EventEnvelope:
+    """Decode an envelope. A missing content type means JSON."""
+    if content_type == MSGPACK_CONTENT_TYPE:
+        return _decode_msgpack(data)
+    if content_type in (None, JSON_CONTENT_TYPE):
+        return _decode_json(data)
+    raise ValueError(f"Unsupported event content type: {content_type}")
+
+
+def decode_header(data: bytes, content_type: str | None = None) -> EnvelopeHeader:
+    """Decode only the routing fields of an envelope."""
+    if content_type == MSGPACK_CONTENT_TYPE:
+        fields = msgpack.unpackb(data, raw=False)
+        return _header_decoder(fields[0])(fields)
+    if content_type not in (None, JSON_CONTENT_TYPE):
+        raise ValueError(f"Unsupported event content type: {content_type}")
+    fields = orjson.loads(data)
+    return EnvelopeHeader(
+        version=fields["version"],
+        event_type=fields["event_type"],
+        user_key=_uuid_str_int(fields["user_id"]),
+        aggregate_key=_uuid_str_int(fields["aggregate_id"]),
+        timestamp=datetime.fromisoformat(fields["timestamp"]),
+        fields=fields,
+    )
+
+
+def decode_from_header(header: EnvelopeHeader) -> EventEnvelope:
+    """Decode the full envelope from the message decode_header parsed."""
+    if isinstance(header.fields, dict):
+        return EventEnvelope.model_validate(header.fields)
+    return _envelope_decoder(header.version)(header.fields)
+
+
+# JSON
+
+
+def _encode_json(envelope: EventEnvelope) -> bytes:
+    return orjson.dumps(
+        {
+            "event_id": envelope.event_id,
+            "event_type": envelope.event_type.value,
+            "user_id": envelope.user_id,
+            "aggregate_id": envelope.aggregate_id,
+            "payload": envelope.payload,
+            "correlation_id": envelope.correlation_id,
+            "causation_id": envelope.causation_id,
+            "timestamp": envelope.timestamp,
+            "version": envelope.version,
+        }
+    )
+
+
+def _decode_json(data: bytes) -> EventEnvelope:
+    return EventEnvelope.model_validate_json(data)
+
+
+def _uuid_str_int(value: str) -> int:
+    return int(value.replace("-", ""), 16)
+
+
+# msgpack
+
+
+def _to_micros(value: datetime) -> int:
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=UTC)
+    delta = value - _EPOCH
+    return (delta.days * 86_400 + delta.seconds) * 1_000_000 + delta.microseconds
+
+
+def _from_micros(micros: int) -> datetime:
+    return _EPOCH + timedelta(microseconds=micros)
+
+
+def _encode_msgpack(envelope: EventEnvelope) -> bytes:
+    # Layout v1: [version, event_type, event_id, user_id, aggregate_id,
+    #             correlation_id, causation_id, timestamp_us, payload]
+    return msgpack.packb(
+        [
+            envelope.version,
+            envelope.event_type.value,
+            envelope.event_id.bytes,
+            envelope.user_id.bytes,
+            envelope.aggregate_id.bytes,
+            envelope.correlation_id.bytes,
+            envelope.causation_id.bytes if envelope.causation_id else None,
+            _to_micros(envelope.timestamp),
+            orjson.dumps(envelope.payload),
+        ],
+        use_bin_type=True,
+    )
+
+
+def _decode_msgpack(data: bytes) -> EventEnvelope:
+    fields = msgpack.unpackb(data, raw=False)
+    return _envelope_decoder(fields[0])(fields)
+
+
+def _header_v1(fields: list) -> EnvelopeHeader:
+    return EnvelopeHeader(
+        version=fields[0],
+        event_type=fields[1],
+        user_key=int.from_bytes(fields[3]),
+        aggregate_key=int.from_bytes(fields[4]),
+        timestamp=_from_micros(fields[7]),
+        fields=fields,
+    )
+
+
+def _envelope_v1(fields: list) -> EventEnvelope:
+    # pydantic builds UUIDs from their 16 raw bytes
+    return EventEnvelope.model_validate(
+        {
+            "event_id": fields[2],
+            "event_type": fields[1],
+            "user_id": fields[3],
+            "aggregate_id": fields[4],
+            "payload": orjson.loads(fields[8]),
+            "correlation_id": fields[5],
+            "causation_id": fields[6],
+            "timestamp": _from_micros(fields[7]),
+            "version": fields[0],
+        }
+    )
+
+
+# Decoders by envelope schema version
+_HEADER_DECODERS: dict[int, Callable[[list], EnvelopeHeader]] = {1: _header_v1}
+_ENVELOPE_DECODERS: dict[int, Callable[[list], EventEnvelope]] = {1: _envelope_v1}
+
+
+def _header_decoder(version: int) -> Callable[[list], EnvelopeHeader]:
+    try:
+        return _HEADER_DECODERS[version]
+    except KeyError:
+        raise ValueError(f"Unsupported event envelope version: {version}") from None
+
+
+def _envelope_decoder(version: int) -> Callable[[list], EventEnvelope]:
+    try:
+        return _ENVELOPE_DECODERS[version]
+    except KeyError:
+        raise ValueError(f"Unsupported event envelope version: {version}") from None
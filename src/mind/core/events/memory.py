@@ -1,7 +1,7 @@
 """Memory-related events."""
 
 from datetime import datetime
-from uuid import UUID
+from uuid import UUID, uuid4
 
 from pydantic import BaseModel, Field
 
@@ -63,6 +63,10 @@ class MemoryRetrieval(Event):
     memories: list[RetrievedMemory]
     latency_ms: float
     trace_id: UUID | None = None  # Link to decision trace if applicable
+    sample_rate: float = 1.0  # Fraction of retrievals published; weight counts by 1/rate
+    # True if this retrieval is already counted by a memory.retrieval_summarized
+    # event or by the sampled events' weights; skip it when counting hits
+    already_counted: bool = False
 
     @property
     def event_type(self) -> EventType:
@@ -73,6 +77,25 @@ class MemoryRetrieval(Event):
         return self.retrieval_id
 
 
+class MemoryRetrievalSummarized(Event):
+    """A user's retrievals over a time window, aggregated."""
+
+    summary_id: UUID = Field(default_factory=uuid4)
+    window_start: datetime
+    window_end: datetime
+    retrieval_count: int
+    total_latency_ms: float
+    memory_hits: dict[str, int] = Field(default_factory=dict)  # memory_id -> times retrieved
+
+    @property
+    def event_type(self) -> EventType:
+        return EventType.MEMORY_RETRIEVAL_SUMMARIZED
+
+    @property
+    def aggregate_id(self) -> UUID:
+        return self.summary_id
+
+
 class MemorySalienceAdjusted(Event):
     """A memory's salience was adjusted based on outcome."""
 
@@ -90,3 +113,35 @@ class MemorySalienceAdjusted(Event):
     @property
     def aggregate_id(self) -> UUID:
         return self.memory_id
+
+
+class MemoryExpired(Event):
+    """A memory passed its valid_until and was archived."""
+
+    memory_id: UUID
+    valid_until: datetime
+    archived: bool = True  # Moved to memories_archive
+
+    @property
+    def event_type(self) -> EventType:
+        return EventType.MEMORY_EXPIRED
+
+    @property
+    def aggregate_id(self) -> UUID:
+        return self.memory_id
+
+
+class MemoryConsolidated(Event):
+    """Near-duplicate memories were merged into a canonical memory."""
+
+    memory_id: UUID  # Canonical memory that was kept
+    merged_ids: list[UUID]  # Memories merged into it, now expired
+    max_distance: float  # Cosine distance threshold used to find them
+
+    @property
+    def event_type(self) -> EventType:
+        return EventType.MEMORY_CONSOLIDATED
+
+    @property
+    def aggregate_id(self) -> UUID:
+        return self.memory_id
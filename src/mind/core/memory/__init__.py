@@ -1,5 +1,6 @@
 """Memory domain models and logic."""
 
+from mind.core.memory.decay import DecayCurve, DecayPolicy
 from mind.core.memory.models import Memory, TemporalLevel
 from mind.core.memory.retrieval import RetrievalResult, RetrievalRequest
 
@@ -8,4 +9,6 @@ __all__ = [
     "TemporalLevel",
     "RetrievalResult",
     "RetrievalRequest",
+    "DecayCurve",
+    "DecayPolicy",
 ]
@@ -0,0 +1,77 @@
+"""Salience decay of unused memories.
+
+Decay is computed at read time from the time since a memory was last
+used (its last_used_at, falling back to updated_at), so it never has
+to be written back: no periodic job rewrites salience, and a memory
+that is retrieved or gets an outcome is fresh again. The same curve is
+available as a Python function and as a SQL expression, so ranking can
+happen in the database.
+
+Decay is off unless MIND_MEMORY_DECAY_CURVE is set.
+"""
+
+import math
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from enum import Enum
+
+
+class DecayCurve(str, Enum):
+    """Shape of the decay over time."""
+
+    NONE = "none"  # No decay
+    EXPONENTIAL = "exponential"  # Halves every half-life
+    LINEAR = "linear"  # Loses half in one half-life, zero after two
+    POWER_LAW = "power_law"  # Halves after one half-life, long tail after
+
+
+@dataclass(frozen=True)
+class DecayPolicy:
+    """A decay curve and its parameters."""
+
+    curve: DecayCurve = DecayCurve.EXPONENTIAL
+    half_life_hours: float = 720.0
+    min_factor: float = 0.0  # Decay never removes more than 1 - min_factor
+
+    def factor(self, hours: float) -> float:
+        """Multiplier for salience after `hours` without use."""
+        if self.curve == DecayCurve.NONE or hours <= 0:
+            return 1.0
+
+        if self.curve == DecayCurve.EXPONENTIAL:
+            factor = math.pow(0.5, hours / self.half_life_hours)
+        elif self.curve == DecayCurve.LINEAR:
+            factor = max(0.0, 1.0 - hours / (2 * self.half_life_hours))
+        else:
+            factor = 1.0 / (1.0 + hours / self.half_life_hours)
+
+        return max(self.min_factor, factor)
+
+    def apply(self, salience: float, last_used: datetime, now: datetime | None = None) -> float:
+        """Decay a salience value by the time since `last_used`."""
+        now = now or datetime.now(UTC)
+        return salience * self.factor((now - last_used).total_seconds() / 3600)
+
+    def sql_factor(self, last_used: str, now: str = ":now") -> str:
+        """SQL expression for the decay factor.
+
+        Args:
+            last_used: SQL expression for the last-used timestamp
+            now: SQL expression for the current time
+
+        Returns:
+            A float8 SQL expression equal to factor() for that row
+        """
+        if self.curve == DecayCurve.NONE:
+            return "1.0"
+
+        hours = f"GREATEST(0.0, EXTRACT(EPOCH FROM ({now} - {last_used})) / 3600.0)"
+        half_life = float(self.half_life_hours)
+        if self.curve == DecayCurve.EXPONENTIAL:
+            factor = f"power(0.5, {hours} / {half_life})"
+        elif self.curve == DecayCurve.LINEAR:
+            factor = f"GREATEST(0.0, 1.0 - {hours} / {2 * half_life})"
+        else:
+            factor = f"1.0 / (1.0 + {hours} / {half_life})"
+
+        return f"GREATEST({float(self.min_factor)}, {factor})"
@@ -0,0 +1,179 @@
+"""Circuit breakers for external dependencies.
+
+A breaker counts consecutive failures of a dependency (NATS, the
+embedding API, Temporal, ...). Once the threshold is reached it opens
+and rejects calls immediately instead of letting every request wait
+on connect or HTTP timeouts. After a jittered recovery interval a
+single probe call is let through (half-open); its outcome closes the
+breaker or re-opens it for another interval.
+"""
+
+import asyncio
+import random
+import time
+from enum import Enum
+from typing import Awaitable, Callable, TypeVar
+
+import structlog
+
+from mind.config import get_settings
+from mind.core.errors import ErrorCode, MindError
+from mind.observability.metrics import metrics
+
+logger = structlog.get_logger()
+
+T = TypeVar("T")
+
+
+class CircuitState(str, Enum):
+    """Breaker states."""
+
+    CLOSED = "closed"  # Calls flow normally
+    HALF_OPEN = "half_open"  # One probe call allowed
+    OPEN = "open"  # Calls are rejected
+
+
+_STATE_VALUES = {
+    CircuitState.CLOSED: 0,
+    CircuitState.HALF_OPEN: 1,
+    CircuitState.OPEN: 2,
+}
+
+
+class CircuitBreaker:
+    """Failure-counting circuit breaker for one dependency."""
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int | None = None,
+        recovery_timeout: float | None = None,
+        jitter: float | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        settings = get_settings()
+        self.name = name
+        self._failure_threshold = failure_threshold or settings.circuit_breaker_failure_threshold
+        self._recovery_timeout = recovery_timeout or settings.circuit_breaker_recovery_timeout
+        self._jitter = jitter if jitter is not None else settings.circuit_breaker_jitter
+        self._clock = clock
+
+        self._state = CircuitState.CLOSED
+        self._failures = 0
+        self._next_probe_at = 0.0
+        self._probe_in_flight = False
+        metrics.circuit_breaker_state.labels(dependency=name).set(0)
+
+    @property
+    def state(self) -> CircuitState:
+        """Current state."""
+        return self._state
+
+    def allow_request(self) -> bool:
+        """Check whether a call may proceed.
+
+        In the open state this is a clock read and a comparison, so
+        rejected calls cost microseconds.
+        """
+        if self._state == CircuitState.CLOSED:
+            return True
+
+        if self._state == CircuitState.OPEN and self._clock() >= self._next_probe_at:
+            self._transition(CircuitState.HALF_OPEN)
+
+        if self._state == CircuitState.HALF_OPEN and not self._probe_in_flight:
+            self._probe_in_flight = True
+            return True
+
+        metrics.circuit_breaker_rejections_total.labels(dependency=self.name).inc()
+        return False
+
+    def record_success(self) -> None:
+        """Record a successful call."""
+        self._failures = 0
+        self._probe_in_flight = False
+        if self._state != CircuitState.CLOSED:
+            self._transition(CircuitState.CLOSED)
+
+    def record_failure(self) -> None:
+        """Record a failed call."""
+        self._failures += 1
+        self._probe_in_flight = False
+        if self._state == CircuitState.HALF_OPEN or (
+            self._state == CircuitState.CLOSED and self._failures >= self._failure_threshold
+        ):
+            self._open()
+
+    def release(self) -> None:
+        """Give back a permit without recording an outcome.
+
+        For calls let through by allow_request() that end without a
+        verdict on the dependency (e.g. cancelled), so a half-open
+        probe slot is not held forever.
+        """
+        self._probe_in_flight = False
+
+    def rejection(self) -> MindError:
+        """Error describing a short-circuited call."""
+        return MindError(
+            code=ErrorCode.CIRCUIT_OPEN,
+            message=f"{self.name} unavailable (circuit open)",
+            context={"dependency": self.name},
+        )
+
+    async def call(self, fn: Callable[..., Awaitable[T]], *args, **kwargs) -> T:
+        """Run a coroutine function through the breaker.
+
+        Raises:
+            MindError: With CIRCUIT_OPEN if the breaker rejects the call
+        """
+        if not self.allow_request():
+            raise self.rejection()
+
+        try:
+            result = await fn(*args, **kwargs)
+        except asyncio.CancelledError:
+            self.release()  # Not the dependency's fault
+            raise
+        except Exception:
+            self.record_failure()
+            raise
+
+        self.record_success()
+        return result
+
+    def _open(self) -> None:
+        """Open the breaker and schedule the next probe."""
+        spread = self._recovery_timeout * self._jitter
+        interval = self._recovery_timeout + random.uniform(-spread, spread)
+        self._next_probe_at = self._clock() + interval
+        self._transition(CircuitState.OPEN)
+
+    def _transition(self, state: CircuitState) -> None:
+        """Move to a new state and record it."""
+        previous = self._state
+        self._state = state
+        metrics.circuit_breaker_state.labels(dependency=self.name).set(_STATE_VALUES[state])
+        metrics.circuit_breaker_transitions_total.labels(
+            dependency=self.name, state=state.value
+        ).inc()
+        logger.info(
+            "circuit_breaker_transition",
+            dependency=self.name,
+            from_state=previous.value,
+            to_state=state.value,
+            failures=self._failures,
+        )
+
+
+# Shared breakers, one per dependency
+_breakers: dict[str, CircuitBreaker] = {}
+
+
+def get_circuit_breaker(name: str) -> CircuitBreaker:
+    """Get or create the breaker for a dependency."""
+    breaker = _breakers.get(name)
+    if breaker is None:
+        breaker = CircuitBreaker(name)
+        _breakers[name] = breaker
+    return breaker
@@ -1,5 +1,6 @@
 """OpenAI embedding generation."""
 
+import time
 from functools import lru_cache
 
 import httpx
@@ -7,6 +8,9 @@ import structlog
 
 from mind.config import get_settings
 from mind.core.errors import ErrorCode, MindError, Result
+from mind.infrastructure.circuit_breaker import get_circuit_breaker
+from mind.observability.metrics import metrics
+from mind.observability.tracing import tracer
 
 logger = structlog.get_logger()
 
@@ -29,6 +33,7 @@ class OpenAIEmbedder:
         self._model = model or settings.embedding_model
         self._dimensions = dimensions or settings.embedding_dimensions
         self._client: httpx.AsyncClient | None = None
+        self._breaker = get_circuit_breaker("embeddings")
 
     async def _get_client(self) -> httpx.AsyncClient:
         """Get or create HTTP client."""
@@ -86,22 +91,36 @@ class OpenAIEmbedder:
         if not texts:
             return Result.ok([])
 
+        # Fail fast while the embedding API is known to be down
+        if not self._breaker.allow_request():
+            return Result.err(self._breaker.rejection())
+
         log = logger.bind(
             model=self._model,
             text_count=len(texts),
         )
+        # Breaker outcome of this call; None (e.g. cancelled) gives the permit back
+        healthy: bool | None = None
 
         try:
             client = await self._get_client()
 
-            response = await client.post(
-                "/embeddings",
-                json={
-                    "input": texts,
-                    "model": self._model,
-                    "dimensions": self._dimensions,
-                },
-            )
+            start = time.perf_counter()
+            with tracer.start_as_current_span(
+                "embeddings.generate",
+                attributes={"model": self._model, "text_count": len(texts)},
+            ):
+                response = await client.post(
+                    "/embeddings",
+                    json={
+                        "input": texts,
+                        "model": self._model,
+                        "dimensions": self._dimensions,
+                    },
+                )
+            metrics.embedding_latency_seconds.observe(time.perf_counter() - start)
+
+            healthy = response.status_code < 500 and response.status_code != 429
 
             if response.status_code != 200:
                 log.error(
@@ -118,6 +137,7 @@ class OpenAIEmbedder:
 
             data = response.json()
             embeddings = [item["embedding"] for item in data["data"]]
+            metrics.embeddings_generated_total.inc(len(embeddings))
 
             log.debug(
                 "embeddings_generated",
@@ -128,6 +148,7 @@ class OpenAIEmbedder:
             return Result.ok(embeddings)
 
         except httpx.TimeoutException:
+            healthy = False
             log.error("embedding_timeout")
             return Result.err(
                 MindError(
@@ -136,6 +157,7 @@ class OpenAIEmbedder:
                 )
             )
         except Exception as e:
+            healthy = False  # Including a 200 with a malformed body
             log.error("embedding_error", error=str(e))
             return Result.err(
                 MindError(
@@ -143,6 +165,13 @@ class OpenAIEmbedder:
                     message=f"Embedding generation failed: {e}",
                 )
             )
+        finally:
+            if healthy is None:
+                self._breaker.release()
+            elif healthy:
+                self._breaker.record_success()
+            else:
+                self._breaker.record_failure()
 
     async def close(self) -> None:
         """Close HTTP client."""
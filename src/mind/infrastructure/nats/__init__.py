@@ -1,12 +1,18 @@
 """NATS JetStream infrastructure for event backbone."""
 
 from mind.infrastructure.nats.client import NatsClient, get_nats_client
-from mind.infrastructure.nats.publisher import EventPublisher
+from mind.infrastructure.nats.publisher import EventPublisher, PipelinedEventPublisher
 from mind.infrastructure.nats.consumer import EventConsumer
+from mind.infrastructure.nats.dispatcher import EventDispatcher
+from mind.infrastructure.nats.dlq import DeadLetter, DeadLetterQueue
 
 __all__ = [
     "NatsClient",
     "get_nats_client",
     "EventPublisher",
+    "PipelinedEventPublisher",
     "EventConsumer",
+    "EventDispatcher",
+    "DeadLetter",
+    "DeadLetterQueue",
 ]
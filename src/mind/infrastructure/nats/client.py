@@ -10,6 +10,7 @@ from nats.js.api import StreamConfig, ConsumerConfig, DeliverPolicy, AckPolicy
 import structlog
 
 from mind.config import get_settings
+from mind.infrastructure.circuit_breaker import get_circuit_breaker
 
 logger = structlog.get_logger()
 
@@ -21,6 +22,10 @@ class NatsClient:
     STREAM_NAME = "MIND_EVENTS"
     STREAM_SUBJECTS = ["mind.>"]  # All Mind events
 
+    # Dead letters: dlq.{consumer}.{original subject}
+    DLQ_STREAM_NAME = "MIND_DLQ"
+    DLQ_SUBJECT_PREFIX = "dlq"
+
     def __init__(self, url: str | None = None):
         settings = get_settings()
         self._url = url or settings.nats_url
@@ -49,8 +54,9 @@ class NatsClient:
             # Get JetStream context
             self._js = self._nc.jetstream()
 
-            # Ensure stream exists
+            # Ensure streams exist
             await self._ensure_stream()
+            await self._ensure_dlq_stream()
 
             self._connected = True
             log.info("nats_connected")
@@ -80,6 +86,23 @@ class NatsClient:
             await self._js.add_stream(config)
             logger.info("nats_stream_created", stream=self.STREAM_NAME)
 
+    async def _ensure_dlq_stream(self) -> None:
+        """Ensure the dead-letter stream exists."""
+        try:
+            await self._js.stream_info(self.DLQ_STREAM_NAME)
+        except nats.js.errors.NotFoundError:
+            config = StreamConfig(
+                name=self.DLQ_STREAM_NAME,
+                subjects=[f"{self.DLQ_SUBJECT_PREFIX}.>"],
+                retention="limits",
+                max_msgs=1_000_000,
+                max_age=60 * 60 * 24 * 30,  # 30 days
+                storage="file",
+                num_replicas=1,
+            )
+            await self._js.add_stream(config)
+            logger.info("nats_stream_created", stream=self.DLQ_STREAM_NAME)
+
     async def close(self) -> None:
         """Close NATS connection."""
         if self._nc and self._connected:
@@ -117,11 +140,17 @@ _nats_client: NatsClient | None = None
 
 
 async def get_nats_client() -> NatsClient:
-    """Get or create NATS client instance."""
+    """Get or create NATS client instance.
+
+    Connection attempts go through the "nats" circuit breaker, so while
+    NATS is down callers fail fast with a CIRCUIT_OPEN MindError instead
+    of each waiting on a fresh connect.
+    """
     global _nats_client
     if _nats_client is None:
-        _nats_client = NatsClient()
-        await _nats_client.connect()
+        client = NatsClient()
+        await get_circuit_breaker("nats").call(client.connect)
+        _nats_client = client
     return _nats_client
 
 
@@ -1,32 +1,85 @@
 """Event consumption from NATS JetStream."""
 
 import asyncio
-from typing import Callable, Awaitable
-from uuid import UUID
+import random
+import time
+from datetime import UTC, datetime
+from typing import Any, Callable, Awaitable, Literal
 
-import orjson
 import structlog
 from nats.js.api import ConsumerConfig, DeliverPolicy, AckPolicy
 
+from mind.config import get_settings
+from mind.core.events import codec
 from mind.core.events.base import EventEnvelope, EventType
 from mind.infrastructure.nats.client import NatsClient
+from mind.infrastructure.nats.dlq import DeadLetterQueue
+from mind.observability.metrics import metrics
 
 logger = structlog.get_logger()
 
 # Type alias for event handlers
 EventHandler = Callable[[EventEnvelope], Awaitable[None]]
 
+PartitionKey = Literal["aggregate_id", "user_id"]
+
 
 class EventConsumer:
-    """Consumes events from NATS JetStream."""
+    """Consumes events from NATS JetStream.
+
+    Fetched messages are partitioned by aggregate_id (or user_id) into
+    worker lanes. Each lane handles its messages in order, so events
+    for the same key are never processed concurrently or out of order,
+    while different keys proceed in parallel. The fetch batch grows
+    while the stream has a backlog and shrinks when it is idle.
+
+    A message whose handler fails or times out is retried in its lane
+    with exponential backoff, so later messages for the same key wait
+    for it (as do other keys sharing the lane). After max_deliver
+    attempts, or straight away if it cannot be decoded, it is moved to
+    the MIND_DLQ stream. A retry reruns every handler for the message,
+    so handlers must be idempotent.
 
-    def __init__(self, client: NatsClient, consumer_name: str):
+    Time a message spends queued behind its lane is not bounded by the
+    handler timeout, so unacked messages get periodic in-progress acks
+    to keep JetStream from redelivering them while they wait.
+    """
+
+    def __init__(
+        self,
+        client: NatsClient,
+        consumer_name: str,
+        lanes: int | None = None,
+        partition_key: PartitionKey = "aggregate_id",
+        min_batch: int | None = None,
+        max_batch: int | None = None,
+    ):
+        settings = get_settings()
         self._client = client
         self._consumer_name = consumer_name
         self._handlers: dict[EventType, list[EventHandler]] = {}
         self._running = False
         self._subscription = None
 
+        self._lane_count = max(1, lanes or settings.event_consumer_lanes)
+        self._partition_key = partition_key
+        self._min_batch = min_batch or settings.event_consumer_min_batch
+        self._max_batch = max(self._min_batch, max_batch or settings.event_consumer_max_batch)
+        self._batch_size = self._min_batch
+
+        self._max_deliver = settings.event_consumer_max_deliver
+        self._retry_base = settings.event_consumer_retry_base
+        self._retry_max = settings.event_consumer_retry_max
+        self._handler_timeout = settings.event_consumer_handler_timeout
+        self._ack_wait = max(30, int(self._handler_timeout * 2))
+        self._dlq = DeadLetterQueue(client)
+
+        self._lanes: list[asyncio.Queue] = []
+        self._tasks: list[asyncio.Task] = []
+        self._acks: set[asyncio.Task] = set()
+        # Routed, not yet handled messages by id(msg): (msg, last ack-timer reset)
+        self._outstanding: dict[int, tuple[Any, float]] = {}
+
     def on(self, event_type: EventType, handler: EventHandler) -> None:
         """Register a handler for an event type.
 
@@ -67,8 +120,11 @@ class EventConsumer:
                 durable_name=self._consumer_name,
                 deliver_policy=deliver_policy,
                 ack_policy=AckPolicy.EXPLICIT,
-                max_deliver=3,  # Retry up to 3 times
-                ack_wait=30,  # 30 seconds to ack
+                # Unlimited on the server: the consumer enforces its own
+                # limit so a failed DLQ publish never drops a message
+                max_deliver=-1,
+                ack_wait=self._ack_wait,
+                max_ack_pending=self._max_batch * self._lane_count,
             )
 
             # Subscribe with pull-based consumer for better control
@@ -79,85 +135,285 @@ class EventConsumer:
             )
 
             self._running = True
-            log.info("consumer_started")
 
-            # Start processing loop
-            asyncio.create_task(self._process_loop())
+            # Bounded lanes give backpressure to the fetch loop
+            self._lanes = [
+                asyncio.Queue(maxsize=self._max_batch) for _ in range(self._lane_count)
+            ]
+            self._tasks = [
+                asyncio.create_task(self._lane_loop(i)) for i in range(self._lane_count)
+            ]
+            self._tasks.append(asyncio.create_task(self._process_loop()))
+            self._tasks.append(asyncio.create_task(self._heartbeat_loop()))
+
+            log.info("consumer_started", lanes=self._lane_count)
 
         except Exception as e:
             log.error("consumer_start_failed", error=str(e))
             raise
 
-    async def stop(self) -> None:
-        """Stop consuming events."""
+    async def stop(self, timeout: float = 10.0) -> None:
+        """Stop consuming events.
+
+        Messages already routed to lanes are handled before the lanes
+        are shut down, up to the timeout.
+        """
         self._running = False
+
+        if self._lanes:
+            try:
+                await asyncio.wait_for(
+                    asyncio.gather(*(lane.join() for lane in self._lanes)),
+                    timeout=timeout,
+                )
+            except asyncio.TimeoutError:
+                logger.warning("consumer_drain_timeout", consumer=self._consumer_name)
+
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+        if self._acks:
+            await asyncio.gather(*self._acks, return_exceptions=True)
+
         if self._subscription:
             await self._subscription.unsubscribe()
             self._subscription = None
         logger.info("consumer_stopped", consumer=self._consumer_name)
 
     async def _process_loop(self) -> None:
-        """Main processing loop."""
+        """Main fetch loop: pull batches and route them to lanes."""
         log = logger.bind(consumer=self._consumer_name)
 
         while self._running:
             try:
-                # Fetch batch of messages
-                messages = await self._subscription.fetch(batch=10, timeout=5)
-
-                for msg in messages:
-                    await self._handle_message(msg)
-
+                messages = await self._subscription.fetch(batch=self._batch_size, timeout=5)
             except asyncio.TimeoutError:
-                # No messages, continue
+                # No messages, shrink towards the minimum batch
+                self._resize_batch(0)
                 continue
             except Exception as e:
                 log.error("process_loop_error", error=str(e))
                 await asyncio.sleep(1)  # Back off on error
+                continue
 
-    async def _handle_message(self, msg) -> None:
-        """Handle a single message."""
-        log = logger.bind(consumer=self._consumer_name, subject=msg.subject)
+            self._resize_batch(len(messages))
+            if messages:
+                try:
+                    metrics.consumer_pending.labels(consumer=self._consumer_name).set(
+                        messages[-1].metadata.num_pending
+                    )
+                except Exception:
+                    pass  # Not a JetStream message (e.g. in tests)
+
+            for msg in messages:
+                await self._route(msg)
 
+    def _resize_batch(self, received: int) -> None:
+        """Adapt the fetch batch size to the observed backlog."""
+        if received >= self._batch_size:
+            self._batch_size = min(self._max_batch, self._batch_size * 2)
+        elif received < self._batch_size // 2:
+            self._batch_size = max(self._min_batch, self._batch_size // 2)
+        metrics.consumer_fetch_batch_size.labels(consumer=self._consumer_name).set(
+            self._batch_size
+        )
+
+    async def _route(self, msg) -> None:
+        """Queue a message on the lane for its key.
+
+        Only the routing header is decoded here; the lane that handles
+        the message builds the envelope from the already parsed fields.
+        """
         try:
-            # Parse envelope
-            data = orjson.loads(msg.data)
-            envelope = EventEnvelope(
-                event_id=UUID(data["event_id"]),
-                event_type=EventType(data["event_type"]),
-                user_id=UUID(data["user_id"]),
-                aggregate_id=UUID(data["aggregate_id"]),
-                payload=data["payload"],
-                correlation_id=UUID(data["correlation_id"]),
-                causation_id=UUID(data["causation_id"]) if data.get("causation_id") else None,
-                timestamp=data["timestamp"],
-                version=data["version"],
+            header = codec.decode_header(msg.data, self._content_type(msg))
+        except Exception as e:
+            logger.error(
+                "message_parse_failed",
+                consumer=self._consumer_name,
+                subject=msg.subject,
+                error=str(e),
             )
+            # Decoding will never succeed; don't burn retries on it
+            self._ack_async(self._dead_letter(msg, "decode", str(e)))
+            return
+
+        key = header.user_key if self._partition_key == "user_id" else header.aggregate_key
+        lane = key % self._lane_count
+        self._outstanding[id(msg)] = (msg, time.monotonic())
+        await self._lanes[lane].put((msg, header))
+        metrics.consumer_lane_depth.labels(
+            consumer=self._consumer_name, lane=str(lane)
+        ).set(self._lanes[lane].qsize())
+
+    async def _lane_loop(self, lane: int) -> None:
+        """Handle one lane's messages strictly in order."""
+        queue = self._lanes[lane]
+        lane_label = str(lane)
 
-            log = log.bind(
-                event_id=str(envelope.event_id),
-                event_type=envelope.event_type.value,
+        while True:
+            msg, header = await queue.get()
+            try:
+                await self._handle_message(msg, header)
+                lag = (datetime.now(UTC) - header.timestamp).total_seconds()
+                metrics.consumer_lag_seconds.labels(
+                    consumer=self._consumer_name, lane=lane_label
+                ).set(lag)
+            finally:
+                self._outstanding.pop(id(msg), None)
+                queue.task_done()
+                metrics.consumer_lane_depth.labels(
+                    consumer=self._consumer_name, lane=lane_label
+                ).set(queue.qsize())
+
+    async def _heartbeat_loop(self) -> None:
+        """Reset the ack timer of messages waiting in lanes.
+
+        Runs every third of ack_wait, so an outstanding message is
+        touched at most two thirds of ack_wait after its last reset.
+        """
+        interval = self._ack_wait / 3
+        while True:
+            await asyncio.sleep(interval)
+            self._touch_outstanding(time.monotonic() - interval)
+
+    def _touch_outstanding(self, before: float) -> None:
+        """Send in-progress acks for messages last reset before a time."""
+        now = time.monotonic()
+        for key, (msg, touched) in list(self._outstanding.items()):
+            if touched <= before:
+                self._outstanding[key] = (msg, now)
+                self._ack_async(msg.in_progress())
+
+    def _ack_async(self, ack: Awaitable[None]) -> None:
+        """Send an ack/nak without blocking the lane."""
+        task = asyncio.create_task(ack)
+        self._acks.add(task)
+        task.add_done_callback(self._acks.discard)
+
+    @staticmethod
+    def _content_type(msg) -> str | None:
+        """Codec of a message, from its Content-Type header."""
+        headers = getattr(msg, "headers", None)
+        return headers.get("Content-Type") if headers else None
+
+    async def _handle_message(self, msg, header: codec.EnvelopeHeader) -> None:
+        """Handle a single message."""
+        attempts = self._attempts(msg)
+        if attempts > self._max_deliver:
+            # Redelivered by ack timeout (e.g. the handler crashed the process)
+            self._ack_async(
+                self._dead_letter(msg, "redelivery", "Exceeded max deliveries", attempts)
             )
+            return
+
+        try:
+            envelope = codec.decode_from_header(header)
+        except Exception as e:
+            logger.error(
+                "message_handling_failed",
+                consumer=self._consumer_name,
+                subject=msg.subject,
+                error=str(e),
+            )
+            self._ack_async(self._dead_letter(msg, "decode", str(e)))
+            return
+
+        await self._handle_envelope(msg, envelope)
+
+    async def _handle_envelope(self, msg, envelope: EventEnvelope) -> None:
+        """Run the handlers for a parsed envelope and ack it.
+
+        Failures are retried here rather than nak'd: a redelivery would
+        let later messages with the same key overtake this one.
+        """
+        log = logger.bind(
+            consumer=self._consumer_name,
+            subject=msg.subject,
+            event_id=str(envelope.event_id),
+            event_type=envelope.event_type.value,
+        )
 
-            # Find handlers
-            handlers = self._handlers.get(envelope.event_type, [])
-            if not handlers:
-                log.debug("no_handlers")
-                await msg.ack()
+        # Find handlers
+        handlers = self._handlers.get(envelope.event_type, [])
+        if not handlers:
+            log.debug("no_handlers")
+            self._ack_async(msg.ack())
+            return
+
+        attempts = self._attempts(msg)
+        while True:
+            failure = await self._run_handlers(handlers, envelope, log)
+            if failure is None:
+                break
+            if attempts >= self._max_deliver:
+                self._ack_async(self._dead_letter(msg, *failure, attempts))
                 return
+            # Still outstanding, so the heartbeat keeps it from redelivery
+            metrics.events_redelivered_total.labels(consumer=self._consumer_name).inc()
+            await asyncio.sleep(self._retry_delay(attempts))
+            attempts += 1
+
+        self._ack_async(msg.ack())
+        metrics.events_consumed_total.labels(
+            event_type=envelope.event_type.value,
+            consumer=self._consumer_name,
+        ).inc()
+        log.debug("message_processed")
+
+    async def _run_handlers(
+        self, handlers: list[EventHandler], envelope: EventEnvelope, log
+    ) -> tuple[str, str] | None:
+        """Run handlers once.
 
-            # Execute handlers
+        Returns:
+            None on success, else the (reason, error) of the failure
+        """
+        try:
             for handler in handlers:
-                try:
-                    await handler(envelope)
-                except Exception as e:
-                    log.error("handler_error", error=str(e))
-                    # Continue with other handlers
+                await asyncio.wait_for(handler(envelope), timeout=self._handler_timeout)
+        except asyncio.TimeoutError:
+            log.error("handler_timeout", timeout=self._handler_timeout)
+            return "timeout", f"Handler exceeded {self._handler_timeout}s"
+        except Exception as e:
+            log.error("handler_error", error=str(e))
+            return "handler", str(e)
+        return None
 
-            await msg.ack()
-            log.debug("message_processed")
+    def _retry_delay(self, attempts: int) -> float:
+        """Exponential backoff with jitter for the given delivery attempt."""
+        delay = min(self._retry_max, self._retry_base * 2 ** (attempts - 1))
+        return delay * random.uniform(0.8, 1.2)
 
+    @staticmethod
+    def _attempts(msg) -> int:
+        """How many times this message has been delivered."""
+        metadata = getattr(msg, "metadata", None)
+        return getattr(metadata, "num_delivered", None) or 1
+
+    async def _dead_letter(
+        self, msg, reason: str, error: str, attempts: int | None = None
+    ) -> None:
+        """Move a message to MIND_DLQ and terminate it here.
+
+        If the DLQ publish fails, the message is redelivered later
+        instead of being lost.
+        """
+        attempts = attempts or self._attempts(msg)
+        try:
+            await self._dlq.send(msg, self._consumer_name, reason, error, attempts)
         except Exception as e:
-            log.error("message_handling_failed", error=str(e))
-            # NAK to retry
-            await msg.nak()
+            logger.error(
+                "dead_letter_failed",
+                consumer=self._consumer_name,
+                subject=msg.subject,
+                error=str(e),
+            )
+            await msg.nak(delay=self._retry_delay(attempts))
+            return
+
+        await msg.term()
+        metrics.events_dead_lettered_total.labels(
+            consumer=self._consumer_name, reason=reason
+        ).inc()
@@ -0,0 +1,245 @@
+"""Background event dispatch from an in-process queue.
+
+Request handlers enqueue envelopes and return immediately; a single
+background task drains the queue in batches and publishes them. This
+keeps NATS latency (or an outage) off the request path.
+"""
+
+import asyncio
+from pathlib import Path
+from typing import Awaitable, Callable, Literal
+
+import structlog
+
+from mind.config import get_settings
+from mind.core.events.base import EventEnvelope
+from mind.infrastructure.nats.publisher import EventPublisher, PipelinedEventPublisher
+from mind.observability.metrics import metrics
+
+logger = structlog.get_logger()
+
+OverflowPolicy = Literal["drop", "block", "spill"]
+PublisherFactory = Callable[[], Awaitable[EventPublisher]]
+
+
+class EventDispatcher:
+    """Bounded queue of envelopes drained by a background task.
+
+    Overflow policies when the queue is full:
+    - drop: discard the new event
+    - block: wait for space (applies backpressure to the caller)
+    - spill: append the event to a local file, replayed once the
+      queue has room again
+    """
+
+    def __init__(
+        self,
+        publisher_factory: PublisherFactory,
+        max_size: int | None = None,
+        batch_size: int | None = None,
+        overflow: OverflowPolicy | None = None,
+        spill_path: str | None = None,
+    ):
+        settings = get_settings()
+        self._publisher_factory = publisher_factory
+        self._max_size = max_size or settings.event_queue_size
+        self._batch_size = batch_size or settings.event_queue_batch_size
+        self._overflow = overflow or settings.event_queue_overflow
+        self._spill_path = Path(spill_path or settings.event_queue_spill_path)
+        self._queue: asyncio.Queue[EventEnvelope] = asyncio.Queue(maxsize=self._max_size)
+        self._task: asyncio.Task | None = None
+        self._publisher: EventPublisher | None = None
+
+    @property
+    def depth(self) -> int:
+        """Number of events waiting to be published."""
+        return self._queue.qsize()
+
+    def start(self) -> None:
+        """Start the background drain task (idempotent)."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._drain_loop())
+            logger.info(
+                "event_dispatcher_started",
+                max_size=self._max_size,
+                overflow=self._overflow,
+            )
+
+    async def enqueue(self, envelope: EventEnvelope) -> bool:
+        """Queue an envelope for publishing.
+
+        Returns:
+            False if the event was dropped, True otherwise
+        """
+        self.start()
+
+        if self._overflow == "block":
+            await self._queue.put(envelope)
+        else:
+            try:
+                self._queue.put_nowait(envelope)
+            except asyncio.QueueFull:
+                if self._overflow == "spill":
+                    self._spill([envelope])
+                    return True
+                metrics.event_queue_overflow_total.labels(action="dropped").inc()
+                logger.warning(
+                    "event_dropped",
+                    event_id=str(envelope.event_id),
+                    event_type=envelope.event_type.value,
+                    reason="queue_full",
+                )
+                return False
+
+        metrics.event_queue_depth.set(self._queue.qsize())
+        return True
+
+    async def close(self, timeout: float = 10.0) -> None:
+        """Flush queued events and stop the drain task."""
+        if self._task is None:
+            return
+
+        try:
+            await asyncio.wait_for(self._queue.join(), timeout=timeout)
+        except asyncio.TimeoutError:
+            logger.warning("event_dispatcher_flush_timeout", remaining=self._queue.qsize())
+
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+        if isinstance(self._publisher, PipelinedEventPublisher):
+            await self._publisher.flush(timeout=timeout)
+
+        logger.info("event_dispatcher_stopped")
+
+    async def _drain_loop(self) -> None:
+        """Publish queued envelopes in batches until cancelled."""
+        while True:
+            batch = [await self._queue.get()]
+            while len(batch) < self._batch_size:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except asyncio.QueueEmpty:
+                    break
+
+            try:
+                delivered = await self._dispatch(batch)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+                metrics.event_queue_depth.set(self._queue.qsize())
+
+            # Only replay spilled events once publishing works again
+            if delivered and self._overflow == "spill":
+                try:
+                    self._restore_spill()
+                except Exception as e:
+                    # The drain task must outlive a bad spill file
+                    logger.error("event_spill_restore_failed", error=str(e))
+
+    async def _dispatch(self, batch: list[EventEnvelope]) -> bool:
+        """Publish a batch, spilling or dropping what fails.
+
+        Returns:
+            True if every envelope in the batch was published
+        """
+        try:
+            if self._publisher is None:
+                self._publisher = await self._publisher_factory()
+            results = await self._publisher.publish_batch(batch)
+        except Exception as e:
+            logger.warning("event_batch_publish_failed", error=str(e), count=len(batch))
+            results = None
+
+        if results is None:
+            failed = batch
+        else:
+            failed = [env for env, result in zip(batch, results) if result.is_err]
+
+        if not failed:
+            return True
+
+        if self._overflow == "spill":
+            self._spill(failed)
+        else:
+            metrics.event_queue_overflow_total.labels(action="dropped").inc(len(failed))
+            logger.warning("event_publish_skipped", count=len(failed))
+        return False
+
+    def _spill(self, envelopes: list[EventEnvelope]) -> None:
+        """Append envelopes to the spill file."""
+        try:
+            with self._spill_path.open("a", encoding="utf-8") as f:
+                for envelope in envelopes:
+                    f.write(envelope.model_dump_json())
+                    f.write("\n")
+        except OSError as e:
+            metrics.event_queue_overflow_total.labels(action="dropped").inc(len(envelopes))
+            logger.error("event_spill_failed", error=str(e), count=len(envelopes))
+            return
+
+        metrics.event_queue_overflow_total.labels(action="spilled").inc(len(envelopes))
+
+    def _restore_spill(self) -> None:
+        """Move spilled envelopes back into the queue while it has room.
+
+        The spill file is renamed to a .restoring file before it is read,
+        so new spills go to a fresh file. Lines that cannot be parsed are
+        logged and skipped. The tail that did not fit in the queue is
+        written back to the spill file before the .restoring file is
+        deleted; if that fails, the .restoring file is read again on the
+        next pass (events already queued are then published twice and
+        deduplicated by their message ID).
+        """
+        if self._queue.full():
+            return
+
+        restoring = self._spill_path.with_name(self._spill_path.name + ".restoring")
+        try:
+            if not restoring.exists():
+                if not self._spill_path.exists():
+                    return
+                self._spill_path.rename(restoring)
+            lines = restoring.read_text(encoding="utf-8").splitlines()
+        except OSError as e:
+            logger.error("event_spill_restore_failed", error=str(e))
+            return
+
+        restored = 0
+        invalid = 0
+        remaining = []
+        for line in lines:
+            if not line:
+                continue
+            if remaining or self._queue.full():
+                remaining.append(line)
+                continue
+            try:
+                envelope = EventEnvelope.model_validate_json(line)
+            except ValueError as e:
+                invalid += 1
+                logger.warning("event_spill_line_invalid", error=str(e))
+                continue
+            self._queue.put_nowait(envelope)
+            restored += 1
+
+        try:
+            if remaining:
+                # Still no room: put the tail back for the next pass
+                with self._spill_path.open("a", encoding="utf-8") as f:
+                    f.write("\n".join(remaining))
+                    f.write("\n")
+            restoring.unlink()
+        except OSError as e:
+            logger.error("event_spill_restore_failed", error=str(e))
+
+        if invalid:
+            metrics.event_queue_overflow_total.labels(action="dropped").inc(invalid)
+        metrics.event_queue_depth.set(self._queue.qsize())
+        logger.info(
+            "event_spill_restored", count=restored, invalid=invalid, remaining=len(remaining)
+        )
@@ -0,0 +1,182 @@
+"""Dead-letter stream for events consumers could not process.
+
+A dead-lettered message keeps its original bytes and headers (so it can
+be decoded with either codec) and gains headers describing the failure.
+It is stored on ``dlq.{consumer}.{original subject}`` in the MIND_DLQ
+stream, where it can be inspected and requeued to its original subject.
+"""
+
+from dataclasses import dataclass
+from datetime import UTC, datetime
+
+import nats
+import structlog
+
+from mind.core.errors import ErrorCode, MindError, Result
+from mind.infrastructure.nats.client import NatsClient
+
+logger = structlog.get_logger()
+
+# Failure context headers
+CONSUMER_HEADER = "Mind-Dlq-Consumer"
+SUBJECT_HEADER = "Mind-Dlq-Subject"
+ERROR_HEADER = "Mind-Dlq-Error"
+REASON_HEADER = "Mind-Dlq-Reason"
+ATTEMPTS_HEADER = "Mind-Dlq-Attempts"
+SEQUENCE_HEADER = "Mind-Dlq-Stream-Seq"
+FAILED_AT_HEADER = "Mind-Dlq-Failed-At"
+
+_DLQ_HEADERS = (
+    CONSUMER_HEADER,
+    SUBJECT_HEADER,
+    ERROR_HEADER,
+    REASON_HEADER,
+    ATTEMPTS_HEADER,
+    SEQUENCE_HEADER,
+    FAILED_AT_HEADER,
+)
+
+# Keep header values bounded; errors can carry large reprs
+_MAX_ERROR_LENGTH = 1000
+
+
+@dataclass
+class DeadLetter:
+    """A message in the dead-letter stream."""
+
+    sequence: int  # Sequence in MIND_DLQ
+    consumer: str
+    subject: str  # Original subject
+    reason: str  # decode, handler, timeout, redelivery
+    error: str
+    attempts: int
+    failed_at: str
+    data: bytes
+    headers: dict[str, str]
+
+
+class DeadLetterQueue:
+    """Sends messages to MIND_DLQ and manages its entries."""
+
+    def __init__(self, client: NatsClient):
+        self._client = client
+
+    async def send(
+        self,
+        msg,
+        consumer: str,
+        reason: str,
+        error: str,
+        attempts: int,
+    ) -> None:
+        """Dead-letter a consumed message.
+
+        Raises:
+            Exception: If the DLQ publish fails; the caller should then
+                leave the message for redelivery
+        """
+        headers = dict(msg.headers or {})
+        try:
+            sequence = str(msg.metadata.sequence.stream)
+        except AttributeError:
+            sequence = ""
+        headers.update(
+            {
+                CONSUMER_HEADER: consumer,
+                SUBJECT_HEADER: msg.subject,
+                REASON_HEADER: reason,
+                ERROR_HEADER: error[:_MAX_ERROR_LENGTH],
+                ATTEMPTS_HEADER: str(attempts),
+                SEQUENCE_HEADER: sequence,
+                FAILED_AT_HEADER: datetime.now(UTC).isoformat(),
+            }
+        )
+        # The original message ID would be deduplicated against itself
+        headers.pop("Nats-Msg-Id", None)
+
+        await self._client.jetstream.publish(
+            f"{NatsClient.DLQ_SUBJECT_PREFIX}.{consumer}.{msg.subject}",
+            msg.data,
+            headers=headers,
+        )
+        logger.warning(
+            "event_dead_lettered",
+            consumer=consumer,
+            subject=msg.subject,
+            reason=reason,
+            attempts=attempts,
+            error=error[:200],
+        )
+
+    async def list(self, limit: int = 100, consumer: str | None = None) -> list[DeadLetter]:
+        """List dead letters, oldest first."""
+        js = self._client.jetstream
+        info = await js.stream_info(NatsClient.DLQ_STREAM_NAME)
+        letters: list[DeadLetter] = []
+
+        sequence = info.state.first_seq
+        while sequence <= info.state.last_seq and len(letters) < limit:
+            try:
+                raw = await js.get_msg(NatsClient.DLQ_STREAM_NAME, seq=sequence)
+            except nats.js.errors.NotFoundError:
+                sequence += 1
+                continue  # Deleted entry
+            letter = self._to_dead_letter(raw)
+            if consumer is None or letter.consumer == consumer:
+                letters.append(letter)
+            sequence += 1
+
+        return letters
+
+    async def requeue(self, sequence: int) -> Result[DeadLetter]:
+        """Republish a dead letter to its original subject and remove it.
+
+        The message goes back on the shared stream, so every consumer of
+        that subject sees it again; handlers must be idempotent.
+        """
+        js = self._client.jetstream
+        try:
+            raw = await js.get_msg(NatsClient.DLQ_STREAM_NAME, seq=sequence)
+        except nats.js.errors.NotFoundError:
+            return Result.err(
+                MindError(
+                    code=ErrorCode.EVENT_NOT_FOUND,
+                    message="Dead letter not found",
+                    context={"sequence": sequence},
+                )
+            )
+
+        letter = self._to_dead_letter(raw)
+        headers = {k: v for k, v in letter.headers.items() if k not in _DLQ_HEADERS}
+        await js.publish(letter.subject, letter.data, headers=headers or None)
+        await js.delete_msg(NatsClient.DLQ_STREAM_NAME, sequence)
+
+        logger.info(
+            "dead_letter_requeued",
+            sequence=sequence,
+            consumer=letter.consumer,
+            subject=letter.subject,
+        )
+        return Result.ok(letter)
+
+    async def delete(self, sequence: int) -> bool:
+        """Discard a dead letter."""
+        try:
+            return await self._client.jetstream.delete_msg(NatsClient.DLQ_STREAM_NAME, sequence)
+        except nats.js.errors.NotFoundError:
+            return False
+
+    @staticmethod
+    def _to_dead_letter(raw) -> DeadLetter:
+        headers = dict(raw.headers or {})
+        return DeadLetter(
+            sequence=raw.seq,
+            consumer=headers.get(CONSUMER_HEADER, ""),
+            subject=headers.get(SUBJECT_HEADER, ""),
+            reason=headers.get(REASON_HEADER, ""),
+            error=headers.get(ERROR_HEADER, ""),
+            attempts=int(headers.get(ATTEMPTS_HEADER) or 0),
+            failed_at=headers.get(FAILED_AT_HEADER, ""),
+            data=raw.data or b"",
+            headers=headers,
+        )
@@ -1,12 +1,19 @@
 """Event publishing to NATS JetStream."""
 
-import orjson
+import asyncio
+import time
+
 import structlog
 from nats.js.api import PubAck
+from nats.js.errors import TooManyStalledMsgsError
 
+from mind.config import get_settings
+from mind.core.events import codec
 from mind.core.events.base import Event, EventEnvelope
 from mind.core.errors import ErrorCode, MindError, Result
+from mind.infrastructure.circuit_breaker import get_circuit_breaker
 from mind.infrastructure.nats.client import NatsClient
+from mind.observability.metrics import metrics
 
 logger = structlog.get_logger()
 
@@ -16,6 +23,21 @@ class EventPublisher:
 
     def __init__(self, client: NatsClient):
         self._client = client
+        self._breaker = get_circuit_breaker("nats")
+        self._content_type = (
+            codec.MSGPACK_CONTENT_TYPE
+            if get_settings().event_codec == "msgpack"
+            else codec.JSON_CONTENT_TYPE
+        )
+
+    def _encode(self, envelope: EventEnvelope) -> tuple[bytes, dict[str, str]]:
+        """Serialize an envelope into payload bytes and headers."""
+        data = codec.encode(envelope, self._content_type)
+        headers = {
+            "Nats-Msg-Id": str(envelope.event_id),  # For deduplication
+            "Content-Type": self._content_type,
+        }
+        return data, headers
 
     async def publish(self, envelope: EventEnvelope) -> Result[PubAck]:
         """Publish an event envelope to NATS.
@@ -34,19 +56,18 @@ class EventPublisher:
             user_id=str(envelope.user_id),
         )
 
+        if not self._breaker.allow_request():
+            return Result.err(self._breaker.rejection())
+
         try:
-            # Serialize with orjson for speed
-            data = orjson.dumps(envelope.model_dump(mode="json"))
+            data, headers = self._encode(envelope)
 
-            # Publish with message ID for deduplication
             ack = await self._client.jetstream.publish(
                 subject=subject,
                 payload=data,
-                headers={
-                    "Nats-Msg-Id": str(envelope.event_id),
-                    "Content-Type": "application/json",
-                },
+                headers=headers,
             )
+            self._breaker.record_success()
 
             log.info(
                 "event_published",
@@ -55,7 +76,12 @@ class EventPublisher:
             )
             return Result.ok(ack)
 
+        except asyncio.CancelledError:
+            # No outcome was observed; free a half-open probe for the next call
+            self._breaker.release()
+            raise
         except Exception as e:
+            self._breaker.record_failure()
             log.error("event_publish_failed", error=str(e))
             return Result.err(
                 MindError(
@@ -97,7 +123,218 @@ class EventPublisher:
         Note: This does not use transactions. Events are published
         individually but concurrently for performance.
         """
-        import asyncio
-
         tasks = [self.publish(env) for env in envelopes]
         return await asyncio.gather(*tasks)
+
+
+class PipelinedEventPublisher(EventPublisher):
+    """High-throughput publisher using JetStream async publish.
+
+    Messages are written to the connection as soon as a slot in the
+    in-flight window is free, and their acks are collected by
+    background tasks. A publish whose ack times out is re-sent with
+    the same Nats-Msg-Id, so the stream's duplicate window makes the
+    retry safe.
+
+    Use submit() for fire-and-forget publishing and flush() to wait
+    for all outstanding acks (e.g. on shutdown).
+    """
+
+    def __init__(
+        self,
+        client: NatsClient,
+        max_pending: int | None = None,
+        ack_timeout: float | None = None,
+        max_retries: int | None = None,
+    ):
+        super().__init__(client)
+        settings = get_settings()
+        self._max_pending = max_pending or settings.event_publish_max_pending
+        self._ack_timeout = ack_timeout or settings.event_publish_ack_timeout
+        self._max_retries = (
+            max_retries if max_retries is not None else settings.event_publish_max_retries
+        )
+        self._window = asyncio.Semaphore(self._max_pending)
+        self._pending: set[asyncio.Task] = set()
+
+    @property
+    def in_flight(self) -> int:
+        """Number of publishes awaiting an ack."""
+        return len(self._pending)
+
+    async def submit(self, envelope: EventEnvelope) -> asyncio.Future:
+        """Send an envelope and return a future resolving to its Result.
+
+        The message is on the wire when this returns; only the ack is
+        awaited in the background. Blocks only while the in-flight
+        window is full. Resolves immediately to an error while the
+        NATS circuit breaker is open.
+
+        The breaker permit taken here is handed to the ack collector,
+        which records the outcome or gives the permit back.
+        """
+        if not self._breaker.allow_request():
+            return self._settled(Result.err(self._breaker.rejection()))
+
+        try:
+            await self._window.acquire()
+        except asyncio.CancelledError:
+            self._breaker.release()
+            raise
+        metrics.events_publish_in_flight.inc()
+
+        subject = envelope.nats_subject()
+        data, headers = b"", {}
+        future: asyncio.Future | None = None
+        error: str | None = None
+        started = time.perf_counter()
+        try:
+            data, headers = self._encode(envelope)
+            future = await self._send(subject, data, headers)
+        except TooManyStalledMsgsError:
+            pass  # The ack collector re-sends it
+        except asyncio.CancelledError:
+            self._breaker.release()
+            self._window.release()
+            metrics.events_publish_in_flight.dec()
+            raise
+        except Exception as e:
+            error = str(e)
+
+        task = asyncio.create_task(
+            self._collect_ack(envelope, subject, data, headers, future, started, error)
+        )
+        self._pending.add(task)
+        task.add_done_callback(self._release)
+        return task
+
+    @staticmethod
+    def _settled(result: Result[PubAck]) -> asyncio.Future:
+        """Wrap an already-known result in a completed future."""
+        future = asyncio.get_running_loop().create_future()
+        future.set_result(result)
+        return future
+
+    async def _send(
+        self,
+        subject: str,
+        data: bytes,
+        headers: dict[str, str],
+    ) -> asyncio.Future:
+        """Write a message and return the future for its ack."""
+        return await self._client.jetstream.publish_async(
+            subject=subject,
+            payload=data,
+            headers=dict(headers),
+            wait_stall=self._ack_timeout,
+        )
+
+    def _release(self, task: asyncio.Task) -> None:
+        """Free a window slot once a publish has settled."""
+        self._pending.discard(task)
+        self._window.release()
+        metrics.events_publish_in_flight.dec()
+
+    async def _collect_ack(
+        self,
+        envelope: EventEnvelope,
+        subject: str,
+        data: bytes,
+        headers: dict[str, str],
+        future: asyncio.Future | None,
+        started: float,
+        error: str | None,
+    ) -> Result[PubAck]:
+        """Wait for an ack, re-sending with the same Nats-Msg-Id on timeout.
+
+        Starts out holding the breaker permit taken by submit(). Each
+        permit gets exactly one outcome recorded, or is released if the
+        attempt ends without one (cancellation), so a half-open probe
+        can never be leaked.
+        """
+        log = logger.bind(
+            event_id=str(envelope.event_id),
+            event_type=envelope.event_type.value,
+            subject=subject,
+        )
+        permitted = True
+
+        try:
+            if error is not None:
+                permitted = False
+                self._breaker.record_failure()
+                log.error("event_publish_failed", error=error)
+                return self._failure(envelope, f"Failed to publish event: {error}")
+
+            for attempt in range(self._max_retries + 1):
+                try:
+                    if future is None:
+                        # A stalled first send still holds submit()'s permit
+                        if not permitted:
+                            if not self._breaker.allow_request():
+                                return Result.err(self._breaker.rejection())
+                            permitted = True
+                        started = time.perf_counter()
+                        future = await self._send(subject, data, headers)
+                    ack = await asyncio.wait_for(future, timeout=self._ack_timeout)
+                except (asyncio.TimeoutError, TooManyStalledMsgsError):
+                    permitted = False
+                    self._breaker.record_failure()
+                    metrics.event_publish_retries_total.inc()
+                    log.warning("event_ack_timeout", attempt=attempt + 1)
+                    future = None
+                    continue
+                except Exception as e:
+                    permitted = False
+                    self._breaker.record_failure()
+                    log.error("event_publish_failed", error=str(e))
+                    return self._failure(envelope, f"Failed to publish event: {e}")
+
+                permitted = False
+                self._breaker.record_success()
+                metrics.event_publish_ack_latency_seconds.observe(time.perf_counter() - started)
+                metrics.events_published_total.labels(event_type=envelope.event_type.value).inc()
+                log.debug("event_published", stream=ack.stream, sequence=ack.seq)
+                return Result.ok(ack)
+
+            log.error("event_publish_failed", error="ack timeout", attempts=self._max_retries + 1)
+            return self._failure(envelope, "Timed out waiting for JetStream ack")
+        finally:
+            if permitted:
+                self._breaker.release()
+
+    def _failure(self, envelope: EventEnvelope, message: str) -> Result[PubAck]:
+        """Build a publish failure result."""
+        metrics.event_publish_failures_total.labels(
+            event_type=envelope.event_type.value
+        ).inc()
+        return Result.err(
+            MindError(
+                code=ErrorCode.EVENT_PUBLISH_FAILED,
+                message=message,
+                context={"event_id": str(envelope.event_id)},
+            )
+        )
+
+    async def publish(self, envelope: EventEnvelope) -> Result[PubAck]:
+        """Publish an envelope and wait for its ack."""
+        task = await self.submit(envelope)
+        return await task
+
+    async def publish_batch(
+        self,
+        envelopes: list[EventEnvelope],
+    ) -> list[Result[PubAck]]:
+        """Publish multiple events, pipelining them through the window.
+
+        All envelopes are written before any ack is awaited, bounded
+        by the max-pending window.
+        """
+        tasks = [await self.submit(env) for env in envelopes]
+        return list(await asyncio.gather(*tasks))
+
+    async def flush(self, timeout: float | None = None) -> None:
+        """Wait until every submitted publish has been acked or failed."""
+        if not self._pending:
+            return
+        await asyncio.wait(set(self._pending), timeout=timeout)
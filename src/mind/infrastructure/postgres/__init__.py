@@ -8,13 +8,20 @@ from mind.infrastructure.postgres.models import (
     Base,
     UserModel,
     EventModel,
+    ProjectionCheckpointModel,
+    GardenerCheckpointModel,
+    SnapshotModel,
     MemoryModel,
+    MemoryArchiveModel,
+    DirtyMemoryModel,
     DecisionTraceModel,
 )
 from mind.infrastructure.postgres.repositories import (
+    UserRepository,
     MemoryRepository,
     DecisionRepository,
     EventRepository,
+    GardenerRepository,
 )
 
 __all__ = [
@@ -23,9 +30,16 @@ __all__ = [
     "Base",
     "UserModel",
     "EventModel",
+    "ProjectionCheckpointModel",
+    "GardenerCheckpointModel",
+    "SnapshotModel",
     "MemoryModel",
+    "MemoryArchiveModel",
+    "DirtyMemoryModel",
     "DecisionTraceModel",
+    "UserRepository",
     "MemoryRepository",
     "DecisionRepository",
     "EventRepository",
+    "GardenerRepository",
 ]
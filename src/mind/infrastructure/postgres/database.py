@@ -1,15 +1,46 @@
 """Database connection and session management."""
 
+import time
 from contextlib import asynccontextmanager
 from typing import AsyncGenerator
 
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import (
     AsyncSession,
     async_sessionmaker,
     create_async_engine,
 )
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 
 from mind.config import get_settings
+from mind.infrastructure.postgres.slow_query import SlowQueryMonitor
+from mind.observability.metrics import metrics
+
+
+class TimedQueuePool(AsyncAdaptedQueuePool):
+    """Connection pool that records how long checkouts wait.
+
+    Pool events fire only once a connection is handed out, so the wait
+    (for a free connection, or to open a new one) is timed here.
+    """
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            metrics.db_pool_wait_seconds.observe(time.perf_counter() - start)
+
+
+def _track_pool(pool) -> None:
+    """Keep the pool gauges current from checkout/checkin events."""
+    metrics.db_pool_size.set(pool.size())
+
+    def update(*args) -> None:
+        metrics.db_pool_checked_out.set(pool.checkedout())
+
+    event.listen(pool, "checkout", update)
+    event.listen(pool, "checkin", update)
 
 
 class Database:
@@ -22,10 +53,16 @@ class Database:
         self._engine = create_async_engine(
             self._url,
             echo=settings.debug,
+            poolclass=TimedQueuePool,
             pool_size=10,
             max_overflow=20,
             pool_pre_ping=True,
         )
+        _track_pool(self._engine.sync_engine.pool)
+
+        slow_queries = SlowQueryMonitor.from_settings()
+        if slow_queries is not None:
+            slow_queries.install(self._engine.sync_engine)
 
         self._session_factory = async_sessionmaker(
             bind=self._engine,
@@ -5,18 +5,23 @@ from uuid import UUID, uuid4
 
 from pgvector.sqlalchemy import Vector
 from sqlalchemy import (
+    BigInteger,
     Boolean,
     DateTime,
     Float,
     ForeignKey,
+    Identity,
     Index,
     Integer,
     String,
     Text,
     func,
+    select,
+    text,
+    union_all,
 )
 from sqlalchemy.dialects.postgresql import ARRAY, JSONB, UUID as PG_UUID
-from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
+from sqlalchemy.orm import DeclarativeBase, Mapped, aliased, mapped_column, relationship
 
 
 class Base(DeclarativeBase):
@@ -76,8 +81,65 @@ class EventModel(Base):
         DateTime(timezone=True), default=lambda: datetime.now(UTC), index=True
     )
 
+    # Order of insertion into the log. Unlike created_at (the envelope
+    # time) it only grows, so late or replayed events sort after
+    # everything already in the log.
+    position: Mapped[int] = mapped_column(BigInteger, Identity(), unique=True)
+
     __table_args__ = (
         Index("idx_events_user_type_created", "user_id", "event_type", "created_at"),
+        Index("idx_events_aggregate_position", "aggregate_id", "position"),
+    )
+
+
+class SnapshotModel(Base):
+    """Folded aggregate state as of a position in the event log."""
+
+    __tablename__ = "snapshots"
+
+    aggregate_id: Mapped[UUID] = mapped_column(PG_UUID(as_uuid=True), primary_key=True)
+    version: Mapped[int] = mapped_column(Integer, primary_key=True)  # Events folded
+    state: Mapped[dict] = mapped_column(JSONB, default=dict)
+
+    # Log position of the last folded event
+    position: Mapped[int] = mapped_column(BigInteger)
+
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), default=lambda: datetime.now(UTC)
+    )
+
+
+class ProjectionCheckpointModel(Base):
+    """Last stream sequence projected per projector partition."""
+
+    __tablename__ = "projection_checkpoints"
+
+    projector: Mapped[str] = mapped_column(String(100), primary_key=True)
+    partition: Mapped[str] = mapped_column(String(50), primary_key=True)
+    stream_sequence: Mapped[int] = mapped_column(BigInteger, default=0)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        default=lambda: datetime.now(UTC),
+        onupdate=lambda: datetime.now(UTC),
+    )
+
+
+class GardenerCheckpointModel(Base):
+    """Progress of a local (non-Temporal) gardener job."""
+
+    __tablename__ = "gardener_checkpoints"
+
+    job: Mapped[str] = mapped_column(String(50), primary_key=True)
+    after_user_id: Mapped[UUID | None] = mapped_column(
+        PG_UUID(as_uuid=True), nullable=True
+    )  # Cursor of an unfinished pass
+    last_completed_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        default=lambda: datetime.now(UTC),
+        onupdate=lambda: datetime.now(UTC),
     )
 
 
@@ -114,6 +176,7 @@ class MemoryModel(Base):
     decision_count: Mapped[int] = mapped_column(Integer, default=0)
     positive_outcomes: Mapped[int] = mapped_column(Integer, default=0)
     negative_outcomes: Mapped[int] = mapped_column(Integer, default=0)
+    last_used_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
 
     # Promotion tracking
     promoted_from_level: Mapped[int | None] = mapped_column(Integer)
@@ -139,6 +202,21 @@ class MemoryModel(Base):
             "user_id",
             (base_salience + outcome_adjustment).desc(),
         ),
+        # Expiration scan
+        Index(
+            "idx_memories_valid_until",
+            "valid_until",
+            postgresql_where=text("valid_until IS NOT NULL"),
+        ),
+        # Promotion candidate scan; identity memories are never promoted
+        Index(
+            "idx_memories_promotion",
+            "user_id",
+            "temporal_level",
+            "created_at",
+            postgresql_include=["retrieval_count"],
+            postgresql_where=text("temporal_level < 4"),
+        ),
         Index(
             "idx_memories_embedding",
             "embedding",
@@ -154,6 +232,69 @@ class MemoryModel(Base):
         return max(0.0, min(1.0, self.base_salience + self.outcome_adjustment))
 
 
+class MemoryArchiveModel(Base):
+    """Expired memories moved out of the memories table.
+
+    Same columns as MemoryModel (the embedding may have been dropped),
+    plus the time the memory was archived.
+    """
+
+    __tablename__ = "memories_archive"
+
+    memory_id: Mapped[UUID] = mapped_column(PG_UUID(as_uuid=True), primary_key=True)
+    user_id: Mapped[UUID] = mapped_column(PG_UUID(as_uuid=True), index=True)
+
+    content: Mapped[str] = mapped_column(Text)
+    content_type: Mapped[str] = mapped_column(String(50))
+    embedding: Mapped[list[float] | None] = mapped_column(Vector(1536))
+
+    temporal_level: Mapped[int] = mapped_column(Integer)
+
+    valid_from: Mapped[datetime] = mapped_column(DateTime(timezone=True))
+    valid_until: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
+
+    base_salience: Mapped[float] = mapped_column(Float, default=1.0)
+    outcome_adjustment: Mapped[float] = mapped_column(Float, default=0.0)
+
+    retrieval_count: Mapped[int] = mapped_column(Integer, default=0)
+    decision_count: Mapped[int] = mapped_column(Integer, default=0)
+    positive_outcomes: Mapped[int] = mapped_column(Integer, default=0)
+    negative_outcomes: Mapped[int] = mapped_column(Integer, default=0)
+    last_used_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
+
+    promoted_from_level: Mapped[int | None] = mapped_column(Integer)
+    promotion_timestamp: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
+
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True))
+    updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True))
+    archived_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), default=lambda: datetime.now(UTC)
+    )
+
+
+class DirtyMemoryModel(Base):
+    """Memories touched by events since they were last gardened."""
+
+    __tablename__ = "gardener_dirty_memories"
+
+    memory_id: Mapped[UUID] = mapped_column(PG_UUID(as_uuid=True), primary_key=True)
+    marked_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), default=lambda: datetime.now(UTC), index=True
+    )
+    # Set when the memory is only too young to promote: when it will be old enough
+    recheck_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
+
+
+def memories_with_archive():
+    """Live and archived memories as one entity, queryable like MemoryModel."""
+    columns = [column.name for column in MemoryModel.__table__.columns]
+    union = union_all(
+        select(*(MemoryModel.__table__.c[name] for name in columns)),
+        select(*(MemoryArchiveModel.__table__.c[name] for name in columns)),
+    ).subquery("memories_all")
+    return aliased(MemoryModel, union)
+
+
 class DecisionTraceModel(Base):
     """Decision tracking for outcome learning."""
 
@@ -212,9 +353,8 @@ class SalienceAdjustmentModel(Base):
     adjustment_id: Mapped[UUID] = mapped_column(
         PG_UUID(as_uuid=True), primary_key=True, default=uuid4
     )
-    memory_id: Mapped[UUID] = mapped_column(
-        PG_UUID(as_uuid=True), ForeignKey("memories.memory_id"), index=True
-    )
+    # No foreign key: the memory may have moved to memories_archive
+    memory_id: Mapped[UUID] = mapped_column(PG_UUID(as_uuid=True), index=True)
     trace_id: Mapped[UUID] = mapped_column(
         PG_UUID(as_uuid=True), ForeignKey("decision_traces.trace_id"), index=True
     )
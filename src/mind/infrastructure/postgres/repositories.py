@@ -3,21 +3,66 @@
 from datetime import UTC, datetime
 from uuid import UUID
 
-from sqlalchemy import select, func, text
+from sqlalchemy import delete, literal, or_, select, func, text, tuple_
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from mind.core.errors import ErrorCode, MindError, Result
 from mind.core.memory.models import Memory, TemporalLevel
 from mind.core.memory.retrieval import RetrievalRequest, RetrievalResult, ScoredMemory
 from mind.core.decision.models import DecisionTrace, Outcome, SalienceUpdate
+from mind.core.events.aggregate import AggregateState
+from mind.core.events.base import EventEnvelope
+from mind.infrastructure.postgres.slow_query import label_queries
 from mind.infrastructure.postgres.models import (
+    DirtyMemoryModel,
+    GardenerCheckpointModel,
+    MemoryArchiveModel,
     MemoryModel,
     DecisionTraceModel,
     EventModel,
+    ProjectionCheckpointModel,
     SalienceAdjustmentModel,
+    SnapshotModel,
+    UserModel,
+    memories_with_archive,
 )
 
+# Rows per multi-row INSERT; keeps bind parameters well under
+# the 32767 limit of the Postgres wire protocol
+_INSERT_CHUNK = 1000
 
+# Columns shared by memories and memories_archive
+_MEMORY_COLUMNS = ", ".join(
+    column.name for column in MemoryModel.__table__.columns if column.name != "embedding"
+)
+
+
+@label_queries
+class UserRepository:
+    """Repository for user operations."""
+
+    def __init__(self, session: AsyncSession):
+        self._session = session
+
+    async def list_ids(self, after: UUID | None = None, limit: int = 1000) -> list[UUID]:
+        """List user IDs in order, one keyset page at a time.
+
+        Args:
+            after: Last user ID of the previous page (None for the first)
+            limit: Maximum IDs to return
+
+        Returns:
+            User IDs greater than `after`, ascending
+        """
+        stmt = select(UserModel.user_id).order_by(UserModel.user_id).limit(limit)
+        if after is not None:
+            stmt = stmt.where(UserModel.user_id > after)
+        result = await self._session.execute(stmt)
+        return list(result.scalars())
+
+
+@label_queries
 class MemoryRepository:
     """Repository for memory operations."""
 
@@ -54,6 +99,10 @@ class MemoryRepository:
         result = await self._session.execute(stmt)
         model = result.scalar_one_or_none()
 
+        if model is None:
+            # Expired memories may have been archived
+            model = await self._session.get(MemoryArchiveModel, memory_id)
+
         if model is None:
             return Result.err(
                 MindError(
@@ -69,31 +118,34 @@ class MemoryRepository:
         """Retrieve memories using multi-source fusion."""
         start_time = datetime.now(UTC)
 
+        # Expired memories may have been moved to the archive
+        memories = memories_with_archive() if request.include_expired else MemoryModel
+
         # Build base query
-        stmt = select(MemoryModel).where(MemoryModel.user_id == request.user_id)
+        stmt = select(memories).where(memories.user_id == request.user_id)
 
         # Filter by temporal levels
         if request.temporal_levels:
             levels = [level.value for level in request.temporal_levels]
-            stmt = stmt.where(MemoryModel.temporal_level.in_(levels))
+            stmt = stmt.where(memories.temporal_level.in_(levels))
 
         # Filter by salience
         if request.min_salience > 0:
             stmt = stmt.where(
-                (MemoryModel.base_salience + MemoryModel.outcome_adjustment) >= request.min_salience
+                (memories.base_salience + memories.outcome_adjustment) >= request.min_salience
             )
 
         # Filter expired
         if not request.include_expired:
             now = datetime.now(UTC)
             stmt = stmt.where(
-                (MemoryModel.valid_until.is_(None)) | (MemoryModel.valid_until > now)
+                (memories.valid_until.is_(None)) | (memories.valid_until > now)
             )
-            stmt = stmt.where(MemoryModel.valid_from <= now)
+            stmt = stmt.where(memories.valid_from <= now)
 
         # Order by effective salience and limit
         stmt = stmt.order_by(
-            (MemoryModel.base_salience + MemoryModel.outcome_adjustment).desc()
+            (memories.base_salience + memories.outcome_adjustment).desc()
         ).limit(request.limit * 3)  # Over-fetch for reranking
 
         result = await self._session.execute(stmt)
@@ -142,6 +194,490 @@ class MemoryRepository:
         result = await self._session.execute(stmt)
         return [(row[0], row[1]) for row in result.all()]
 
+    async def find_promotion_candidates(
+        self,
+        user_id: UUID | None,
+        thresholds: dict[tuple[TemporalLevel, TemporalLevel], dict],
+        limit: int = 100,
+        memory_ids: list[UUID] | None = None,
+        include_young: bool = False,
+    ) -> list:
+        """Find the best promotion candidates across all levels in one query.
+
+        Each (from_level, to_level) threshold set becomes a row of a VALUES
+        list joined to the user's memories, so every criterion and the
+        promotion score are evaluated in Postgres and only the top `limit`
+        rows come back.
+
+        Args:
+            user_id: User whose memories to scan (None with memory_ids)
+            thresholds: Criteria keyed by (from_level, to_level), with
+                min_age_hours, min_retrieval_count, min_positive_ratio
+                and min_salience
+            limit: Maximum candidates to return
+            memory_ids: Evaluate only these memories, of any user
+            include_young: Also return memories that meet every criterion
+                but min_age_hours
+
+        Returns:
+            Rows with memory_id, user_id, from_level, to_level, age_hours,
+            retrieval_count, salience, score and old_enough_at (when the
+            memory meets min_age_hours), best score first
+        """
+        if not thresholds or memory_ids == []:
+            return []
+
+        params: dict = {"now": datetime.now(UTC), "limit": limit}
+        if memory_ids is not None:
+            scope = "m.memory_id = ANY(:memory_ids)"
+            params["memory_ids"] = memory_ids
+        else:
+            scope = "m.user_id = :user_id"
+            params["user_id"] = user_id
+        rows = []
+        for i, ((from_level, to_level), criteria) in enumerate(thresholds.items()):
+            rows.append(
+                f"(CAST(:from_{i} AS integer), CAST(:to_{i} AS integer), "
+                f"CAST(:age_{i} AS float8), CAST(:count_{i} AS integer), "
+                f"CAST(:ratio_{i} AS float8), CAST(:salience_{i} AS float8))"
+            )
+            params.update(
+                {
+                    f"from_{i}": int(from_level),
+                    f"to_{i}": int(to_level),
+                    f"age_{i}": float(criteria["min_age_hours"]),
+                    f"count_{i}": int(criteria["min_retrieval_count"]),
+                    f"ratio_{i}": float(criteria["min_positive_ratio"]),
+                    f"salience_{i}": float(criteria["min_salience"]),
+                }
+            )
+
+        old_enough_at = "m.created_at + make_interval(secs => t.min_age_hours * 3600)"
+        age = "" if include_young else f"AND {old_enough_at} <= CAST(:now AS timestamptz)"
+
+        # The literal top-level bound lets the planner use the partial
+        # idx_memories_promotion index
+        result = await self._session.execute(
+            text(f"""
+                WITH thresholds (
+                    from_level, to_level, min_age_hours, min_retrieval_count,
+                    min_positive_ratio, min_salience
+                ) AS (
+                    VALUES {", ".join(rows)}
+                ),
+                eligible AS (
+                    SELECT
+                        m.memory_id,
+                        m.user_id,
+                        t.from_level,
+                        t.to_level,
+                        t.min_age_hours,
+                        t.min_retrieval_count,
+                        m.retrieval_count,
+                        m.positive_outcomes,
+                        m.positive_outcomes + m.negative_outcomes AS total_outcomes,
+                        EXTRACT(EPOCH FROM (CAST(:now AS timestamptz) - m.created_at)) / 3600.0
+                            AS age_hours,
+                        GREATEST(0.0, LEAST(1.0, m.base_salience + m.outcome_adjustment))
+                            AS salience,
+                        {old_enough_at} AS old_enough_at
+                    FROM memories m
+                    JOIN thresholds t ON m.temporal_level = t.from_level
+                    WHERE {scope}
+                      AND m.temporal_level < {int(TemporalLevel.IDENTITY)}
+                      AND (m.valid_until IS NULL OR m.valid_until > CAST(:now AS timestamptz))
+                      {age}
+                      AND m.retrieval_count >= t.min_retrieval_count
+                      AND (
+                          m.positive_outcomes + m.negative_outcomes = 0
+                          OR m.positive_outcomes::float8
+                             / (m.positive_outcomes + m.negative_outcomes)
+                             >= t.min_positive_ratio
+                      )
+                      AND GREATEST(0.0, LEAST(1.0, m.base_salience + m.outcome_adjustment))
+                          >= t.min_salience
+                )
+                SELECT
+                    memory_id,
+                    user_id,
+                    from_level,
+                    to_level,
+                    age_hours,
+                    retrieval_count,
+                    salience,
+                    old_enough_at,
+                    GREATEST(0.0, LEAST(1.0,
+                        0.15 * LEAST(1.0, age_hours / min_age_hours)
+                        + 0.25 * LEAST(1.0, retrieval_count / (min_retrieval_count * 2.0))
+                        + 0.25 * salience
+                        + 0.35 * CASE
+                            WHEN total_outcomes > 0
+                            THEN positive_outcomes::float8 / total_outcomes
+                            ELSE 0.5
+                          END
+                    )) AS score
+                FROM eligible
+                ORDER BY score DESC, memory_id
+                LIMIT :limit
+            """),
+            params,
+        )
+        return list(result)
+
+    async def promote_batch(
+        self,
+        promotions: list[tuple[UUID, TemporalLevel, TemporalLevel]],
+    ) -> list:
+        """Promote many memories with a single UPDATE.
+
+        Only memories still below their target level are changed, so
+        the statement is safe to repeat. Memories that were already at
+        or above the target before it ran are returned with
+        changed=False, letting a retried caller finish work (such as
+        publishing events) for rows an earlier attempt promoted.
+
+        Args:
+            promotions: (memory_id, from_level, to_level) per memory
+
+        Returns:
+            Rows with memory_id, from_level, to_level and changed; missing
+            memories are absent
+        """
+        if not promotions:
+            return []
+
+        result = await self._session.execute(
+            text("""
+                WITH targets AS (
+                    SELECT *
+                    FROM unnest(
+                        CAST(:memory_ids AS uuid[]),
+                        CAST(:from_levels AS integer[]),
+                        CAST(:to_levels AS integer[])
+                    ) AS t(memory_id, from_level, to_level)
+                ),
+                promoted AS (
+                    UPDATE memories m
+                    SET temporal_level = t.to_level,
+                        promoted_from_level = m.temporal_level,
+                        promotion_timestamp = :now,
+                        updated_at = :now
+                    FROM targets t
+                    WHERE m.memory_id = t.memory_id
+                      AND m.temporal_level < t.to_level
+                    RETURNING m.memory_id, m.promoted_from_level AS from_level,
+                              m.temporal_level AS to_level
+                )
+                SELECT memory_id, from_level, to_level, TRUE AS changed
+                FROM promoted
+                UNION ALL
+                SELECT m.memory_id, m.promoted_from_level, m.temporal_level, FALSE
+                FROM memories m
+                JOIN targets t ON m.memory_id = t.memory_id
+                WHERE m.temporal_level >= t.to_level
+            """),
+            {
+                "memory_ids": [memory_id for memory_id, _, _ in promotions],
+                "from_levels": [int(from_level) for _, from_level, _ in promotions],
+                "to_levels": [int(to_level) for _, _, to_level in promotions],
+                "now": datetime.now(UTC),
+            },
+        )
+        return list(result)
+
+    async def find_near_duplicates(
+        self,
+        user_id: UUID,
+        max_distance: float,
+        neighbors: int = 5,
+        limit: int = 1000,
+    ) -> list:
+        """Find pairs of a user's live memories with near-identical embeddings.
+
+        An ANN self-join: for each memory, its nearest `neighbors` of the
+        same content type are looked up through the vector index, and
+        pairs within `max_distance` (cosine) are kept. Each pair is
+        returned once.
+
+        Args:
+            user_id: User whose memories to compare
+            max_distance: Largest cosine distance counted as a duplicate
+            neighbors: Nearest neighbors checked per memory
+            limit: Maximum pairs to return
+
+        Returns:
+            Rows with memory_id, duplicate_id and distance
+        """
+        result = await self._session.execute(
+            text("""
+                SELECT a.memory_id, n.memory_id AS duplicate_id, n.distance
+                FROM memories a
+                CROSS JOIN LATERAL (
+                    SELECT b.memory_id, a.embedding <=> b.embedding AS distance
+                    FROM memories b
+                    WHERE b.user_id = a.user_id
+                      AND b.memory_id <> a.memory_id
+                      AND b.content_type = a.content_type
+                      AND b.embedding IS NOT NULL
+                      AND (b.valid_until IS NULL OR b.valid_until > :now)
+                    ORDER BY a.embedding <=> b.embedding
+                    LIMIT :neighbors
+                ) n
+                WHERE a.user_id = :user_id
+                  AND a.embedding IS NOT NULL
+                  AND (a.valid_until IS NULL OR a.valid_until > :now)
+                  AND n.distance <= :max_distance
+                  AND a.memory_id < n.memory_id
+                LIMIT :limit
+            """),
+            {
+                "user_id": user_id,
+                "now": datetime.now(UTC),
+                "max_distance": max_distance,
+                "neighbors": neighbors,
+                "limit": limit,
+            },
+        )
+        return list(result)
+
+    async def merge_duplicates(
+        self,
+        user_id: UUID,
+        memory_ids: list[UUID],
+    ) -> tuple[UUID, list[UUID]] | None:
+        """Merge a cluster of duplicate memories into one, in a single statement.
+
+        The canonical memory is the one at the highest temporal level,
+        then with the highest salience, most retrievals and earliest
+        creation. The others get valid_until set to now, and their usage
+        and outcome counters are added to the canonical memory, which
+        keeps the larger of the outcome adjustments and the latest use.
+
+        Args:
+            user_id: Owner of the memories
+            memory_ids: The cluster
+
+        Returns:
+            (canonical_id, merged_ids), or None if fewer than two of the
+            memories were still live
+        """
+        result = await self._session.execute(
+            text("""
+                WITH canonical AS (
+                    SELECT memory_id
+                    FROM memories
+                    WHERE memory_id = ANY(:memory_ids)
+                      AND user_id = :user_id
+                      AND (valid_until IS NULL OR valid_until > :now)
+                    ORDER BY temporal_level DESC,
+                             base_salience + outcome_adjustment DESC,
+                             retrieval_count DESC,
+                             created_at
+                    LIMIT 1
+                ),
+                merged AS (
+                    UPDATE memories m
+                    SET valid_until = :now, updated_at = :now
+                    FROM canonical c
+                    WHERE m.memory_id = ANY(:memory_ids)
+                      AND m.memory_id <> c.memory_id
+                      AND m.user_id = :user_id
+                      AND (m.valid_until IS NULL OR m.valid_until > :now)
+                    RETURNING m.memory_id, m.retrieval_count, m.decision_count,
+                              m.positive_outcomes, m.negative_outcomes, m.outcome_adjustment,
+                              m.last_used_at
+                ),
+                totals AS (
+                    SELECT count(*) AS merged,
+                           array_agg(memory_id) AS merged_ids,
+                           COALESCE(sum(retrieval_count), 0) AS retrieval_count,
+                           COALESCE(sum(decision_count), 0) AS decision_count,
+                           COALESCE(sum(positive_outcomes), 0) AS positive_outcomes,
+                           COALESCE(sum(negative_outcomes), 0) AS negative_outcomes,
+                           max(outcome_adjustment) AS outcome_adjustment,
+                           max(last_used_at) AS last_used_at
+                    FROM merged
+                )
+                UPDATE memories m
+                SET retrieval_count = m.retrieval_count + t.retrieval_count,
+                    decision_count = m.decision_count + t.decision_count,
+                    positive_outcomes = m.positive_outcomes + t.positive_outcomes,
+                    negative_outcomes = m.negative_outcomes + t.negative_outcomes,
+                    outcome_adjustment = GREATEST(m.outcome_adjustment, t.outcome_adjustment),
+                    last_used_at = GREATEST(m.last_used_at, t.last_used_at),
+                    updated_at = :now
+                FROM canonical c, totals t
+                WHERE m.memory_id = c.memory_id
+                  AND t.merged > 0
+                RETURNING m.memory_id, t.merged_ids
+            """),
+            {"user_id": user_id, "memory_ids": list(memory_ids), "now": datetime.now(UTC)},
+        )
+        row = result.first()
+        if row is None:
+            return None
+        return row.memory_id, list(row.merged_ids)
+
+    async def archive_expired(
+        self,
+        batch_size: int = 1000,
+        drop_embeddings: bool = True,
+    ) -> list:
+        """Move a batch of expired memories to memories_archive.
+
+        Rows are deleted from memories and inserted into the archive by
+        one statement. Rows locked by other transactions are skipped, so
+        several archivers can run at once.
+
+        Args:
+            batch_size: Maximum memories to move
+            drop_embeddings: Archive without the embedding vector
+
+        Returns:
+            Rows with memory_id, user_id and valid_until of the archived
+            memories
+        """
+        result = await self._session.execute(
+            text(f"""
+                WITH expired AS (
+                    SELECT memory_id
+                    FROM memories
+                    WHERE valid_until IS NOT NULL AND valid_until <= :now
+                    ORDER BY valid_until
+                    LIMIT :batch_size
+                    FOR UPDATE SKIP LOCKED
+                ),
+                moved AS (
+                    DELETE FROM memories m
+                    USING expired e
+                    WHERE m.memory_id = e.memory_id
+                    RETURNING m.*
+                )
+                INSERT INTO memories_archive (
+                    {_MEMORY_COLUMNS}, embedding, archived_at
+                )
+                SELECT {_MEMORY_COLUMNS},
+                       CASE WHEN :drop_embeddings THEN NULL ELSE embedding END,
+                       :now
+                FROM moved
+                RETURNING memory_id, user_id, valid_until
+            """),
+            {
+                "now": datetime.now(UTC),
+                "batch_size": batch_size,
+                "drop_embeddings": drop_embeddings,
+            },
+        )
+        return list(result)
+
+    async def mark_dirty(self, memory_ids: list[UUID]) -> None:
+        """Record memories as changed since they were last gardened.
+
+        Marking an already dirty memory moves its marked_at forward, so
+        a gardening pass that started before the mark keeps it dirty,
+        and makes it due again if it was waiting to be old enough.
+        """
+        now = datetime.now(UTC)
+        unique_ids = list(dict.fromkeys(memory_ids))
+        for start in range(0, len(unique_ids), _INSERT_CHUNK):
+            chunk = unique_ids[start : start + _INSERT_CHUNK]
+            stmt = pg_insert(DirtyMemoryModel).values(
+                [{"memory_id": memory_id, "marked_at": now} for memory_id in chunk]
+            )
+            await self._session.execute(
+                stmt.on_conflict_do_update(
+                    index_elements=[DirtyMemoryModel.memory_id],
+                    set_={"marked_at": stmt.excluded.marked_at, "recheck_at": None},
+                )
+            )
+
+    async def touch_last_used(self, last_used: dict[UUID, datetime]) -> None:
+        """Move memories' last_used_at forward to the given times.
+
+        Only ever moves forward, so redelivered or out-of-order events
+        are harmless. updated_at is left alone.
+
+        Args:
+            last_used: Time of the latest use per memory
+        """
+        items = list(last_used.items())
+        for start in range(0, len(items), _INSERT_CHUNK):
+            chunk = items[start : start + _INSERT_CHUNK]
+            await self._session.execute(
+                text("""
+                    UPDATE memories m
+                    SET last_used_at = GREATEST(m.last_used_at, t.used_at)
+                    FROM unnest(
+                        CAST(:memory_ids AS uuid[]),
+                        CAST(:used_at AS timestamptz[])
+                    ) AS t(memory_id, used_at)
+                    WHERE m.memory_id = t.memory_id
+                """),
+                {
+                    "memory_ids": [memory_id for memory_id, _ in chunk],
+                    "used_at": [used_at for _, used_at in chunk],
+                },
+            )
+
+    async def get_dirty(self, watermark: datetime, limit: int = 1000) -> list[UUID]:
+        """Dirty memories marked at or before the watermark and due, oldest first."""
+        result = await self._session.execute(
+            select(DirtyMemoryModel.memory_id)
+            .where(DirtyMemoryModel.marked_at <= watermark)
+            .where(
+                or_(
+                    DirtyMemoryModel.recheck_at.is_(None),
+                    DirtyMemoryModel.recheck_at <= watermark,
+                )
+            )
+            .order_by(DirtyMemoryModel.marked_at)
+            .limit(limit)
+        )
+        return list(result.scalars())
+
+    async def defer_dirty(self, recheck_at: dict[UUID, datetime]) -> None:
+        """Keep memories dirty but skip them until their recheck time.
+
+        Args:
+            recheck_at: Time from which each memory is due again
+        """
+        items = list(recheck_at.items())
+        for start in range(0, len(items), _INSERT_CHUNK):
+            chunk = items[start : start + _INSERT_CHUNK]
+            await self._session.execute(
+                text("""
+                    UPDATE gardener_dirty_memories d
+                    SET recheck_at = t.recheck_at
+                    FROM unnest(
+                        CAST(:memory_ids AS uuid[]),
+                        CAST(:recheck_at AS timestamptz[])
+                    ) AS t(memory_id, recheck_at)
+                    WHERE d.memory_id = t.memory_id
+                """),
+                {
+                    "memory_ids": [memory_id for memory_id, _ in chunk],
+                    "recheck_at": [due for _, due in chunk],
+                },
+            )
+
+    async def clear_dirty(self, memory_ids: list[UUID], watermark: datetime) -> int:
+        """Clear gardened memories that were not marked again after the watermark.
+
+        Memories deferred to a recheck time after the watermark stay dirty.
+        """
+        result = await self._session.execute(
+            delete(DirtyMemoryModel)
+            .where(DirtyMemoryModel.memory_id.in_(memory_ids))
+            .where(DirtyMemoryModel.marked_at <= watermark)
+            .where(
+                or_(
+                    DirtyMemoryModel.recheck_at.is_(None),
+                    DirtyMemoryModel.recheck_at <= watermark,
+                )
+            )
+        )
+        return result.rowcount
+
     async def update_salience(
         self,
         memory_id: UUID,
@@ -204,6 +740,7 @@ class MemoryRepository:
         )
 
 
+@label_queries
 class DecisionRepository:
     """Repository for decision tracking."""
 
@@ -315,6 +852,7 @@ class DecisionRepository:
         )
 
 
+@label_queries
 class EventRepository:
     """Repository for event sourcing."""
 
@@ -327,21 +865,273 @@ class EventRepository:
         await self._session.flush()
         return Result.ok(event)
 
+    async def append_batch(self, envelopes: list[EventEnvelope]) -> int:
+        """Append many events with multi-row inserts.
+
+        Events already in the log (same event_id) are skipped, so a
+        redelivered batch is harmless.
+
+        Returns:
+            Number of events actually inserted
+        """
+        table = EventModel.__table__
+        inserted = 0
+
+        for start in range(0, len(envelopes), _INSERT_CHUNK):
+            rows = [
+                {
+                    "event_id": envelope.event_id,
+                    "user_id": envelope.user_id,
+                    "event_type": envelope.event_type.value,
+                    "aggregate_id": envelope.aggregate_id,
+                    "payload": envelope.payload,
+                    "metadata": {},
+                    "correlation_id": envelope.correlation_id,
+                    "causation_id": envelope.causation_id,
+                    "version": envelope.version,
+                    "created_at": envelope.timestamp,
+                }
+                for envelope in envelopes[start : start + _INSERT_CHUNK]
+            ]
+            stmt = (
+                pg_insert(table)
+                .values(rows)
+                .on_conflict_do_nothing(index_elements=[table.c.event_id])
+                .returning(table.c.event_id)
+            )
+            result = await self._session.execute(stmt)
+            inserted += len(result.fetchall())
+
+        return inserted
+
+    async def get_checkpoints(self, projector: str) -> dict[str, int]:
+        """Get the last projected stream sequence for each partition."""
+        stmt = select(
+            ProjectionCheckpointModel.partition,
+            ProjectionCheckpointModel.stream_sequence,
+        ).where(ProjectionCheckpointModel.projector == projector)
+        result = await self._session.execute(stmt)
+        return {partition: sequence for partition, sequence in result.all()}
+
+    async def save_checkpoint(self, projector: str, partition: str, sequence: int) -> None:
+        """Record a projected stream sequence (never moves backwards)."""
+        stmt = pg_insert(ProjectionCheckpointModel).values(
+            projector=projector,
+            partition=partition,
+            stream_sequence=sequence,
+            updated_at=datetime.now(UTC),
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[
+                ProjectionCheckpointModel.projector,
+                ProjectionCheckpointModel.partition,
+            ],
+            set_={
+                "stream_sequence": func.greatest(
+                    ProjectionCheckpointModel.stream_sequence,
+                    stmt.excluded.stream_sequence,
+                ),
+                "updated_at": stmt.excluded.updated_at,
+            },
+        )
+        await self._session.execute(stmt)
+
     async def get_by_aggregate(
         self,
         aggregate_id: UUID,
         after_version: int = 0,
+        after_position: int = 0,
+        up_to_position: int | None = None,
     ) -> list[EventModel]:
-        """Get events for an aggregate."""
+        """Get events for an aggregate, in log order.
+
+        Args:
+            aggregate_id: The aggregate
+            after_version: Only events with a higher schema version
+            after_position: Only events after this log position
+            up_to_position: Only events at or before this log position
+        """
         stmt = (
             select(EventModel)
             .where(EventModel.aggregate_id == aggregate_id)
             .where(EventModel.version > after_version)
-            .order_by(EventModel.created_at)
+            .where(EventModel.position > after_position)
+        )
+        if up_to_position is not None:
+            stmt = stmt.where(EventModel.position <= up_to_position)
+        stmt = stmt.order_by(EventModel.position)
+        result = await self._session.execute(stmt)
+        return list(result.scalars().all())
+
+    async def get_window(
+        self,
+        event_types: list[str],
+        start: datetime,
+        end: datetime,
+        after: tuple[datetime, UUID] | None = None,
+        limit: int = 1000,
+    ) -> list[EventModel]:
+        """Get a page of events of some types in a time window, oldest first.
+
+        Args:
+            event_types: Event type values to include
+            start: Inclusive start of the window
+            end: Exclusive end of the window
+            after: Only events after this (created_at, event_id) position,
+                the last one of the previous page
+            limit: Page size
+        """
+        stmt = (
+            select(EventModel)
+            .where(EventModel.event_type.in_(event_types))
+            .where(EventModel.created_at >= start)
+            .where(EventModel.created_at < end)
         )
+        if after is not None:
+            after_at, after_id = after
+            stmt = stmt.where(
+                tuple_(EventModel.created_at, EventModel.event_id)
+                > tuple_(
+                    literal(after_at, EventModel.created_at.type),
+                    literal(after_id, EventModel.event_id.type),
+                )
+            )
+        stmt = stmt.order_by(EventModel.created_at, EventModel.event_id).limit(limit)
         result = await self._session.execute(stmt)
         return list(result.scalars().all())
 
+    async def load_aggregate(
+        self,
+        aggregate_id: UUID,
+        up_to_position: int | None = None,
+    ) -> AggregateState:
+        """Rebuild an aggregate from its latest snapshot and later events.
+
+        Args:
+            aggregate_id: The aggregate
+            up_to_position: Only fold events at or before this log position
+        """
+        snapshot = await self.get_latest_snapshot(aggregate_id)
+        if snapshot is None:
+            aggregate = AggregateState(aggregate_id=aggregate_id)
+        else:
+            aggregate = AggregateState(
+                aggregate_id=aggregate_id,
+                version=snapshot.version,
+                state=dict(snapshot.state),
+                position=snapshot.position,
+            )
+        events = await self.get_by_aggregate(
+            aggregate_id, after_position=aggregate.position, up_to_position=up_to_position
+        )
+
+        for event in events:
+            aggregate.apply(event.position, event.event_type, event.payload)
+        return aggregate
+
+    async def get_allocated_position(self) -> int:
+        """Highest log position handed out so far, committed or not."""
+        result = await self._session.execute(
+            text(
+                "SELECT pg_sequence_last_value("
+                "pg_get_serial_sequence('events', 'position')::regclass)"
+            )
+        )
+        return result.scalar_one() or 0
+
+    async def get_latest_snapshot(self, aggregate_id: UUID) -> SnapshotModel | None:
+        """Get the most recent snapshot of an aggregate."""
+        stmt = (
+            select(SnapshotModel)
+            .where(SnapshotModel.aggregate_id == aggregate_id)
+            .order_by(SnapshotModel.version.desc())
+            .limit(1)
+        )
+        result = await self._session.execute(stmt)
+        return result.scalar_one_or_none()
+
+    async def save_snapshot(self, aggregate: AggregateState) -> None:
+        """Store a snapshot and drop the ones it supersedes."""
+        if aggregate.version == 0:
+            return
+
+        stmt = pg_insert(SnapshotModel).values(
+            aggregate_id=aggregate.aggregate_id,
+            version=aggregate.version,
+            state=aggregate.state,
+            position=aggregate.position,
+            created_at=datetime.now(UTC),
+        )
+        await self._session.execute(stmt.on_conflict_do_nothing())
+        await self._session.execute(
+            delete(SnapshotModel)
+            .where(SnapshotModel.aggregate_id == aggregate.aggregate_id)
+            .where(SnapshotModel.version < aggregate.version)
+        )
+
+    async def find_snapshot_candidates(
+        self,
+        threshold: int,
+        after_position: int,
+        up_to_position: int,
+        after_id: UUID | None = None,
+        limit: int = 500,
+    ) -> list[UUID]:
+        """Find aggregates with at least `threshold` events since their latest snapshot.
+
+        Only aggregates with events in the (after_position,
+        up_to_position] range of the log are considered, so a periodic
+        caller scans just the recently active ones, and only events up
+        to up_to_position are counted.
+
+        Args:
+            threshold: Events since the latest snapshot
+            after_position: Log position already scanned by the caller
+            up_to_position: Last log position to consider
+            after_id: Keyset cursor, the last aggregate of the previous page
+            limit: Page size
+
+        Returns:
+            Aggregate IDs in ascending order
+        """
+        result = await self._session.execute(
+            text("""
+                WITH active AS (
+                    SELECT DISTINCT e.aggregate_id
+                    FROM events e
+                    WHERE e.position > :after_position AND e.position <= :up_to_position
+                )
+                SELECT a.aggregate_id
+                FROM active a
+                LEFT JOIN LATERAL (
+                    SELECT s.position
+                    FROM snapshots s
+                    WHERE s.aggregate_id = a.aggregate_id
+                    ORDER BY s.version DESC
+                    LIMIT 1
+                ) s ON TRUE
+                CROSS JOIN LATERAL (
+                    SELECT count(*) AS pending
+                    FROM events e
+                    WHERE e.aggregate_id = a.aggregate_id
+                      AND e.position > coalesce(s.position, 0)
+                      AND e.position <= :up_to_position
+                ) p
+                WHERE p.pending >= :threshold
+                  AND a.aggregate_id > :after_id
+                ORDER BY a.aggregate_id
+                LIMIT :limit
+            """),
+            {
+                "after_position": after_position,
+                "up_to_position": up_to_position,
+                "after_id": after_id or UUID(int=0),
+                "threshold": threshold,
+                "limit": limit,
+            },
+        )
+        return [row.aggregate_id for row in result]
+
     async def get_by_user(
         self,
         user_id: UUID,
@@ -357,3 +1147,43 @@ class EventRepository:
         stmt = stmt.order_by(EventModel.created_at.desc()).limit(limit)
         result = await self._session.execute(stmt)
         return list(result.scalars().all())
+
+
+@label_queries
+class GardenerRepository:
+    """Repository for local gardener job checkpoints."""
+
+    def __init__(self, session: AsyncSession):
+        self._session = session
+
+    async def get_checkpoint(self, job: str) -> GardenerCheckpointModel | None:
+        """Get a job's checkpoint (None if the job never ran)."""
+        return await self._session.get(GardenerCheckpointModel, job)
+
+    async def save_checkpoint(
+        self,
+        job: str,
+        after_user_id: UUID | None = None,
+        completed_at: datetime | None = None,
+    ) -> None:
+        """Record a job's progress.
+
+        Args:
+            job: Job name
+            after_user_id: Cursor of the unfinished pass (None when done)
+            completed_at: When the pass finished; keeps the previous
+                value if None
+        """
+        now = datetime.now(UTC)
+        stmt = pg_insert(GardenerCheckpointModel).values(
+            job=job,
+            after_user_id=after_user_id,
+            last_completed_at=completed_at,
+            updated_at=now,
+        )
+        set_ = {"after_user_id": stmt.excluded.after_user_id, "updated_at": now}
+        if completed_at is not None:
+            set_["last_completed_at"] = stmt.excluded.last_completed_at
+        await self._session.execute(
+            stmt.on_conflict_do_update(index_elements=[GardenerCheckpointModel.job], set_=set_)
+        )
@@ -0,0 +1,165 @@
+"""Slow-query capture for the database engine.
+
+Statements slower than a threshold are logged with their parameters
+redacted (only types are kept) and counted per operation, the
+repository or service method that issued them. For a sample of slow
+retrieval SELECTs the plan is captured with EXPLAIN (ANALYZE, BUFFERS),
+so a switch away from the vector or salience index shows up in the
+logs without reproducing the load.
+
+Operations are labelled by decorating a class with ``label_queries``;
+the label travels in a context variable, which SQLAlchemy's async
+engine carries into the greenlet that runs the statement.
+"""
+
+import functools
+import inspect
+import random
+import time
+from contextvars import ContextVar
+from typing import Any, Callable
+
+import structlog
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from mind.config import get_settings
+from mind.observability.metrics import metrics
+
+logger = structlog.get_logger()
+
+_query_label: ContextVar[str] = ContextVar("mind_query_label", default="unlabelled")
+
+# Only these operations are re-run under EXPLAIN ANALYZE (read-only SELECTs)
+_EXPLAIN_PREFIXES = ("RetrievalService.",)
+
+_MAX_STATEMENT_LENGTH = 2000
+
+
+def label_queries(cls: type) -> type:
+    """Label the queries of every async method of a class with its name."""
+    for name, fn in list(vars(cls).items()):
+        if inspect.iscoroutinefunction(fn) and not name.startswith("__"):
+            setattr(cls, name, _labelled(fn, f"{cls.__name__}.{name}"))
+    return cls
+
+
+def _labelled(fn: Callable, label: str) -> Callable:
+    @functools.wraps(fn)
+    async def wrapper(*args: Any, **kwargs: Any) -> Any:
+        token = _query_label.set(label)
+        try:
+            return await fn(*args, **kwargs)
+        finally:
+            _query_label.reset(token)
+
+    return wrapper
+
+
+def redact(parameters: Any) -> Any:
+    """Parameter types without their values."""
+    if isinstance(parameters, dict):
+        return {key: type(value).__name__ for key, value in parameters.items()}
+    if isinstance(parameters, (list, tuple)):
+        return [redact(value) for value in parameters]
+    return type(parameters).__name__
+
+
+class SlowQueryMonitor:
+    """Logs, counts and samples plans of slow statements on an engine."""
+
+    def __init__(
+        self,
+        threshold_ms: float,
+        explain_sample_rate: float = 0.0,
+        explain_interval: float = 60.0,
+        rng: Callable[[], float] = random.random,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._threshold = threshold_ms / 1000
+        self._explain_sample_rate = explain_sample_rate
+        self._explain_interval = explain_interval
+        self._rng = rng
+        self._clock = clock
+        self._last_explain: float | None = None
+
+    @classmethod
+    def from_settings(cls) -> "SlowQueryMonitor | None":
+        """Monitor configured by settings, or None if disabled."""
+        settings = get_settings()
+        if not settings.db_slow_query_ms:
+            return None
+        return cls(
+            threshold_ms=settings.db_slow_query_ms,
+            explain_sample_rate=settings.db_slow_query_explain_sample_rate,
+            explain_interval=settings.db_slow_query_explain_interval,
+        )
+
+    def install(self, engine: Engine) -> None:
+        """Listen to a (sync) engine's statement execution."""
+        event.listen(engine, "before_cursor_execute", self._before)
+        event.listen(engine, "after_cursor_execute", self._after)
+
+    def _before(self, conn, cursor, statement, parameters, context, executemany) -> None:
+        if context is not None:
+            context._mind_query_start = time.perf_counter()
+
+    def _after(self, conn, cursor, statement, parameters, context, executemany) -> None:
+        start = getattr(context, "_mind_query_start", None)
+        if start is None:
+            return
+        duration = time.perf_counter() - start
+        if duration < self._threshold:
+            return
+
+        operation = _query_label.get()
+        metrics.db_slow_queries_total.labels(operation=operation).inc()
+        logger.warning(
+            "slow_query",
+            operation=operation,
+            duration_ms=round(duration * 1000, 2),
+            statement=statement[:_MAX_STATEMENT_LENGTH],
+            parameters=redact(parameters[:1] if executemany else parameters),
+            executemany=executemany,
+        )
+
+        if not executemany and self._should_explain(operation, statement):
+            self._explain(conn, statement, parameters, operation)
+
+    def _should_explain(self, operation: str, statement: str) -> bool:
+        if not operation.startswith(_EXPLAIN_PREFIXES):
+            return False
+        if not statement.lstrip().upper().startswith("SELECT"):
+            return False  # ANALYZE runs the statement; never re-run writes
+        if self._rng() >= self._explain_sample_rate:
+            return False
+        now = self._clock()
+        if self._last_explain is not None and now - self._last_explain < self._explain_interval:
+            return False
+        self._last_explain = now
+        return True
+
+    def _explain(self, conn, statement: str, parameters: Any, operation: str) -> None:
+        """Capture the plan on a separate cursor of the same connection.
+
+        The EXPLAIN runs in a savepoint so that a failure cannot abort
+        the caller's transaction.
+        """
+        cursor = conn.connection.cursor()
+        try:
+            cursor.execute("SAVEPOINT mind_explain")
+            try:
+                cursor.execute(f"EXPLAIN (ANALYZE, BUFFERS) {statement}", parameters)
+                plan = "\n".join(row[0] for row in cursor.fetchall())
+            except Exception as e:
+                cursor.execute("ROLLBACK TO SAVEPOINT mind_explain")
+                logger.warning("slow_query_explain_failed", operation=operation, error=str(e))
+                return
+            cursor.execute("RELEASE SAVEPOINT mind_explain")
+        except Exception as e:
+            logger.warning("slow_query_explain_failed", operation=operation, error=str(e))
+            return
+        finally:
+            cursor.close()
+
+        logger.warning("slow_query_plan", operation=operation, plan=plan)
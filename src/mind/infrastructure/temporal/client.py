@@ -4,6 +4,7 @@ from temporalio.client import Client
 import structlog
 
 from mind.config import get_settings
+from mind.infrastructure.circuit_breaker import get_circuit_breaker
 
 logger = structlog.get_logger()
 
@@ -24,7 +25,8 @@ async def get_temporal_client() -> Client:
         settings = get_settings()
         logger.info("temporal_connecting", host=settings.temporal_host)
 
-        _temporal_client = await Client.connect(
+        _temporal_client = await get_circuit_breaker("temporal").call(
+            Client.connect,
             f"{settings.temporal_host}:{settings.temporal_port}",
             namespace=settings.temporal_namespace,
         )
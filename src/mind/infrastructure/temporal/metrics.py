@@ -0,0 +1,57 @@
+"""Prometheus metrics for Temporal workers.
+
+The interceptor tracks, per task queue, how many activity slots are
+busy and how long activities waited in the queue before a worker
+picked them up. Slots used against slots max shows whether a worker
+pool is saturated; a growing schedule-to-start time shows that the
+queue needs more workers (or higher concurrency limits).
+"""
+
+import time
+from datetime import UTC, datetime
+from typing import Any
+
+from temporalio import activity
+from temporalio.worker import (
+    ActivityInboundInterceptor,
+    ExecuteActivityInput,
+    Interceptor,
+)
+
+from mind.observability.metrics import metrics
+
+
+class ActivityMetricsInterceptor(Interceptor):
+    """Records activity slot usage and queue latency."""
+
+    def __init__(self, task_queue: str, max_concurrent_activities: int):
+        metrics.worker_activity_slots.labels(task_queue=task_queue, state="max").set(
+            max_concurrent_activities
+        )
+        metrics.worker_activity_slots.labels(task_queue=task_queue, state="used").set(0)
+
+    def intercept_activity(self, next: ActivityInboundInterceptor) -> ActivityInboundInterceptor:
+        return _ActivityMetricsInbound(next)
+
+
+class _ActivityMetricsInbound(ActivityInboundInterceptor):
+    async def execute_activity(self, input: ExecuteActivityInput) -> Any:
+        info = activity.info()
+        queued = (datetime.now(UTC) - info.current_attempt_scheduled_time).total_seconds()
+        metrics.worker_activity_schedule_to_start_seconds.labels(
+            task_queue=info.task_queue, activity=info.activity_type
+        ).observe(max(0.0, queued))
+
+        slots = metrics.worker_activity_slots.labels(task_queue=info.task_queue, state="used")
+        slots.inc()
+        start = time.perf_counter()
+        status = "failure"
+        try:
+            result = await super().execute_activity(input)
+            status = "success"
+            return result
+        finally:
+            slots.dec()
+            metrics.worker_activity_duration_seconds.labels(
+                task_queue=info.task_queue, activity=info.activity_type, status=status
+            ).observe(time.perf_counter() - start)
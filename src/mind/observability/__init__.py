@@ -2,5 +2,14 @@
 
 from mind.observability.logging import configure_logging
 from mind.observability.metrics import metrics, MetricsMiddleware
+from mind.observability.tracing import configure_tracing, shutdown_tracing, timed_span, tracer
 
-__all__ = ["configure_logging", "metrics", "MetricsMiddleware"]
+__all__ = [
+    "configure_logging",
+    "metrics",
+    "MetricsMiddleware",
+    "configure_tracing",
+    "shutdown_tracing",
+    "timed_span",
+    "tracer",
+]
@@ -1,12 +1,11 @@
 """Prometheus metrics for Mind v5."""
 
 import time
-from typing import Callable
 
-from fastapi import Request, Response
+from fastapi import Request
 from prometheus_client import Counter, Histogram, Gauge, generate_latest, CONTENT_TYPE_LATEST
-from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.responses import Response as StarletteResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 
 class MindMetrics:
@@ -27,6 +26,19 @@ class MindMetrics:
             buckets=[0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0],
         )
 
+        self.http_response_size_bytes = Histogram(
+            "mind_http_response_size_bytes",
+            "HTTP response body size in bytes",
+            ["method", "endpoint"],
+            buckets=[100, 1_000, 10_000, 100_000, 1_000_000, 10_000_000],
+        )
+
+        self.http_requests_in_flight = Gauge(
+            "mind_http_requests_in_flight",
+            "HTTP requests being handled",
+            ["method"],
+        )
+
         # Memory retrieval metrics
         self.retrieval_latency_seconds = Histogram(
             "mind_retrieval_latency_seconds",
@@ -35,6 +47,15 @@ class MindMetrics:
             buckets=[0.01, 0.02, 0.05, 0.1, 0.2, 0.5, 1.0],
         )
 
+        self.retrieval_stage_seconds = Histogram(
+            "mind_retrieval_stage_seconds",
+            "Time spent in each stage of a retrieval",
+            # embedding, query, hydration, fusion, serialization, publish;
+            # source is the retrieval source for query/hydration, else "all"
+            ["stage", "source"],
+            buckets=[0.0005, 0.001, 0.0025, 0.005, 0.01, 0.02, 0.05, 0.1, 0.2, 0.5],
+        )
+
         self.retrieval_results_total = Counter(
             "mind_retrieval_results_total",
             "Total memories retrieved",
@@ -92,6 +113,122 @@ class MindMetrics:
             ["event_type", "consumer"],
         )
 
+        self.consumer_lane_depth = Gauge(
+            "mind_consumer_lane_depth",
+            "Messages queued in a consumer lane",
+            ["consumer", "lane"],
+        )
+
+        self.consumer_lag_seconds = Gauge(
+            "mind_consumer_lag_seconds",
+            "Age of the most recently handled event per lane",
+            ["consumer", "lane"],
+        )
+
+        self.consumer_pending = Gauge(
+            "mind_consumer_pending",
+            "Messages in the stream not yet delivered to the consumer",
+            ["consumer"],
+        )
+
+        self.events_redelivered_total = Counter(
+            "mind_events_redelivered_total",
+            "Failed messages retried after a backoff delay",
+            ["consumer"],
+        )
+
+        self.events_dead_lettered_total = Counter(
+            "mind_events_dead_lettered_total",
+            "Messages moved to the dead-letter stream",
+            ["consumer", "reason"],  # decode, handler, timeout, redelivery
+        )
+
+        self.consumer_fetch_batch_size = Gauge(
+            "mind_consumer_fetch_batch_size",
+            "Current adaptive fetch batch size",
+            ["consumer"],
+        )
+
+        self.events_publish_in_flight = Gauge(
+            "mind_events_publish_in_flight",
+            "Events published but not yet acknowledged by JetStream",
+        )
+
+        self.event_publish_ack_latency_seconds = Histogram(
+            "mind_event_publish_ack_latency_seconds",
+            "Time from publish to JetStream ack",
+            buckets=[0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 1.0],
+        )
+
+        self.event_publish_retries_total = Counter(
+            "mind_event_publish_retries_total",
+            "Event publishes re-sent after an ack timeout",
+        )
+
+        self.event_publish_failures_total = Counter(
+            "mind_event_publish_failures_total",
+            "Event publishes that failed after all retries",
+            ["event_type"],
+        )
+
+        self.event_queue_depth = Gauge(
+            "mind_event_queue_depth",
+            "Events waiting in the in-process dispatch queue",
+        )
+
+        self.event_queue_overflow_total = Counter(
+            "mind_event_queue_overflow_total",
+            "Events that overflowed the dispatch queue",
+            ["action"],  # dropped, spilled
+        )
+
+        # Event log projection metrics
+        self.events_projected_total = Counter(
+            "mind_events_projected_total",
+            "Events written to the Postgres event log",
+            ["partition"],
+        )
+
+        self.event_projection_rejected_total = Counter(
+            "mind_event_projection_rejected_total",
+            "Stream messages the projector could not write",
+            ["partition", "reason"],  # decode, constraint
+        )
+
+        self.event_projection_batch_seconds = Histogram(
+            "mind_event_projection_batch_seconds",
+            "Time to write one projected batch",
+            ["partition"],
+            buckets=[0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5],
+        )
+
+        self.event_projection_pending = Gauge(
+            "mind_event_projection_pending",
+            "Stream messages not yet delivered to the projector",
+            ["partition"],
+        )
+
+        # Temporal worker metrics
+        self.worker_activity_slots = Gauge(
+            "mind_worker_activity_slots",
+            "Activity slots of a Temporal worker",
+            ["task_queue", "state"],  # used, max
+        )
+
+        self.worker_activity_schedule_to_start_seconds = Histogram(
+            "mind_worker_activity_schedule_to_start_seconds",
+            "Time activities waited in the task queue before starting",
+            ["task_queue", "activity"],
+            buckets=[0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 15.0, 60.0, 300.0],
+        )
+
+        self.worker_activity_duration_seconds = Histogram(
+            "mind_worker_activity_duration_seconds",
+            "Activity execution time",
+            ["task_queue", "activity", "status"],  # success, failure
+            buckets=[0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 15.0, 60.0, 300.0],
+        )
+
         # Embedding metrics
         self.embeddings_generated_total = Counter(
             "mind_embeddings_generated_total",
@@ -104,6 +241,25 @@ class MindMetrics:
             buckets=[0.05, 0.1, 0.2, 0.5, 1.0, 2.0],
         )
 
+        # Circuit breaker metrics
+        self.circuit_breaker_state = Gauge(
+            "mind_circuit_breaker_state",
+            "Circuit breaker state (0=closed, 1=half_open, 2=open)",
+            ["dependency"],
+        )
+
+        self.circuit_breaker_transitions_total = Counter(
+            "mind_circuit_breaker_transitions_total",
+            "Circuit breaker state transitions",
+            ["dependency", "state"],
+        )
+
+        self.circuit_breaker_rejections_total = Counter(
+            "mind_circuit_breaker_rejections_total",
+            "Calls short-circuited by an open breaker",
+            ["dependency"],
+        )
+
         # Connection pool metrics
         self.db_pool_size = Gauge(
             "mind_db_pool_size",
@@ -115,6 +271,25 @@ class MindMetrics:
             "Database connections currently checked out",
         )
 
+        self.db_slow_queries_total = Counter(
+            "mind_db_slow_queries_total",
+            "Statements slower than the slow-query threshold",
+            ["operation"],  # Repository or service method
+        )
+
+        self.db_pool_wait_seconds = Histogram(
+            "mind_db_pool_wait_seconds",
+            "Time waiting to check a connection out of the pool",
+            buckets=[0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0],
+        )
+
+        # Event loop
+        self.event_loop_lag_seconds = Histogram(
+            "mind_event_loop_lag_seconds",
+            "Delay of a scheduled event-loop wakeup past its due time",
+            buckets=[0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 5.0],
+        )
+
     def observe_retrieval(
         self,
         latency_seconds: float,
@@ -141,41 +316,75 @@ class MindMetrics:
 metrics = MindMetrics()
 
 
-class MetricsMiddleware(BaseHTTPMiddleware):
-    """Middleware to record HTTP metrics."""
-
-    async def dispatch(
-        self,
-        request: Request,
-        call_next: Callable,
-    ) -> Response:
-        # Skip metrics endpoint to avoid recursion
-        if request.url.path == "/metrics":
-            return await call_next(request)
-
-        start_time = time.perf_counter()
-
-        response = await call_next(request)
-
-        duration = time.perf_counter() - start_time
-
-        # Extract endpoint (remove path parameters)
-        endpoint = request.url.path
-        for key, value in request.path_params.items():
-            endpoint = endpoint.replace(str(value), f"{{{key}}}")
-
-        metrics.http_requests_total.labels(
-            method=request.method,
-            endpoint=endpoint,
-            status=response.status_code,
-        ).inc()
-
-        metrics.http_request_duration_seconds.labels(
-            method=request.method,
-            endpoint=endpoint,
-        ).observe(duration)
-
-        return response
+_METHODS = frozenset({"GET", "HEAD", "POST", "PUT", "PATCH", "DELETE", "OPTIONS"})
+
+
+class MetricsMiddleware:
+    """ASGI middleware to record HTTP metrics.
+
+    Requests are labelled with the matched route's path template (e.g.
+    /v1/memories/{memory_id}), never the raw path, so label cardinality
+    is bounded by the routes; unmatched paths share one label. Label
+    children are bound once per (method, endpoint, status) and reused.
+    """
+
+    def __init__(self, app: ASGIApp, skip_paths: tuple[str, ...] = ("/metrics",)):
+        self.app = app
+        self._skip_paths = frozenset(skip_paths)
+        self._children: dict[tuple[str, str, int], tuple] = {}
+        self._in_flight: dict[str, Gauge] = {}
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["path"] in self._skip_paths:
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"] if scope["method"] in _METHODS else "OTHER"
+        in_flight = self._in_flight.get(method)
+        if in_flight is None:
+            in_flight = self._in_flight[method] = metrics.http_requests_in_flight.labels(
+                method=method
+            )
+
+        status = 500  # If the app fails before starting a response
+        size = 0
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status, size
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            elif message["type"] == "http.response.body":
+                size += len(message.get("body", b""))
+            await send(message)
+
+        in_flight.inc()
+        start = time.perf_counter_ns()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            duration = (time.perf_counter_ns() - start) / 1e9
+            in_flight.dec()
+
+            # The router stores the matched route in the (shared) scope
+            endpoint = getattr(scope.get("route"), "path", None) or "unmatched"
+            requests, latency, response_size = self._bind(method, endpoint, status)
+            requests.inc()
+            latency.observe(duration)
+            response_size.observe(size)
+
+    def _bind(self, method: str, endpoint: str, status: int) -> tuple:
+        """Label children for a request, bound on first use."""
+        key = (method, endpoint, status)
+        children = self._children.get(key)
+        if children is None:
+            children = self._children[key] = (
+                metrics.http_requests_total.labels(
+                    method=method, endpoint=endpoint, status=status
+                ),
+                metrics.http_request_duration_seconds.labels(method=method, endpoint=endpoint),
+                metrics.http_response_size_bytes.labels(method=method, endpoint=endpoint),
+            )
+        return children
 
 
 async def metrics_endpoint(request: Request) -> StarletteResponse:
@@ -0,0 +1,138 @@
+"""Sampling profiler for a live process.
+
+A background thread snapshots the stacks of the event-loop thread (or
+every thread) at a fixed interval and counts identical stacks. Only the
+sampler thread does work between samples, so the profiled process keeps
+serving; the cost is one stack walk per sample.
+
+Profiles are returned as collapsed stacks ("root;...;leaf count" per
+line), the input format of flamegraph.pl, speedscope and inferno.
+Coroutines show up as the frames of whichever task the loop is running
+when sampled; an idle loop shows as its selector call.
+"""
+
+import asyncio
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from types import CodeType, FrameType
+
+# One profile at a time per process; overlapping samplers distort each other
+profile_lock = asyncio.Lock()
+
+_MAX_DEPTH = 128
+
+
+@dataclass
+class Profile:
+    """Stack samples collected over a time span."""
+
+    interval: float
+    duration: float = 0.0
+    samples: int = 0
+    stacks: Counter = field(default_factory=Counter)  # Collapsed stack -> samples
+
+    def collapsed(self) -> str:
+        """Collapsed stacks, most sampled first."""
+        return "".join(f"{stack} {count}\n" for stack, count in self.stacks.most_common())
+
+
+def _short_path(filename: str) -> str:
+    parts = filename.replace(os.sep, "/").split("/")
+    return "/".join(parts[-2:])
+
+
+def _label(code: CodeType) -> str:
+    name = getattr(code, "co_qualname", code.co_name)
+    label = f"{name} ({_short_path(code.co_filename)}:{code.co_firstlineno})"
+    return label.replace(";", ":")
+
+
+def collapse(frame: FrameType | None, prefix: str | None = None) -> str:
+    """A stack as one collapsed line, root first."""
+    labels = []
+    while frame is not None and len(labels) < _MAX_DEPTH:
+        labels.append(_label(frame.f_code))
+        frame = frame.f_back
+    if prefix:
+        labels.append(prefix)
+    return ";".join(reversed(labels))
+
+
+class SamplingProfiler:
+    """Samples thread stacks from a background thread."""
+
+    def __init__(self, interval: float = 0.005, thread_id: int | None = None):
+        """Create a profiler.
+
+        Args:
+            interval: Seconds between samples
+            thread_id: Only sample this thread; None samples every thread,
+                each stack prefixed with its thread's name
+        """
+        self._profile = Profile(interval=interval)
+        self._thread_id = thread_id
+        self._stopping = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._started = 0.0
+
+    def start(self) -> None:
+        """Start sampling."""
+        self._started = time.perf_counter()
+        self._thread = threading.Thread(target=self._run, name="mind-profiler", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> Profile:
+        """Stop sampling and return the profile."""
+        self._stopping.set()
+        if self._thread is not None:
+            self._thread.join()
+        self._profile.duration = time.perf_counter() - self._started
+        return self._profile
+
+    def _run(self) -> None:
+        own = threading.get_ident()
+        profile = self._profile
+
+        while not self._stopping.wait(profile.interval):
+            frames = sys._current_frames()
+            if self._thread_id is not None:
+                frame = frames.get(self._thread_id)
+                if frame is not None:
+                    profile.stacks[collapse(frame)] += 1
+            else:
+                names = {thread.ident: thread.name for thread in threading.enumerate()}
+                for thread_id, frame in frames.items():
+                    if thread_id != own:
+                        prefix = names.get(thread_id, str(thread_id))
+                        profile.stacks[collapse(frame, prefix)] += 1
+            profile.samples += 1
+            del frames
+
+
+async def profile_process(
+    seconds: float,
+    interval: float = 0.005,
+    all_threads: bool = False,
+) -> Profile:
+    """Profile the running process for a number of seconds.
+
+    Args:
+        seconds: How long to sample
+        interval: Seconds between samples
+        all_threads: Sample every thread instead of the event loop's
+
+    Returns:
+        The collected profile
+    """
+    thread_id = None if all_threads else threading.get_ident()
+    profiler = SamplingProfiler(interval=interval, thread_id=thread_id)
+    profiler.start()
+    try:
+        await asyncio.sleep(seconds)
+    finally:
+        profile = profiler.stop()
+    return profile
@@ -0,0 +1,192 @@
+"""Asyncio task introspection and event-loop lag.
+
+With tracking installed, every task records when it was created and
+which HTTP request it belongs to: the request's task is registered by
+TaskOwnerMiddleware, and tasks it creates inherit the request through a
+context variable. Only the request's method and path are kept, not its
+ASGI scope, so a long-lived task does not hold the request alive. A
+snapshot lists pending tasks with their stack, age and owning route.
+
+Event-loop lag is how late a scheduled wakeup runs. It grows when a
+coroutine blocks the loop (CPU work, sync I/O) and is the most direct
+sign that every request on the process is being held up.
+"""
+
+import asyncio
+import time
+from collections import deque
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any
+from weakref import WeakKeyDictionary
+
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from mind.config import get_settings
+from mind.observability.metrics import metrics
+
+_request_route: ContextVar[str | None] = ContextVar("mind_request_route", default=None)
+
+
+@dataclass
+class _TaskInfo:
+    created: float  # time.monotonic()
+    route: str | None  # Owning request, "METHOD /path"
+
+
+_tasks: "WeakKeyDictionary[asyncio.Task, _TaskInfo]" = WeakKeyDictionary()
+
+
+def install_task_tracking(loop: asyncio.AbstractEventLoop | None = None) -> None:
+    """Record creation time and owning request of tasks created on a loop."""
+    loop = loop or asyncio.get_running_loop()
+    previous = loop.get_task_factory()
+    if getattr(previous, "_mind_tracking", False):
+        return
+
+    def factory(loop: asyncio.AbstractEventLoop, coro: Any, **kwargs: Any) -> asyncio.Future:
+        if previous is not None:
+            task = previous(loop, coro, **kwargs)
+        else:
+            task = asyncio.Task(coro, loop=loop, **kwargs)
+        _tasks[task] = _TaskInfo(created=time.monotonic(), route=_request_route.get())
+        return task
+
+    factory._mind_tracking = True  # type: ignore[attr-defined]
+    loop.set_task_factory(factory)
+
+
+class TaskOwnerMiddleware:
+    """ASGI middleware that attributes the request's tasks to its route."""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        route = f"{scope.get('method', '')} {scope.get('path', '')}".strip()
+        task = asyncio.current_task()
+        if task is not None:
+            # The server created this task before the request was known
+            _tasks[task] = _TaskInfo(created=time.monotonic(), route=route)
+        token = _request_route.set(route)
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            _request_route.reset(token)
+
+
+def _coroutine_name(task: asyncio.Task) -> str:
+    coro = task.get_coro()
+    return getattr(coro, "__qualname__", None) or repr(coro)
+
+
+def task_snapshot(stack_limit: int = 20) -> list[dict[str, Any]]:
+    """Pending tasks of the running loop, oldest first.
+
+    Args:
+        stack_limit: Most frames reported per task
+
+    Returns:
+        One dict per task: name, coroutine, age_seconds (None if created
+        before tracking), route (None outside requests) and stack
+        (innermost frame last)
+    """
+    now = time.monotonic()
+    current = asyncio.current_task()
+    snapshot = []
+
+    for task in asyncio.all_tasks():
+        if task.done() or task is current:
+            continue
+        info = _tasks.get(task)
+        stack = [
+            f"{frame.f_code.co_filename}:{frame.f_lineno} in {frame.f_code.co_name}"
+            for frame in task.get_stack(limit=stack_limit)
+        ]
+        snapshot.append(
+            {
+                "name": task.get_name(),
+                "coroutine": _coroutine_name(task),
+                "age_seconds": round(now - info.created, 3) if info else None,
+                "route": info.route if info else None,
+                "stack": stack,
+            }
+        )
+
+    snapshot.sort(
+        key=lambda task: -1.0 if task["age_seconds"] is None else task["age_seconds"],
+        reverse=True,
+    )
+    return snapshot
+
+
+async def probe_loop_lag() -> float:
+    """Seconds a callback scheduled now waits before it runs."""
+    loop = asyncio.get_running_loop()
+    ran = loop.create_future()
+    scheduled = loop.time()
+    loop.call_soon(lambda: ran.done() or ran.set_result(loop.time()))
+    return max(0.0, await ran - scheduled)
+
+
+class LoopLagMonitor:
+    """Periodically measures event-loop lag into a histogram and a window."""
+
+    def __init__(self, interval: float = 0.5, window: int = 120):
+        self._interval = interval
+        self._recent: deque[float] = deque(maxlen=window)
+        self._task: asyncio.Task | None = None
+
+    def start(self) -> None:
+        """Start probing on the running loop."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run(), name="mind-loop-lag-monitor")
+
+    async def stop(self) -> None:
+        """Stop probing."""
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            due = loop.time() + self._interval
+            await asyncio.sleep(self._interval)
+            lag = max(0.0, loop.time() - due)
+            self._recent.append(lag)
+            metrics.event_loop_lag_seconds.observe(lag)
+
+    def stats(self) -> dict[str, Any]:
+        """Lag over the recent window, in milliseconds."""
+        recent = list(self._recent)
+        return {
+            "window_seconds": round(len(recent) * self._interval, 1),
+            "last_ms": round(recent[-1] * 1000, 3) if recent else None,
+            "mean_ms": round(sum(recent) / len(recent) * 1000, 3) if recent else None,
+            "max_ms": round(max(recent) * 1000, 3) if recent else None,
+        }
+
+
+_loop_lag_monitor: LoopLagMonitor | None = None
+
+
+def get_loop_lag_monitor() -> LoopLagMonitor:
+    """Get or create the process's loop lag monitor."""
+    global _loop_lag_monitor
+    if _loop_lag_monitor is None:
+        _loop_lag_monitor = LoopLagMonitor(interval=get_settings().debug_loop_lag_interval)
+    return _loop_lag_monitor
+
+
+async def close_loop_lag_monitor() -> None:
+    """Stop the loop lag monitor."""
+    global _loop_lag_monitor
+    if _loop_lag_monitor is not None:
+        await _loop_lag_monitor.stop()
+        _loop_lag_monitor = None
@@ -0,0 +1,97 @@
+"""OpenTelemetry tracing.
+
+Tracing is exported over OTLP when MIND_OTEL_EXPORTER_OTLP_ENDPOINT is
+set; otherwise the OpenTelemetry API's no-op tracer is used and spans
+cost next to nothing. ``timed_span`` pairs a span with a Prometheus
+histogram, so hot-path stages are visible both per request (traces)
+and in aggregate (metrics).
+"""
+
+import time
+from contextlib import contextmanager
+from typing import Iterator
+
+import structlog
+from opentelemetry import trace
+from opentelemetry.trace import Span
+
+from mind.config import get_settings
+
+logger = structlog.get_logger()
+
+tracer = trace.get_tracer("mind")
+
+_provider = None
+
+
+def configure_tracing(service_name: str | None = None) -> bool:
+    """Export traces to the configured OTLP endpoint.
+
+    Returns:
+        True if an exporter was installed
+    """
+    global _provider
+
+    settings = get_settings()
+    endpoint = settings.otel_exporter_otlp_endpoint
+    if not endpoint or _provider is not None:
+        return _provider is not None
+
+    try:
+        from opentelemetry.exporter.otlp.proto.grpc.trace_exporter import OTLPSpanExporter
+    except ImportError:
+        logger.warning("otlp_exporter_unavailable", endpoint=endpoint)
+        return False
+
+    from opentelemetry.sdk.resources import SERVICE_NAME, Resource
+    from opentelemetry.sdk.trace import TracerProvider
+    from opentelemetry.sdk.trace.export import BatchSpanProcessor
+    from opentelemetry.sdk.trace.sampling import ParentBasedTraceIdRatio
+
+    _provider = TracerProvider(
+        resource=Resource.create({SERVICE_NAME: service_name or settings.otel_service_name}),
+        sampler=ParentBasedTraceIdRatio(settings.otel_traces_sample_ratio),
+    )
+    _provider.add_span_processor(BatchSpanProcessor(OTLPSpanExporter(endpoint=endpoint)))
+    trace.set_tracer_provider(_provider)
+
+    logger.info("tracing_configured", endpoint=endpoint)
+    return True
+
+
+def instrument_fastapi(app) -> None:
+    """Trace every request of a FastAPI app (when tracing is configured)."""
+    if _provider is None:
+        return
+    try:
+        from opentelemetry.instrumentation.fastapi import FastAPIInstrumentor
+    except ImportError:
+        logger.warning("fastapi_instrumentation_unavailable")
+        return
+    FastAPIInstrumentor.instrument_app(app, tracer_provider=_provider, excluded_urls="/metrics")
+
+
+def shutdown_tracing() -> None:
+    """Flush and stop the exporter."""
+    global _provider
+    if _provider is not None:
+        _provider.shutdown()
+        _provider = None
+
+
+@contextmanager
+def timed_span(name: str, histogram=None, **attributes) -> Iterator[Span]:
+    """Trace a block and observe its duration in seconds.
+
+    Args:
+        name: Span name
+        histogram: Bound Prometheus histogram child to observe, if any
+        **attributes: Span attributes
+    """
+    start = time.perf_counter()
+    with tracer.start_as_current_span(name, attributes=attributes) as span:
+        try:
+            yield span
+        finally:
+            if histogram is not None:
+                histogram.observe(time.perf_counter() - start)
@@ -1,10 +1,12 @@
 """Event service for publishing domain events."""
 
+import asyncio
 from uuid import UUID
 
 import structlog
 
-from mind.core.errors import Result
+from mind.config import get_settings
+from mind.core.errors import ErrorCode, MindError, Result
 from mind.core.events.base import Event, EventEnvelope
 from mind.core.events.memory import (
     MemoryCreated,
@@ -16,7 +18,9 @@ from mind.core.events.decision import DecisionTracked, OutcomeObserved
 from mind.core.memory.models import Memory
 from mind.core.decision.models import DecisionTrace, Outcome
 from mind.infrastructure.nats.client import get_nats_client, NatsClient
-from mind.infrastructure.nats.publisher import EventPublisher
+from mind.infrastructure.nats.dispatcher import EventDispatcher
+from mind.infrastructure.nats.publisher import EventPublisher, PipelinedEventPublisher
+from mind.services.retrieval_events import RetrievalEventPolicy
 
 logger = structlog.get_logger()
 
@@ -27,20 +31,118 @@ class EventService:
     This service provides high-level methods for publishing domain
     events. It handles connection management and wraps events in
     envelopes with proper correlation IDs.
+
+    By default events are handed to a background EventDispatcher so
+    request handlers never wait on NATS. Set
+    MIND_EVENT_DISPATCH_BACKGROUND=false to publish inline instead.
+
+    Retrieval events go through a RetrievalEventPolicy, which may
+    sample them or fold them into per-user window summaries.
     """
 
-    def __init__(self, client: NatsClient | None = None):
+    def __init__(
+        self,
+        client: NatsClient | None = None,
+        background: bool | None = None,
+        retrieval_policy: RetrievalEventPolicy | None = None,
+    ):
         self._client = client
         self._publisher: EventPublisher | None = None
+        if background is None:
+            background = get_settings().event_dispatch_background
+        self._dispatcher = EventDispatcher(self._ensure_publisher) if background else None
+        self._retrieval_policy = retrieval_policy or RetrievalEventPolicy()
+        self._summary_task: asyncio.Task | None = None
+
+    @property
+    def dispatcher(self) -> EventDispatcher | None:
+        """Background dispatcher, if enabled."""
+        return self._dispatcher
+
+    def start(self) -> None:
+        """Start background dispatch and retrieval summary tasks."""
+        if self._dispatcher is not None:
+            self._dispatcher.start()
+        if self._retrieval_policy.mode != "full" and (
+            self._summary_task is None or self._summary_task.done()
+        ):
+            self._summary_task = asyncio.create_task(self._summary_loop())
+
+    async def close(self) -> None:
+        """Flush open retrieval windows and queued events before shutdown."""
+        if self._summary_task is not None:
+            self._summary_task.cancel()
+            try:
+                await self._summary_task
+            except asyncio.CancelledError:
+                pass
+            self._summary_task = None
+            await self.flush_retrieval_summaries(force=True)
+        if self._dispatcher is not None:
+            await self._dispatcher.close()
+
+    async def flush_retrieval_summaries(self, force: bool = False) -> int:
+        """Publish summaries for finished retrieval windows.
+
+        Returns:
+            Number of summaries published
+        """
+        summaries = self._retrieval_policy.drain_summaries(force=force)
+        for user_id, summary in summaries:
+            await self._publish(summary, user_id)
+        return len(summaries)
+
+    async def _summary_loop(self) -> None:
+        """Close retrieval windows as they finish."""
+        interval = max(1.0, self._retrieval_policy.window_seconds / 4)
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                await self.flush_retrieval_summaries()
+            except Exception as e:
+                logger.warning("retrieval_summary_flush_failed", error=str(e))
 
     async def _ensure_publisher(self) -> EventPublisher:
         """Lazily initialize publisher."""
         if self._publisher is None:
             if self._client is None:
                 self._client = await get_nats_client()
-            self._publisher = EventPublisher(self._client)
+            if get_settings().event_publish_mode == "pipelined":
+                self._publisher = PipelinedEventPublisher(self._client)
+            else:
+                self._publisher = EventPublisher(self._client)
         return self._publisher
 
+    async def _publish(
+        self,
+        event: Event,
+        user_id: UUID,
+        correlation_id: UUID | None = None,
+    ) -> Result[None]:
+        """Wrap an event and queue it, or publish inline."""
+        envelope = EventEnvelope.wrap(
+            event=event,
+            user_id=user_id,
+            correlation_id=correlation_id,
+        )
+
+        if self._dispatcher is not None:
+            if await self._dispatcher.enqueue(envelope):
+                return Result.ok(None)
+            return Result.err(
+                MindError(
+                    code=ErrorCode.EVENT_PUBLISH_FAILED,
+                    message="Event queue full",
+                    context={"event_id": str(envelope.event_id)},
+                )
+            )
+
+        publisher = await self._ensure_publisher()
+        result = await publisher.publish(envelope)
+        if result.is_ok:
+            return Result.ok(None)
+        return Result.err(result.error)
+
     async def publish_memory_created(
         self,
         memory: Memory,
@@ -48,8 +150,6 @@ class EventService:
     ) -> Result[None]:
         """Publish a MemoryCreated event."""
         try:
-            publisher = await self._ensure_publisher()
-
             event = MemoryCreated(
                 memory_id=memory.memory_id,
                 content=memory.content,
@@ -59,15 +159,7 @@ class EventService:
                 valid_from=memory.valid_from,
             )
 
-            result = await publisher.publish_event(
-                event=event,
-                user_id=memory.user_id,
-                correlation_id=correlation_id,
-            )
-
-            if result.is_ok:
-                return Result.ok(None)
-            return Result.err(result.error)
+            return await self._publish(event, memory.user_id, correlation_id)
 
         except Exception as e:
             logger.warning("event_publish_skipped", error=str(e), event_type="memory.created")
@@ -86,8 +178,6 @@ class EventService:
     ) -> Result[None]:
         """Publish a MemoryRetrieval event."""
         try:
-            publisher = await self._ensure_publisher()
-
             retrieved = [
                 RetrievedMemory(
                     memory_id=mid,
@@ -106,15 +196,11 @@ class EventService:
                 trace_id=trace_id,
             )
 
-            result = await publisher.publish_event(
-                event=event,
-                user_id=user_id,
-                correlation_id=correlation_id,
-            )
-
-            if result.is_ok:
-                return Result.ok(None)
-            return Result.err(result.error)
+            for kept in self._retrieval_policy.on_retrieval(user_id, event):
+                result = await self._publish(kept, user_id, correlation_id)
+                if result.is_err:
+                    return result
+            return Result.ok(None)
 
         except Exception as e:
             logger.warning("event_publish_skipped", error=str(e), event_type="memory.retrieval")
@@ -133,8 +219,6 @@ class EventService:
     ) -> Result[None]:
         """Publish a MemorySalienceAdjusted event."""
         try:
-            publisher = await self._ensure_publisher()
-
             event = MemorySalienceAdjusted(
                 memory_id=memory_id,
                 trace_id=trace_id,
@@ -144,15 +228,7 @@ class EventService:
                 reason=reason,
             )
 
-            result = await publisher.publish_event(
-                event=event,
-                user_id=user_id,
-                correlation_id=correlation_id,
-            )
-
-            if result.is_ok:
-                return Result.ok(None)
-            return Result.err(result.error)
+            return await self._publish(event, user_id, correlation_id)
 
         except Exception as e:
             logger.warning("event_publish_skipped", error=str(e), event_type="memory.salience_adjusted")
@@ -165,8 +241,6 @@ class EventService:
     ) -> Result[None]:
         """Publish a DecisionTracked event."""
         try:
-            publisher = await self._ensure_publisher()
-
             event = DecisionTracked(
                 trace_id=trace.trace_id,
                 session_id=trace.session_id,
@@ -178,15 +252,15 @@ class EventService:
                 alternatives_count=trace.alternatives_count,
             )
 
-            result = await publisher.publish_event(
-                event=event,
-                user_id=trace.user_id,
-                correlation_id=correlation_id,
-            )
+            result = await self._publish(event, trace.user_id, correlation_id)
 
-            if result.is_ok:
-                return Result.ok(None)
-            return Result.err(result.error)
+            # Retrievals held back by sampling/windowing that fed this decision
+            for linked in self._retrieval_policy.on_decision(
+                trace.user_id, trace.trace_id, trace.memory_ids
+            ):
+                await self._publish(linked, trace.user_id, correlation_id)
+
+            return result
 
         except Exception as e:
             logger.warning("event_publish_skipped", error=str(e), event_type="decision.tracked")
@@ -202,8 +276,6 @@ class EventService:
     ) -> Result[None]:
         """Publish an OutcomeObserved event."""
         try:
-            publisher = await self._ensure_publisher()
-
             event = OutcomeObserved(
                 trace_id=trace_id,
                 outcome_quality=outcome.quality,
@@ -212,15 +284,7 @@ class EventService:
                 memory_attributions=attributions,
             )
 
-            result = await publisher.publish_event(
-                event=event,
-                user_id=user_id,
-                correlation_id=correlation_id,
-            )
-
-            if result.is_ok:
-                return Result.ok(None)
-            return Result.err(result.error)
+            return await self._publish(event, user_id, correlation_id)
 
         except Exception as e:
             logger.warning("event_publish_skipped", error=str(e), event_type="outcome.observed")
@@ -237,3 +301,11 @@ def get_event_service() -> EventService:
     if _event_service is None:
         _event_service = EventService()
     return _event_service
+
+
+async def close_event_service() -> None:
+    """Flush pending events and release the event service."""
+    global _event_service
+    if _event_service is not None:
+        await _event_service.close()
+        _event_service = None
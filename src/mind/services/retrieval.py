@@ -2,13 +2,16 @@
 
 import asyncio
 from datetime import UTC, datetime
+from functools import cache
 from uuid import UUID, uuid4
 
 import structlog
-from sqlalchemy import select, text
+from sqlalchemy import Float, func, inspect, literal_column, select, text
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from mind.config import get_settings
 from mind.core.errors import Result
+from mind.core.memory.decay import DecayCurve, DecayPolicy
 from mind.core.memory.models import Memory, TemporalLevel
 from mind.core.memory.retrieval import RetrievalRequest, RetrievalResult, ScoredMemory
 from mind.core.memory.fusion import (
@@ -17,19 +20,48 @@ from mind.core.memory.fusion import (
     reciprocal_rank_fusion,
     weighted_rrf,
 )
-from mind.infrastructure.postgres.models import MemoryModel
+from mind.infrastructure.postgres.models import MemoryModel, memories_with_archive
+from mind.infrastructure.postgres.slow_query import label_queries
 from mind.infrastructure.embeddings.openai import OpenAIEmbedder
+from mind.observability.metrics import metrics
+from mind.observability.tracing import timed_span
 
 logger = structlog.get_logger()
 
+_MEMORY_COLUMNS = ", ".join(column.name for column in MemoryModel.__table__.columns)
 
+# FROM clauses for raw SQL sources, without and with archived memories
+_LIVE_SOURCE = "memories"
+_ARCHIVE_SOURCE = (
+    f"(SELECT {_MEMORY_COLUMNS} FROM memories "
+    f"UNION ALL SELECT {_MEMORY_COLUMNS} FROM memories_archive) AS memories"
+)
+_VALIDITY_FILTER = """
+                AND (valid_until IS NULL OR valid_until > :now)
+                AND valid_from <= :now"""
+
+
+@cache
+def _stage_histogram(stage: str, source: str):
+    return metrics.retrieval_stage_seconds.labels(stage=stage, source=source)
+
+
+def retrieval_stage(stage: str, source: str = "all"):
+    """Span and stage histogram for one step of a retrieval.
+
+    Stages: embedding, query, hydration, fusion, serialization, publish.
+    """
+    return timed_span(f"retrieval.{stage}", _stage_histogram(stage, source), source=source)
+
+
+@label_queries
 class RetrievalService:
     """Multi-source memory retrieval with RRF fusion.
 
     Combines:
     - Vector similarity (semantic search)
     - Keyword/BM25 (full-text search)
-    - Salience ranking (outcome-weighted)
+    - Salience ranking (outcome-weighted, optionally decayed by time since last use)
     - Recency decay (time-based)
     """
 
@@ -45,9 +77,11 @@ class RetrievalService:
         self,
         session: AsyncSession,
         embedder: OpenAIEmbedder | None = None,
+        decay: DecayPolicy | None = None,
     ):
         self._session = session
         self._embedder = embedder
+        self._decay = decay or decay_policy_from_settings()
 
     async def retrieve(
         self,
@@ -68,21 +102,27 @@ class RetrievalService:
             limit=request.limit,
         )
 
+        with timed_span("retrieval", limit=request.limit):
+            return await self._retrieve(request, start_time, log)
+
+    async def _retrieve(
+        self, request: RetrievalRequest, start_time: datetime, log
+    ) -> Result[RetrievalResult]:
         # Run retrieval sources in parallel
         sources_to_run = []
 
         # Vector search (if embedder available)
         if self._embedder:
-            sources_to_run.append(self._vector_search(request))
+            sources_to_run.append(self._timed_source("vector", self._vector_search(request)))
 
         # Keyword search (always available)
-        sources_to_run.append(self._keyword_search(request))
+        sources_to_run.append(self._timed_source("keyword", self._keyword_search(request)))
 
         # Salience ranking (always available)
-        sources_to_run.append(self._salience_search(request))
+        sources_to_run.append(self._timed_source("salience", self._salience_search(request)))
 
         # Recency ranking (always available)
-        sources_to_run.append(self._recency_search(request))
+        sources_to_run.append(self._timed_source("recency", self._recency_search(request)))
 
         # Execute in parallel
         results = await asyncio.gather(*sources_to_run, return_exceptions=True)
@@ -109,26 +149,27 @@ class RetrievalService:
                 )
             )
 
-        # Fuse results
-        fused = weighted_rrf(
-            ranked_lists=ranked_lists,
-            k=60,
-            limit=request.limit,
-        )
-
-        # Convert to ScoredMemory
-        scored_memories = []
-        for i, fm in enumerate(fused):
-            scored = ScoredMemory(
-                memory=fm.memory,
-                vector_score=fm.raw_scores.get("vector"),
-                keyword_score=fm.raw_scores.get("keyword"),
-                recency_score=fm.raw_scores.get("recency"),
-                salience_score=fm.raw_scores.get("salience"),
-                final_score=fm.rrf_score,
-                rank=i + 1,
+        with retrieval_stage("fusion"):
+            # Fuse results
+            fused = weighted_rrf(
+                ranked_lists=ranked_lists,
+                k=60,
+                limit=request.limit,
             )
-            scored_memories.append(scored)
+
+            # Convert to ScoredMemory
+            scored_memories = []
+            for i, fm in enumerate(fused):
+                scored = ScoredMemory(
+                    memory=fm.memory,
+                    vector_score=fm.raw_scores.get("vector"),
+                    keyword_score=fm.raw_scores.get("keyword"),
+                    recency_score=fm.raw_scores.get("recency"),
+                    salience_score=fm.raw_scores.get("salience"),
+                    final_score=fm.rrf_score,
+                    rank=i + 1,
+                )
+                scored_memories.append(scored)
 
         latency_ms = (datetime.now(UTC) - start_time).total_seconds() * 1000
 
@@ -148,6 +189,15 @@ class RetrievalService:
             )
         )
 
+    async def _timed_source(self, source: str, search) -> list[RankedMemory]:
+        """Run one source under its span and per-source latency histogram."""
+        with timed_span(
+            f"retrieval.source.{source}",
+            metrics.retrieval_latency_seconds.labels(source=source),
+            source=source,
+        ):
+            return await search
+
     async def _vector_search(
         self,
         request: RetrievalRequest,
@@ -157,7 +207,8 @@ class RetrievalService:
             return []
 
         # Generate query embedding
-        embed_result = await self._embedder.embed(request.query)
+        with retrieval_stage("embedding"):
+            embed_result = await self._embedder.embed(request.query)
         if embed_result.is_err:
             logger.warning("embedding_failed", error=str(embed_result.error))
             return []
@@ -165,43 +216,45 @@ class RetrievalService:
         query_embedding = embed_result.value
 
         # Vector search using pgvector
-        stmt = text("""
+        source, validity = self._sql_source(request)
+        stmt = text(f"""
             SELECT
                 memory_id, user_id, content, content_type, temporal_level,
                 valid_from, valid_until, base_salience, outcome_adjustment,
                 retrieval_count, decision_count, positive_outcomes, negative_outcomes,
                 promoted_from_level, promotion_timestamp, created_at, updated_at,
                 1 - (embedding <=> :embedding::vector) as similarity
-            FROM memories
+            FROM {source}
             WHERE user_id = :user_id
-                AND embedding IS NOT NULL
-                AND (valid_until IS NULL OR valid_until > :now)
-                AND valid_from <= :now
+                AND embedding IS NOT NULL{validity}
             ORDER BY embedding <=> :embedding::vector
             LIMIT :limit
         """)
 
-        result = await self._session.execute(
-            stmt,
-            {
-                "user_id": str(request.user_id),
-                "embedding": query_embedding,
-                "now": datetime.now(UTC),
-                "limit": request.limit * 2,  # Over-fetch for fusion
-            },
-        )
-
-        ranked = []
-        for i, row in enumerate(result.fetchall()):
-            memory = self._row_to_memory(row)
-            ranked.append(
-                RankedMemory(
-                    memory=memory,
-                    rank=i + 1,
-                    source="vector",
-                    raw_score=float(row.similarity),
-                )
+        with retrieval_stage("query", "vector"):
+            result = await self._session.execute(
+                stmt,
+                {
+                    "user_id": str(request.user_id),
+                    "embedding": query_embedding,
+                    "now": datetime.now(UTC),
+                    "limit": request.limit * 2,  # Over-fetch for fusion
+                },
             )
+            rows = result.fetchall()
+
+        with retrieval_stage("hydration", "vector"):
+            ranked = []
+            for i, row in enumerate(rows):
+                memory = self._row_to_memory(row)
+                ranked.append(
+                    RankedMemory(
+                        memory=memory,
+                        rank=i + 1,
+                        source="vector",
+                        raw_score=float(row.similarity),
+                    )
+                )
 
         return ranked
 
@@ -211,43 +264,45 @@ class RetrievalService:
     ) -> list[RankedMemory]:
         """Search by keyword/full-text."""
         # PostgreSQL full-text search
-        stmt = text("""
+        source, validity = self._sql_source(request)
+        stmt = text(f"""
             SELECT
                 memory_id, user_id, content, content_type, temporal_level,
                 valid_from, valid_until, base_salience, outcome_adjustment,
                 retrieval_count, decision_count, positive_outcomes, negative_outcomes,
                 promoted_from_level, promotion_timestamp, created_at, updated_at,
                 ts_rank(to_tsvector('english', content), plainto_tsquery('english', :query)) as rank_score
-            FROM memories
+            FROM {source}
             WHERE user_id = :user_id
-                AND to_tsvector('english', content) @@ plainto_tsquery('english', :query)
-                AND (valid_until IS NULL OR valid_until > :now)
-                AND valid_from <= :now
+                AND to_tsvector('english', content) @@ plainto_tsquery('english', :query){validity}
             ORDER BY rank_score DESC
             LIMIT :limit
         """)
 
-        result = await self._session.execute(
-            stmt,
-            {
-                "user_id": str(request.user_id),
-                "query": request.query,
-                "now": datetime.now(UTC),
-                "limit": request.limit * 2,
-            },
-        )
-
-        ranked = []
-        for i, row in enumerate(result.fetchall()):
-            memory = self._row_to_memory(row)
-            ranked.append(
-                RankedMemory(
-                    memory=memory,
-                    rank=i + 1,
-                    source="keyword",
-                    raw_score=float(row.rank_score) if row.rank_score else 0.0,
-                )
+        with retrieval_stage("query", "keyword"):
+            result = await self._session.execute(
+                stmt,
+                {
+                    "user_id": str(request.user_id),
+                    "query": request.query,
+                    "now": datetime.now(UTC),
+                    "limit": request.limit * 2,
+                },
             )
+            rows = result.fetchall()
+
+        with retrieval_stage("hydration", "keyword"):
+            ranked = []
+            for i, row in enumerate(rows):
+                memory = self._row_to_memory(row)
+                ranked.append(
+                    RankedMemory(
+                        memory=memory,
+                        rank=i + 1,
+                        source="keyword",
+                        raw_score=float(row.rank_score) if row.rank_score else 0.0,
+                    )
+                )
 
         return ranked
 
@@ -255,45 +310,55 @@ class RetrievalService:
         self,
         request: RetrievalRequest,
     ) -> list[RankedMemory]:
-        """Search by outcome-weighted salience."""
-        stmt = (
-            select(MemoryModel)
-            .where(MemoryModel.user_id == request.user_id)
-            .where(
-                (MemoryModel.valid_until.is_(None))
-                | (MemoryModel.valid_until > datetime.now(UTC))
-            )
-            .where(MemoryModel.valid_from <= datetime.now(UTC))
-            .order_by(
-                (MemoryModel.base_salience + MemoryModel.outcome_adjustment).desc()
+        """Search by outcome-weighted salience, decayed at read time."""
+        memories = self._orm_source(request)
+        salience = memories.base_salience + memories.outcome_adjustment
+        if self._decay.curve != DecayCurve.NONE:
+            # Clamped like Memory.effective_salience, then decayed; without
+            # decay the raw sum is used so the salience index applies
+            table = inspect(memories).selectable.name
+            last_used = f"COALESCE({table}.last_used_at, {table}.updated_at)"
+            salience = func.greatest(0.0, func.least(1.0, salience)) * literal_column(
+                self._decay.sql_factor(last_used, "now()"), Float
             )
+
+        stmt = (
+            select(memories)
+            .where(memories.user_id == request.user_id)
+            .order_by(salience.desc())
             .limit(request.limit * 2)
         )
+        if not request.include_expired:
+            stmt = self._only_valid(stmt, memories)
 
         if request.temporal_levels:
             levels = [level.value for level in request.temporal_levels]
-            stmt = stmt.where(MemoryModel.temporal_level.in_(levels))
+            stmt = stmt.where(memories.temporal_level.in_(levels))
 
         if request.min_salience > 0:
-            stmt = stmt.where(
-                (MemoryModel.base_salience + MemoryModel.outcome_adjustment)
-                >= request.min_salience
-            )
-
-        result = await self._session.execute(stmt)
-        models = result.scalars().all()
-
-        ranked = []
-        for i, model in enumerate(models):
-            memory = self._model_to_memory(model)
-            ranked.append(
-                RankedMemory(
-                    memory=memory,
-                    rank=i + 1,
-                    source="salience",
-                    raw_score=memory.effective_salience,
+            stmt = stmt.where(salience >= request.min_salience)
+
+        with retrieval_stage("query", "salience"):
+            result = await self._session.execute(stmt)
+            models = result.scalars().all()
+
+        with retrieval_stage("hydration", "salience"):
+            now = datetime.now(UTC)
+            ranked = []
+            for i, model in enumerate(models):
+                memory = self._model_to_memory(model)
+                ranked.append(
+                    RankedMemory(
+                        memory=memory,
+                        rank=i + 1,
+                        source="salience",
+                        raw_score=self._decay.apply(
+                            memory.effective_salience,
+                            model.last_used_at or memory.updated_at,
+                            now,
+                        ),
+                    )
                 )
-            )
 
         return ranked
 
@@ -302,39 +367,63 @@ class RetrievalService:
         request: RetrievalRequest,
     ) -> list[RankedMemory]:
         """Search by recency (most recent first)."""
+        memories = self._orm_source(request)
         stmt = (
-            select(MemoryModel)
-            .where(MemoryModel.user_id == request.user_id)
-            .where(
-                (MemoryModel.valid_until.is_(None))
-                | (MemoryModel.valid_until > datetime.now(UTC))
-            )
-            .where(MemoryModel.valid_from <= datetime.now(UTC))
-            .order_by(MemoryModel.created_at.desc())
+            select(memories)
+            .where(memories.user_id == request.user_id)
+            .order_by(memories.created_at.desc())
             .limit(request.limit * 2)
         )
-
-        result = await self._session.execute(stmt)
-        models = result.scalars().all()
-
-        now = datetime.now(UTC)
-        ranked = []
-        for i, model in enumerate(models):
-            memory = self._model_to_memory(model)
-            # Recency score: exponential decay over 7 days
-            age_hours = (now - memory.created_at).total_seconds() / 3600
-            recency_score = 1.0 / (1.0 + age_hours / 168)  # 168 hours = 7 days
-            ranked.append(
-                RankedMemory(
-                    memory=memory,
-                    rank=i + 1,
-                    source="recency",
-                    raw_score=recency_score,
+        if not request.include_expired:
+            stmt = self._only_valid(stmt, memories)
+
+        with retrieval_stage("query", "recency"):
+            result = await self._session.execute(stmt)
+            models = result.scalars().all()
+
+        with retrieval_stage("hydration", "recency"):
+            now = datetime.now(UTC)
+            ranked = []
+            for i, model in enumerate(models):
+                memory = self._model_to_memory(model)
+                # Recency score: exponential decay over 7 days
+                age_hours = (now - memory.created_at).total_seconds() / 3600
+                recency_score = 1.0 / (1.0 + age_hours / 168)  # 168 hours = 7 days
+                ranked.append(
+                    RankedMemory(
+                        memory=memory,
+                        rank=i + 1,
+                        source="recency",
+                        raw_score=recency_score,
+                    )
                 )
-            )
 
         return ranked
 
+    @staticmethod
+    def _sql_source(request: RetrievalRequest) -> tuple[str, str]:
+        """FROM clause and validity filter for the raw SQL sources.
+
+        With include_expired, archived memories are searched too and
+        expired ones are not filtered out.
+        """
+        if request.include_expired:
+            return _ARCHIVE_SOURCE, ""
+        return _LIVE_SOURCE, _VALIDITY_FILTER
+
+    @staticmethod
+    def _orm_source(request: RetrievalRequest):
+        """Entity for the ORM sources, including the archive if requested."""
+        return memories_with_archive() if request.include_expired else MemoryModel
+
+    @staticmethod
+    def _only_valid(stmt, memories):
+        """Restrict a query to currently valid memories."""
+        now = datetime.now(UTC)
+        return stmt.where(
+            (memories.valid_until.is_(None)) | (memories.valid_until > now)
+        ).where(memories.valid_from <= now)
+
     def _model_to_memory(self, model: MemoryModel) -> Memory:
         """Convert SQLAlchemy model to domain object."""
         return Memory(
@@ -386,3 +475,13 @@ class RetrievalService:
             created_at=row.created_at,
             updated_at=row.updated_at,
         )
+
+
+def decay_policy_from_settings() -> DecayPolicy:
+    """Build the configured salience decay policy."""
+    settings = get_settings()
+    return DecayPolicy(
+        curve=DecayCurve(settings.memory_decay_curve),
+        half_life_hours=settings.memory_decay_half_life_hours,
+        min_factor=settings.memory_decay_min_factor,
+    )
@@ -0,0 +1,181 @@
+"""Publishing policy for memory.retrieval events.
+
+Retrievals are by far the highest-volume event, and most consumers only
+need aggregates. The policy decides what is published:
+
+- full: every MemoryRetrieval event
+- sampled: a random fraction, marked with its sample_rate
+- windowed: one MemoryRetrievalSummarized per user and time window,
+  with counts and a memory-id hit histogram
+
+Retrievals that carry a trace_id are always published. Those that are
+not published are held for a while; if a decision trace for the same
+user then cites any of their memories, they are published in full with
+that trace_id, so the outcome-learning signal is never sampled away.
+
+Each retrieval is counted in exactly one place. In windowed mode every
+retrieval, traced or not, is counted by its window's summary. A full
+event published alongside, whether traced or released by a decision,
+is marked already_counted. In sampled mode the sampled events' weights
+stand for every untraced retrieval, so released events are marked
+already_counted too. Traced events are counted at weight 1.
+"""
+
+import random
+from collections import Counter, deque
+from dataclasses import dataclass, field
+from datetime import UTC, datetime, timedelta
+from typing import Callable, Literal
+from uuid import UUID
+
+from mind.config import get_settings
+from mind.core.events.memory import MemoryRetrieval, MemoryRetrievalSummarized
+
+RetrievalMode = Literal["full", "sampled", "windowed"]
+
+
+@dataclass
+class _Window:
+    """Running totals of one user's retrievals."""
+
+    start: datetime
+    count: int = 0
+    total_latency_ms: float = 0.0
+    hits: Counter = field(default_factory=Counter)
+
+
+class RetrievalEventPolicy:
+    """Decides which retrieval events to publish."""
+
+    def __init__(
+        self,
+        mode: RetrievalMode | None = None,
+        sample_rate: float | None = None,
+        window_seconds: float | None = None,
+        hold_seconds: float | None = None,
+        hold_per_user: int | None = None,
+        clock: Callable[[], datetime] = lambda: datetime.now(UTC),
+        rng: Callable[[], float] = random.random,
+    ):
+        settings = get_settings()
+        self.mode: RetrievalMode = mode or settings.event_retrieval_mode
+        self._sample_rate = (
+            sample_rate if sample_rate is not None else settings.event_retrieval_sample_rate
+        )
+        self._window = timedelta(
+            seconds=window_seconds or settings.event_retrieval_window_seconds
+        )
+        self._hold = timedelta(seconds=hold_seconds or settings.event_retrieval_hold_seconds)
+        self._hold_per_user = hold_per_user or settings.event_retrieval_hold_per_user
+        self._clock = clock
+        self._rng = rng
+
+        self._windows: dict[UUID, _Window] = {}
+        self._held: dict[UUID, deque[tuple[datetime, MemoryRetrieval]]] = {}
+
+    @property
+    def window_seconds(self) -> float:
+        """Length of a summary window."""
+        return self._window.total_seconds()
+
+    def on_retrieval(self, user_id: UUID, event: MemoryRetrieval) -> list[MemoryRetrieval]:
+        """Account for a retrieval.
+
+        Returns:
+            The retrieval events to publish now
+        """
+        if self.mode == "full":
+            return [event]
+
+        if self.mode == "windowed":
+            self._add_to_window(user_id, event)
+            if event.trace_id is not None:
+                return [event.model_copy(update={"already_counted": True})]
+        elif event.trace_id is not None:
+            return [event]
+        elif self._rng() < self._sample_rate:
+            return [event.model_copy(update={"sample_rate": self._sample_rate})]
+
+        self._hold_event(user_id, event)
+        return []
+
+    def on_decision(
+        self, user_id: UUID, trace_id: UUID, memory_ids: list[UUID]
+    ) -> list[MemoryRetrieval]:
+        """Release held retrievals that a decision trace links to.
+
+        Returns:
+            The linked retrieval events, with trace_id set and marked
+            already_counted
+        """
+        held = self._held.get(user_id)
+        if not held:
+            return []
+
+        cited = set(memory_ids)
+        linked, kept = [], deque(maxlen=self._hold_per_user)
+        cutoff = self._clock() - self._hold
+        for held_at, event in held:
+            if held_at < cutoff:
+                continue
+            if cited.intersection(m.memory_id for m in event.memories):
+                linked.append(
+                    event.model_copy(update={"trace_id": trace_id, "already_counted": True})
+                )
+            else:
+                kept.append((held_at, event))
+
+        if kept:
+            self._held[user_id] = kept
+        else:
+            del self._held[user_id]
+        return linked
+
+    def drain_summaries(
+        self, force: bool = False
+    ) -> list[tuple[UUID, MemoryRetrievalSummarized]]:
+        """Close finished windows (all windows if forced) and expire held events.
+
+        Returns:
+            (user_id, summary) pairs to publish
+        """
+        now = self._clock()
+        summaries = []
+        for user_id, window in list(self._windows.items()):
+            if force or now - window.start >= self._window:
+                del self._windows[user_id]
+                summaries.append(
+                    (
+                        user_id,
+                        MemoryRetrievalSummarized(
+                            window_start=window.start,
+                            window_end=now,
+                            retrieval_count=window.count,
+                            total_latency_ms=window.total_latency_ms,
+                            memory_hits={str(mid): n for mid, n in window.hits.items()},
+                        ),
+                    )
+                )
+
+        cutoff = now - self._hold
+        for user_id, held in list(self._held.items()):
+            while held and held[0][0] < cutoff:
+                held.popleft()
+            if not held:
+                del self._held[user_id]
+
+        return summaries
+
+    def _add_to_window(self, user_id: UUID, event: MemoryRetrieval) -> None:
+        window = self._windows.get(user_id)
+        if window is None:
+            window = self._windows[user_id] = _Window(start=self._clock())
+        window.count += 1
+        window.total_latency_ms += event.latency_ms
+        window.hits.update(m.memory_id for m in event.memories)
+
+    def _hold_event(self, user_id: UUID, event: MemoryRetrieval) -> None:
+        held = self._held.get(user_id)
+        if held is None:
+            held = self._held[user_id] = deque(maxlen=self._hold_per_user)
+        held.append((self._clock(), event))
@@ -0,0 +1,82 @@
+"""Command-line tooling for the MIND_DLQ dead-letter stream.
+
+Usage:
+    python -m mind.workers.dlq list [--consumer NAME] [--limit N]
+    python -m mind.workers.dlq requeue SEQUENCE [SEQUENCE ...]
+    python -m mind.workers.dlq requeue --all [--consumer NAME]
+    python -m mind.workers.dlq delete SEQUENCE [SEQUENCE ...]
+"""
+
+import argparse
+import asyncio
+import sys
+
+from mind.infrastructure.nats.client import close_nats_client, get_nats_client
+from mind.infrastructure.nats.dlq import DeadLetterQueue
+
+
+async def run(args: argparse.Namespace) -> int:
+    """Run a DLQ command and return a process exit code."""
+    dlq = DeadLetterQueue(await get_nats_client())
+    failed = 0
+
+    try:
+        if args.command == "list":
+            for letter in await dlq.list(limit=args.limit, consumer=args.consumer):
+                print(
+                    f"{letter.sequence}\t{letter.failed_at}\t{letter.consumer}\t"
+                    f"{letter.subject}\t{letter.reason}\tattempts={letter.attempts}\t"
+                    f"{letter.error}"
+                )
+
+        elif args.command == "requeue":
+            sequences = args.sequences
+            if args.all:
+                letters = await dlq.list(limit=args.limit, consumer=args.consumer)
+                sequences = [letter.sequence for letter in letters]
+            for sequence in sequences:
+                result = await dlq.requeue(sequence)
+                if result.is_err:
+                    print(f"{sequence}: {result.error}", file=sys.stderr)
+                    failed += 1
+                else:
+                    print(f"{sequence}: requeued to {result.value.subject}")
+
+        elif args.command == "delete":
+            for sequence in args.sequences:
+                if not await dlq.delete(sequence):
+                    print(f"{sequence}: not found", file=sys.stderr)
+                    failed += 1
+    finally:
+        await close_nats_client()
+
+    return 1 if failed else 0
+
+
+def main() -> None:
+    """Entry point for the DLQ tool."""
+    parser = argparse.ArgumentParser(description="Inspect and requeue dead-lettered events")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    list_cmd = commands.add_parser("list", help="List dead letters, oldest first")
+    list_cmd.add_argument("--consumer", help="Only entries from this consumer")
+    list_cmd.add_argument("--limit", type=int, default=100)
+
+    requeue_cmd = commands.add_parser("requeue", help="Republish to the original subject")
+    requeue_cmd.add_argument("sequences", type=int, nargs="*")
+    requeue_cmd.add_argument("--all", action="store_true", help="Requeue every listed entry")
+    requeue_cmd.add_argument("--consumer", help="With --all, only this consumer's entries")
+    requeue_cmd.add_argument("--limit", type=int, default=1000)
+
+    delete_cmd = commands.add_parser("delete", help="Discard dead letters")
+    delete_cmd.add_argument("sequences", type=int, nargs="+")
+
+    args = parser.parse_args()
+    if args.command == "requeue" and not (args.sequences or args.all):
+        parser.error("requeue needs sequences or --all")
+
+    sys.exit(asyncio.run(run(args)))
+
+
+if __name__ == "__main__":
+    main()
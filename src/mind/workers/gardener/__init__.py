@@ -1,15 +1,35 @@
 """Gardener worker - manages memory lifecycle and promotion."""
 
-from mind.workers.gardener.workflows import MemoryPromotionWorkflow
+from mind.workers.gardener.workflows import (
+    IncrementalGardenerWorkflow,
+    MemoryConsolidationWorkflow,
+    MemoryExpirationWorkflow,
+    MemoryPromotionWorkflow,
+)
 from mind.workers.gardener.activities import (
+    archive_expired_memories,
+    clear_dirty_memories,
+    consolidate_memories,
+    find_dirty_promotion_candidates,
     find_promotion_candidates,
+    list_users_page,
+    promote_memories_batch,
     promote_memory,
     notify_promotion,
 )
 
 __all__ = [
+    "IncrementalGardenerWorkflow",
+    "MemoryConsolidationWorkflow",
+    "MemoryExpirationWorkflow",
     "MemoryPromotionWorkflow",
+    "archive_expired_memories",
+    "clear_dirty_memories",
+    "consolidate_memories",
+    "find_dirty_promotion_candidates",
     "find_promotion_candidates",
+    "list_users_page",
+    "promote_memories_batch",
     "promote_memory",
     "notify_promotion",
 ]
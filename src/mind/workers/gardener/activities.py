@@ -5,16 +5,20 @@ They should be idempotent and handle their own retries for
 transient failures.
 """
 
-from dataclasses import dataclass
+import heapq
+from dataclasses import dataclass, field
 from datetime import UTC, datetime, timedelta
-from uuid import UUID
+from uuid import UUID, uuid5
 
 from temporalio import activity
 
 from mind.core.memory.models import Memory, TemporalLevel
-from mind.core.events.memory import MemoryPromoted
+from mind.core.events.base import EventEnvelope
+from mind.core.events.memory import MemoryConsolidated, MemoryExpired, MemoryPromoted
+from mind.infrastructure.nats.client import get_nats_client
+from mind.infrastructure.nats.publisher import PipelinedEventPublisher
 from mind.infrastructure.postgres.database import get_database
-from mind.infrastructure.postgres.repositories import MemoryRepository
+from mind.infrastructure.postgres.repositories import MemoryRepository, UserRepository
 from mind.services.events import get_event_service
 
 
@@ -41,6 +45,42 @@ class PromotionResult:
     error: str | None = None
 
 
+@dataclass
+class BatchPromotionResult:
+    """Result of promoting a batch of candidates."""
+
+    results: list[PromotionResult] = field(default_factory=list)
+    events_published: int = 0
+
+
+@dataclass
+class DirtyBatch:
+    """Dirty memories evaluated in one incremental gardening step."""
+
+    memory_ids: list[UUID]
+    watermark: datetime  # Marks at or before this time were evaluated
+    candidates: list[PromotionCandidate] = field(default_factory=list)
+
+
+@dataclass
+class ConsolidationResult:
+    """Result of consolidating a user's near-duplicate memories."""
+
+    pairs_found: int = 0
+    clusters_merged: int = 0
+    memories_merged: int = 0
+    events_published: int = 0
+    budget_exhausted: bool = False
+
+
+@dataclass
+class ExpirationResult:
+    """Result of archiving one batch of expired memories."""
+
+    archived: int = 0
+    events_published: int = 0
+
+
 # Promotion criteria thresholds
 PROMOTION_THRESHOLDS = {
     # From IMMEDIATE to SITUATIONAL
@@ -67,6 +107,25 @@ PROMOTION_THRESHOLDS = {
 }
 
 
+@activity.defn
+async def list_users_page(
+    after_user_id: UUID | None,
+    limit: int = 1000,
+) -> list[UUID]:
+    """List the next page of user IDs for a gardening pass.
+
+    Args:
+        after_user_id: Last user ID of the previous page (None to start)
+        limit: Page size
+
+    Returns:
+        Up to `limit` user IDs after `after_user_id`, ascending
+    """
+    db = get_database()
+    async with db.session() as session:
+        return await UserRepository(session).list_ids(after=after_user_id, limit=limit)
+
+
 @activity.defn
 async def find_promotion_candidates(
     user_id: UUID,
@@ -75,7 +134,8 @@ async def find_promotion_candidates(
     """Find memories eligible for promotion.
 
     This activity scans a user's memories and identifies those that
-    meet the criteria for promotion to the next temporal level.
+    meet the criteria for promotion to the next temporal level. All
+    levels are checked and scored in a single query.
 
     Criteria include:
     - Age (time since creation)
@@ -92,99 +152,91 @@ async def find_promotion_candidates(
     """
     activity.logger.info(f"Finding promotion candidates for user {user_id}")
 
-    candidates = []
     db = get_database()
-
     async with db.session() as session:
         repo = MemoryRepository(session)
+        rows = await repo.find_promotion_candidates(
+            user_id=user_id,
+            thresholds=PROMOTION_THRESHOLDS,
+            limit=batch_size,
+        )
 
-        # Check each level for promotion opportunities
-        for from_level in [TemporalLevel.IMMEDIATE, TemporalLevel.SITUATIONAL, TemporalLevel.SEASONAL]:
-            to_level = TemporalLevel(from_level.value + 1)
-            thresholds = PROMOTION_THRESHOLDS.get((from_level, to_level))
-
-            if not thresholds:
-                continue
-
-            # Query memories at this level
-            result = await repo.retrieve(
-                user_id=user_id,
-                temporal_levels=[from_level],
-                limit=batch_size,
-            )
-
-            if not result.is_ok:
-                activity.logger.warning(f"Failed to query level {from_level}: {result.error}")
-                continue
+    return [_promotion_candidate(row) for row in rows]
 
-            for scored_memory in result.value.memories:
-                memory = scored_memory.memory
 
-                # Check age
-                age_hours = (datetime.now(UTC) - memory.created_at).total_seconds() / 3600
-                if age_hours < thresholds["min_age_hours"]:
-                    continue
+@activity.defn
+async def find_dirty_promotion_candidates(batch_size: int = 1000) -> DirtyBatch:
+    """Evaluate the memories touched by events since they were last gardened.
 
-                # Check retrieval count
-                if memory.retrieval_count < thresholds["min_retrieval_count"]:
-                    continue
+    The oldest due dirty memories marked up to now are read and checked
+    against the promotion criteria in one query, across all users.
+    Memories that meet every criterion but min_age_hours stay dirty,
+    deferred until they are old enough: no event would mark them again.
 
-                # Check outcome ratio
-                total_outcomes = memory.positive_outcomes + memory.negative_outcomes
-                if total_outcomes > 0:
-                    positive_ratio = memory.positive_outcomes / total_outcomes
-                    if positive_ratio < thresholds["min_positive_ratio"]:
-                        continue
+    Args:
+        batch_size: Maximum dirty memories to evaluate
 
-                # Check salience
-                if memory.effective_salience < thresholds["min_salience"]:
-                    continue
+    Returns:
+        The evaluated memory IDs, the watermark to clear them with and
+        the promotion candidates among them
+    """
+    watermark = datetime.now(UTC)
 
-                # Calculate promotion score (higher is better)
-                score = _calculate_promotion_score(memory, thresholds)
+    db = get_database()
+    async with db.session() as session:
+        repo = MemoryRepository(session)
+        memory_ids = await repo.get_dirty(watermark, limit=batch_size)
+        rows = await repo.find_promotion_candidates(
+            user_id=None,
+            thresholds=PROMOTION_THRESHOLDS,
+            limit=len(memory_ids),
+            memory_ids=memory_ids,
+            include_young=True,
+        )
+        candidates = [row for row in rows if row.old_enough_at <= watermark]
+        deferred = {
+            row.memory_id: row.old_enough_at for row in rows if row.old_enough_at > watermark
+        }
+        await repo.defer_dirty(deferred)
 
-                candidates.append(PromotionCandidate(
-                    memory_id=memory.memory_id,
-                    user_id=memory.user_id,
-                    current_level=from_level,
-                    target_level=to_level,
-                    score=score,
-                    reason=f"Met all criteria: age={age_hours:.0f}h, retrievals={memory.retrieval_count}, "
-                           f"salience={memory.effective_salience:.2f}",
-                ))
+    activity.logger.info(
+        f"Evaluated {len(memory_ids)} dirty memories, {len(candidates)} promotion candidates, "
+        f"{len(deferred)} deferred until old enough"
+    )
+    return DirtyBatch(
+        memory_ids=memory_ids,
+        watermark=watermark,
+        candidates=[_promotion_candidate(row) for row in candidates],
+    )
 
-    # Sort by score and limit
-    candidates.sort(key=lambda c: c.score, reverse=True)
-    return candidates[:batch_size]
 
+@activity.defn
+async def clear_dirty_memories(memory_ids: list[UUID], watermark: datetime) -> int:
+    """Clear gardened memories from the dirty set.
 
-def _calculate_promotion_score(memory: Memory, thresholds: dict) -> float:
-    """Calculate a promotion confidence score for a memory.
+    Memories marked again after the watermark, or deferred until they
+    are old enough, stay dirty for a later pass.
 
-    Higher scores indicate stronger candidates for promotion.
+    Returns:
+        Number of memories cleared
     """
-    # Factors that increase score
-    age_factor = min(1.0, (datetime.now(UTC) - memory.created_at).total_seconds() / 3600 / thresholds["min_age_hours"])
-    retrieval_factor = min(1.0, memory.retrieval_count / (thresholds["min_retrieval_count"] * 2))
-    salience_factor = memory.effective_salience
-
-    # Outcome factor (heavily weighted)
-    total_outcomes = memory.positive_outcomes + memory.negative_outcomes
-    if total_outcomes > 0:
-        outcome_factor = memory.positive_outcomes / total_outcomes
-    else:
-        outcome_factor = 0.5  # Neutral if no outcomes
-
-    # Weighted average
-    score = (
-        age_factor * 0.15 +
-        retrieval_factor * 0.25 +
-        salience_factor * 0.25 +
-        outcome_factor * 0.35
+    db = get_database()
+    async with db.session() as session:
+        return await MemoryRepository(session).clear_dirty(memory_ids, watermark)
+
+
+def _promotion_candidate(row) -> PromotionCandidate:
+    """PromotionCandidate from a MemoryRepository.find_promotion_candidates row."""
+    return PromotionCandidate(
+        memory_id=row.memory_id,
+        user_id=row.user_id,
+        current_level=TemporalLevel(row.from_level),
+        target_level=TemporalLevel(row.to_level),
+        score=float(row.score),
+        reason=f"Met all criteria: age={row.age_hours:.0f}h, "
+               f"retrievals={row.retrieval_count}, salience={row.salience:.2f}",
     )
 
-    return min(1.0, max(0.0, score))
-
 
 @activity.defn
 async def promote_memory(
@@ -328,3 +380,284 @@ async def notify_promotion(
     except Exception as e:
         activity.logger.warning(f"Failed to publish promotion event: {e}")
         return False
+
+
+@activity.defn
+async def promote_memories_batch(
+    candidates: list[PromotionCandidate],
+) -> BatchPromotionResult:
+    """Promote a batch of memories and publish their events.
+
+    All candidates are promoted with one UPDATE and the MemoryPromoted
+    events are pipelined to NATS together. Event IDs are derived from
+    the memory and target level, so when a retry re-publishes events
+    for memories an earlier attempt already promoted, JetStream
+    deduplication and the event log drop the repeats.
+
+    Args:
+        candidates: The promotion candidates
+
+    Returns:
+        Per-candidate results and the number of events published
+
+    Raises:
+        RuntimeError: If any event failed to publish, so the activity
+            is retried
+    """
+    if not candidates:
+        return BatchPromotionResult()
+
+    activity.logger.info(f"Promoting {len(candidates)} memories")
+
+    db = get_database()
+    async with db.session() as session:
+        rows = await MemoryRepository(session).promote_batch(
+            [(c.memory_id, c.current_level, c.target_level) for c in candidates]
+        )
+    by_id = {row.memory_id: row for row in rows}
+
+    batch = BatchPromotionResult()
+    envelopes = []
+    for candidate in candidates:
+        row = by_id.get(candidate.memory_id)
+        if row is None:
+            batch.results.append(
+                PromotionResult(
+                    memory_id=candidate.memory_id,
+                    success=False,
+                    error="Memory not found",
+                )
+            )
+            continue
+
+        batch.results.append(
+            PromotionResult(
+                memory_id=candidate.memory_id,
+                success=True,
+                from_level=candidate.current_level,
+                to_level=TemporalLevel(row.to_level),
+            )
+        )
+        # Promoted by this or an earlier attempt (not by some other path)
+        if row.to_level == candidate.target_level and row.from_level == candidate.current_level:
+            envelopes.append(_promotion_envelope(candidate))
+
+    if envelopes:
+        publisher = PipelinedEventPublisher(await get_nats_client())
+        outcomes = await publisher.publish_batch(envelopes)
+        failed = [o.error.message for o in outcomes if not o.is_ok]
+        if failed:
+            raise RuntimeError(
+                f"Failed to publish {len(failed)} promotion events: {failed[0]}"
+            )
+        batch.events_published = len(envelopes)
+
+    return batch
+
+
+def _promotion_envelope(candidate: PromotionCandidate) -> EventEnvelope:
+    """Wrap a MemoryPromoted event with an ID stable across retries."""
+    event = MemoryPromoted(
+        memory_id=candidate.memory_id,
+        from_level=candidate.current_level,
+        to_level=candidate.target_level,
+        reason="Met promotion criteria",
+    )
+    envelope = EventEnvelope.wrap(event=event, user_id=candidate.user_id)
+    return envelope.model_copy(
+        update={
+            "event_id": uuid5(candidate.memory_id, f"memory.promoted.{int(candidate.target_level)}")
+        }
+    )
+
+
+@activity.defn
+async def consolidate_memories(
+    user_id: UUID,
+    max_distance: float = 0.05,
+    max_merges: int = 100,
+    candidate_limit: int = 2000,
+) -> ConsolidationResult:
+    """Merge clusters of near-duplicate memories into canonical memories.
+
+    Pairs of memories whose embeddings are within `max_distance` are
+    found with an ANN self-join and grouped into clusters (connected
+    pairs). Each cluster is merged with one statement; largest
+    clusters go first until `max_merges` memories have been merged
+    away. A MemoryConsolidated event is published per cluster.
+
+    Merges are committed before events are published, so a failed
+    publish is logged rather than retried.
+
+    Args:
+        user_id: User whose memories to consolidate
+        max_distance: Cosine distance below which memories are duplicates
+        max_merges: Budget of memories merged away per run
+        candidate_limit: Maximum duplicate pairs read per run
+
+    Returns:
+        Counts of what was found and merged
+    """
+    consolidation = ConsolidationResult()
+    merges: list[tuple[UUID, list[UUID]]] = []
+
+    db = get_database()
+    async with db.session() as session:
+        repo = MemoryRepository(session)
+        pairs = await repo.find_near_duplicates(
+            user_id, max_distance=max_distance, limit=candidate_limit
+        )
+        consolidation.pairs_found = len(pairs)
+        edges = _edges(pairs)
+
+        for cluster in _clusters((row.memory_id, row.duplicate_id) for row in pairs):
+            remaining = max_merges - consolidation.memories_merged
+            if remaining <= 0:
+                consolidation.budget_exhausted = True
+                break
+            # A cluster over budget is merged in part; the next run continues it
+            merged = await repo.merge_duplicates(
+                user_id, _connected_subset(cluster, edges, remaining + 1)
+            )
+            if merged is None:
+                continue
+            merges.append(merged)
+            consolidation.clusters_merged += 1
+            consolidation.memories_merged += len(merged[1])
+
+    activity.logger.info(
+        f"Consolidated {consolidation.memories_merged} memories into "
+        f"{consolidation.clusters_merged} for user {user_id}"
+    )
+
+    if merges:
+        envelopes = [
+            EventEnvelope.wrap(
+                event=MemoryConsolidated(
+                    memory_id=canonical_id,
+                    merged_ids=merged_ids,
+                    max_distance=max_distance,
+                ),
+                user_id=user_id,
+            )
+            for canonical_id, merged_ids in merges
+        ]
+        try:
+            publisher = PipelinedEventPublisher(await get_nats_client())
+            outcomes = await publisher.publish_batch(envelopes)
+            consolidation.events_published = sum(1 for o in outcomes if o.is_ok)
+        except Exception as e:
+            # The merges are committed; don't redo them for the events
+            activity.logger.warning(f"Failed to publish consolidation events: {e}")
+
+    return consolidation
+
+
+def _clusters(pairs) -> list[set[UUID]]:
+    """Group duplicate pairs into connected clusters, largest first."""
+    parent: dict[UUID, UUID] = {}
+
+    def find(memory_id: UUID) -> UUID:
+        root = parent.setdefault(memory_id, memory_id)
+        while root != parent[root]:
+            parent[root] = parent[parent[root]]
+            root = parent[root]
+        return root
+
+    for a, b in pairs:
+        root_a, root_b = find(a), find(b)
+        if root_a != root_b:
+            parent[root_b] = root_a
+
+    clusters: dict[UUID, set[UUID]] = {}
+    for memory_id in parent:
+        clusters.setdefault(find(memory_id), set()).add(memory_id)
+    return sorted(clusters.values(), key=len, reverse=True)
+
+
+def _edges(pairs) -> dict[UUID, list[tuple[float, UUID]]]:
+    """Near-duplicate edges per memory, as (distance, neighbor)."""
+    edges: dict[UUID, list[tuple[float, UUID]]] = {}
+    for row in pairs:
+        edges.setdefault(row.memory_id, []).append((row.distance, row.duplicate_id))
+        edges.setdefault(row.duplicate_id, []).append((row.distance, row.memory_id))
+    return edges
+
+
+def _connected_subset(
+    cluster: set[UUID],
+    edges: dict[UUID, list[tuple[float, UUID]]],
+    size: int,
+) -> list[UUID]:
+    """Up to `size` members of a cluster that stay connected by duplicate edges.
+
+    Starts at the member with the most edges and repeatedly adds the
+    outside member with the closest edge to those already taken, so
+    every member is a near duplicate of one before it.
+    """
+    if len(cluster) <= size:
+        return sorted(cluster)
+
+    start = min(cluster, key=lambda memory_id: (-len(edges[memory_id]), memory_id))
+    taken = {start}
+    frontier = list(edges[start])
+    heapq.heapify(frontier)
+    while frontier and len(taken) < size:
+        _, memory_id = heapq.heappop(frontier)
+        if memory_id in taken:
+            continue
+        taken.add(memory_id)
+        for edge in edges[memory_id]:
+            if edge[1] not in taken:
+                heapq.heappush(frontier, edge)
+    return sorted(taken)
+
+
+@activity.defn
+async def archive_expired_memories(
+    batch_size: int = 1000,
+    drop_embeddings: bool = True,
+) -> ExpirationResult:
+    """Move one batch of expired memories to the archive.
+
+    The MemoryExpired events are published before the move commits,
+    and their IDs are derived from the memory ID. A failed publish
+    rolls the batch back for a retry; a failed commit after a publish
+    only leads to a duplicate event, dropped by deduplication.
+
+    Args:
+        batch_size: Maximum memories to archive
+        drop_embeddings: Archive without the embedding vector
+
+    Returns:
+        Number of memories archived and events published
+    """
+    result = ExpirationResult()
+
+    db = get_database()
+    async with db.session() as session:
+        rows = await MemoryRepository(session).archive_expired(
+            batch_size=batch_size, drop_embeddings=drop_embeddings
+        )
+        result.archived = len(rows)
+
+        if rows:
+            envelopes = [_expiration_envelope(row) for row in rows]
+            publisher = PipelinedEventPublisher(await get_nats_client())
+            outcomes = await publisher.publish_batch(envelopes)
+            failed = [o.error.message for o in outcomes if not o.is_ok]
+            if failed:
+                raise RuntimeError(
+                    f"Failed to publish {len(failed)} expiration events: {failed[0]}"
+                )
+            result.events_published = len(envelopes)
+
+    activity.logger.info(f"Archived {result.archived} expired memories")
+    return result
+
+
+def _expiration_envelope(row) -> EventEnvelope:
+    """Wrap a MemoryExpired event with an ID stable across retries."""
+    event = MemoryExpired(memory_id=row.memory_id, valid_until=row.valid_until)
+    envelope = EventEnvelope.wrap(event=event, user_id=row.user_id)
+    return envelope.model_copy(update={"event_id": uuid5(row.memory_id, "memory.expired")})
@@ -0,0 +1,251 @@
+"""Tracking of memories touched by events, for incremental gardening.
+
+A memory's promotion criteria only change when it is retrieved, when an
+outcome is attributed to it or when its salience is adjusted. The
+tracker reads those events from durable pull consumers and records the
+memory IDs in ``gardener_dirty_memories``; IncrementalGardenerWorkflow
+then evaluates just those memories instead of scanning every user.
+
+Retrievals and outcomes also move the memory's last_used_at forward,
+in the same transaction as the mark; salience decay is keyed on it.
+
+Each batch is acked only after its IDs are written, so a crash
+redelivers rather than loses marks. Marking is an upsert, so
+redeliveries are harmless. A mark made while a gardening pass is
+running has a later marked_at than the pass's watermark and survives
+the pass.
+
+The tracker does not use EventConsumer: that acks each message after
+its handlers run, one at a time, while the tracker writes a whole fetch
+in one upsert and acks it with a single AckPolicy.ALL ack.
+
+Run the tracker with:
+    python -m mind.workers.gardener.dirty
+"""
+
+import asyncio
+import signal
+from datetime import datetime
+from typing import Any
+from uuid import UUID
+
+import structlog
+from nats.js.api import AckPolicy, ConsumerConfig, DeliverPolicy
+
+from mind.config import get_settings
+from mind.core.events import codec
+from mind.core.events.base import EventEnvelope, EventType
+from mind.infrastructure.nats.client import NatsClient, close_nats_client, get_nats_client
+from mind.infrastructure.postgres.database import Database, close_database, get_database
+from mind.infrastructure.postgres.repositories import MemoryRepository
+
+logger = structlog.get_logger()
+
+_MAX_RETRY_DELAY = 30.0
+
+# Events that can change whether a memory meets the promotion criteria
+TRACKED_EVENT_TYPES = (
+    EventType.MEMORY_RETRIEVAL,
+    EventType.MEMORY_RETRIEVAL_SUMMARIZED,
+    EventType.MEMORY_SALIENCE_ADJUSTED,
+    EventType.OUTCOME_OBSERVED,
+)
+
+
+# Events that count as using a memory, for last_used_at
+USE_EVENT_TYPES = (
+    EventType.MEMORY_RETRIEVAL,
+    EventType.MEMORY_RETRIEVAL_SUMMARIZED,
+    EventType.OUTCOME_OBSERVED,
+)
+
+
+def touched_memory_ids(envelope: EventEnvelope) -> set[UUID]:
+    """IDs of the memories an event touches (empty for other events)."""
+    payload = envelope.payload
+    if envelope.event_type == EventType.MEMORY_RETRIEVAL:
+        ids = [memory["memory_id"] for memory in payload.get("memories", [])]
+    elif envelope.event_type == EventType.MEMORY_RETRIEVAL_SUMMARIZED:
+        ids = list(payload.get("memory_hits", {}))
+    elif envelope.event_type == EventType.MEMORY_SALIENCE_ADJUSTED:
+        ids = [payload["memory_id"]]
+    elif envelope.event_type == EventType.OUTCOME_OBSERVED:
+        ids = list(payload.get("memory_attributions", {}))
+    else:
+        return set()
+    return {UUID(str(memory_id)) for memory_id in ids}
+
+
+def _subject(event_type: EventType) -> str:
+    category, action = event_type.value.split(".", 1)
+    return f"mind.{category}.{action}.*"
+
+
+class DirtyMemoryTracker:
+    """Marks memories touched by events as dirty for the gardener."""
+
+    def __init__(
+        self,
+        client: NatsClient,
+        database: Database,
+        name: str = "gardener-dirty-tracker",
+        batch_size: int | None = None,
+        fetch_timeout: float | None = None,
+    ):
+        settings = get_settings()
+        self._client = client
+        self._database = database
+        self._name = name
+        self._batch_size = batch_size or settings.gardener_dirty_batch_size
+        self._fetch_timeout = fetch_timeout or settings.gardener_dirty_fetch_timeout
+
+        self._tasks: list[asyncio.Task] = []
+        self._running = False
+
+    async def start(self) -> None:
+        """Subscribe to every tracked event type and start marking."""
+        if self._running:
+            return
+
+        self._running = True
+        for event_type in TRACKED_EVENT_TYPES:
+            subscription = await self._subscribe(event_type)
+            self._tasks.append(asyncio.create_task(self._loop(event_type, subscription)))
+
+        logger.info(
+            "dirty_tracker_started",
+            tracker=self._name,
+            event_types=[event_type.value for event_type in TRACKED_EVENT_TYPES],
+        )
+
+    async def stop(self, timeout: float = 10.0) -> None:
+        """Stop after in-progress batches are written, up to the timeout."""
+        self._running = False
+        if self._tasks:
+            _, pending = await asyncio.wait(self._tasks, timeout=timeout)
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+            self._tasks = []
+        logger.info("dirty_tracker_stopped", tracker=self._name)
+
+    async def _subscribe(self, event_type: EventType):
+        """Bind the event type's durable consumer (new consumers start at new events)."""
+        durable = f"{self._name}-{event_type.value.replace('.', '-')}"
+        config = ConsumerConfig(
+            durable_name=durable,
+            deliver_policy=DeliverPolicy.NEW,
+            ack_policy=AckPolicy.ALL,
+            ack_wait=60,
+            max_ack_pending=self._batch_size * 2,
+        )
+        return await self._client.jetstream.pull_subscribe(
+            subject=_subject(event_type),
+            durable=durable,
+            config=config,
+        )
+
+    async def _loop(self, event_type: EventType, subscription) -> None:
+        """Fetch and mark batches for one event type."""
+        log = logger.bind(tracker=self._name, event_type=event_type.value)
+
+        while self._running:
+            try:
+                messages = await subscription.fetch(
+                    batch=self._batch_size, timeout=self._fetch_timeout
+                )
+            except asyncio.TimeoutError:
+                continue
+            except Exception as e:
+                log.error("dirty_tracker_fetch_failed", error=str(e))
+                await asyncio.sleep(1)
+                continue
+
+            if messages:
+                await self.mark(messages)
+
+    async def mark(self, messages: list) -> int:
+        """Mark the memories of one fetched batch, retrying until stored, then ack it.
+
+        Returns:
+            Number of distinct memories marked
+        """
+        memory_ids: set[UUID] = set()
+        last_used: dict[UUID, datetime] = {}
+        for msg in messages:
+            headers = msg.headers or {}
+            try:
+                envelope = codec.decode(msg.data, headers.get("Content-Type"))
+                touched = touched_memory_ids(envelope)
+            except Exception as e:
+                # The projector and DLQ consumers report undecodable messages
+                logger.warning("dirty_tracker_decode_failed", tracker=self._name, error=str(e))
+                continue
+
+            memory_ids |= touched
+            if envelope.event_type in USE_EVENT_TYPES:
+                for memory_id in touched:
+                    if memory_id not in last_used or last_used[memory_id] < envelope.timestamp:
+                        last_used[memory_id] = envelope.timestamp
+
+        delay = 0.5
+        while memory_ids:
+            try:
+                async with self._database.session() as session:
+                    repo = MemoryRepository(session)
+                    await repo.mark_dirty(list(memory_ids))
+                    await repo.touch_last_used(last_used)
+                break
+            except Exception as e:
+                logger.warning(
+                    "dirty_tracker_write_failed",
+                    tracker=self._name,
+                    count=len(memory_ids),
+                    retry_in=delay,
+                    error=str(e),
+                )
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, _MAX_RETRY_DELAY)
+
+        # AckPolicy.ALL: acking the last message acks the whole batch
+        await messages[-1].ack()
+        return len(memory_ids)
+
+
+async def run_tracker() -> None:
+    """Run the dirty-memory tracker until interrupted (SIGINT/SIGTERM)."""
+    logger.info("dirty_tracker_starting")
+
+    tracker = DirtyMemoryTracker(await get_nats_client(), get_database())
+
+    # Handle graceful shutdown
+    shutdown_event = asyncio.Event()
+
+    def handle_shutdown(sig: Any) -> None:
+        logger.info("dirty_tracker_shutdown_requested", signal=sig)
+        shutdown_event.set()
+
+    loop = asyncio.get_event_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(sig, handle_shutdown, sig)
+        except NotImplementedError:
+            # Windows doesn't support add_signal_handler
+            pass
+
+    await tracker.start()
+    try:
+        await shutdown_event.wait()
+    finally:
+        await tracker.stop()
+        await close_nats_client()
+        await close_database()
+
+
+def main() -> None:
+    """Entry point for running the tracker."""
+    asyncio.run(run_tracker())
+
+
+if __name__ == "__main__":
+    main()
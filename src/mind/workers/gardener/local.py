@@ -0,0 +1,259 @@
+"""Gardener that runs inside its own process, without Temporal.
+
+Small deployments and CI can garden without a Temporal server: the
+local gardener runs the same activity functions on an asyncio
+scheduler. Each job records its progress in ``gardener_checkpoints``,
+so a restart resumes an unfinished promotion pass from its last page
+of users, and a finished job waits out the rest of its interval.
+
+Jobs:
+- promotion: every user, a page at a time, as MemoryPromotionWorkflow
+- expiration: archive expired memories, as MemoryExpirationWorkflow
+
+Decay needs no job; it is applied at read time (mind.core.memory.decay).
+
+Only one local gardener should run against a database. Use the
+Temporal worker (mind.workers.gardener.worker) to scale out.
+
+Run it with:
+    python -m mind.workers.gardener.local
+"""
+
+import asyncio
+import signal
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from typing import Any, Awaitable, Callable
+from uuid import UUID
+
+import structlog
+
+from mind.config import get_settings
+from mind.infrastructure.postgres.database import Database, close_database, get_database
+from mind.infrastructure.postgres.models import GardenerCheckpointModel
+from mind.infrastructure.postgres.repositories import GardenerRepository
+from mind.workers.gardener.activities import (
+    archive_expired_memories,
+    find_promotion_candidates,
+    list_users_page,
+    promote_memories_batch,
+)
+from mind.workers.gardener.workflows import ExpirationWorkflowInput
+
+logger = structlog.get_logger()
+
+PROMOTION_JOB = "promotion"
+EXPIRATION_JOB = "expiration"
+
+_RETRY_DELAY = 60.0
+
+# Same limits as the PromotionWorkflowInput defaults
+_PROMOTION_BATCH_SIZE = 100
+_MAX_PROMOTIONS_PER_USER = 50
+_PROMOTION_CHUNK_SIZE = 50
+
+
+@dataclass
+class _Job:
+    name: str
+    interval: timedelta
+    run: Callable[[UUID | None], Awaitable[bool]]  # Returns True when the pass finished
+
+
+def next_run_delay(
+    checkpoint: GardenerCheckpointModel | None,
+    interval: timedelta,
+    now: datetime | None = None,
+) -> float:
+    """Seconds until a job should run, given its checkpoint.
+
+    A job that never ran or whose last pass was interrupted runs now.
+    """
+    if checkpoint is None or checkpoint.after_user_id is not None:
+        return 0.0
+    if checkpoint.last_completed_at is None:
+        return 0.0
+    due = checkpoint.last_completed_at + interval
+    return max(0.0, (due - (now or datetime.now(UTC))).total_seconds())
+
+
+class LocalGardener:
+    """Runs gardener jobs on an asyncio scheduler with Postgres checkpoints."""
+
+    def __init__(
+        self,
+        database: Database,
+        promotion_interval: float | None = None,
+        expiration_interval: float | None = None,
+        concurrency: int | None = None,
+        page_size: int | None = None,
+    ):
+        settings = get_settings()
+        self._database = database
+        self._concurrency = concurrency or settings.gardener_local_concurrency
+        self._page_size = page_size or settings.gardener_local_page_size
+        self._expiration = ExpirationWorkflowInput()
+
+        self._jobs = [
+            _Job(
+                PROMOTION_JOB,
+                timedelta(
+                    seconds=promotion_interval or settings.gardener_local_promotion_interval
+                ),
+                self.promotion_pass,
+            ),
+            _Job(
+                EXPIRATION_JOB,
+                timedelta(
+                    seconds=expiration_interval or settings.gardener_local_expiration_interval
+                ),
+                self.expiration_pass,
+            ),
+        ]
+        self._stopping = asyncio.Event()
+        self._tasks: list[asyncio.Task] = []
+
+    async def start(self) -> None:
+        """Start every job's schedule."""
+        if self._tasks:
+            return
+        self._stopping.clear()
+        self._tasks = [asyncio.create_task(self._job_loop(job)) for job in self._jobs]
+        logger.info("local_gardener_started", jobs=[job.name for job in self._jobs])
+
+    async def stop(self, timeout: float = 30.0) -> None:
+        """Stop after in-progress pages are checkpointed, up to the timeout."""
+        self._stopping.set()
+        if self._tasks:
+            _, pending = await asyncio.wait(self._tasks, timeout=timeout)
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+            self._tasks = []
+        logger.info("local_gardener_stopped")
+
+    async def _job_loop(self, job: _Job) -> None:
+        """Run a job whenever its checkpoint says it is due."""
+        log = logger.bind(job=job.name)
+
+        while not self._stopping.is_set():
+            try:
+                async with self._database.session() as session:
+                    checkpoint = await GardenerRepository(session).get_checkpoint(job.name)
+                delay = next_run_delay(checkpoint, job.interval)
+                if delay and await self._sleep(delay):
+                    return
+
+                after = checkpoint.after_user_id if checkpoint else None
+                log.info("local_gardener_job_started", resume_after=after)
+                if await job.run(after):
+                    await self._save_checkpoint(job.name, None, datetime.now(UTC))
+                    log.info("local_gardener_job_completed")
+            except Exception as e:
+                log.error("local_gardener_job_failed", error=str(e))
+                if await self._sleep(min(_RETRY_DELAY, job.interval.total_seconds())):
+                    return
+
+    async def _sleep(self, seconds: float) -> bool:
+        """Wait, returning True early if the gardener is stopping."""
+        try:
+            await asyncio.wait_for(self._stopping.wait(), timeout=seconds)
+            return True
+        except asyncio.TimeoutError:
+            return False
+
+    async def promotion_pass(self, after: UUID | None = None) -> bool:
+        """Promote every user's candidates, checkpointing after each page.
+
+        Returns:
+            True if the pass reached the last user, False if stopped
+        """
+        slots = asyncio.Semaphore(self._concurrency)
+
+        while not self._stopping.is_set():
+            user_ids = await list_users_page(after, self._page_size)
+            if not user_ids:
+                return True
+
+            await asyncio.gather(*(self._promote_user(user_id, slots) for user_id in user_ids))
+            after = user_ids[-1]
+            await self._save_checkpoint(PROMOTION_JOB, after)
+
+            if len(user_ids) < self._page_size:
+                return True
+
+        return False
+
+    async def _promote_user(self, user_id: UUID, slots: asyncio.Semaphore) -> int:
+        """Promote one user's candidates; failures are left for the next pass."""
+        async with slots:
+            try:
+                candidates = await find_promotion_candidates(user_id, _PROMOTION_BATCH_SIZE)
+                candidates = candidates[:_MAX_PROMOTIONS_PER_USER]
+                promoted = 0
+                for i in range(0, len(candidates), _PROMOTION_CHUNK_SIZE):
+                    batch = await promote_memories_batch(
+                        candidates[i : i + _PROMOTION_CHUNK_SIZE]
+                    )
+                    promoted += sum(1 for result in batch.results if result.success)
+                return promoted
+            except Exception as e:
+                logger.warning("local_gardener_user_failed", user_id=str(user_id), error=str(e))
+                return 0
+
+    async def expiration_pass(self, after: UUID | None = None) -> bool:
+        """Archive expired memories until none are left.
+
+        Returns:
+            True if every expired memory was archived, False if stopped
+        """
+        options = self._expiration
+        while not self._stopping.is_set():
+            batch = await archive_expired_memories(options.batch_size, options.drop_embeddings)
+            if batch.archived < options.batch_size:
+                return True
+        return False
+
+    async def _save_checkpoint(
+        self, job: str, after: UUID | None, completed_at: datetime | None = None
+    ) -> None:
+        async with self._database.session() as session:
+            await GardenerRepository(session).save_checkpoint(job, after, completed_at)
+
+
+async def run_local_gardener() -> None:
+    """Run the local gardener until interrupted (SIGINT/SIGTERM)."""
+    logger.info("local_gardener_starting")
+
+    gardener = LocalGardener(get_database())
+
+    # Handle graceful shutdown
+    shutdown_event = asyncio.Event()
+
+    def handle_shutdown(sig: Any) -> None:
+        logger.info("local_gardener_shutdown_requested", signal=sig)
+        shutdown_event.set()
+
+    loop = asyncio.get_event_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(sig, handle_shutdown, sig)
+        except NotImplementedError:
+            # Windows doesn't support add_signal_handler
+            pass
+
+    await gardener.start()
+    try:
+        await shutdown_event.wait()
+    finally:
+        await gardener.stop()
+        await close_database()
+
+
+def main() -> None:
+    """Entry point for running the local gardener."""
+    asyncio.run(run_local_gardener())
+
+
+if __name__ == "__main__":
+    main()
@@ -2,61 +2,135 @@
 
 The Gardener is responsible for memory lifecycle management:
 - Promotion: Moving memories to higher temporal levels
-- Expiration: Marking memories as no longer valid
-- Decay: Gradually reducing salience of unused memories
+- Expiration: Moving memories that are no longer valid to the archive
+- Decay: Optionally reducing salience of unused memories (applied at read
+  time from last_used_at, see mind.core.memory.decay; no job required)
 - Consolidation: Merging similar memories
 
+Incremental gardening (IncrementalGardenerWorkflow) needs the
+dirty-memory tracker running alongside:
+    python -m mind.workers.gardener.dirty
+
 Run this worker with:
     python -m mind.workers.gardener.worker
 
 Or use the CLI:
     mind worker gardener
+
+Single-node deployments and CI can garden without a Temporal server:
+    python -m mind.workers.gardener.local
+
+Each worker polls one task queue (MIND_GARDENER_TASK_QUEUE) and the
+matching "-db" queue for DB-heavy activities. To shard a gardening
+pass, run worker pools on several queues and list them in
+GardenerRunInput.task_queues.
+
+Tuning (MIND_GARDENER_* settings): DB activity concurrency should stay
+at or below the database connection pool size; the per-queue rate
+limit caps database load however many replicas run. Throughput then
+grows with replicas until that limit. Set MIND_GARDENER_METRICS_PORT
+to export slot usage and schedule-to-start latency per queue.
 """
 
 import asyncio
 import signal
 from typing import Any
 
+from prometheus_client import start_http_server
 from temporalio.worker import Worker
 import structlog
 
+from mind.config import get_settings
 from mind.infrastructure.temporal.client import get_temporal_client
+from mind.infrastructure.temporal.metrics import ActivityMetricsInterceptor
 from mind.workers.gardener.workflows import (
+    IncrementalGardenerWorkflow,
+    MemoryConsolidationWorkflow,
+    MemoryExpirationWorkflow,
     MemoryPromotionWorkflow,
     ScheduledGardenerWorkflow,
+    db_task_queue,
 )
 from mind.workers.gardener.activities import (
+    archive_expired_memories,
+    clear_dirty_memories,
+    consolidate_memories,
+    find_dirty_promotion_candidates,
     find_promotion_candidates,
+    list_users_page,
+    promote_memories_batch,
     promote_memory,
     notify_promotion,
 )
 
 logger = structlog.get_logger()
 
-TASK_QUEUE = "gardener"
-
 
 async def run_worker() -> None:
     """Run the Gardener worker.
 
-    This starts a Temporal worker that processes gardening tasks.
-    The worker runs until interrupted (SIGINT/SIGTERM).
+    This starts two Temporal workers in one process: one polls the
+    gardener queue for workflow tasks and event-publishing activities,
+    the other polls its "-db" queue for DB-heavy activities with their
+    own concurrency and rate limits. Both run until interrupted
+    (SIGINT/SIGTERM).
     """
-    logger.info("gardener_starting", task_queue=TASK_QUEUE)
+    settings = get_settings()
+    task_queue = settings.gardener_task_queue
+    db_queue = db_task_queue(task_queue)
+    logger.info("gardener_starting", task_queue=task_queue, db_task_queue=db_queue)
+
+    if settings.gardener_metrics_port:
+        start_http_server(settings.gardener_metrics_port)
 
     client = await get_temporal_client()
 
+    db_activities = [
+        archive_expired_memories,
+        clear_dirty_memories,
+        consolidate_memories,
+        find_dirty_promotion_candidates,
+        find_promotion_candidates,
+        list_users_page,
+        promote_memories_batch,
+    ]
+
     worker = Worker(
         client,
-        task_queue=TASK_QUEUE,
+        task_queue=task_queue,
         workflows=[
+            IncrementalGardenerWorkflow,
+            MemoryConsolidationWorkflow,
+            MemoryExpirationWorkflow,
             MemoryPromotionWorkflow,
             ScheduledGardenerWorkflow,
         ],
+        # Single-memory activities, plus the DB activities for runs that
+        # started before the DB queue existed and still schedule them here
+        # (see workflows.activity_task_queue)
         activities=[
-            find_promotion_candidates,
             promote_memory,
             notify_promotion,
+            *db_activities,
+        ],
+        max_concurrent_workflow_tasks=settings.gardener_max_concurrent_workflow_tasks,
+        max_concurrent_activities=settings.gardener_max_concurrent_activities,
+        interceptors=[
+            ActivityMetricsInterceptor(task_queue, settings.gardener_max_concurrent_activities)
+        ],
+    )
+
+    db_worker = Worker(
+        client,
+        task_queue=db_queue,
+        activities=db_activities,
+        max_concurrent_activities=settings.gardener_db_max_concurrent_activities,
+        max_activities_per_second=settings.gardener_db_activities_per_second,
+        max_task_queue_activities_per_second=(
+            settings.gardener_db_task_queue_activities_per_second
+        ),
+        interceptors=[
+            ActivityMetricsInterceptor(db_queue, settings.gardener_db_max_concurrent_activities)
         ],
     )
 
@@ -75,10 +149,10 @@ async def run_worker() -> None:
             # Windows doesn't support add_signal_handler
             pass
 
-    logger.info("gardener_running", task_queue=TASK_QUEUE)
+    logger.info("gardener_running", task_queue=task_queue)
 
-    # Run worker until shutdown
-    async with worker:
+    # Run workers until shutdown
+    async with worker, db_worker:
         await shutdown_event.wait()
 
     logger.info("gardener_stopped")
@@ -5,7 +5,8 @@ coordinate activities. They handle retries, timeouts, and
 maintain state across failures.
 """
 
-from dataclasses import dataclass
+import asyncio
+from dataclasses import dataclass, field
 from datetime import timedelta
 from uuid import UUID
 
@@ -15,14 +16,30 @@ from temporalio.common import RetryPolicy
 # Import activity stubs (not the actual implementations)
 with workflow.unsafe.imports_passed_through():
     from mind.workers.gardener.activities import (
+        BatchPromotionResult,
+        ConsolidationResult,
+        DirtyBatch,
+        ExpirationResult,
         PromotionCandidate,
         PromotionResult,
+        archive_expired_memories,
+        clear_dirty_memories,
+        consolidate_memories,
+        find_dirty_promotion_candidates,
         find_promotion_candidates,
-        promote_memory,
+        list_users_page,
         notify_promotion,
+        promote_memories_batch,
+        promote_memory,
     )
 
 
+# DB-heavy activities run on "{queue}-db", polled by a worker with its own
+# concurrency and rate limits; workflow tasks and event-publishing
+# activities stay on the gardener queue itself
+DB_QUEUE_SUFFIX = "-db"
+
+
 @dataclass
 class PromotionWorkflowInput:
     """Input for the memory promotion workflow."""
@@ -30,6 +47,7 @@ class PromotionWorkflowInput:
     user_id: UUID
     batch_size: int = 100
     max_promotions_per_run: int = 50
+    chunk_size: int = 50  # Candidates per promote_memories_batch activity
 
 
 @dataclass
@@ -52,9 +70,9 @@ class MemoryPromotionWorkflow:
 
     The workflow:
     1. Finds candidate memories for promotion
-    2. Promotes each candidate (with retries)
-    3. Publishes events for successful promotions
-    4. Returns summary of actions taken
+    2. Promotes the candidates in chunks, one activity per chunk that
+       updates them together and publishes their events (with retries)
+    3. Returns summary of actions taken
 
     Example usage:
         # Start a single run
@@ -91,6 +109,7 @@ class MemoryPromotionWorkflow:
             candidates = await workflow.execute_activity(
                 find_promotion_candidates,
                 args=[input.user_id, input.batch_size],
+                task_queue=activity_task_queue(),
                 start_to_close_timeout=timedelta(minutes=5),
                 retry_policy=RetryPolicy(
                     initial_interval=timedelta(seconds=1),
@@ -123,18 +142,46 @@ class MemoryPromotionWorkflow:
         # Limit number of promotions per run
         candidates_to_process = candidates[:input.max_promotions_per_run]
 
-        # Step 2: Promote each candidate
-        promotions_attempted = 0
-        promotions_succeeded = 0
-        promotions_failed = 0
+        # Step 2: Promote in chunks; each activity also publishes the events.
+        # Runs started before batching replay the per-candidate activities.
+        if workflow.patched("promote-batch"):
+            succeeded = await self._promote_chunks(candidates_to_process, input, errors)
+        else:
+            succeeded = await self._promote_each(candidates_to_process, input, errors)
+
+        promotions_attempted = len(candidates_to_process)
+        workflow.logger.info(
+            f"Promotion complete: {succeeded}/{promotions_attempted} succeeded"
+        )
+
+        return PromotionWorkflowResult(
+            candidates_found=candidates_found,
+            promotions_attempted=promotions_attempted,
+            promotions_succeeded=succeeded,
+            promotions_failed=promotions_attempted - succeeded,
+            errors=errors,
+        )
+
+    async def _promote_chunks(
+        self,
+        candidates: list[PromotionCandidate],
+        input: PromotionWorkflowInput,
+        errors: list[str],
+    ) -> int:
+        """Promote candidates with one promote_memories_batch activity per chunk.
 
-        for candidate in candidates_to_process:
-            promotions_attempted += 1
+        Returns:
+            Number of memories promoted
+        """
+        succeeded = 0
+        for i in range(0, len(candidates), input.chunk_size):
+            chunk = candidates[i:i + input.chunk_size]
 
             try:
-                result: PromotionResult = await workflow.execute_activity(
-                    promote_memory,
-                    args=[candidate],
+                batch: BatchPromotionResult = await workflow.execute_activity(
+                    promote_memories_batch,
+                    args=[chunk],
+                    task_queue=activity_task_queue(),
                     start_to_close_timeout=timedelta(minutes=2),
                     retry_policy=RetryPolicy(
                         initial_interval=timedelta(seconds=1),
@@ -142,89 +189,457 @@ class MemoryPromotionWorkflow:
                         maximum_attempts=3,
                     ),
                 )
+            except Exception as e:
+                errors.append(f"Chunk of {len(chunk)} from {chunk[0].memory_id}: {str(e)}")
+                workflow.logger.error(f"Failed to promote chunk of {len(chunk)}: {e}")
+                continue
 
+            for result in batch.results:
                 if result.success:
-                    promotions_succeeded += 1
-
-                    # Step 3: Publish promotion event
-                    try:
-                        await workflow.execute_activity(
-                            notify_promotion,
-                            args=[result, input.user_id],
-                            start_to_close_timeout=timedelta(seconds=30),
-                            retry_policy=RetryPolicy(
-                                initial_interval=timedelta(seconds=1),
-                                maximum_interval=timedelta(seconds=10),
-                                maximum_attempts=2,
-                            ),
-                        )
-                    except Exception as e:
-                        # Don't fail the workflow for notification failures
-                        workflow.logger.warning(
-                            f"Failed to notify promotion for {candidate.memory_id}: {e}"
-                        )
-
+                    succeeded += 1
                 else:
-                    promotions_failed += 1
-                    errors.append(f"Memory {candidate.memory_id}: {result.error}")
+                    errors.append(f"Memory {result.memory_id}: {result.error}")
+        return succeeded
+
+    async def _promote_each(
+        self,
+        candidates: list[PromotionCandidate],
+        input: PromotionWorkflowInput,
+        errors: list[str],
+    ) -> int:
+        """Promote candidates one activity at a time (runs started before batching).
 
+        Returns:
+            Number of memories promoted
+        """
+        succeeded = 0
+        for candidate in candidates:
+            try:
+                result: PromotionResult = await workflow.execute_activity(
+                    promote_memory,
+                    args=[candidate],
+                    start_to_close_timeout=timedelta(minutes=2),
+                    retry_policy=RetryPolicy(
+                        initial_interval=timedelta(seconds=1),
+                        maximum_interval=timedelta(seconds=30),
+                        maximum_attempts=3,
+                    ),
+                )
             except Exception as e:
-                promotions_failed += 1
                 errors.append(f"Memory {candidate.memory_id}: {str(e)}")
                 workflow.logger.error(f"Failed to promote {candidate.memory_id}: {e}")
+                continue
 
-        workflow.logger.info(
-            f"Promotion complete: {promotions_succeeded}/{promotions_attempted} succeeded"
+            if not result.success:
+                errors.append(f"Memory {candidate.memory_id}: {result.error}")
+                continue
+            succeeded += 1
+
+            try:
+                await workflow.execute_activity(
+                    notify_promotion,
+                    args=[result, input.user_id],
+                    start_to_close_timeout=timedelta(seconds=30),
+                    retry_policy=RetryPolicy(
+                        initial_interval=timedelta(seconds=1),
+                        maximum_interval=timedelta(seconds=10),
+                        maximum_attempts=2,
+                    ),
+                )
+            except Exception as e:
+                # Don't fail the workflow for notification failures
+                workflow.logger.warning(
+                    f"Failed to notify promotion for {candidate.memory_id}: {e}"
+                )
+        return succeeded
+
+
+@dataclass
+class ConsolidationWorkflowInput:
+    """Input for the memory consolidation workflow."""
+
+    user_id: UUID
+    max_distance: float = 0.05  # Cosine distance (similarity >= 0.95)
+    max_merges: int = 100  # Budget of memories merged away per run
+    candidate_limit: int = 2000
+
+
+@workflow.defn
+class MemoryConsolidationWorkflow:
+    """Workflow that merges a user's near-duplicate memories.
+
+    Agents often store paraphrases of the same observation. This
+    workflow merges clusters of memories with near-identical
+    embeddings into one canonical memory, within a per-run budget, so
+    repeated runs work through a large backlog gradually.
+
+    Example usage:
+        await client.start_workflow(
+            MemoryConsolidationWorkflow.run,
+            ConsolidationWorkflowInput(user_id=user_id),
+            id=f"consolidate-{user_id}",
+            task_queue="gardener",
         )
+    """
 
-        return PromotionWorkflowResult(
-            candidates_found=candidates_found,
-            promotions_attempted=promotions_attempted,
-            promotions_succeeded=promotions_succeeded,
-            promotions_failed=promotions_failed,
-            errors=errors,
+    @workflow.run
+    async def run(self, input: ConsolidationWorkflowInput) -> ConsolidationResult:
+        """Execute the memory consolidation workflow."""
+        workflow.logger.info(f"Starting memory consolidation for user {input.user_id}")
+
+        return await workflow.execute_activity(
+            consolidate_memories,
+            args=[input.user_id, input.max_distance, input.max_merges, input.candidate_limit],
+            task_queue=activity_task_queue(),
+            start_to_close_timeout=timedelta(minutes=10),
+            retry_policy=RetryPolicy(
+                initial_interval=timedelta(seconds=1),
+                maximum_interval=timedelta(minutes=1),
+                maximum_attempts=3,
+            ),
         )
 
 
+@dataclass
+class ExpirationWorkflowInput:
+    """Input for the memory expiration workflow."""
+
+    batch_size: int = 1000
+    max_batches: int = 100  # Per run; the next scheduled run continues
+    drop_embeddings: bool = True
+
+
+@workflow.defn
+class MemoryExpirationWorkflow:
+    """Workflow that moves expired memories to the archive.
+
+    Memories past their valid_until are moved in batches from the
+    memories table to memories_archive, so the hot table and its
+    indexes only hold live memories. Archived memories can still be
+    read with RetrievalRequest.include_expired.
+
+    Example usage:
+        await client.start_workflow(
+            MemoryExpirationWorkflow.run,
+            ExpirationWorkflowInput(),
+            id="expire-memories",
+            task_queue="gardener",
+            cron_schedule="*/15 * * * *",
+        )
+    """
+
+    @workflow.run
+    async def run(self, input: ExpirationWorkflowInput) -> ExpirationResult:
+        """Archive batches until none are left or the run's budget is spent."""
+        total = ExpirationResult()
+
+        for _ in range(input.max_batches):
+            batch: ExpirationResult = await workflow.execute_activity(
+                archive_expired_memories,
+                args=[input.batch_size, input.drop_embeddings],
+                task_queue=activity_task_queue(),
+                start_to_close_timeout=timedelta(minutes=5),
+                retry_policy=RetryPolicy(
+                    initial_interval=timedelta(seconds=1),
+                    maximum_interval=timedelta(minutes=1),
+                    maximum_attempts=5,
+                ),
+            )
+            total.archived += batch.archived
+            total.events_published += batch.events_published
+            if batch.archived < input.batch_size:
+                break
+
+        workflow.logger.info(f"Archived {total.archived} expired memories")
+        return total
+
+
+@dataclass
+class IncrementalGardenerInput:
+    """Input for the incremental gardening workflow."""
+
+    batch_size: int = 1000  # Dirty memories evaluated per step
+    max_batches: int = 20  # Per run; the next scheduled run continues
+    chunk_size: int = 50  # Candidates per promote_memories_batch activity
+
+
+@dataclass
+class IncrementalGardenerResult:
+    """Result of an incremental gardening run."""
+
+    memories_evaluated: int = 0
+    promotions_succeeded: int = 0
+    promotions_failed: int = 0
+
+
+@workflow.defn
+class IncrementalGardenerWorkflow:
+    """Workflow that gardens only the memories touched by recent events.
+
+    The dirty-memory tracker (mind.workers.gardener.dirty) records the
+    memories whose retrievals, outcomes or salience changed. Each step
+    evaluates a batch of them against the promotion criteria, promotes
+    the candidates and clears the batch up to its watermark. Memories
+    that are only too young stay dirty until they are old enough. A
+    failed promotion chunk stays dirty and the run stops, so the next
+    scheduled run retries it. ScheduledGardenerWorkflow remains the
+    full pass for catching up, e.g. after the tracker was down.
+
+    Example usage:
+        await client.start_workflow(
+            IncrementalGardenerWorkflow.run,
+            IncrementalGardenerInput(),
+            id="garden-incremental",
+            task_queue="gardener",
+            cron_schedule="*/5 * * * *",
+        )
+    """
+
+    @workflow.run
+    async def run(self, input: IncrementalGardenerInput) -> IncrementalGardenerResult:
+        """Garden dirty batches until none are left or the run's budget is spent."""
+        total = IncrementalGardenerResult()
+        retry_policy = RetryPolicy(
+            initial_interval=timedelta(seconds=1),
+            maximum_interval=timedelta(minutes=1),
+            maximum_attempts=3,
+        )
+
+        for _ in range(input.max_batches):
+            batch: DirtyBatch = await workflow.execute_activity(
+                find_dirty_promotion_candidates,
+                args=[input.batch_size],
+                task_queue=activity_task_queue(),
+                start_to_close_timeout=timedelta(minutes=5),
+                retry_policy=retry_policy,
+            )
+            if not batch.memory_ids:
+                break
+            total.memories_evaluated += len(batch.memory_ids)
+
+            failed: set[UUID] = set()
+            for i in range(0, len(batch.candidates), input.chunk_size):
+                chunk = batch.candidates[i:i + input.chunk_size]
+                try:
+                    promoted: BatchPromotionResult = await workflow.execute_activity(
+                        promote_memories_batch,
+                        args=[chunk],
+                        task_queue=activity_task_queue(),
+                        start_to_close_timeout=timedelta(minutes=2),
+                        retry_policy=retry_policy,
+                    )
+                except Exception as e:
+                    workflow.logger.error(f"Failed to promote dirty chunk: {e}")
+                    failed.update(candidate.memory_id for candidate in chunk)
+                    total.promotions_failed += len(chunk)
+                    continue
+                total.promotions_succeeded += sum(1 for r in promoted.results if r.success)
+
+            await workflow.execute_activity(
+                clear_dirty_memories,
+                args=[[m for m in batch.memory_ids if m not in failed], batch.watermark],
+                task_queue=activity_task_queue(),
+                start_to_close_timeout=timedelta(minutes=1),
+                retry_policy=retry_policy,
+            )
+            if failed or len(batch.memory_ids) < input.batch_size:
+                break
+
+        workflow.logger.info(
+            f"Incremental gardening evaluated {total.memories_evaluated} memories, "
+            f"promoted {total.promotions_succeeded}"
+        )
+        return total
+
+
+@dataclass
+class GardenerRunInput:
+    """Input for a scheduled gardening pass over all users.
+
+    The cursor and running totals are carried from one run to the
+    next when the pass continues as new.
+    """
+
+    task_queues: list[str] = field(default_factory=lambda: ["gardener"])
+    page_size: int = 1000
+    max_concurrent_children: int = 200
+    pages_per_run: int = 5  # Pages before continuing as new
+
+    # Progress so far
+    after_user_id: UUID | None = None
+    users_processed: int = 0
+    promotions_succeeded: int = 0
+    users_failed: int = 0
+
+
+@dataclass
+class GardenerRunResult:
+    """Result of a full gardening pass."""
+
+    users_processed: int
+    promotions_succeeded: int
+    users_failed: int
+
+
 @workflow.defn
 class ScheduledGardenerWorkflow:
     """Parent workflow that runs gardening tasks on a schedule.
 
     This workflow is designed to run continuously with a cron schedule.
+    It pages through users by keyset (ordered by user_id) in an
+    activity and starts one child workflow per user, with a bounded
+    number of children running at once. Children are sharded across
+    the gardener task queues by user ID, so each queue can be served
+    by its own pool of workers. After a few pages the workflow
+    continues as new with its cursor to keep its history small.
+
+    The earlier version took a list of user IDs and gardened them one
+    by one. That input is still accepted, and runs without the
+    "gardener-paging" patch (started before paging existed) keep the
+    old behaviour, so their histories replay.
+
     It coordinates multiple gardening tasks:
     - Memory promotion
-    - Memory expiration (future)
-    - Salience decay (future)
+    - Memory expiration (MemoryExpirationWorkflow, scheduled separately)
+    - Consolidation (MemoryConsolidationWorkflow, scheduled separately)
     - Pattern extraction (future)
+
+    Example usage:
+        await client.start_workflow(
+            ScheduledGardenerWorkflow.run,
+            GardenerRunInput(task_queues=["gardener-0", "gardener-1"]),
+            id="gardener-nightly",
+            task_queue="gardener",
+            cron_schedule="0 2 * * *",
+        )
     """
 
     @workflow.run
-    async def run(self, user_ids: list[UUID]) -> dict[str, int]:
-        """Run gardening tasks for all specified users.
+    async def run(
+        self, input: GardenerRunInput | list[UUID]
+    ) -> GardenerRunResult | dict[str, int]:
+        """Garden the next pages of users, then finish or continue as new.
 
         Args:
-            user_ids: List of user IDs to process
+            input: Sharding and paging options, and progress so far; or,
+                as before paging, the user IDs to garden
 
         Returns:
-            Summary of actions taken per user
+            Totals for the whole pass; for a list of user IDs, the
+            promotions per user (-1 if gardening the user failed)
         """
+        if not workflow.patched("gardener-paging") or isinstance(input, list):
+            return await self._garden_listed(input)
+
+        workflow.logger.info(
+            f"Gardening users after {input.after_user_id} "
+            f"({input.users_processed} processed so far)"
+        )
+
+        slots = asyncio.Semaphore(input.max_concurrent_children)
+
+        for _ in range(input.pages_per_run):
+            user_ids: list[UUID] = await workflow.execute_activity(
+                list_users_page,
+                args=[input.after_user_id, input.page_size],
+                task_queue=activity_task_queue(),
+                start_to_close_timeout=timedelta(minutes=1),
+                retry_policy=RetryPolicy(
+                    initial_interval=timedelta(seconds=1),
+                    maximum_interval=timedelta(seconds=30),
+                    maximum_attempts=5,
+                ),
+            )
+
+            results = await asyncio.gather(
+                *(self._garden_user(user_id, input, slots) for user_id in user_ids)
+            )
+            input.users_processed += len(user_ids)
+            input.promotions_succeeded += sum(r for r in results if r is not None)
+            input.users_failed += sum(1 for r in results if r is None)
+
+            if len(user_ids) < input.page_size:
+                workflow.logger.info(
+                    f"Gardening pass complete: {input.users_processed} users, "
+                    f"{input.promotions_succeeded} promotions, {input.users_failed} failed"
+                )
+                return GardenerRunResult(
+                    users_processed=input.users_processed,
+                    promotions_succeeded=input.promotions_succeeded,
+                    users_failed=input.users_failed,
+                )
+
+            input.after_user_id = user_ids[-1]
+            if workflow.info().is_continue_as_new_suggested():
+                break
+
+        workflow.continue_as_new(input)
+
+    async def _garden_listed(self, user_ids: list[UUID]) -> dict[str, int]:
+        """Garden the given users one at a time, as before paging."""
         workflow.logger.info(f"Starting scheduled gardening for {len(user_ids)} users")
 
         results = {}
 
         for user_id in user_ids:
             try:
-                # Run promotion as a child workflow
                 result = await workflow.execute_child_workflow(
                     MemoryPromotionWorkflow.run,
                     args=[PromotionWorkflowInput(user_id=user_id)],
                     id=f"promote-child-{user_id}-{workflow.info().workflow_id}",
                 )
-
                 results[str(user_id)] = result.promotions_succeeded
-
             except Exception as e:
                 workflow.logger.error(f"Failed gardening for user {user_id}: {e}")
                 results[str(user_id)] = -1  # Indicate failure
 
         return results
+
+    async def _garden_user(
+        self,
+        user_id: UUID,
+        input: GardenerRunInput,
+        slots: asyncio.Semaphore,
+    ) -> int | None:
+        """Run one user's promotion child workflow on its shard queue.
+
+        Returns:
+            Promotions made, or None if the child failed
+        """
+        async with slots:
+            try:
+                result = await workflow.execute_child_workflow(
+                    MemoryPromotionWorkflow.run,
+                    args=[PromotionWorkflowInput(user_id=user_id)],
+                    id=f"promote-child-{user_id}-{workflow.info().workflow_id}",
+                    task_queue=shard_task_queue(user_id, input.task_queues),
+                )
+                return result.promotions_succeeded
+            except Exception as e:
+                workflow.logger.error(f"Failed gardening for user {user_id}: {e}")
+                return None
+
+
+def activity_task_queue() -> str:
+    """Task queue for a DB-heavy activity scheduled by the running workflow.
+
+    Runs started before the DB queue existed scheduled every activity on
+    their own queue, and must keep doing so to replay deterministically.
+    """
+    if workflow.patched("db-task-queue"):
+        return db_task_queue()
+    return workflow.info().task_queue
+
+
+def db_task_queue(task_queue: str | None = None) -> str:
+    """Task queue for DB-heavy activities, beside a gardener queue.
+
+    Defaults to the queue of the running workflow, so sharded gardener
+    queues each keep their own DB activity pool.
+    """
+    return f"{task_queue or workflow.info().task_queue}{DB_QUEUE_SUFFIX}"
+
+
+def shard_task_queue(user_id: UUID, task_queues: list[str]) -> str:
+    """Pick the gardener task queue for a user."""
+    return task_queues[user_id.int % len(task_queues)]
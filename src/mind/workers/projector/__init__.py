@@ -0,0 +1,6 @@
+"""Event log projector: MIND_EVENTS stream -> Postgres events table."""
+
+from mind.workers.projector.projector import EventProjector
+from mind.workers.projector.snapshotter import AggregateSnapshotter
+
+__all__ = ["EventProjector", "AggregateSnapshotter"]
@@ -0,0 +1,253 @@
+"""Projection of the MIND_EVENTS stream into the Postgres event log.
+
+Each partition is one event category (``mind.memory.>``,
+``mind.decision.>``, ...) read by its own durable pull consumer. A
+partition fetches a batch, writes it with multi-row inserts that skip
+event_ids already in the log, records the last stream sequence in
+``projection_checkpoints`` in the same transaction, and only then acks
+the batch with a single ack (AckPolicy.ALL). Partitions run in
+parallel with a bounded number writing to Postgres at once.
+
+If a write fails the partition retries the same batch with backoff
+rather than fetching more, so a later ack can never cover events that
+were not written.
+"""
+
+import asyncio
+import time
+
+import structlog
+from nats.js.api import AckPolicy, ConsumerConfig, DeliverPolicy
+from sqlalchemy.exc import IntegrityError
+
+from mind.config import get_settings
+from mind.core.events import codec
+from mind.core.events.base import EventEnvelope, EventType
+from mind.infrastructure.nats.client import NatsClient
+from mind.infrastructure.postgres.database import Database
+from mind.infrastructure.postgres.repositories import EventRepository
+from mind.observability.metrics import metrics
+
+logger = structlog.get_logger()
+
+_MAX_RETRY_DELAY = 30.0
+
+
+def default_partitions() -> list[str]:
+    """One partition per event category."""
+    return sorted({event_type.value.split(".")[0] for event_type in EventType})
+
+
+class EventProjector:
+    """Writes stream events into the ``events`` table in batches."""
+
+    def __init__(
+        self,
+        client: NatsClient,
+        database: Database,
+        name: str = "event-projector",
+        partitions: list[str] | None = None,
+        batch_size: int | None = None,
+        concurrency: int | None = None,
+        fetch_timeout: float | None = None,
+    ):
+        settings = get_settings()
+        self._client = client
+        self._database = database
+        self._name = name
+        self._partitions = partitions or default_partitions()
+        self._batch_size = batch_size or settings.projector_batch_size
+        self._fetch_timeout = fetch_timeout or settings.projector_fetch_timeout
+        self._write_slots = asyncio.Semaphore(concurrency or settings.projector_concurrency)
+
+        self._checkpoints: dict[str, int] = {}
+        self._tasks: list[asyncio.Task] = []
+        self._running = False
+
+    async def start(self) -> None:
+        """Subscribe every partition and start projecting."""
+        if self._running:
+            return
+
+        async with self._database.session() as session:
+            self._checkpoints = await EventRepository(session).get_checkpoints(self._name)
+
+        self._running = True
+        for partition in self._partitions:
+            subscription = await self._subscribe(partition)
+            self._tasks.append(
+                asyncio.create_task(self._partition_loop(partition, subscription))
+            )
+
+        logger.info(
+            "projector_started",
+            projector=self._name,
+            partitions=self._partitions,
+            checkpoints=self._checkpoints,
+        )
+
+    async def stop(self, timeout: float = 10.0) -> None:
+        """Stop after in-progress batches are written, up to the timeout."""
+        self._running = False
+        if self._tasks:
+            _, pending = await asyncio.wait(self._tasks, timeout=timeout)
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+            self._tasks = []
+        logger.info("projector_stopped", projector=self._name)
+
+    async def _subscribe(self, partition: str):
+        """Bind the partition's durable consumer.
+
+        A new consumer (first run, or after it was deleted) starts
+        right after the Postgres checkpoint instead of replaying the
+        whole stream.
+        """
+        checkpoint = self._checkpoints.get(partition, 0)
+        config = ConsumerConfig(
+            durable_name=f"{self._name}-{partition}",
+            deliver_policy=(
+                DeliverPolicy.BY_START_SEQUENCE if checkpoint else DeliverPolicy.ALL
+            ),
+            opt_start_seq=checkpoint + 1 if checkpoint else None,
+            ack_policy=AckPolicy.ALL,
+            ack_wait=60,
+            max_ack_pending=self._batch_size * 2,
+        )
+        return await self._client.jetstream.pull_subscribe(
+            subject=f"mind.{partition}.>",
+            durable=f"{self._name}-{partition}",
+            config=config,
+        )
+
+    async def _partition_loop(self, partition: str, subscription) -> None:
+        """Fetch and project batches for one partition."""
+        log = logger.bind(projector=self._name, partition=partition)
+
+        while self._running:
+            try:
+                messages = await subscription.fetch(
+                    batch=self._batch_size, timeout=self._fetch_timeout
+                )
+            except asyncio.TimeoutError:
+                continue
+            except Exception as e:
+                log.error("projector_fetch_failed", error=str(e))
+                await asyncio.sleep(1)
+                continue
+
+            if messages:
+                await self._project(partition, messages)
+
+    async def _project(self, partition: str, messages: list) -> None:
+        """Write one fetched batch, retrying until it is stored, then ack it."""
+        envelopes, sequence = self._decode_batch(partition, messages)
+
+        delay = 0.5
+        while True:
+            try:
+                async with self._write_slots:
+                    start = time.perf_counter()
+                    inserted = await self._write(partition, envelopes, sequence)
+                    metrics.event_projection_batch_seconds.labels(partition=partition).observe(
+                        time.perf_counter() - start
+                    )
+                break
+            except Exception as e:
+                logger.warning(
+                    "projector_write_failed",
+                    projector=self._name,
+                    partition=partition,
+                    count=len(envelopes),
+                    retry_in=delay,
+                    error=str(e),
+                )
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, _MAX_RETRY_DELAY)
+
+        # AckPolicy.ALL: acking the last message acks the whole batch
+        await messages[-1].ack()
+
+        self._checkpoints[partition] = max(self._checkpoints.get(partition, 0), sequence)
+        metrics.events_projected_total.labels(partition=partition).inc(inserted)
+        try:
+            metrics.event_projection_pending.labels(partition=partition).set(
+                messages[-1].metadata.num_pending
+            )
+        except Exception:
+            pass  # Not a JetStream message (e.g. in tests)
+
+    def _decode_batch(
+        self, partition: str, messages: list
+    ) -> tuple[list[EventEnvelope], int]:
+        """Decode a batch, skipping already-projected and unreadable messages.
+
+        Returns:
+            The envelopes to write and the batch's last stream sequence
+        """
+        checkpoint = self._checkpoints.get(partition, 0)
+        envelopes = []
+        sequence = checkpoint
+
+        for msg in messages:
+            seq = msg.metadata.sequence.stream
+            sequence = max(sequence, seq)
+            if seq <= checkpoint:
+                continue  # Redelivery of an already-projected message
+
+            headers = msg.headers or {}
+            try:
+                envelopes.append(codec.decode(msg.data, headers.get("Content-Type")))
+            except Exception as e:
+                metrics.event_projection_rejected_total.labels(
+                    partition=partition, reason="decode"
+                ).inc()
+                logger.error(
+                    "projector_decode_failed",
+                    projector=self._name,
+                    partition=partition,
+                    stream_sequence=seq,
+                    error=str(e),
+                )
+
+        return envelopes, sequence
+
+    async def _write(self, partition: str, envelopes: list[EventEnvelope], sequence: int) -> int:
+        """Insert envelopes and move the checkpoint in one transaction.
+
+        A constraint violation (e.g. an unknown user) would fail the
+        batch on every retry, so the batch is then written row by row
+        and only the offending events are skipped.
+        """
+        async with self._database.session() as session:
+            repo = EventRepository(session)
+            try:
+                async with session.begin_nested():
+                    inserted = await repo.append_batch(envelopes)
+            except IntegrityError:
+                inserted = await self._write_rows(partition, session, repo, envelopes)
+            await repo.save_checkpoint(self._name, partition, sequence)
+        return inserted
+
+    async def _write_rows(
+        self, partition: str, session, repo: EventRepository, envelopes: list[EventEnvelope]
+    ) -> int:
+        """Insert envelopes one at a time, skipping those that violate constraints."""
+        inserted = 0
+        for envelope in envelopes:
+            try:
+                async with session.begin_nested():
+                    inserted += await repo.append_batch([envelope])
+            except IntegrityError as e:
+                metrics.event_projection_rejected_total.labels(
+                    partition=partition, reason="constraint"
+                ).inc()
+                logger.error(
+                    "projector_event_rejected",
+                    projector=self._name,
+                    event_id=str(envelope.event_id),
+                    event_type=envelope.event_type.value,
+                    error=str(e.orig),
+                )
+        return inserted
@@ -0,0 +1,134 @@
+"""Background aggregate snapshotter.
+
+Periodically looks for aggregates that gained at least
+``snapshot_event_threshold`` events since their latest snapshot and
+stores a new one, so ``EventRepository.load_aggregate`` never applies
+more than about that many events.
+
+Snapshots are cut at a log position, and reads resume after it. A
+position can be handed out to a transaction that commits later than
+one with a higher position, so each run only folds positions that had
+already been handed out by the previous run: by then their
+transactions have committed, as long as no event write stays open for
+a whole ``snapshot_interval``.
+
+The position covered so far is stored in ``projection_checkpoints``, so
+a restarted snapshotter resumes from it instead of rescanning the log.
+"""
+
+import asyncio
+from uuid import UUID
+
+import structlog
+
+from mind.config import get_settings
+from mind.infrastructure.postgres.database import Database
+from mind.infrastructure.postgres.repositories import EventRepository
+
+logger = structlog.get_logger()
+
+# projection_checkpoints row holding the log position covered so far
+CHECKPOINT_NAME = "snapshotter"
+CHECKPOINT_PARTITION = "events"
+
+
+class AggregateSnapshotter:
+    """Writes snapshots for aggregates past the event-count threshold."""
+
+    def __init__(
+        self,
+        database: Database,
+        threshold: int | None = None,
+        interval: float | None = None,
+        batch_size: int | None = None,
+    ):
+        settings = get_settings()
+        self._database = database
+        self._threshold = threshold or settings.snapshot_event_threshold
+        self._interval = interval or settings.snapshot_interval
+        self._batch_size = batch_size or settings.snapshot_batch_size
+        self._scanned: int | None = None  # Log position covered, loaded on first run
+        self._horizon: int | None = None  # Allocated position seen by the last run
+        self._task: asyncio.Task | None = None
+
+    def start(self) -> None:
+        """Start the periodic snapshot task (idempotent)."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._loop())
+            logger.info("snapshotter_started", threshold=self._threshold)
+
+    async def stop(self) -> None:
+        """Stop the periodic snapshot task."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        logger.info("snapshotter_stopped")
+
+    async def run_once(self) -> int:
+        """Snapshot every aggregate past the threshold up to the settled position.
+
+        An aggregate that cannot be folded (e.g. a reducer raises) is
+        logged and skipped; it is looked at again once it has new events.
+
+        Returns:
+            Number of snapshots written
+        """
+        async with self._database.session() as session:
+            repo = EventRepository(session)
+            if self._scanned is None:
+                checkpoints = await repo.get_checkpoints(CHECKPOINT_NAME)
+                self._scanned = checkpoints.get(CHECKPOINT_PARTITION, 0)
+            allocated = await repo.get_allocated_position()
+        horizon, self._horizon = self._horizon, allocated
+        if horizon is None or horizon <= self._scanned:
+            return 0
+
+        written = 0
+        after_id: UUID | None = None
+        while True:
+            async with self._database.session() as session:
+                repo = EventRepository(session)
+                candidates = await repo.find_snapshot_candidates(
+                    self._threshold,
+                    after_position=self._scanned,
+                    up_to_position=horizon,
+                    after_id=after_id,
+                    limit=self._batch_size,
+                )
+                for aggregate_id in candidates:
+                    try:
+                        async with session.begin_nested():
+                            aggregate = await repo.load_aggregate(
+                                aggregate_id, up_to_position=horizon
+                            )
+                            await repo.save_snapshot(aggregate)
+                    except Exception as e:
+                        logger.error(
+                            "snapshot_failed", aggregate_id=str(aggregate_id), error=str(e)
+                        )
+                        continue
+                    written += 1
+            if len(candidates) < self._batch_size:
+                break
+            after_id = candidates[-1]
+
+        async with self._database.session() as session:
+            await EventRepository(session).save_checkpoint(
+                CHECKPOINT_NAME, CHECKPOINT_PARTITION, horizon
+            )
+        self._scanned = horizon
+        return written
+
+    async def _loop(self) -> None:
+        while True:
+            try:
+                written = await self.run_once()
+                if written:
+                    logger.info("snapshots_written", count=written)
+            except Exception as e:
+                logger.error("snapshotter_failed", error=str(e))
+            await asyncio.sleep(self._interval)
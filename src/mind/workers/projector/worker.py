@@ -0,0 +1,61 @@
+"""Worker process for the event log projector and aggregate snapshotter.
+
+Run this worker with:
+    python -m mind.workers.projector.worker
+"""
+
+import asyncio
+import signal
+from typing import Any
+
+import structlog
+
+from mind.infrastructure.nats.client import close_nats_client, get_nats_client
+from mind.infrastructure.postgres.database import close_database, get_database
+from mind.workers.projector.projector import EventProjector
+from mind.workers.projector.snapshotter import AggregateSnapshotter
+
+logger = structlog.get_logger()
+
+
+async def run_worker() -> None:
+    """Run the projector until interrupted (SIGINT/SIGTERM)."""
+    logger.info("projector_starting")
+
+    client = await get_nats_client()
+    projector = EventProjector(client, get_database())
+    snapshotter = AggregateSnapshotter(get_database())
+
+    # Handle graceful shutdown
+    shutdown_event = asyncio.Event()
+
+    def handle_shutdown(sig: Any) -> None:
+        logger.info("projector_shutdown_requested", signal=sig)
+        shutdown_event.set()
+
+    loop = asyncio.get_event_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(sig, handle_shutdown, sig)
+        except NotImplementedError:
+            # Windows doesn't support add_signal_handler
+            pass
+
+    await projector.start()
+    snapshotter.start()
+    try:
+        await shutdown_event.wait()
+    finally:
+        await snapshotter.stop()
+        await projector.stop()
+        await close_nats_client()
+        await close_database()
+
+
+def main() -> None:
+    """Entry point for running the worker."""
+    asyncio.run(run_worker())
+
+
+if __name__ == "__main__":
+    main()
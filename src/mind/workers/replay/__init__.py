@@ -0,0 +1,17 @@
+"""Event replay: rebuild projections from the MIND_EVENTS stream."""
+
+from mind.workers.replay.engine import (
+    ReplayEngine,
+    ReplayProgress,
+    ReplayReport,
+    ReplaySink,
+)
+from mind.workers.replay.sinks import SalienceSink
+
+__all__ = [
+    "ReplayEngine",
+    "ReplayProgress",
+    "ReplayReport",
+    "ReplaySink",
+    "SalienceSink",
+]
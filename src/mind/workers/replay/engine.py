@@ -0,0 +1,321 @@
+"""Replay of the MIND_EVENTS stream into rebuilt projections.
+
+The engine reads the stream from a sequence or a point in time through
+an ephemeral, no-ack consumer, up to the last sequence present when the
+replay started. Messages are routed by the user ID at the end of their
+subject to parallel lanes, so each user's events reach the sinks in
+stream order while different users are processed concurrently. Only the
+subject is read for routing; lanes decode the envelopes.
+
+Sinks accumulate rebuilt state in memory and write it in batches on
+``flush``. In dry-run mode nothing is written: each sink's ``verify``
+diffs the rebuilt state against the live tables instead.
+"""
+
+import asyncio
+import time
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Callable
+
+import structlog
+from nats.js.api import AckPolicy, ConsumerConfig, DeliverPolicy
+
+from mind.config import get_settings
+from mind.core.errors import ErrorCode, MindError, Result
+from mind.core.events import codec
+from mind.core.events.base import EventEnvelope, EventType
+from mind.infrastructure.nats.client import NatsClient
+
+logger = structlog.get_logger()
+
+
+class ReplaySink(ABC):
+    """A projection that can be rebuilt from events."""
+
+    name: str = "sink"
+    event_types: frozenset[EventType] = frozenset()
+
+    @abstractmethod
+    async def handle(self, envelope: EventEnvelope) -> None:
+        """Apply one event to the rebuilt state."""
+        ...
+
+    @abstractmethod
+    async def flush(self) -> None:
+        """Write the state accumulated since the last flush."""
+        ...
+
+    async def verify(self) -> list[str]:
+        """Describe differences between the rebuilt and live state."""
+        return []
+
+
+@dataclass
+class ReplayProgress:
+    """Running totals of a replay."""
+
+    end_sequence: int = 0
+    last_sequence: int = 0
+    processed: int = 0
+    skipped: int = 0  # Undecodable messages
+    started_at: float = field(default_factory=time.monotonic)
+
+    @property
+    def elapsed(self) -> float:
+        """Seconds since the replay started."""
+        return time.monotonic() - self.started_at
+
+    @property
+    def rate(self) -> float:
+        """Events processed per second."""
+        elapsed = self.elapsed
+        return self.processed / elapsed if elapsed > 0 else 0.0
+
+
+@dataclass
+class ReplayReport:
+    """Outcome of a replay."""
+
+    progress: ReplayProgress
+    dry_run: bool
+    differences: dict[str, list[str]] = field(default_factory=dict)
+
+
+ProgressCallback = Callable[[ReplayProgress], None]
+
+
+class ReplayEngine:
+    """Replays stream events through registered sinks."""
+
+    def __init__(
+        self,
+        client: NatsClient,
+        sinks: list[ReplaySink],
+        lanes: int | None = None,
+        batch_size: int | None = None,
+        flush_every: int | None = None,
+        progress_interval: float = 5.0,
+        on_progress: ProgressCallback | None = None,
+    ):
+        settings = get_settings()
+        self._client = client
+        self._sinks = sinks
+        self._lane_count = max(1, lanes or settings.replay_lanes)
+        self._batch_size = batch_size or settings.replay_batch_size
+        self._flush_every = flush_every or settings.replay_flush_every
+        self._progress_interval = progress_interval
+        self._on_progress = on_progress
+
+        self._routes: dict[EventType, list[ReplaySink]] = {}
+        for sink in sinks:
+            for event_type in sink.event_types:
+                self._routes.setdefault(event_type, []).append(sink)
+
+        self._failure: Exception | None = None
+
+    async def run(
+        self,
+        start_sequence: int | None = None,
+        start_time: datetime | None = None,
+        dry_run: bool = False,
+    ) -> Result[ReplayReport]:
+        """Replay the stream from a sequence or time (default: the beginning).
+
+        Args:
+            start_sequence: First stream sequence to replay
+            start_time: Replay events stored at or after this time
+            dry_run: Verify against live tables instead of writing
+
+        Returns:
+            Result with the replay report, or EVENT_REPLAY_FAILED
+        """
+        progress = ReplayProgress()
+        log = logger.bind(dry_run=dry_run, sinks=[sink.name for sink in self._sinks])
+        log.info("replay_started", start_sequence=start_sequence, start_time=start_time)
+
+        try:
+            report = await self._replay(progress, start_sequence, start_time, dry_run)
+        except Exception as e:
+            log.error(
+                "replay_failed",
+                error=str(e),
+                processed=progress.processed,
+                last_sequence=progress.last_sequence,
+            )
+            return Result.err(
+                MindError(
+                    code=ErrorCode.EVENT_REPLAY_FAILED,
+                    message=f"Replay failed: {e}",
+                    context={
+                        "processed": progress.processed,
+                        "last_sequence": progress.last_sequence,
+                    },
+                )
+            )
+
+        log.info(
+            "replay_completed",
+            processed=progress.processed,
+            skipped=progress.skipped,
+            seconds=round(progress.elapsed, 2),
+            events_per_second=round(progress.rate),
+            differences={name: len(diff) for name, diff in report.differences.items()},
+        )
+        return Result.ok(report)
+
+    async def _replay(
+        self,
+        progress: ReplayProgress,
+        start_sequence: int | None,
+        start_time: datetime | None,
+        dry_run: bool,
+    ) -> ReplayReport:
+        js = self._client.jetstream
+        info = await js.stream_info(NatsClient.STREAM_NAME)
+        progress.end_sequence = info.state.last_seq
+        self._failure = None
+
+        if progress.end_sequence == 0 or (start_sequence or 0) > progress.end_sequence:
+            return await self._finish(progress, dry_run)
+
+        if start_sequence:
+            deliver = {
+                "deliver_policy": DeliverPolicy.BY_START_SEQUENCE,
+                "opt_start_seq": start_sequence,
+            }
+        elif start_time:
+            deliver = {
+                "deliver_policy": DeliverPolicy.BY_START_TIME,
+                "opt_start_time": start_time,
+            }
+        else:
+            deliver = {"deliver_policy": DeliverPolicy.ALL}
+
+        # Ephemeral, read-only consumer: no acks to send or track
+        subscription = await js.pull_subscribe(
+            subject="mind.>",
+            stream=NatsClient.STREAM_NAME,
+            config=ConsumerConfig(ack_policy=AckPolicy.NONE, inactive_threshold=60, **deliver),
+        )
+
+        lanes = [asyncio.Queue(maxsize=self._batch_size) for _ in range(self._lane_count)]
+        workers = [asyncio.create_task(self._lane_loop(lane, progress)) for lane in lanes]
+        try:
+            await self._read(subscription, lanes, progress, dry_run)
+            await asyncio.gather(*(lane.join() for lane in lanes))
+            self._raise_failure()
+        finally:
+            for worker in workers:
+                worker.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+            await subscription.unsubscribe()
+
+        return await self._finish(progress, dry_run)
+
+    async def _read(
+        self,
+        subscription,
+        lanes: list[asyncio.Queue],
+        progress: ReplayProgress,
+        dry_run: bool,
+    ) -> None:
+        """Fetch up to the end sequence, routing messages to lanes."""
+        flushed_at = 0
+        reported_at = time.monotonic()
+
+        while progress.last_sequence < progress.end_sequence:
+            try:
+                messages = await subscription.fetch(batch=self._batch_size, timeout=2)
+            except asyncio.TimeoutError:
+                break  # Nothing left to deliver (e.g. the tail was purged)
+
+            for msg in messages:
+                sequence = msg.metadata.sequence.stream
+                if sequence > progress.end_sequence:
+                    break
+                progress.last_sequence = sequence
+                await lanes[self._lane_for(msg.subject)].put(msg)
+
+            self._raise_failure()
+
+            if not dry_run and progress.processed - flushed_at >= self._flush_every:
+                # Let the lanes catch up so a flush covers a stream prefix
+                await asyncio.gather(*(lane.join() for lane in lanes))
+                await self._flush()
+                flushed_at = progress.processed
+
+            if time.monotonic() - reported_at >= self._progress_interval:
+                self._report(progress)
+                reported_at = time.monotonic()
+
+            if messages and messages[-1].metadata.num_pending == 0:
+                break
+
+    def _lane_for(self, subject: str) -> int:
+        """Lane for a subject, keyed by its trailing user ID."""
+        try:
+            return int(subject.rsplit(".", 1)[-1].replace("-", ""), 16) % self._lane_count
+        except ValueError:
+            return hash(subject) % self._lane_count
+
+    async def _lane_loop(self, queue: asyncio.Queue, progress: ReplayProgress) -> None:
+        """Decode and apply one lane's messages in order."""
+        while True:
+            msg = await queue.get()
+            try:
+                if self._failure is None:
+                    await self._apply(msg, progress)
+            except Exception as e:
+                self._failure = e
+            finally:
+                queue.task_done()
+
+    async def _apply(self, msg, progress: ReplayProgress) -> None:
+        """Apply one message to the sinks interested in it."""
+        headers = msg.headers or {}
+        try:
+            envelope = codec.decode(msg.data, headers.get("Content-Type"))
+        except Exception as e:
+            progress.skipped += 1
+            logger.warning(
+                "replay_message_skipped",
+                stream_sequence=msg.metadata.sequence.stream,
+                error=str(e),
+            )
+            return
+
+        for sink in self._routes.get(envelope.event_type, ()):
+            await sink.handle(envelope)
+        progress.processed += 1
+
+    async def _flush(self) -> None:
+        for sink in self._sinks:
+            await sink.flush()
+
+    async def _finish(self, progress: ReplayProgress, dry_run: bool) -> ReplayReport:
+        """Write (or verify) the remaining state."""
+        report = ReplayReport(progress=progress, dry_run=dry_run)
+        if dry_run:
+            for sink in self._sinks:
+                report.differences[sink.name] = await sink.verify()
+        else:
+            await self._flush()
+        self._report(progress)
+        return report
+
+    def _report(self, progress: ReplayProgress) -> None:
+        logger.info(
+            "replay_progress",
+            processed=progress.processed,
+            last_sequence=progress.last_sequence,
+            end_sequence=progress.end_sequence,
+            events_per_second=round(progress.rate),
+        )
+        if self._on_progress:
+            self._on_progress(progress)
+
+    def _raise_failure(self) -> None:
+        if self._failure is not None:
+            raise self._failure
@@ -0,0 +1,80 @@
+"""Replay sinks for projections derived from events."""
+
+from uuid import UUID
+
+from sqlalchemy import text
+
+from mind.core.events.base import EventEnvelope, EventType
+from mind.infrastructure.postgres.database import Database
+from mind.workers.replay.engine import ReplaySink
+
+# Rows per UPDATE ... FROM unnest() statement
+_UPDATE_CHUNK = 5000
+
+
+class SalienceSink(ReplaySink):
+    """Rebuilds ``memories.outcome_adjustment`` from salience events.
+
+    Each MemorySalienceAdjusted event carries the resulting adjustment,
+    so the last event per memory (in stream order) is its state.
+    """
+
+    name = "salience"
+    event_types = frozenset({EventType.MEMORY_SALIENCE_ADJUSTED})
+
+    def __init__(self, database: Database, tolerance: float = 1e-6):
+        self._database = database
+        self._tolerance = tolerance
+        self._pending: dict[UUID, float] = {}
+
+    async def handle(self, envelope: EventEnvelope) -> None:
+        payload = envelope.payload
+        self._pending[UUID(str(payload["memory_id"]))] = float(payload["new_adjustment"])
+
+    async def flush(self) -> None:
+        pending, self._pending = self._pending, {}
+        items = list(pending.items())
+
+        async with self._database.session() as session:
+            for start in range(0, len(items), _UPDATE_CHUNK):
+                chunk = items[start : start + _UPDATE_CHUNK]
+                await session.execute(
+                    text("""
+                        UPDATE memories AS m
+                        SET outcome_adjustment = v.adjustment, updated_at = NOW()
+                        FROM unnest(CAST(:ids AS uuid[]), CAST(:adjustments AS float8[]))
+                            AS v(memory_id, adjustment)
+                        WHERE m.memory_id = v.memory_id
+                    """),
+                    {
+                        "ids": [memory_id for memory_id, _ in chunk],
+                        "adjustments": [adjustment for _, adjustment in chunk],
+                    },
+                )
+
+    async def verify(self) -> list[str]:
+        differences = []
+        items = list(self._pending.items())
+
+        async with self._database.session() as session:
+            for start in range(0, len(items), _UPDATE_CHUNK):
+                chunk = dict(items[start : start + _UPDATE_CHUNK])
+                result = await session.execute(
+                    text("""
+                        SELECT memory_id, outcome_adjustment FROM memories
+                        WHERE memory_id = ANY(CAST(:ids AS uuid[]))
+                    """),
+                    {"ids": list(chunk)},
+                )
+                live = {row.memory_id: row.outcome_adjustment for row in result}
+
+                for memory_id, rebuilt in chunk.items():
+                    if memory_id not in live:
+                        differences.append(f"memory {memory_id}: missing from live table")
+                    elif abs(live[memory_id] - rebuilt) > self._tolerance:
+                        differences.append(
+                            f"memory {memory_id}: live {live[memory_id]:.6f}, "
+                            f"replayed {rebuilt:.6f}"
+                        )
+
+        return differences
@@ -0,0 +1,70 @@
+"""Command-line entry point for event replay.
+
+Run a replay with:
+    python -m mind.workers.replay.worker [--from-seq N | --from-time ISO] [--dry-run]
+"""
+
+import argparse
+import asyncio
+import sys
+from datetime import datetime
+
+import structlog
+
+from mind.infrastructure.nats.client import close_nats_client, get_nats_client
+from mind.infrastructure.postgres.database import close_database, get_database
+from mind.workers.replay.engine import ReplayEngine
+from mind.workers.replay.sinks import SalienceSink
+
+logger = structlog.get_logger()
+
+
+async def run_replay(
+    start_sequence: int | None,
+    start_time: datetime | None,
+    dry_run: bool,
+    lanes: int | None,
+) -> int:
+    """Run a replay of all sinks and return a process exit code."""
+    client = await get_nats_client()
+    engine = ReplayEngine(client, sinks=[SalienceSink(get_database())], lanes=lanes)
+
+    try:
+        result = await engine.run(
+            start_sequence=start_sequence,
+            start_time=start_time,
+            dry_run=dry_run,
+        )
+    finally:
+        await close_nats_client()
+        await close_database()
+
+    if result.is_err:
+        return 1
+
+    for sink, differences in result.value.differences.items():
+        for difference in differences:
+            print(f"[{sink}] {difference}")
+    # A dry run with differences fails, so it can gate a rebuild
+    return 1 if any(result.value.differences.values()) else 0
+
+
+def main() -> None:
+    """Entry point for running a replay."""
+    parser = argparse.ArgumentParser(description="Replay MIND_EVENTS into projections")
+    start = parser.add_mutually_exclusive_group()
+    start.add_argument("--from-seq", type=int, help="First stream sequence to replay")
+    start.add_argument(
+        "--from-time", type=datetime.fromisoformat, help="Replay events from this ISO time"
+    )
+    parser.add_argument(
+        "--dry-run", action="store_true", help="Diff against live tables without writing"
+    )
+    parser.add_argument("--lanes", type=int, help="Parallel lanes (default from settings)")
+    args = parser.parse_args()
+
+    sys.exit(asyncio.run(run_replay(args.from_seq, args.from_time, args.dry_run, args.lanes)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,171 @@
+"""Integration tests for the gardener's set-based MemoryRepository statements."""
+
+from datetime import UTC, datetime, timedelta
+from uuid import UUID, uuid4
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from mind.core.memory.models import Memory, TemporalLevel
+from mind.infrastructure.postgres.models import MemoryArchiveModel, MemoryModel
+from mind.infrastructure.postgres.repositories import MemoryRepository
+
+pytestmark = pytest.mark.asyncio
+
+
+def unit_vector(*components: float) -> list[float]:
+    """A 1536-dimensional embedding starting with the given components."""
+    return list(components) + [0.0] * (1536 - len(components))
+
+
+async def create_memory(
+    repo: MemoryRepository,
+    user_id: UUID,
+    embedding: list[float] | None = None,
+    **fields,
+) -> Memory:
+    """Store a memory with test defaults overridden by fields."""
+    values = {
+        "memory_id": uuid4(),
+        "user_id": user_id,
+        "content": "User prefers short answers",
+        "content_type": "preference",
+        "temporal_level": TemporalLevel.IMMEDIATE,
+        "valid_from": datetime.now(UTC) - timedelta(days=2),
+        "base_salience": 0.5,
+    }
+    values.update(fields)
+    memory = Memory(**values)
+    result = await repo.create(memory, embedding=embedding)
+    assert result.is_ok
+    return memory
+
+
+class TestArchiveExpired:
+    """Tests for moving expired memories to memories_archive."""
+
+    async def test_moves_only_expired_memories(self, session: AsyncSession, user_id):
+        """Expired rows leave memories for the archive; live rows stay."""
+        repo = MemoryRepository(session)
+        expired = await create_memory(
+            repo, user_id, valid_until=datetime.now(UTC) - timedelta(hours=1)
+        )
+        live = await create_memory(repo, user_id)
+
+        rows = await repo.archive_expired(batch_size=100)
+
+        assert [row.memory_id for row in rows] == [expired.memory_id]
+        assert await session.get(MemoryModel, live.memory_id) is not None
+        remaining = await session.execute(
+            select(MemoryModel.memory_id).where(MemoryModel.memory_id == expired.memory_id)
+        )
+        assert remaining.first() is None
+        archived = await session.get(MemoryArchiveModel, expired.memory_id)
+        assert archived.content == expired.content
+        assert archived.archived_at is not None
+
+    async def test_drops_embeddings_unless_asked_to_keep_them(
+        self, session: AsyncSession, user_id
+    ):
+        """The archived copy has no vector when drop_embeddings is set."""
+        repo = MemoryRepository(session)
+        expired_at = datetime.now(UTC) - timedelta(hours=1)
+        dropped = await create_memory(
+            repo, user_id, embedding=unit_vector(1.0), valid_until=expired_at
+        )
+
+        await repo.archive_expired(batch_size=100, drop_embeddings=True)
+        kept = await create_memory(
+            repo, user_id, embedding=unit_vector(1.0), valid_until=expired_at
+        )
+        await repo.archive_expired(batch_size=100, drop_embeddings=False)
+
+        assert (await session.get(MemoryArchiveModel, dropped.memory_id)).embedding is None
+        assert (await session.get(MemoryArchiveModel, kept.memory_id)).embedding is not None
+
+
+class TestFindNearDuplicates:
+    """Tests for the ANN self-join."""
+
+    async def test_returns_each_close_pair_once(self, session: AsyncSession, user_id):
+        """Close embeddings of the same content type pair up exactly once."""
+        repo = MemoryRepository(session)
+        a = await create_memory(repo, user_id, embedding=unit_vector(1.0, 0.001))
+        b = await create_memory(repo, user_id, embedding=unit_vector(1.0, 0.002))
+        await create_memory(repo, user_id, embedding=unit_vector(0.0, 1.0))
+        await create_memory(
+            repo, user_id, embedding=unit_vector(1.0, 0.001), content_type="fact"
+        )
+
+        rows = await repo.find_near_duplicates(user_id, max_distance=0.01)
+
+        assert [{row.memory_id, row.duplicate_id} for row in rows] == [
+            {a.memory_id, b.memory_id}
+        ]
+
+
+class TestMergeDuplicates:
+    """Tests for merging a duplicate cluster in one statement."""
+
+    async def test_merges_into_highest_level_memory(self, session: AsyncSession, user_id):
+        """The canonical memory absorbs the others' counters; they expire."""
+        repo = MemoryRepository(session)
+        canonical = await create_memory(
+            repo,
+            user_id,
+            temporal_level=TemporalLevel.SITUATIONAL,
+            retrieval_count=2,
+            outcome_adjustment=0.1,
+        )
+        duplicate = await create_memory(
+            repo, user_id, retrieval_count=3, positive_outcomes=1, outcome_adjustment=0.2
+        )
+
+        merged = await repo.merge_duplicates(
+            user_id, [duplicate.memory_id, canonical.memory_id]
+        )
+
+        assert merged == (canonical.memory_id, [duplicate.memory_id])
+        session.expire_all()
+        kept = await session.get(MemoryModel, canonical.memory_id)
+        gone = await session.get(MemoryModel, duplicate.memory_id)
+        assert kept.retrieval_count == 5
+        assert kept.positive_outcomes == 1
+        assert kept.outcome_adjustment == pytest.approx(0.2)
+        assert kept.valid_until is None
+        assert gone.valid_until is not None
+
+    async def test_nothing_to_merge_when_one_is_left(self, session: AsyncSession, user_id):
+        """A cluster whose other members already expired is left alone."""
+        repo = MemoryRepository(session)
+        live = await create_memory(repo, user_id)
+        expired = await create_memory(
+            repo, user_id, valid_until=datetime.now(UTC) - timedelta(hours=1)
+        )
+
+        assert await repo.merge_duplicates(user_id, [live.memory_id, expired.memory_id]) is None
+
+
+class TestPromoteBatch:
+    """Tests for promoting many memories with one UPDATE."""
+
+    async def test_promotes_and_reports_already_promoted(self, session: AsyncSession, user_id):
+        """Rows below the target change; a repeat reports them unchanged."""
+        repo = MemoryRepository(session)
+        memory = await create_memory(repo, user_id)
+        promotion = (memory.memory_id, TemporalLevel.IMMEDIATE, TemporalLevel.SITUATIONAL)
+
+        first = await repo.promote_batch(
+            [promotion, (uuid4(), TemporalLevel.IMMEDIATE, TemporalLevel.SITUATIONAL)]
+        )
+        repeat = await repo.promote_batch([promotion])
+
+        assert [(r.memory_id, r.from_level, r.to_level, r.changed) for r in first] == [
+            (memory.memory_id, 1, 2, True)
+        ]
+        assert [(r.memory_id, r.changed) for r in repeat] == [(memory.memory_id, False)]
+        session.expire_all()
+        promoted = await session.get(MemoryModel, memory.memory_id)
+        assert promoted.temporal_level == TemporalLevel.SITUATIONAL
+        assert promoted.promoted_from_level == TemporalLevel.IMMEDIATE
@@ -0,0 +1,84 @@
+"""Tests for aggregate state folding."""
+
+from datetime import UTC, datetime
+from uuid import uuid4
+
+from mind.core.events.aggregate import AggregateState
+from mind.core.events.base import EventType
+
+
+def memory_events(memory_id) -> list[tuple]:
+    """Created, promoted, then three salience adjustments."""
+    start = datetime(2025, 1, 1, tzinfo=UTC)
+    payloads = [
+        (
+            EventType.MEMORY_CREATED,
+            {
+                "memory_id": str(memory_id),
+                "content_type": "fact",
+                "temporal_level": 1,
+                "base_salience": 0.8,
+                "valid_from": start.isoformat(),
+            },
+        ),
+        (EventType.MEMORY_PROMOTED, {"from_level": 1, "to_level": 2, "reason": "stable"}),
+    ]
+    payloads += [
+        (EventType.MEMORY_SALIENCE_ADJUSTED, {"new_adjustment": 0.1 * i}) for i in (1, 2, 3)
+    ]
+    return [
+        (position, event_type.value, payload)
+        for position, (event_type, payload) in enumerate(payloads, start=1)
+    ]
+
+
+class TestAggregateState:
+    """Tests for AggregateState.apply."""
+
+    def test_fold_memory_events(self):
+        """Applying a memory's events should produce its current state."""
+        memory_id = uuid4()
+        events = memory_events(memory_id)
+        aggregate = AggregateState(aggregate_id=memory_id)
+
+        for event in events:
+            aggregate.apply(*event)
+
+        assert aggregate.version == 5
+        assert aggregate.state["temporal_level"] == 2
+        assert aggregate.state["promoted_from_level"] == 1
+        assert abs(aggregate.state["outcome_adjustment"] - 0.3) < 1e-9
+        assert aggregate.state["adjustment_count"] == 3
+        assert aggregate.position == events[-1][0]
+
+    def test_snapshot_then_remaining_events_matches_full_fold(self):
+        """Resuming from a snapshot should equal folding every event."""
+        memory_id = uuid4()
+        events = memory_events(memory_id)
+
+        full = AggregateState(aggregate_id=memory_id)
+        for event in events:
+            full.apply(*event)
+
+        snapshot = AggregateState(aggregate_id=memory_id)
+        for event in events[:2]:
+            snapshot.apply(*event)
+        resumed = AggregateState(
+            aggregate_id=memory_id,
+            version=snapshot.version,
+            state=dict(snapshot.state),
+            position=snapshot.position,
+        )
+        for event in events[2:]:
+            resumed.apply(*event)
+
+        assert resumed == full
+
+    def test_event_without_reducer_advances_version(self):
+        """Unhandled event types should count but not change state."""
+        aggregate = AggregateState(aggregate_id=uuid4())
+
+        aggregate.apply(1, EventType.DECISION_TRACKED, {})
+
+        assert aggregate.version == 1
+        assert aggregate.state == {}
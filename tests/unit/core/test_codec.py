@@ -0,0 +1,110 @@
+"""Tests for event envelope wire codecs."""
+
+from datetime import UTC, datetime
+from uuid import uuid4
+
+import msgpack
+import orjson
+import pytest
+
+from mind.core.events import codec
+from mind.core.events.base import EventEnvelope
+from mind.core.events.memory import MemoryCreated, MemoryRetrieval, RetrievedMemory
+from mind.core.memory.models import TemporalLevel
+
+
+@pytest.fixture
+def envelope() -> EventEnvelope:
+    event = MemoryCreated(
+        memory_id=uuid4(),
+        content="User prefers dark mode",
+        content_type="preference",
+        temporal_level=TemporalLevel.IDENTITY,
+        base_salience=0.8,
+        valid_from=datetime.now(UTC),
+    )
+    return EventEnvelope.wrap(event=event, user_id=uuid4(), causation_id=uuid4())
+
+
+@pytest.mark.parametrize("content_type", [codec.JSON_CONTENT_TYPE, codec.MSGPACK_CONTENT_TYPE])
+class TestRoundTrip:
+    """Both codecs should reproduce the envelope."""
+
+    def test_envelope_fields(self, envelope: EventEnvelope, content_type: str):
+        """Routing and tracing fields should survive a round trip."""
+        decoded = codec.decode(codec.encode(envelope, content_type), content_type)
+
+        assert decoded.event_id == envelope.event_id
+        assert decoded.event_type == envelope.event_type
+        assert decoded.user_id == envelope.user_id
+        assert decoded.aggregate_id == envelope.aggregate_id
+        assert decoded.correlation_id == envelope.correlation_id
+        assert decoded.causation_id == envelope.causation_id
+        assert decoded.timestamp == envelope.timestamp
+        assert decoded.version == envelope.version
+
+    def test_payload_matches_json_mode(self, envelope: EventEnvelope, content_type: str):
+        """Payloads should decode to the same JSON-compatible values."""
+        decoded = codec.decode(codec.encode(envelope, content_type), content_type)
+        expected = orjson.loads(orjson.dumps(envelope.payload))
+
+        assert decoded.payload == expected
+
+    def test_nested_payload(self, content_type: str):
+        """Lists of nested models should round trip."""
+        event = MemoryRetrieval(
+            retrieval_id=uuid4(),
+            query="dark mode",
+            memories=[RetrievedMemory(memory_id=uuid4(), rank=1, score=0.9, source="vector")],
+            latency_ms=12.5,
+        )
+        envelope = EventEnvelope.wrap(event=event, user_id=uuid4())
+
+        decoded = codec.decode(codec.encode(envelope, content_type), content_type)
+
+        assert decoded.payload["memories"][0]["memory_id"] == str(event.memories[0].memory_id)
+
+    def test_header(self, envelope: EventEnvelope, content_type: str):
+        """The header should carry the routing fields."""
+        header = codec.decode_header(codec.encode(envelope, content_type), content_type)
+
+        assert header.aggregate_key == envelope.aggregate_id.int
+        assert header.user_key == envelope.user_id.int
+        assert header.event_type == envelope.event_type.value
+
+    def test_decode_from_header(self, envelope: EventEnvelope, content_type: str):
+        """The header's parsed fields should decode to the same envelope."""
+        data = codec.encode(envelope, content_type)
+
+        decoded = codec.decode_from_header(codec.decode_header(data, content_type))
+
+        assert decoded == codec.decode(data, content_type)
+
+
+class TestCodec:
+    """Codec selection and versioning."""
+
+    def test_missing_content_type_is_json(self, envelope: EventEnvelope):
+        """Messages without a Content-Type header should decode as JSON."""
+        decoded = codec.decode(codec.encode(envelope))
+        assert decoded.event_id == envelope.event_id
+
+    def test_msgpack_is_smaller(self, envelope: EventEnvelope):
+        """The binary format should be more compact than JSON."""
+        binary = codec.encode(envelope, codec.MSGPACK_CONTENT_TYPE)
+        text = codec.encode(envelope, codec.JSON_CONTENT_TYPE)
+        assert len(binary) < len(text)
+
+    def test_unknown_version_rejected(self, envelope: EventEnvelope):
+        """An unknown envelope version should fail loudly."""
+        fields = msgpack.unpackb(codec.encode(envelope, codec.MSGPACK_CONTENT_TYPE))
+        fields[0] = 99
+        data = msgpack.packb(fields, use_bin_type=True)
+
+        with pytest.raises(ValueError):
+            codec.decode(data, codec.MSGPACK_CONTENT_TYPE)
+
+    def test_unknown_content_type_rejected(self, envelope: EventEnvelope):
+        """Unsupported content types should be rejected."""
+        with pytest.raises(ValueError):
+            codec.encode(envelope, "text/plain")
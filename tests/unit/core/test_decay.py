@@ -0,0 +1,59 @@
+"""Tests for read-time salience decay."""
+
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from mind.core.memory.decay import DecayCurve, DecayPolicy
+
+
+class TestDecayPolicy:
+    """Tests for decay curves."""
+
+    @pytest.mark.parametrize(
+        "curve", [DecayCurve.EXPONENTIAL, DecayCurve.LINEAR, DecayCurve.POWER_LAW]
+    )
+    def test_halves_after_one_half_life(self, curve: DecayCurve):
+        """Every curve should keep half the salience after one half-life."""
+        policy = DecayPolicy(curve=curve, half_life_hours=24)
+
+        assert policy.factor(0) == 1.0
+        assert policy.factor(24) == pytest.approx(0.5)
+
+    def test_curves_differ_after_half_life(self):
+        """Linear reaches zero, power law keeps a long tail."""
+        hours = 24 * 3
+
+        linear = DecayPolicy(curve=DecayCurve.LINEAR, half_life_hours=24).factor(hours)
+        exponential = DecayPolicy(curve=DecayCurve.EXPONENTIAL, half_life_hours=24).factor(hours)
+        power_law = DecayPolicy(curve=DecayCurve.POWER_LAW, half_life_hours=24).factor(hours)
+
+        assert linear == 0.0
+        assert exponential < power_law
+
+    def test_min_factor_bounds_decay(self):
+        """Decay should never go below the minimum factor."""
+        policy = DecayPolicy(half_life_hours=1, min_factor=0.1)
+
+        assert policy.factor(1000) == 0.1
+
+    def test_none_disables_decay(self):
+        """The none curve leaves salience untouched."""
+        policy = DecayPolicy(curve=DecayCurve.NONE)
+
+        assert policy.factor(10_000) == 1.0
+        assert policy.sql_factor("updated_at") == "1.0"
+
+    def test_apply_uses_time_since_last_use(self):
+        """Salience decays by the time elapsed since the last update."""
+        now = datetime.now(UTC)
+        policy = DecayPolicy(half_life_hours=24)
+
+        assert policy.apply(0.8, now - timedelta(hours=48), now) == pytest.approx(0.2)
+
+    def test_sql_factor_references_last_used(self):
+        """The SQL form should be computed from the given column."""
+        sql = DecayPolicy(half_life_hours=24).sql_factor("m.updated_at", now="now()")
+
+        assert "now() - m.updated_at" in sql
+        assert "power(0.5" in sql
@@ -0,0 +1,78 @@
+"""Fakes shared by unit tests."""
+
+from types import SimpleNamespace
+
+from mind.core.errors import ErrorCode, MindError, Result
+from mind.core.events import codec
+from mind.core.events.base import EventEnvelope
+
+
+class FakeMsg:
+    """JetStream message stand-in that records how it was acknowledged."""
+
+    def __init__(
+        self,
+        data: bytes,
+        subject: str = "",
+        sequence: int = 0,
+        num_delivered: int = 1,
+        num_pending: int = 0,
+    ):
+        self.subject = subject
+        self.data = data
+        self.headers = {"Content-Type": codec.JSON_CONTENT_TYPE}
+        self.metadata = SimpleNamespace(
+            sequence=SimpleNamespace(stream=sequence),
+            num_delivered=num_delivered,
+            num_pending=num_pending,
+        )
+        self.acked = False
+        self.terminated = False
+        self.nak_delay = None
+        self.in_progress_count = 0
+
+    @classmethod
+    def wrap(cls, envelope: EventEnvelope, **kwargs) -> "FakeMsg":
+        """Message carrying an encoded envelope on its subject."""
+        return cls(codec.encode(envelope), subject=envelope.nats_subject(), **kwargs)
+
+    async def ack(self):
+        self.acked = True
+
+    async def in_progress(self):
+        self.in_progress_count += 1
+
+    async def nak(self, delay=None):
+        self.nak_delay = delay
+
+    async def term(self):
+        self.terminated = True
+
+
+class FakeSession:
+    """Captures the executed statement and returns canned rows."""
+
+    def __init__(self, rows=()):
+        self.rows = list(rows)
+        self.statement = None
+        self.params = None
+
+    async def execute(self, statement, params=None):
+        self.statement = str(statement)
+        self.params = params
+        return iter(self.rows)
+
+
+class FakePublisher:
+    """Records published envelopes; fails them all when fail is set."""
+
+    def __init__(self):
+        self.published: list = []
+        self.fail = False
+
+    async def publish_batch(self, envelopes):
+        self.published.extend(envelopes)
+        if self.fail:
+            error = MindError(code=ErrorCode.EVENT_PUBLISH_FAILED, message="down")
+            return [Result.err(error) for _ in envelopes]
+        return [Result.ok(None) for _ in envelopes]
@@ -0,0 +1,162 @@
+"""Tests for the circuit breaker."""
+
+import asyncio
+
+import httpx
+import pytest
+
+from mind.core.errors import ErrorCode, MindError
+from mind.infrastructure.circuit_breaker import CircuitBreaker, CircuitState
+from mind.infrastructure.embeddings.openai import OpenAIEmbedder
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    return FakeClock()
+
+
+@pytest.fixture
+def breaker(clock: FakeClock) -> CircuitBreaker:
+    return CircuitBreaker(
+        "test",
+        failure_threshold=3,
+        recovery_timeout=10.0,
+        jitter=0.0,
+        clock=clock,
+    )
+
+
+class TestCircuitBreaker:
+    """Tests for CircuitBreaker state transitions."""
+
+    def test_starts_closed(self, breaker: CircuitBreaker):
+        """A new breaker should allow calls."""
+        assert breaker.state == CircuitState.CLOSED
+        assert breaker.allow_request() is True
+
+    def test_opens_after_threshold(self, breaker: CircuitBreaker):
+        """Consecutive failures should open the breaker."""
+        for _ in range(3):
+            breaker.record_failure()
+
+        assert breaker.state == CircuitState.OPEN
+        assert breaker.allow_request() is False
+
+    def test_success_resets_failures(self, breaker: CircuitBreaker):
+        """Only consecutive failures should count."""
+        breaker.record_failure()
+        breaker.record_failure()
+        breaker.record_success()
+        breaker.record_failure()
+
+        assert breaker.state == CircuitState.CLOSED
+
+    def test_half_open_allows_single_probe(self, breaker: CircuitBreaker, clock: FakeClock):
+        """After the recovery interval exactly one probe should pass."""
+        for _ in range(3):
+            breaker.record_failure()
+
+        clock.now = 10.0
+        assert breaker.allow_request() is True
+        assert breaker.state == CircuitState.HALF_OPEN
+        assert breaker.allow_request() is False
+
+    def test_probe_success_closes(self, breaker: CircuitBreaker, clock: FakeClock):
+        """A successful probe should close the breaker."""
+        for _ in range(3):
+            breaker.record_failure()
+        clock.now = 10.0
+        breaker.allow_request()
+
+        breaker.record_success()
+
+        assert breaker.state == CircuitState.CLOSED
+
+    def test_probe_failure_reopens(self, breaker: CircuitBreaker, clock: FakeClock):
+        """A failed probe should re-open for another interval."""
+        for _ in range(3):
+            breaker.record_failure()
+        clock.now = 10.0
+        breaker.allow_request()
+
+        breaker.record_failure()
+
+        assert breaker.state == CircuitState.OPEN
+        clock.now = 15.0
+        assert breaker.allow_request() is False
+
+    async def test_call_short_circuits(self, breaker: CircuitBreaker):
+        """call() should raise CIRCUIT_OPEN without invoking the function."""
+        calls = 0
+
+        async def failing():
+            nonlocal calls
+            calls += 1
+            raise ConnectionError("down")
+
+        for _ in range(3):
+            with pytest.raises(ConnectionError):
+                await breaker.call(failing)
+
+        with pytest.raises(MindError) as exc:
+            await breaker.call(failing)
+
+        assert exc.value.code == ErrorCode.CIRCUIT_OPEN
+        assert calls == 3
+
+
+class TestEmbedderBreaker:
+    """Tests for the embedder's use of its breaker."""
+
+    @pytest.fixture
+    def probing(self, breaker: CircuitBreaker, clock: FakeClock) -> CircuitBreaker:
+        """The breaker, opened and due for a half-open probe."""
+        for _ in range(3):
+            breaker.record_failure()
+        clock.now = 10.0
+        return breaker
+
+    def embedder(self, breaker: CircuitBreaker, handler) -> OpenAIEmbedder:
+        embedder = OpenAIEmbedder(api_key="test")
+        embedder._breaker = breaker
+        embedder._client = httpx.AsyncClient(
+            base_url="http://test", transport=httpx.MockTransport(handler)
+        )
+        return embedder
+
+    async def test_malformed_response_counts_once(self, probing: CircuitBreaker):
+        """A 200 with an unparseable body should be a single failed probe."""
+        embedder = self.embedder(probing, lambda request: httpx.Response(200, json={}))
+
+        result = await embedder.embed_batch(["text"])
+
+        assert result.is_err
+        assert probing.state == CircuitState.OPEN
+
+    async def test_cancelled_request_releases_probe(self, probing: CircuitBreaker):
+        """A request cancelled mid-flight should give the probe back."""
+        started = asyncio.Event()
+
+        async def hang(request: httpx.Request) -> httpx.Response:
+            started.set()
+            await asyncio.Event().wait()
+
+        embedder = self.embedder(probing, hang)
+        task = asyncio.create_task(embedder.embed_batch(["text"]))
+        await started.wait()
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        assert probing.state == CircuitState.HALF_OPEN
+        assert probing.allow_request() is True
@@ -0,0 +1,214 @@
+"""Tests for key-ordered concurrent event consumption."""
+
+import asyncio
+import time
+from datetime import UTC, datetime
+from uuid import uuid4
+
+from mind.core.events.base import EventEnvelope, EventType
+from mind.core.events.memory import MemoryCreated
+from mind.core.memory.models import TemporalLevel
+from mind.infrastructure.nats.consumer import EventConsumer
+from tests.unit.fakes import FakeMsg
+
+
+class FakeDLQ:
+    """Records dead-lettered messages."""
+
+    def __init__(self):
+        self.sent = []
+
+    async def send(self, msg, consumer, reason, error, attempts):
+        self.sent.append((msg, reason, attempts))
+
+
+def make_envelope(memory_id) -> EventEnvelope:
+    event = MemoryCreated(
+        memory_id=memory_id,
+        content="Test memory",
+        content_type="fact",
+        temporal_level=TemporalLevel.IMMEDIATE,
+        valid_from=datetime.now(UTC),
+    )
+    return EventEnvelope.wrap(event=event, user_id=uuid4())
+
+
+async def run_lanes(consumer: EventConsumer, messages: list[FakeMsg]) -> None:
+    """Route messages through the lanes without a NATS subscription."""
+    consumer._lanes = [asyncio.Queue() for _ in range(consumer._lane_count)]
+    consumer._tasks = [
+        asyncio.create_task(consumer._lane_loop(i)) for i in range(consumer._lane_count)
+    ]
+    for msg in messages:
+        await consumer._route(msg)
+    await consumer.stop(timeout=1)
+
+
+class TestEventConsumer:
+    """Tests for EventConsumer lanes."""
+
+    async def test_per_key_order_preserved(self):
+        """Events for the same aggregate should be handled in publish order."""
+        consumer = EventConsumer(client=None, consumer_name="test", lanes=4)
+        keys = [uuid4() for _ in range(5)]
+        seen: dict = {k: [] for k in keys}
+
+        async def handler(envelope: EventEnvelope):
+            await asyncio.sleep(0.001)
+            seen[envelope.aggregate_id].append(envelope.event_id)
+
+        consumer.on(EventType.MEMORY_CREATED, handler)
+
+        envelopes = [make_envelope(keys[i % 5]) for i in range(50)]
+        messages = [FakeMsg.wrap(env) for env in envelopes]
+        await run_lanes(consumer, messages)
+
+        for key in keys:
+            expected = [env.event_id for env in envelopes if env.aggregate_id == key]
+            assert seen[key] == expected
+        assert all(msg.acked for msg in messages)
+
+    async def test_different_keys_run_concurrently(self):
+        """Events for different keys should be processed in parallel."""
+        consumer = EventConsumer(client=None, consumer_name="test", lanes=8)
+        active = 0
+        peak = 0
+
+        async def handler(envelope: EventEnvelope):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+
+        consumer.on(EventType.MEMORY_CREATED, handler)
+
+        messages = [FakeMsg.wrap(make_envelope(uuid4())) for _ in range(32)]
+        await run_lanes(consumer, messages)
+
+        assert peak > 1
+
+    def test_batch_size_adapts(self):
+        """The fetch batch should grow under backlog and shrink when idle."""
+        consumer = EventConsumer(
+            client=None, consumer_name="test", min_batch=10, max_batch=80
+        )
+
+        consumer._resize_batch(10)
+        consumer._resize_batch(20)
+        assert consumer._batch_size == 40
+
+        consumer._resize_batch(0)
+        consumer._resize_batch(0)
+        consumer._resize_batch(0)
+        assert consumer._batch_size == 10
+
+    async def test_queued_messages_kept_in_progress(self):
+        """Messages waiting in a lane should get in-progress acks until handled."""
+        consumer = EventConsumer(client=None, consumer_name="test", lanes=1)
+        release = asyncio.Event()
+
+        async def handler(envelope: EventEnvelope):
+            await release.wait()
+
+        consumer.on(EventType.MEMORY_CREATED, handler)
+        consumer._lanes = [asyncio.Queue()]
+        consumer._tasks = [asyncio.create_task(consumer._lane_loop(0))]
+        handling = FakeMsg.wrap(make_envelope(uuid4()))
+        queued = FakeMsg.wrap(make_envelope(uuid4()))
+        await consumer._route(handling)
+        await consumer._route(queued)
+        await asyncio.sleep(0)
+
+        consumer._touch_outstanding(time.monotonic())
+        consumer._touch_outstanding(time.monotonic() - 60)  # Recently reset: skipped
+        release.set()
+        await consumer.stop(timeout=1)
+
+        assert handling.in_progress_count == 1
+        assert queued.in_progress_count == 1
+        assert handling.acked and queued.acked
+        assert consumer._outstanding == {}
+
+
+class TestEventConsumerFailures:
+    """Tests for retry backoff and dead-lettering."""
+
+    async def test_failed_message_holds_its_lane(self):
+        """A retried message should still be handled before later ones with its key."""
+        consumer = EventConsumer(client=None, consumer_name="test", lanes=4)
+        consumer._retry_base = 0.001
+        key = uuid4()
+        first, second = make_envelope(key), make_envelope(key)
+        failures = 2
+        seen = []
+
+        async def handler(envelope: EventEnvelope):
+            nonlocal failures
+            if envelope.event_id == first.event_id and failures:
+                failures -= 1
+                raise RuntimeError("boom")
+            seen.append(envelope.event_id)
+
+        consumer.on(EventType.MEMORY_CREATED, handler)
+        messages = [FakeMsg.wrap(first), FakeMsg.wrap(second)]
+
+        await run_lanes(consumer, messages)
+
+        assert seen == [first.event_id, second.event_id]
+        assert all(msg.acked and msg.nak_delay is None for msg in messages)
+
+    def test_retry_delay_backs_off(self):
+        """Later attempts should wait longer, up to the cap."""
+        consumer = EventConsumer(client=None, consumer_name="test")
+        consumer._retry_max = 10
+
+        assert 0 < consumer._retry_delay(1) < consumer._retry_delay(3)
+        assert consumer._retry_delay(20) <= 10 * 1.2
+
+    async def test_last_attempt_dead_lettered(self):
+        """After max_deliver attempts the message should go to the DLQ."""
+        consumer = EventConsumer(client=None, consumer_name="test", lanes=1)
+        consumer._dlq = FakeDLQ()
+
+        async def handler(envelope: EventEnvelope):
+            raise RuntimeError("boom")
+
+        consumer.on(EventType.MEMORY_CREATED, handler)
+        msg = FakeMsg.wrap(make_envelope(uuid4()), num_delivered=consumer._max_deliver)
+
+        await run_lanes(consumer, [msg])
+
+        assert consumer._dlq.sent == [(msg, "handler", consumer._max_deliver)]
+        assert msg.terminated
+        assert msg.nak_delay is None
+
+    async def test_slow_handler_times_out(self):
+        """A handler over the timeout should count as a failure."""
+        consumer = EventConsumer(client=None, consumer_name="test", lanes=1)
+        consumer._dlq = FakeDLQ()
+        consumer._handler_timeout = 0.01
+        consumer._retry_base = 0.001
+
+        async def handler(envelope: EventEnvelope):
+            await asyncio.sleep(1)
+
+        consumer.on(EventType.MEMORY_CREATED, handler)
+        msg = FakeMsg.wrap(make_envelope(uuid4()))
+
+        await run_lanes(consumer, [msg])
+
+        assert not msg.acked
+        assert consumer._dlq.sent == [(msg, "timeout", consumer._max_deliver)]
+
+    async def test_undecodable_message_dead_lettered(self):
+        """A message that cannot be decoded should skip retries."""
+        consumer = EventConsumer(client=None, consumer_name="test", lanes=1)
+        consumer._dlq = FakeDLQ()
+        msg = FakeMsg.wrap(make_envelope(uuid4()))
+        msg.data = b"not an envelope"
+
+        await run_lanes(consumer, [msg])
+
+        assert [reason for _, reason, _ in consumer._dlq.sent] == ["decode"]
+        assert msg.terminated
@@ -0,0 +1,135 @@
+"""Tests for background event dispatch."""
+
+import asyncio
+from datetime import UTC, datetime
+from uuid import uuid4
+
+from mind.core.errors import ErrorCode, MindError, Result
+from mind.core.events.base import EventEnvelope
+from mind.core.events.memory import MemoryCreated
+from mind.core.memory.models import TemporalLevel
+from mind.infrastructure.nats.dispatcher import EventDispatcher
+
+
+class FakePublisher:
+    """Publisher stand-in that records batches."""
+
+    def __init__(self, fail: bool = False):
+        self.batches: list[list[EventEnvelope]] = []
+        self.fail = fail
+
+    async def publish_batch(self, envelopes):
+        self.batches.append(list(envelopes))
+        if self.fail:
+            error = MindError(code=ErrorCode.EVENT_PUBLISH_FAILED, message="down")
+            return [Result.err(error) for _ in envelopes]
+        return [Result.ok(None) for _ in envelopes]
+
+
+def make_envelope() -> EventEnvelope:
+    event = MemoryCreated(
+        memory_id=uuid4(),
+        content="Test memory",
+        content_type="fact",
+        temporal_level=TemporalLevel.IMMEDIATE,
+        valid_from=datetime.now(UTC),
+    )
+    return EventEnvelope.wrap(event=event, user_id=uuid4())
+
+
+class TestEventDispatcher:
+    """Tests for EventDispatcher."""
+
+    async def test_drains_in_batches(self):
+        """Queued events should be published in batches and flushed on close."""
+        publisher = FakePublisher()
+
+        async def factory():
+            return publisher
+
+        dispatcher = EventDispatcher(factory, max_size=100, batch_size=4, overflow="drop")
+        for _ in range(10):
+            assert await dispatcher.enqueue(make_envelope())
+
+        await dispatcher.close(timeout=1)
+
+        assert sum(len(b) for b in publisher.batches) == 10
+        assert max(len(b) for b in publisher.batches) <= 4
+        assert dispatcher.depth == 0
+
+    async def test_drop_when_full(self):
+        """The drop policy should reject events once the queue is full."""
+        blocker = asyncio.Event()
+
+        async def factory():
+            await blocker.wait()
+            return FakePublisher()
+
+        dispatcher = EventDispatcher(factory, max_size=2, batch_size=1, overflow="drop")
+        results = [await dispatcher.enqueue(make_envelope()) for _ in range(4)]
+
+        # One event is taken by the drain task, two fill the queue
+        assert results.count(False) >= 1
+
+        blocker.set()
+        await dispatcher.close(timeout=1)
+
+    async def test_spill_and_restore(self, tmp_path):
+        """Failed events should be spilled and replayed once publishing recovers."""
+        publisher = FakePublisher(fail=True)
+        spill_path = tmp_path / "spill.jsonl"
+
+        async def factory():
+            return publisher
+
+        dispatcher = EventDispatcher(
+            factory,
+            max_size=10,
+            batch_size=10,
+            overflow="spill",
+            spill_path=str(spill_path),
+        )
+        lost = make_envelope()
+        await dispatcher.enqueue(lost)
+        await asyncio.sleep(0.01)
+
+        assert spill_path.exists()
+
+        publisher.fail = False
+        await dispatcher.enqueue(make_envelope())
+        await asyncio.sleep(0.01)
+        await dispatcher.close(timeout=1)
+
+        published = [env.event_id for batch in publisher.batches[1:] for env in batch]
+        assert lost.event_id in published
+        assert not spill_path.exists()
+
+    async def test_restore_skips_malformed_lines(self, tmp_path):
+        """A corrupt spill line should be skipped without losing the rest."""
+        spill_path = tmp_path / "spill.jsonl"
+        good = [make_envelope() for _ in range(3)]
+        spill_path.write_text(
+            "\n".join(
+                [good[0].model_dump_json(), '{"event_id": "trunc', good[1].model_dump_json()]
+                + [good[2].model_dump_json()]
+            )
+            + "\n",
+            encoding="utf-8",
+        )
+
+        async def factory():
+            return FakePublisher()
+
+        dispatcher = EventDispatcher(
+            factory, max_size=2, batch_size=2, overflow="spill", spill_path=str(spill_path)
+        )
+        dispatcher._restore_spill()
+
+        queued = [dispatcher._queue.get_nowait().event_id for _ in range(dispatcher.depth)]
+        assert queued == [good[0].event_id, good[1].event_id]
+        # The tail that did not fit is kept for the next pass
+        tail = spill_path.read_text(encoding="utf-8").splitlines()
+        assert [EventEnvelope.model_validate_json(line).event_id for line in tail] == [
+            good[2].event_id
+        ]
+        assert not (tmp_path / "spill.jsonl.restoring").exists()
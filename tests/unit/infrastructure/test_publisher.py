@@ -0,0 +1,183 @@
+"""Tests for serial and pipelined event publishing."""
+
+import asyncio
+from datetime import UTC, datetime
+from uuid import uuid4
+
+import pytest
+from nats.js.api import PubAck
+from nats.js.errors import TooManyStalledMsgsError
+
+from mind.core.events.base import EventEnvelope
+from mind.core.events.memory import MemoryCreated
+from mind.core.memory.models import TemporalLevel
+from mind.infrastructure.circuit_breaker import CircuitBreaker, CircuitState
+from mind.infrastructure.nats.publisher import EventPublisher, PipelinedEventPublisher
+
+
+class FakeJetStream:
+    """JetStream stand-in that acks publishes on demand."""
+
+    def __init__(self, drop_first: int = 0, stall_first: int = 0):
+        self.sent: list[tuple[str, dict]] = []
+        self.futures: list[asyncio.Future] = []
+        self._drop_first = drop_first
+        self._stall_first = stall_first
+
+    async def publish_async(self, subject, payload=b"", wait_stall=None, headers=None):
+        if self._stall_first > 0:
+            self._stall_first -= 1
+            raise TooManyStalledMsgsError()
+        self.sent.append((subject, headers))
+        future = asyncio.get_running_loop().create_future()
+        if len(self.sent) > self._drop_first:
+            future.set_result(PubAck(stream="MIND_EVENTS", seq=len(self.sent)))
+        self.futures.append(future)
+        return future
+
+
+class HangingJetStream:
+    """JetStream stand-in whose publishes never complete."""
+
+    async def publish(self, subject, payload=b"", headers=None):
+        await asyncio.Event().wait()
+
+
+class FakeClient:
+    def __init__(self, jetstream: FakeJetStream):
+        self.jetstream = jetstream
+
+
+def half_open_breaker() -> CircuitBreaker:
+    """A breaker whose next allowed call is the half-open probe."""
+    breaker = CircuitBreaker("test", failure_threshold=1, recovery_timeout=0.001, jitter=0.0)
+    breaker.record_failure()
+    breaker._next_probe_at = 0.0
+    return breaker
+
+
+def make_envelope() -> EventEnvelope:
+    event = MemoryCreated(
+        memory_id=uuid4(),
+        content="Test memory",
+        content_type="fact",
+        temporal_level=TemporalLevel.IMMEDIATE,
+        valid_from=datetime.now(UTC),
+    )
+    return EventEnvelope.wrap(event=event, user_id=uuid4())
+
+
+class TestEventPublisher:
+    """Tests for the serial publisher."""
+
+    async def test_cancelled_probe_is_released(self):
+        """Cancelling the half-open probe should let the next publish probe again."""
+        publisher = EventPublisher(FakeClient(HangingJetStream()))
+        publisher._breaker = breaker = half_open_breaker()
+
+        probe = asyncio.create_task(publisher.publish(make_envelope()))
+        await asyncio.sleep(0.01)
+        probe.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await probe
+
+        assert breaker.state == CircuitState.HALF_OPEN
+        assert breaker.allow_request() is True
+
+
+class TestPipelinedEventPublisher:
+    """Tests for PipelinedEventPublisher."""
+
+    async def test_batch_is_acked(self):
+        """All envelopes in a batch should be published and acked."""
+        js = FakeJetStream()
+        publisher = PipelinedEventPublisher(FakeClient(js), max_pending=4)
+
+        results = await publisher.publish_batch([make_envelope() for _ in range(10)])
+
+        assert all(r.is_ok for r in results)
+        assert len(js.sent) == 10
+        assert publisher.in_flight == 0
+
+    async def test_retry_reuses_message_id(self):
+        """A timed-out ack should be re-sent with the same Nats-Msg-Id."""
+        js = FakeJetStream(drop_first=1)
+        publisher = PipelinedEventPublisher(
+            FakeClient(js), max_pending=4, ack_timeout=0.01, max_retries=2
+        )
+        envelope = make_envelope()
+
+        result = await publisher.publish(envelope)
+
+        assert result.is_ok
+        assert len(js.sent) == 2
+        assert js.sent[0][1]["Nats-Msg-Id"] == js.sent[1][1]["Nats-Msg-Id"]
+        assert js.sent[0][1]["Nats-Msg-Id"] == str(envelope.event_id)
+
+    async def test_gives_up_after_max_retries(self):
+        """Publishing should fail once retries are exhausted."""
+        js = FakeJetStream(drop_first=100)
+        publisher = PipelinedEventPublisher(
+            FakeClient(js), max_pending=4, ack_timeout=0.01, max_retries=1
+        )
+
+        result = await publisher.publish(make_envelope())
+
+        assert result.is_err
+        assert len(js.sent) == 2
+
+    async def test_window_bounds_in_flight(self):
+        """Submissions should block once the window is full."""
+        js = FakeJetStream(drop_first=100)
+        publisher = PipelinedEventPublisher(
+            FakeClient(js), max_pending=2, ack_timeout=10, max_retries=0
+        )
+
+        await publisher.submit(make_envelope())
+        await publisher.submit(make_envelope())
+        blocked = asyncio.create_task(publisher.submit(make_envelope()))
+        await asyncio.sleep(0.01)
+
+        assert not blocked.done()
+        assert publisher.in_flight == 2
+
+        js.futures[0].set_result(PubAck(stream="MIND_EVENTS", seq=1))
+        await asyncio.wait_for(blocked, timeout=1)
+        assert len(js.sent) == 3
+
+        for future in js.futures[1:]:
+            future.set_result(PubAck(stream="MIND_EVENTS", seq=2))
+        await publisher.flush(timeout=1)
+        assert publisher.in_flight == 0
+
+    async def test_stalled_probe_is_retried_without_regating(self):
+        """A half-open probe that stalls should be re-sent under the same permit."""
+        js = FakeJetStream(stall_first=1)
+        publisher = PipelinedEventPublisher(
+            FakeClient(js), max_pending=4, ack_timeout=0.01, max_retries=2
+        )
+        publisher._breaker = breaker = half_open_breaker()
+
+        result = await publisher.publish(make_envelope())
+
+        assert result.is_ok
+        assert len(js.sent) == 1
+        assert breaker.state == CircuitState.CLOSED
+
+    async def test_cancelled_submit_releases_probe(self):
+        """Cancelling a submit blocked on the window should free the probe."""
+        js = FakeJetStream(drop_first=100)
+        publisher = PipelinedEventPublisher(
+            FakeClient(js), max_pending=1, ack_timeout=10, max_retries=0
+        )
+        await publisher.submit(make_envelope())
+        publisher._breaker = breaker = half_open_breaker()
+
+        blocked = asyncio.create_task(publisher.submit(make_envelope()))
+        await asyncio.sleep(0.01)
+        blocked.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await blocked
+
+        assert breaker.state == CircuitState.HALF_OPEN
+        assert breaker.allow_request() is True
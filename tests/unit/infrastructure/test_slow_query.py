@@ -0,0 +1,69 @@
+"""Tests for slow-query capture."""
+
+from prometheus_client import REGISTRY
+from sqlalchemy import create_engine, text
+
+from mind.infrastructure.postgres.slow_query import SlowQueryMonitor, label_queries, redact
+
+
+def slow_count(operation: str) -> float:
+    value = REGISTRY.get_sample_value(
+        "mind_db_slow_queries_total", {"operation": operation}
+    )
+    return value or 0.0
+
+
+@label_queries
+class FakeRepository:
+    def __init__(self, engine):
+        self._engine = engine
+
+    async def count(self):
+        with self._engine.connect() as conn:
+            return conn.execute(text("SELECT 1")).scalar()
+
+
+class TestSlowQueryMonitor:
+    """Tests for logging, counting and plan sampling."""
+
+    async def test_counts_per_labelled_operation(self):
+        engine = create_engine("sqlite://")
+        SlowQueryMonitor(threshold_ms=0).install(engine)
+        before = slow_count("FakeRepository.count")
+
+        assert await FakeRepository(engine).count() == 1
+
+        assert slow_count("FakeRepository.count") == before + 1
+
+    async def test_fast_queries_not_counted(self):
+        engine = create_engine("sqlite://")
+        SlowQueryMonitor(threshold_ms=60_000).install(engine)
+        before = slow_count("FakeRepository.count")
+
+        await FakeRepository(engine).count()
+
+        assert slow_count("FakeRepository.count") == before
+
+    def test_explains_only_sampled_retrieval_selects(self):
+        monitor = SlowQueryMonitor(threshold_ms=0, explain_sample_rate=0.5, rng=lambda: 0.1)
+
+        assert not monitor._should_explain("MemoryRepository.get", "SELECT 1")
+        assert not monitor._should_explain("RetrievalService._vector_search", "UPDATE m SET x=1")
+        assert monitor._should_explain("RetrievalService._vector_search", "  select 1")
+
+    def test_explain_rate_limited(self):
+        now = [0.0]
+        monitor = SlowQueryMonitor(
+            threshold_ms=0, explain_sample_rate=1.0, explain_interval=60, clock=lambda: now[0]
+        )
+
+        assert monitor._should_explain("RetrievalService._keyword_search", "SELECT 1")
+        now[0] = 30.0
+        assert not monitor._should_explain("RetrievalService._keyword_search", "SELECT 1")
+        now[0] = 61.0
+        assert monitor._should_explain("RetrievalService._keyword_search", "SELECT 1")
+
+
+def test_redact_keeps_only_types():
+    assert redact({"user_id": "secret", "limit": 10}) == {"user_id": "str", "limit": "int"}
+    assert redact(("secret", 1.5)) == ["str", "float"]
@@ -0,0 +1,69 @@
+"""Tests for Temporal worker metrics."""
+
+from datetime import UTC, datetime, timedelta
+from types import SimpleNamespace
+
+import pytest
+from temporalio.worker import ActivityInboundInterceptor
+
+from mind.infrastructure.temporal import metrics as temporal_metrics
+from mind.infrastructure.temporal.metrics import ActivityMetricsInterceptor
+from mind.observability.metrics import metrics
+from mind.workers.gardener.workflows import db_task_queue
+
+
+class FakeNext(ActivityInboundInterceptor):
+    """Innermost interceptor that checks the slot gauge mid-activity."""
+
+    def __init__(self, fail: bool = False):
+        self.fail = fail
+        self.used_during = None
+
+    async def execute_activity(self, input):
+        self.used_during = slots("test-queue", "used")
+        if self.fail:
+            raise RuntimeError("boom")
+        return "done"
+
+
+def slots(queue: str, state: str) -> float:
+    return metrics.worker_activity_slots.labels(task_queue=queue, state=state)._value.get()
+
+
+@pytest.fixture
+def activity_info(monkeypatch):
+    info = SimpleNamespace(
+        task_queue="test-queue",
+        activity_type="find_promotion_candidates",
+        current_attempt_scheduled_time=datetime.now(UTC) - timedelta(seconds=2),
+    )
+    monkeypatch.setattr(temporal_metrics.activity, "info", lambda: info)
+    return info
+
+
+class TestActivityMetricsInterceptor:
+    """Tests for slot and queue latency tracking."""
+
+    async def test_slot_held_while_running(self, activity_info):
+        interceptor = ActivityMetricsInterceptor("test-queue", 10)
+        inner = FakeNext()
+
+        assert await interceptor.intercept_activity(inner).execute_activity(None) == "done"
+
+        assert slots("test-queue", "max") == 10
+        assert inner.used_during == 1
+        assert slots("test-queue", "used") == 0
+
+    async def test_slot_released_on_failure(self, activity_info):
+        interceptor = ActivityMetricsInterceptor("test-queue", 10)
+
+        with pytest.raises(RuntimeError):
+            await interceptor.intercept_activity(FakeNext(fail=True)).execute_activity(None)
+
+        assert slots("test-queue", "used") == 0
+
+
+def test_db_task_queue_follows_gardener_queue():
+    """Each (sharded) gardener queue gets its own DB activity queue."""
+    assert db_task_queue("gardener") == "gardener-db"
+    assert db_task_queue("gardener-2") == "gardener-2-db"
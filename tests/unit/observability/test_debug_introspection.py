@@ -0,0 +1,133 @@
+"""Tests for the sampling profiler, task introspection and debug routes."""
+
+import asyncio
+import threading
+import time
+
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+from pydantic import SecretStr
+
+from mind.api import app as app_module
+from mind.api.routes import debug
+from mind.config import Settings
+from mind.observability.profiling import SamplingProfiler, collapse
+from mind.observability.tasks import (
+    TaskOwnerMiddleware,
+    install_task_tracking,
+    probe_loop_lag,
+    task_snapshot,
+)
+
+
+def spin_for(seconds: float) -> None:
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        pass
+
+
+class TestSamplingProfiler:
+    def test_samples_the_target_thread(self):
+        profiler = SamplingProfiler(interval=0.001, thread_id=threading.get_ident())
+        profiler.start()
+        spin_for(0.2)
+        profile = profiler.stop()
+
+        assert profile.samples > 0
+        assert any("spin_for" in stack for stack in profile.stacks)
+        line = profile.collapsed().splitlines()[0]
+        stack, count = line.rsplit(" ", 1)
+        assert int(count) > 0 and ";" in stack
+
+    def test_collapse_is_root_first(self):
+        def inner():
+            import sys
+
+            return collapse(sys._getframe(), prefix="main")
+
+        frames = inner().split(";")
+        assert frames[0] == "main"
+        assert frames[-1].startswith("TestSamplingProfiler.test_collapse_is_root_first")
+        assert "<locals>.inner" in frames[-1]
+
+
+class TestTaskIntrospection:
+    async def test_tasks_report_age_and_owning_route(self):
+        install_task_tracking()
+        started = asyncio.Event()
+        release = asyncio.Event()
+        children = []
+
+        async def child():
+            started.set()
+            await release.wait()
+
+        async def app(scope, receive, send):
+            children.append(asyncio.create_task(child(), name="background-work"))
+            await started.wait()
+
+        scope = {"type": "http", "method": "POST", "path": "/v1/memories/retrieve"}
+        await TaskOwnerMiddleware(app)(scope, None, None)
+
+        snapshot = {task["name"]: task for task in task_snapshot()}
+        release.set()
+        await asyncio.gather(*children)
+
+        task = snapshot["background-work"]
+        assert task["route"] == "POST /v1/memories/retrieve"
+        assert task["age_seconds"] >= 0
+        assert any("child" in frame for frame in task["stack"])
+
+    async def test_probe_loop_lag(self):
+        assert await probe_loop_lag() >= 0.0
+
+
+class TestDebugRoutes:
+    def make_app(self, monkeypatch, token: str | None) -> FastAPI:
+        settings = Settings(
+            debug_endpoints_enabled=True,
+            debug_endpoints_token=SecretStr(token) if token else None,
+            debug_profile_max_seconds=1.0,
+        )
+        monkeypatch.setattr(debug, "get_settings", lambda: settings)
+        app = FastAPI()
+        app.include_router(debug.router, prefix="/debug")
+        return app
+
+    async def get(self, app: FastAPI, path: str, **headers):
+        transport = ASGITransport(app=app)
+        async with AsyncClient(transport=transport, base_url="http://test") as client:
+            return await client.get(path, headers=headers)
+
+    async def test_token_is_required_when_configured(self, monkeypatch):
+        app = self.make_app(monkeypatch, token="secret")
+
+        assert (await self.get(app, "/debug/tasks")).status_code == 401
+        response = await self.get(app, "/debug/tasks", authorization="Bearer secret")
+        assert response.status_code == 200
+        assert "now_ms" in response.json()["loop_lag"]
+
+    async def test_nothing_is_allowed_without_a_token(self, monkeypatch):
+        app = self.make_app(monkeypatch, token=None)
+
+        response = await self.get(app, "/debug/tasks", authorization="Bearer ")
+        assert response.status_code == 403
+
+    async def test_router_is_not_mounted_without_a_token(self, monkeypatch):
+        settings = Settings(debug_endpoints_enabled=True, debug_endpoints_token=None)
+        monkeypatch.setattr(app_module, "get_settings", lambda: settings)
+
+        response = await self.get(app_module.create_app(), "/debug/tasks")
+
+        assert response.status_code == 404
+
+    async def test_profile_returns_collapsed_stacks(self, monkeypatch):
+        app = self.make_app(monkeypatch, token="secret")
+        auth = {"authorization": "Bearer secret"}
+
+        response = await self.get(app, "/debug/profile?seconds=0.05&all_threads=true", **auth)
+        too_long = await self.get(app, "/debug/profile?seconds=5", **auth)
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/plain")
+        assert too_long.status_code == 400
@@ -0,0 +1,78 @@
+"""Tests for the HTTP metrics middleware."""
+
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+from prometheus_client import REGISTRY
+
+from mind.observability.metrics import MetricsMiddleware
+
+
+def make_app() -> FastAPI:
+    app = FastAPI()
+    app.add_middleware(MetricsMiddleware)
+
+    @app.get("/test-items/{item_id}")
+    async def get_item(item_id: str):
+        return {"item_id": item_id}
+
+    @app.get("/metrics")
+    async def metrics_route():
+        return {}
+
+    return app
+
+
+def requests_count(endpoint: str, status: str) -> float:
+    value = REGISTRY.get_sample_value(
+        "mind_http_requests_total",
+        {"method": "GET", "endpoint": endpoint, "status": status},
+    )
+    return value or 0.0
+
+
+async def get(app: FastAPI, path: str):
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        return await client.get(path)
+
+
+class TestMetricsMiddleware:
+    """Tests for labels and recorded values."""
+
+    async def test_labels_with_route_template(self):
+        """Different IDs should share the route template label."""
+        app = make_app()
+        before = requests_count("/test-items/{item_id}", "200")
+
+        await get(app, "/test-items/a")
+        await get(app, "/test-items/b")
+
+        assert requests_count("/test-items/{item_id}", "200") == before + 2
+        assert requests_count("/test-items/a", "200") == 0
+
+    async def test_unmatched_paths_share_one_label(self):
+        app = make_app()
+        before = requests_count("unmatched", "404")
+
+        await get(app, "/nope/1")
+        await get(app, "/nope/2")
+
+        assert requests_count("unmatched", "404") == before + 2
+
+    async def test_records_response_size_and_settles_in_flight(self):
+        app = make_app()
+        labels = {"method": "GET", "endpoint": "/test-items/{item_id}"}
+        before = REGISTRY.get_sample_value("mind_http_response_size_bytes_sum", labels) or 0.0
+
+        response = await get(app, "/test-items/xyz")
+
+        after = REGISTRY.get_sample_value("mind_http_response_size_bytes_sum", labels)
+        assert after - before == len(response.content)
+        assert REGISTRY.get_sample_value("mind_http_requests_in_flight", {"method": "GET"}) == 0
+
+    async def test_skips_metrics_endpoint(self):
+        app = make_app()
+        before = requests_count("/metrics", "200")
+
+        await get(app, "/metrics")
+
+        assert requests_count("/metrics", "200") == before
@@ -0,0 +1,43 @@
+"""Tests for tracing and hot-path stage timing."""
+
+from prometheus_client import REGISTRY
+
+from mind.observability.metrics import metrics
+from mind.observability.tracing import configure_tracing, timed_span
+from mind.services.retrieval import retrieval_stage
+
+
+def stage_count(stage: str, source: str) -> float:
+    value = REGISTRY.get_sample_value(
+        "mind_retrieval_stage_seconds_count", {"stage": stage, "source": source}
+    )
+    return value or 0.0
+
+
+class TestTimedSpan:
+    """Tests for spans paired with histograms."""
+
+    def test_observes_even_on_error(self):
+        histogram = metrics.retrieval_stage_seconds.labels(stage="test", source="all")
+        before = stage_count("test", "all")
+
+        try:
+            with timed_span("test", histogram):
+                raise ValueError("boom")
+        except ValueError:
+            pass
+
+        assert stage_count("test", "all") == before + 1
+
+    def test_retrieval_stage_labels(self):
+        before = stage_count("query", "keyword")
+
+        with retrieval_stage("query", "keyword") as span:
+            assert span is not None
+
+        assert stage_count("query", "keyword") == before + 1
+
+
+def test_tracing_disabled_without_endpoint():
+    """Without an OTLP endpoint no exporter is installed."""
+    assert configure_tracing() is False
@@ -0,0 +1,127 @@
+"""Tests for the retrieval event publishing policy."""
+
+from datetime import UTC, datetime, timedelta
+from uuid import uuid4
+
+from mind.core.events.memory import MemoryRetrieval, RetrievedMemory
+from mind.services.retrieval_events import RetrievalEventPolicy
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = datetime(2025, 1, 1, tzinfo=UTC)
+
+    def __call__(self) -> datetime:
+        return self.now
+
+    def advance(self, seconds: float) -> None:
+        self.now += timedelta(seconds=seconds)
+
+
+def make_retrieval(*memory_ids, trace_id=None) -> MemoryRetrieval:
+    return MemoryRetrieval(
+        retrieval_id=uuid4(),
+        query="what did I decide?",
+        memories=[
+            RetrievedMemory(memory_id=mid, rank=i, score=0.5, source="fusion")
+            for i, mid in enumerate(memory_ids)
+        ],
+        latency_ms=10.0,
+        trace_id=trace_id,
+    )
+
+
+class TestRetrievalEventPolicy:
+    """Tests for RetrievalEventPolicy."""
+
+    def test_full_mode_publishes_everything(self):
+        """Full mode should pass every retrieval through."""
+        policy = RetrievalEventPolicy(mode="full")
+        event = make_retrieval(uuid4())
+
+        assert policy.on_retrieval(uuid4(), event) == [event]
+
+    def test_sampled_mode_marks_sample_rate(self):
+        """Sampled-in events should record the rate; others are held back."""
+        draws = iter([0.05, 0.5])
+        policy = RetrievalEventPolicy(mode="sampled", sample_rate=0.1, rng=lambda: next(draws))
+        user_id = uuid4()
+
+        kept = policy.on_retrieval(user_id, make_retrieval(uuid4()))
+        dropped = policy.on_retrieval(user_id, make_retrieval(uuid4()))
+
+        assert len(kept) == 1
+        assert kept[0].sample_rate == 0.1
+        assert dropped == []
+
+    def test_traced_retrieval_always_published(self):
+        """Retrievals already linked to a trace should bypass sampling."""
+        policy = RetrievalEventPolicy(mode="sampled", sample_rate=0.0)
+        event = make_retrieval(uuid4(), trace_id=uuid4())
+
+        assert policy.on_retrieval(uuid4(), event) == [event]
+
+    def test_decision_releases_held_retrieval(self):
+        """A decision citing a held retrieval's memory should publish it with the trace."""
+        policy = RetrievalEventPolicy(mode="sampled", sample_rate=0.0)
+        user_id, memory_id, trace_id = uuid4(), uuid4(), uuid4()
+        cited = make_retrieval(memory_id, uuid4())
+        unrelated = make_retrieval(uuid4())
+        policy.on_retrieval(user_id, cited)
+        policy.on_retrieval(user_id, unrelated)
+
+        linked = policy.on_decision(user_id, trace_id, [memory_id])
+
+        assert [e.retrieval_id for e in linked] == [cited.retrieval_id]
+        assert linked[0].trace_id == trace_id
+        assert linked[0].already_counted
+        assert policy.on_decision(user_id, trace_id, [memory_id]) == []
+
+    def test_held_retrievals_expire(self):
+        """Retrievals older than the hold period should not be linked."""
+        clock = FakeClock()
+        policy = RetrievalEventPolicy(
+            mode="sampled", sample_rate=0.0, hold_seconds=60, clock=clock
+        )
+        user_id, memory_id = uuid4(), uuid4()
+        policy.on_retrieval(user_id, make_retrieval(memory_id))
+
+        clock.advance(61)
+
+        assert policy.on_decision(user_id, uuid4(), [memory_id]) == []
+
+    def test_windowed_summary_counts_hits(self):
+        """A finished window should summarize counts and memory hits per user."""
+        clock = FakeClock()
+        policy = RetrievalEventPolicy(mode="windowed", window_seconds=60, clock=clock)
+        user_id, a, b = uuid4(), uuid4(), uuid4()
+        policy.on_retrieval(user_id, make_retrieval(a, b))
+        policy.on_retrieval(user_id, make_retrieval(a))
+
+        assert policy.drain_summaries() == []
+        clock.advance(60)
+        summaries = policy.drain_summaries()
+
+        assert len(summaries) == 1
+        summary_user, summary = summaries[0]
+        assert summary_user == user_id
+        assert summary.retrieval_count == 2
+        assert summary.total_latency_ms == 20.0
+        assert summary.memory_hits == {str(a): 2, str(b): 1}
+        assert policy.drain_summaries() == []
+
+    def test_windowed_counts_each_retrieval_once(self):
+        """Traced and released retrievals should be in the summary and marked counted."""
+        clock = FakeClock()
+        policy = RetrievalEventPolicy(mode="windowed", window_seconds=60, clock=clock)
+        user_id, a, b = uuid4(), uuid4(), uuid4()
+
+        traced = policy.on_retrieval(user_id, make_retrieval(a, trace_id=uuid4()))
+        policy.on_retrieval(user_id, make_retrieval(b))
+        released = policy.on_decision(user_id, uuid4(), [b])
+        clock.advance(60)
+        [(_, summary)] = policy.drain_summaries()
+
+        assert summary.retrieval_count == 2
+        assert summary.memory_hits == {str(a): 1, str(b): 1}
+        assert [e.already_counted for e in traced + released] == [True, True]
@@ -0,0 +1,94 @@
+"""Tests for the benchmark suite's helpers."""
+
+import pytest
+
+from benchmarks.compare import compare
+from benchmarks.data import SCALES, generate
+from benchmarks.standins import HashEmbedder, InMemoryNatsClient
+from benchmarks.stats import Measurement, measure, percentile
+from benchmarks.suites import BenchmarkContext, bench_pipelined_event_publisher
+
+
+def _result(p50: float, throughput: float) -> dict:
+    return {
+        "benchmarks": {
+            "retrieval": {
+                "latency_ms": {"p50": p50, "p95": p50, "p99": p50},
+                "throughput_per_second": throughput,
+            },
+            "memory_create": {"skipped": "no --postgres-url"},
+        }
+    }
+
+
+class TestStats:
+    def test_percentile_interpolates(self):
+        values = [float(v) for v in range(1, 101)]
+        assert percentile(values, 50) == pytest.approx(50.5)
+        assert percentile(values, 99) == pytest.approx(99.01)
+        assert percentile([], 50) is None
+
+    async def test_measure_counts_errors_and_operations(self):
+        async def operation(i: int) -> bool:
+            return i % 2 == 0
+
+        result = await measure(operation, 10, concurrency=3, operations_per_call=5)
+        summary = result.summary()
+
+        assert summary["operations"] == 50
+        assert summary["errors"] == 5
+
+    def test_empty_summary(self):
+        assert Measurement().summary()["latency_ms"]["p99"] is None
+
+
+class TestData:
+    def test_same_seed_same_data(self):
+        first = generate(SCALES["tiny"], seed=7)
+        second = generate(SCALES["tiny"], seed=7)
+
+        assert first.user_ids == second.user_ids
+        assert [m.content for m in first.memories] == [m.content for m in second.memories]
+        assert first.queries == second.queries
+        assert generate(SCALES["tiny"], seed=8).user_ids != first.user_ids
+
+
+class TestHashEmbedder:
+    def test_deterministic_and_normalized(self):
+        embedder = HashEmbedder(dimensions=64)
+        vector = embedder.vector("user prefers coffee")
+
+        assert vector == HashEmbedder(dimensions=64).vector("user prefers coffee")
+        assert sum(v * v for v in vector) == pytest.approx(1.0)
+
+    def test_shared_words_are_closer(self):
+        embedder = HashEmbedder(dimensions=256)
+
+        def similarity(a: str, b: str) -> float:
+            return sum(x * y for x, y in zip(embedder.vector(a), embedder.vector(b)))
+
+        assert similarity("coffee mornings", "user enjoys coffee") > similarity(
+            "coffee mornings", "team avoids kubernetes"
+        )
+
+
+class TestCompare:
+    def test_flags_regressions_beyond_threshold(self):
+        rows = compare(_result(30.0, 1000.0), _result(36.0, 950.0), threshold=0.1)
+        by_metric = {row["metric"]: row for row in rows}
+
+        assert by_metric["p50_ms"]["regression"]  # 20% slower
+        assert not by_metric["throughput_per_second"]["regression"]  # 5% lower
+        assert all(row["benchmark"] == "retrieval" for row in rows)  # Skipped ignored
+
+
+async def test_pipelined_publisher_benchmark_in_memory():
+    data = generate(SCALES["tiny"])
+    ctx = BenchmarkContext(
+        data=data, embedder=HashEmbedder(dimensions=8), nats_client=InMemoryNatsClient()
+    )
+
+    summary = (await bench_pipelined_event_publisher(ctx)).summary()
+
+    assert summary["operations"] == SCALES["tiny"].events
+    assert summary["errors"] == 0
@@ -0,0 +1,167 @@
+"""Tests for traffic capture and replay."""
+
+from datetime import UTC, datetime, timedelta
+from uuid import uuid4
+
+import httpx
+
+from benchmarks.replay import replay
+from benchmarks.traffic import (
+    RETRIEVE,
+    TRACK,
+    Anonymizer,
+    CapturedRequest,
+    expand_samples,
+    read_capture,
+    remap_users,
+    to_request,
+    write_capture,
+)
+from mind.core.events.base import EventType
+
+START = datetime(2026, 1, 1, tzinfo=UTC)
+
+
+def retrieval_payload(query: str, sample_rate: float = 1.0) -> dict:
+    return {
+        "retrieval_id": str(uuid4()),
+        "query": query,
+        "memories": [],
+        "latency_ms": 12.5,
+        "sample_rate": sample_rate,
+    }
+
+
+class TestToRequest:
+    def test_retrieval_is_anonymized_consistently(self):
+        anonymizer = Anonymizer(key=b"k" * 32)
+        user_id = uuid4()
+
+        first = to_request(
+            EventType.MEMORY_RETRIEVAL,
+            user_id,
+            retrieval_payload("coffee in the morning"),
+            START + timedelta(seconds=3),
+            START,
+            anonymizer,
+        )
+        second = to_request(
+            "memory.retrieval",
+            user_id,
+            retrieval_payload("coffee at 9"),
+            START,
+            START,
+            anonymizer,
+        )
+
+        assert first.kind == RETRIEVE
+        assert first.offset == 3.0
+        assert first.original_latency_ms == 12.5
+        assert first.body["user_id"] == second.body["user_id"] != str(user_id)
+        assert "coffee" not in first.body["query"]
+        assert [len(w) for w in first.body["query"].split()] == [6, 2, 3, 7]
+        assert first.body["query"].split()[0] == second.body["query"].split()[0]
+        assert second.body["query"].split()[-1].isdigit()
+
+    def test_decision_tracked_maps_memory_ids(self):
+        anonymizer = Anonymizer()
+        memory_id = uuid4()
+        request = to_request(
+            EventType.DECISION_TRACKED,
+            uuid4(),
+            {
+                "trace_id": str(uuid4()),
+                "session_id": str(uuid4()),
+                "memory_ids": [str(memory_id)],
+                "memory_scores": {str(memory_id): 0.7},
+                "decision_type": "recommendation",
+                "decision_summary": "suggested the usual",
+                "confidence": 0.8,
+            },
+            START,
+            START,
+            anonymizer,
+        )
+
+        assert request.kind == TRACK
+        assert request.body["memory_ids"] == list(request.body["memory_scores"])
+        assert request.body["memory_ids"][0] != str(memory_id)
+
+    def test_other_events_are_not_captured(self):
+        payload = {"memory_id": str(uuid4())}
+        request = to_request(EventType.MEMORY_EXPIRED, uuid4(), payload, START, START, Anonymizer())
+        assert request is None
+
+
+class TestCaptureFile:
+    def test_round_trip(self, tmp_path):
+        requests = [CapturedRequest(offset=1.5, kind=RETRIEVE, body={"query": "x"}, weight=4.0)]
+        path = tmp_path / "capture.jsonl"
+
+        write_capture(path, {"source": "database"}, requests)
+        header, loaded = read_capture(path)
+
+        assert header["counts"] == {RETRIEVE: 1}
+        assert loaded == requests
+
+
+class TestReshaping:
+    def test_expand_samples_restores_volume(self):
+        requests = [
+            CapturedRequest(offset=float(i), kind=RETRIEVE, body={}, weight=10.0) for i in range(5)
+        ]
+
+        expanded = expand_samples(requests, seed=1)
+
+        assert len(expanded) == 50
+        assert all(r.weight == 1.0 for r in expanded)
+        assert [r.offset for r in expanded] == sorted(r.offset for r in expanded)
+
+    def test_remap_users_is_consistent(self):
+        user = str(uuid4())
+        requests = expand_samples(
+            [CapturedRequest(offset=0.0, kind=RETRIEVE, body={"user_id": user}, weight=3.0)]
+        )
+
+        remap_users(requests, ["a", "b"])
+
+        assert len({r.body["user_id"] for r in requests}) == 1
+
+
+class TestReplay:
+    async def test_reports_latency_errors_and_statuses(self):
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(500 if request.url.path.endswith("/track") else 200)
+
+        requests = [
+            CapturedRequest(offset=i * 0.01, kind=RETRIEVE, body={}, original_latency_ms=5.0)
+            for i in range(10)
+        ] + [CapturedRequest(offset=0.05, kind=TRACK, body={})]
+        requests.sort(key=lambda r: r.offset)
+
+        async with httpx.AsyncClient(
+            transport=httpx.MockTransport(handler), base_url="http://api"
+        ) as client:
+            results = await replay(requests, client, speed=10.0)
+
+        retrieve = results[RETRIEVE].summary()
+        track = results[TRACK].summary()
+        assert retrieve["operations"] == 10
+        assert retrieve["error_rate"] == 0.0
+        assert retrieve["original_latency_ms"]["p50"] == 5.0
+        assert track["statuses"] == {"500": 1}
+        assert track["error_rate"] == 1.0
+
+    async def test_max_speed_bounds_in_flight(self):
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200)
+
+        requests = [CapturedRequest(offset=100.0, kind=RETRIEVE, body={}) for _ in range(20)]
+
+        async with httpx.AsyncClient(
+            transport=httpx.MockTransport(handler), base_url="http://api"
+        ) as client:
+            results = await replay(requests, client, speed=None, max_in_flight=2)
+
+        assert results[RETRIEVE].summary()["operations"] == 20
+        assert results[RETRIEVE].measurement.wall_seconds < 5
@@ -0,0 +1,43 @@
+"""Shared fixtures for worker tests."""
+
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+
+import pytest
+
+from mind.workers.gardener import activities
+from tests.unit.fakes import FakePublisher, FakeSession
+
+
+class GardenerEnv:
+    """Database and NATS fakes behind the gardener activities."""
+
+    def __init__(self, monkeypatch: pytest.MonkeyPatch):
+        self.session = FakeSession()
+        self.publisher = FakePublisher()
+        self.committed = False
+        self._monkeypatch = monkeypatch
+
+        async def get_nats_client():
+            return None
+
+        monkeypatch.setattr(
+            activities, "get_database", lambda: SimpleNamespace(session=self._session)
+        )
+        monkeypatch.setattr(activities, "get_nats_client", get_nats_client)
+        monkeypatch.setattr(activities, "PipelinedEventPublisher", lambda client: self.publisher)
+
+    @asynccontextmanager
+    async def _session(self):
+        yield self.session
+        self.committed = True
+
+    def use_repository(self, repository) -> None:
+        """Have the activities use this object as their MemoryRepository."""
+        self._monkeypatch.setattr(activities, "MemoryRepository", lambda session: repository)
+
+
+@pytest.fixture
+def gardener_env(monkeypatch) -> GardenerEnv:
+    """Run gardener activities against fakes instead of Postgres and NATS."""
+    return GardenerEnv(monkeypatch)
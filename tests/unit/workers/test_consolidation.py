@@ -0,0 +1,80 @@
+"""Tests for near-duplicate memory consolidation."""
+
+from types import SimpleNamespace
+from uuid import uuid4
+
+from mind.workers.gardener.activities import _clusters, consolidate_memories
+
+
+class FakeRepository:
+    """Returns canned duplicate pairs and records merges."""
+
+    def __init__(self, pairs):
+        self.pairs = pairs
+        self.merges: list = []
+
+    async def find_near_duplicates(self, user_id, max_distance, limit):
+        return self.pairs
+
+    async def merge_duplicates(self, user_id, memory_ids):
+        self.merges.append(memory_ids)
+        return memory_ids[0], memory_ids[1:]
+
+
+def pair(a, b, distance=0.01):
+    return SimpleNamespace(memory_id=a, duplicate_id=b, distance=distance)
+
+
+class TestClusters:
+    """Tests for grouping duplicate pairs."""
+
+    def test_connected_pairs_form_one_cluster(self):
+        """Pairs sharing a memory should end up in the same cluster."""
+        a, b, c, d, e = (uuid4() for _ in range(5))
+
+        clusters = _clusters([(a, b), (b, c), (d, e)])
+
+        assert clusters == [{a, b, c}, {d, e}]
+
+
+class TestConsolidateMemories:
+    """Tests for the consolidate_memories activity."""
+
+    async def test_merges_each_cluster_once(self, gardener_env):
+        """Every cluster should be merged with one call and one event."""
+        a, b, c, d, e = (uuid4() for _ in range(5))
+        repo = FakeRepository([pair(a, b), pair(b, c), pair(d, e)])
+        gardener_env.use_repository(repo)
+
+        result = await consolidate_memories(uuid4())
+
+        assert len(repo.merges) == 2
+        assert result.clusters_merged == 2
+        assert result.memories_merged == 3
+        assert result.events_published == 2
+        assert not result.budget_exhausted
+
+    async def test_budget_limits_merges(self, gardener_env):
+        """Work stops once the budget of merged memories is spent."""
+        a, b, c, d, e = (uuid4() for _ in range(5))
+        repo = FakeRepository([pair(a, b), pair(b, c), pair(d, e)])
+        gardener_env.use_repository(repo)
+
+        result = await consolidate_memories(uuid4(), max_merges=2)
+
+        assert result.memories_merged == 2
+        assert result.budget_exhausted
+        assert repo.merges == [sorted([a, b, c])]
+
+    async def test_partial_merge_of_a_chain_stays_connected(self, gardener_env):
+        """A capped merge must not combine memories with no duplicate edge between them."""
+        u0, u1, u2, u3, u4 = sorted(uuid4() for _ in range(5))
+        # Chain u0 - u4 - u1 - u3 - u2: the three smallest IDs are not connected
+        chain = [pair(u0, u4, 0.04), pair(u4, u1, 0.02), pair(u1, u3, 0.01), pair(u3, u2, 0.03)]
+        repo = FakeRepository(chain)
+        gardener_env.use_repository(repo)
+
+        await consolidate_memories(uuid4(), max_merges=2)
+
+        # From the best-connected member, the closest edges first
+        assert repo.merges == [sorted([u1, u3, u4])]
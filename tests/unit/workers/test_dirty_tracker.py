@@ -0,0 +1,267 @@
+"""Tests for dirty-memory tracking and incremental gardening."""
+
+from contextlib import asynccontextmanager
+from datetime import UTC, datetime, timedelta
+from types import SimpleNamespace
+from uuid import uuid4
+
+from mind.core.events import codec
+from mind.core.events.base import EventEnvelope
+from mind.core.events.decision import OutcomeObserved
+from mind.core.events.memory import (
+    MemoryCreated,
+    MemoryRetrieval,
+    MemorySalienceAdjusted,
+    RetrievedMemory,
+)
+from mind.core.memory.models import TemporalLevel
+from mind.infrastructure.postgres.repositories import MemoryRepository
+from mind.workers.gardener import activities, dirty
+from mind.workers.gardener.activities import PROMOTION_THRESHOLDS
+from mind.workers.gardener.dirty import DirtyMemoryTracker, touched_memory_ids
+from tests.unit.fakes import FakeMsg
+
+
+def wrap(event) -> EventEnvelope:
+    return EventEnvelope.wrap(event=event, user_id=uuid4())
+
+
+def retrieval(*memory_ids) -> MemoryRetrieval:
+    return MemoryRetrieval(
+        retrieval_id=uuid4(),
+        query="q",
+        memories=[
+            RetrievedMemory(memory_id=m, rank=i, score=0.5, source="vector")
+            for i, m in enumerate(memory_ids)
+        ],
+        latency_ms=1.0,
+    )
+
+
+def candidate_row(memory_id, old_enough_at) -> SimpleNamespace:
+    return SimpleNamespace(
+        memory_id=memory_id,
+        user_id=uuid4(),
+        from_level=int(TemporalLevel.IMMEDIATE),
+        to_level=int(TemporalLevel.SITUATIONAL),
+        age_hours=1.0,
+        retrieval_count=5,
+        salience=0.8,
+        score=0.7,
+        old_enough_at=old_enough_at,
+    )
+
+
+class FakeDatabase:
+    @asynccontextmanager
+    async def session(self):
+        yield None
+
+
+class TestTouchedMemoryIds:
+    """Tests for extracting memory IDs from events."""
+
+    def test_retrieval(self):
+        a, b = uuid4(), uuid4()
+
+        assert touched_memory_ids(wrap(retrieval(a, b))) == {a, b}
+
+    def test_outcome_attributions_survive_encoding(self):
+        """Attribution keys are strings; decoded envelopes should still yield UUIDs."""
+        a = uuid4()
+        event = OutcomeObserved(
+            trace_id=uuid4(),
+            outcome_quality=0.5,
+            outcome_signal="explicit_feedback",
+            observed_at=datetime.now(UTC),
+            memory_attributions={str(a): 1.0},
+        )
+        envelope = codec.decode(codec.encode(wrap(event)), codec.JSON_CONTENT_TYPE)
+
+        assert touched_memory_ids(envelope) == {a}
+
+    def test_untracked_event(self):
+        event = MemoryCreated(
+            memory_id=uuid4(),
+            content="c",
+            content_type="fact",
+            temporal_level=TemporalLevel.IMMEDIATE,
+            valid_from=datetime.now(UTC),
+        )
+
+        assert touched_memory_ids(wrap(event)) == set()
+
+
+class TestDirtyMemoryTracker:
+    """Tests for marking fetched batches."""
+
+    async def test_marks_distinct_ids_then_acks_once(self, monkeypatch):
+        marked = []
+
+        class FakeRepo:
+            def __init__(self, session):
+                pass
+
+            async def mark_dirty(self, memory_ids):
+                marked.append(set(memory_ids))
+
+            async def touch_last_used(self, last_used):
+                pass
+
+        monkeypatch.setattr(dirty, "MemoryRepository", FakeRepo)
+        a, b = uuid4(), uuid4()
+        messages = [
+            FakeMsg(codec.encode(wrap(retrieval(a, b)))),
+            FakeMsg(b"not json"),
+            FakeMsg(codec.encode(wrap(retrieval(a)))),
+        ]
+        tracker = DirtyMemoryTracker(client=None, database=FakeDatabase())
+
+        assert await tracker.mark(messages) == 2
+        assert marked == [{a, b}]
+        assert messages[-1].acked
+        assert not any(msg.acked for msg in messages[:-1])
+
+    async def test_records_latest_use_per_memory(self, monkeypatch):
+        """Retrievals move last_used_at forward; salience adjustments do not."""
+        touched = []
+
+        class FakeRepo:
+            def __init__(self, session):
+                pass
+
+            async def mark_dirty(self, memory_ids):
+                pass
+
+            async def touch_last_used(self, last_used):
+                touched.append(last_used)
+
+        monkeypatch.setattr(dirty, "MemoryRepository", FakeRepo)
+        a, b = uuid4(), uuid4()
+        later = wrap(retrieval(a))
+        earlier = wrap(retrieval(a))
+        earlier.timestamp = later.timestamp - timedelta(hours=1)
+        adjusted = wrap(
+            MemorySalienceAdjusted(
+                memory_id=b,
+                trace_id=uuid4(),
+                previous_adjustment=0.0,
+                new_adjustment=0.1,
+                delta=0.1,
+                reason="positive_outcome",
+            )
+        )
+        messages = [FakeMsg(codec.encode(e)) for e in (later, earlier, adjusted)]
+
+        await DirtyMemoryTracker(client=None, database=FakeDatabase()).mark(messages)
+
+        assert touched == [{a: later.timestamp}]
+
+    async def test_retries_write_before_ack(self, monkeypatch):
+        """A failed write must not be acked; the batch is written again."""
+        attempts = []
+
+        class FlakyRepo:
+            def __init__(self, session):
+                pass
+
+            async def mark_dirty(self, memory_ids):
+                attempts.append(len(memory_ids))
+                if len(attempts) == 1:
+                    raise ConnectionError("db down")
+
+            async def touch_last_used(self, last_used):
+                pass
+
+        async def no_sleep(delay):
+            pass
+
+        monkeypatch.setattr(dirty, "MemoryRepository", FlakyRepo)
+        monkeypatch.setattr(dirty.asyncio, "sleep", no_sleep)
+        message = FakeMsg(codec.encode(wrap(retrieval(uuid4()))))
+
+        await DirtyMemoryTracker(client=None, database=FakeDatabase()).mark([message])
+
+        assert attempts == [1, 1]
+        assert message.acked
+
+
+class TestDirtyRepository:
+    """Tests for the dirty-set queries."""
+
+    async def test_candidates_scoped_to_memory_ids(self):
+        executed = []
+
+        class Session:
+            async def execute(self, statement, params=None):
+                executed.append((str(statement), params))
+                return iter(())
+
+        ids = [uuid4(), uuid4()]
+        await MemoryRepository(Session()).find_promotion_candidates(
+            None, PROMOTION_THRESHOLDS, memory_ids=ids
+        )
+
+        statement, params = executed[0]
+        assert "m.memory_id = ANY(:memory_ids)" in statement
+        assert "user_id" not in params
+        assert params["memory_ids"] == ids
+
+    async def test_young_memories_can_be_included(self):
+        """include_young drops only the min_age_hours condition."""
+        executed = []
+
+        class Session:
+            async def execute(self, statement, params=None):
+                executed.append(str(statement))
+                return iter(())
+
+        repo = MemoryRepository(Session())
+        await repo.find_promotion_candidates(None, PROMOTION_THRESHOLDS, memory_ids=[uuid4()])
+        await repo.find_promotion_candidates(
+            None, PROMOTION_THRESHOLDS, memory_ids=[uuid4()], include_young=True
+        )
+
+        strict, young = executed
+        assert "<= CAST(:now AS timestamptz)" in strict
+        assert "<= CAST(:now AS timestamptz)" not in young
+        assert "min_retrieval_count" in young and "AS old_enough_at" in young
+
+    async def test_empty_dirty_batch_skips_query(self):
+        session = SimpleNamespace(execute=None)
+
+        assert await MemoryRepository(session).find_promotion_candidates(
+            None, PROMOTION_THRESHOLDS, memory_ids=[]
+        ) == []
+
+
+class TestFindDirtyPromotionCandidates:
+    """Tests for evaluating a dirty batch."""
+
+    async def test_defers_memories_that_are_only_too_young(self, gardener_env):
+        """A young memory would never be marked again, so it must stay dirty."""
+        ready, young = uuid4(), uuid4()
+        now = datetime.now(UTC)
+        deferred = []
+
+        class FakeRepo:
+            async def get_dirty(self, watermark, limit):
+                return [ready, young]
+
+            async def find_promotion_candidates(self, **kwargs):
+                assert kwargs["include_young"]
+                return [
+                    candidate_row(ready, old_enough_at=now - timedelta(hours=1)),
+                    candidate_row(young, old_enough_at=now + timedelta(hours=5)),
+                ]
+
+            async def defer_dirty(self, recheck_at):
+                deferred.append(recheck_at)
+
+        gardener_env.use_repository(FakeRepo())
+
+        batch = await activities.find_dirty_promotion_candidates(batch_size=10)
+
+        assert batch.memory_ids == [ready, young]
+        assert [c.memory_id for c in batch.candidates] == [ready]
+        assert deferred == [{young: now + timedelta(hours=5)}]
@@ -0,0 +1,72 @@
+"""Tests for archiving expired memories."""
+
+from datetime import UTC, datetime
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+
+from mind.core.memory.retrieval import RetrievalRequest
+from mind.services.retrieval import RetrievalService
+from mind.workers.gardener.activities import archive_expired_memories
+
+
+class FakeRepository:
+    """Returns canned archived rows."""
+
+    def __init__(self, rows):
+        self.rows = rows
+
+    async def archive_expired(self, batch_size, drop_embeddings):
+        return self.rows
+
+
+def expired_row():
+    return SimpleNamespace(memory_id=uuid4(), user_id=uuid4(), valid_until=datetime.now(UTC))
+
+
+class TestArchiveExpiredMemories:
+    """Tests for the archive_expired_memories activity."""
+
+    async def test_publishes_expired_event_per_memory(self, gardener_env):
+        """Each archived memory gets a memory.expired event with a stable ID."""
+        gardener_env.use_repository(FakeRepository([expired_row(), expired_row()]))
+
+        result = await archive_expired_memories(batch_size=10)
+        await archive_expired_memories(batch_size=10)
+
+        assert result.archived == 2
+        assert result.events_published == 2
+        published = gardener_env.publisher.published
+        first, second = published[:2], published[2:]
+        assert [e.event_id for e in first] == [e.event_id for e in second]
+        assert first[0].event_type.value == "memory.expired"
+        assert gardener_env.committed
+
+    async def test_publish_failure_rolls_back_batch(self, gardener_env):
+        """The move is not committed when its events could not be published."""
+        gardener_env.use_repository(FakeRepository([expired_row()]))
+        gardener_env.publisher.fail = True
+
+        with pytest.raises(RuntimeError):
+            await archive_expired_memories()
+
+        assert not gardener_env.committed
+
+
+class TestIncludeExpired:
+    """Tests for reading archived memories in retrieval."""
+
+    def test_sources_include_archive_only_when_requested(self):
+        """include_expired should search the archive without validity filters."""
+        user_id = uuid4()
+        live = RetrievalRequest(user_id=user_id, query="q")
+        expired = RetrievalRequest(user_id=user_id, query="q", include_expired=True)
+
+        live_source, live_filter = RetrievalService._sql_source(live)
+        all_source, all_filter = RetrievalService._sql_source(expired)
+
+        assert "memories_archive" not in live_source
+        assert "valid_until" in live_filter
+        assert "memories_archive" in all_source
+        assert all_filter == ""
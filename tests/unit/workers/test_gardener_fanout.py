@@ -0,0 +1,80 @@
+"""Tests for the sharded gardener fan-out."""
+
+import typing
+from collections import Counter
+from uuid import uuid4
+
+from temporalio.converter import value_to_type
+
+from mind.infrastructure.postgres.repositories import UserRepository
+from mind.workers.gardener.workflows import (
+    GardenerRunInput,
+    ScheduledGardenerWorkflow,
+    shard_task_queue,
+)
+
+
+class FakeSession:
+    """Captures the executed statement."""
+
+    def __init__(self):
+        self.statement = None
+
+    async def execute(self, statement):
+        self.statement = statement
+        return FakeResult()
+
+
+class FakeResult:
+    def scalars(self):
+        return iter([])
+
+
+class TestShardTaskQueue:
+    """Tests for assigning users to gardener queues."""
+
+    def test_user_always_maps_to_same_queue(self):
+        """A user's children should always run on the same shard."""
+        user_id = uuid4()
+        queues = ["gardener-0", "gardener-1", "gardener-2"]
+
+        assert shard_task_queue(user_id, queues) == shard_task_queue(user_id, queues)
+
+    def test_users_spread_across_queues(self):
+        """Every queue should receive a share of the users."""
+        queues = ["gardener-0", "gardener-1", "gardener-2"]
+        counts = Counter(shard_task_queue(uuid4(), queues) for _ in range(300))
+
+        assert set(counts) == set(queues)
+
+    def test_default_is_single_queue(self):
+        """Without sharding everything runs on the gardener queue."""
+        assert shard_task_queue(uuid4(), GardenerRunInput().task_queues) == "gardener"
+
+
+class TestScheduledGardenerInput:
+    """Tests for the scheduled gardener's input shapes."""
+
+    def test_accepts_old_and_new_input(self):
+        """Histories that passed a list of user IDs must still decode."""
+        hint = typing.get_type_hints(ScheduledGardenerWorkflow.run)["input"]
+        user_id = uuid4()
+
+        assert value_to_type(hint, [str(user_id)], []) == [user_id]
+        assert value_to_type(hint, {"page_size": 10}, []) == GardenerRunInput(page_size=10)
+
+
+class TestUserRepositoryListIds:
+    """Tests for keyset pagination of user IDs."""
+
+    async def test_pages_after_cursor(self):
+        """A cursor should become a keyset condition, not an offset."""
+        session = FakeSession()
+        cursor = uuid4()
+
+        await UserRepository(session).list_ids(after=cursor, limit=500)
+
+        sql = str(session.statement.compile(compile_kwargs={"literal_binds": False}))
+        assert "users.user_id >" in sql
+        assert "ORDER BY users.user_id" in sql
+        assert "OFFSET" not in sql
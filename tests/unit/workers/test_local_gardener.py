@@ -0,0 +1,93 @@
+"""Tests for the local (non-Temporal) gardener."""
+
+from contextlib import asynccontextmanager
+from datetime import UTC, datetime, timedelta
+from types import SimpleNamespace
+from uuid import UUID
+
+from mind.workers.gardener import local
+from mind.workers.gardener.activities import ExpirationResult
+from mind.workers.gardener.local import LocalGardener, next_run_delay
+
+
+class FakeDatabase:
+    @asynccontextmanager
+    async def session(self):
+        yield None
+
+
+def checkpoint(after=None, completed_at=None):
+    return SimpleNamespace(after_user_id=after, last_completed_at=completed_at)
+
+
+class TestNextRunDelay:
+    """Tests for scheduling from checkpoints."""
+
+    def test_new_job_runs_now(self):
+        assert next_run_delay(None, timedelta(hours=1)) == 0.0
+
+    def test_interrupted_pass_resumes_now(self):
+        recent = datetime.now(UTC)
+
+        assert next_run_delay(checkpoint(UUID(int=5), recent), timedelta(hours=1)) == 0.0
+
+    def test_completed_pass_waits_out_interval(self):
+        now = datetime.now(UTC)
+        done = checkpoint(completed_at=now - timedelta(minutes=20))
+
+        assert next_run_delay(done, timedelta(hours=1), now=now) == 40 * 60
+
+
+class TestPromotionPass:
+    """Tests for paging users with checkpoints."""
+
+    async def test_checkpoints_each_page(self, monkeypatch):
+        users = [UUID(int=i) for i in range(1, 6)]
+        saved, promoted_users = [], []
+
+        async def list_users_page(after, limit):
+            start = 0 if after is None else users.index(after) + 1
+            return users[start : start + limit]
+
+        async def find_promotion_candidates(user_id, batch_size):
+            promoted_users.append(user_id)
+            return []
+
+        async def save(self, job, after, completed_at=None):
+            saved.append((job, after))
+
+        monkeypatch.setattr(local, "list_users_page", list_users_page)
+        monkeypatch.setattr(local, "find_promotion_candidates", find_promotion_candidates)
+        monkeypatch.setattr(LocalGardener, "_save_checkpoint", save)
+        gardener = LocalGardener(FakeDatabase(), page_size=2)
+
+        assert await gardener.promotion_pass(after=users[0])
+
+        assert promoted_users == users[1:]
+        assert saved == [("promotion", users[2]), ("promotion", users[4])]
+
+    async def test_user_failure_does_not_stop_pass(self, monkeypatch):
+        async def find_promotion_candidates(user_id, batch_size):
+            return ["candidate"]
+
+        async def promote_memories_batch(candidates):
+            raise RuntimeError("publish failed")
+
+        monkeypatch.setattr(local, "find_promotion_candidates", find_promotion_candidates)
+        monkeypatch.setattr(local, "promote_memories_batch", promote_memories_batch)
+        gardener = LocalGardener(FakeDatabase())
+
+        assert await gardener._promote_user(UUID(int=1), local.asyncio.Semaphore(1)) == 0
+
+
+async def test_expiration_pass_drains_batches(monkeypatch):
+    batches = iter([1000, 1000, 3])
+
+    async def archive_expired_memories(batch_size, drop_embeddings):
+        return ExpirationResult(archived=next(batches))
+
+    monkeypatch.setattr(local, "archive_expired_memories", archive_expired_memories)
+
+    assert await LocalGardener(FakeDatabase()).expiration_pass()
+    assert next(batches, None) is None
+
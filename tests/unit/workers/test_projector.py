@@ -0,0 +1,87 @@
+"""Tests for the event log projector."""
+
+import asyncio
+from uuid import uuid4
+
+from mind.core.events.base import EventEnvelope
+from mind.core.events.memory import MemoryRetrieval
+from mind.workers.projector.projector import EventProjector, default_partitions
+from tests.unit.fakes import FakeMsg
+
+
+def make_msg(sequence: int) -> FakeMsg:
+    event = MemoryRetrieval(
+        retrieval_id=uuid4(), query="q", memories=[], latency_ms=1.0
+    )
+    envelope = EventEnvelope.wrap(event=event, user_id=uuid4())
+    return FakeMsg.wrap(envelope, sequence=sequence)
+
+
+def make_projector() -> EventProjector:
+    return EventProjector(client=None, database=None, batch_size=10, concurrency=1)
+
+
+class TestEventProjector:
+    """Tests for batch decoding, checkpointing and acking."""
+
+    def test_partitions_are_event_categories(self):
+        """Each event category should be its own partition."""
+        partitions = default_partitions()
+
+        assert "memory" in partitions
+        assert "decision" in partitions
+        assert len(partitions) == len(set(partitions))
+
+    def test_decode_skips_checkpointed_and_bad_messages(self):
+        """Already-projected and undecodable messages should not be written."""
+        projector = make_projector()
+        projector._checkpoints["memory"] = 2
+        messages = [make_msg(1), make_msg(2), make_msg(3), FakeMsg(b"not json", sequence=4)]
+
+        envelopes, sequence = projector._decode_batch("memory", messages)
+
+        assert len(envelopes) == 1
+        assert sequence == 4
+
+    async def test_batch_acked_once_after_write(self):
+        """Only the last message should be acked, after the write succeeds."""
+        projector = make_projector()
+        written = []
+
+        async def write(partition, envelopes, sequence):
+            written.append((partition, len(envelopes), sequence))
+            return len(envelopes)
+
+        projector._write = write
+        messages = [make_msg(i) for i in range(1, 6)]
+
+        await projector._project("memory", messages)
+
+        assert written == [("memory", 5, 5)]
+        assert messages[-1].acked
+        assert not any(msg.acked for msg in messages[:-1])
+        assert projector._checkpoints["memory"] == 5
+
+    async def test_failed_write_retried_before_ack(self, monkeypatch):
+        """A failed write should be retried and the batch not acked until it lands."""
+        projector = make_projector()
+        attempts = []
+        real_sleep = asyncio.sleep
+
+        async def write(partition, envelopes, sequence):
+            attempts.append(messages[-1].acked)
+            if len(attempts) < 3:
+                raise ConnectionError("postgres down")
+            return len(envelopes)
+
+        async def no_sleep(delay):
+            await real_sleep(0)
+
+        monkeypatch.setattr(asyncio, "sleep", no_sleep)
+        projector._write = write
+        messages = [make_msg(1), make_msg(2)]
+
+        await projector._project("memory", messages)
+
+        assert attempts == [False, False, False]
+        assert messages[-1].acked
@@ -0,0 +1,110 @@
+"""Tests for promotion candidate scanning and batch promotion."""
+
+from types import SimpleNamespace
+from uuid import uuid4
+
+from mind.core.memory.models import TemporalLevel
+from mind.infrastructure.postgres.repositories import MemoryRepository
+from mind.workers.gardener.activities import (
+    PROMOTION_THRESHOLDS,
+    PromotionCandidate,
+    promote_memories_batch,
+)
+from tests.unit.fakes import FakeSession
+
+
+class TestFindPromotionCandidates:
+    """Tests for MemoryRepository.find_promotion_candidates."""
+
+    async def test_one_statement_covers_all_levels(self):
+        """Every threshold set should become a row of a single query."""
+        session = FakeSession()
+        await MemoryRepository(session).find_promotion_candidates(
+            uuid4(), PROMOTION_THRESHOLDS, limit=50
+        )
+
+        assert session.statement.count("CAST(:from_") == len(PROMOTION_THRESHOLDS)
+        assert session.params["limit"] == 50
+        from_levels = {v for k, v in session.params.items() if k.startswith("from_")}
+        assert from_levels == {
+            TemporalLevel.IMMEDIATE,
+            TemporalLevel.SITUATIONAL,
+            TemporalLevel.SEASONAL,
+        }
+        # Matches the partial index predicate
+        assert f"temporal_level < {int(TemporalLevel.IDENTITY)}" in session.statement
+
+    async def test_returns_rows_in_query_order(self):
+        """Rows should come back as ordered by the database."""
+        rows = [SimpleNamespace(memory_id=uuid4(), score=0.9), SimpleNamespace(score=0.4)]
+        session = FakeSession(rows)
+
+        result = await MemoryRepository(session).find_promotion_candidates(
+            uuid4(), PROMOTION_THRESHOLDS
+        )
+
+        assert result == rows
+
+    async def test_no_thresholds_skips_query(self):
+        """Without criteria there is nothing to scan."""
+        session = FakeSession()
+
+        assert await MemoryRepository(session).find_promotion_candidates(uuid4(), {}) == []
+        assert session.statement is None
+
+
+def make_candidate(level: TemporalLevel = TemporalLevel.IMMEDIATE) -> PromotionCandidate:
+    return PromotionCandidate(
+        memory_id=uuid4(),
+        user_id=uuid4(),
+        current_level=level,
+        target_level=TemporalLevel(level + 1),
+        score=0.8,
+        reason="test",
+    )
+
+
+class TestPromoteMemoriesBatch:
+    """Tests for the promote_memories_batch activity."""
+
+    async def test_promotes_and_publishes_once_per_memory(self, gardener_env):
+        """Promoted rows get results and one event each; missing ones fail."""
+        promoted, missing = make_candidate(), make_candidate()
+        gardener_env.session.rows = [
+            SimpleNamespace(
+                memory_id=promoted.memory_id, from_level=1, to_level=2, changed=True
+            )
+        ]
+
+        batch = await promote_memories_batch([promoted, missing])
+
+        assert [r.success for r in batch.results] == [True, False]
+        assert batch.events_published == 1
+        assert gardener_env.publisher.published[0].aggregate_id == promoted.memory_id
+
+    async def test_retry_republishes_with_same_event_id(self, gardener_env):
+        """Rows promoted by an earlier attempt are re-sent with a stable ID."""
+        candidate = make_candidate()
+        row = SimpleNamespace(memory_id=candidate.memory_id, from_level=1, to_level=2)
+        gardener_env.session.rows = [SimpleNamespace(**vars(row), changed=True)]
+        await promote_memories_batch([candidate])
+        gardener_env.session.rows = [SimpleNamespace(**vars(row), changed=False)]
+        await promote_memories_batch([candidate])
+
+        first, retry = gardener_env.publisher.published
+        assert first.event_id == retry.event_id
+
+    async def test_no_event_for_memory_promoted_elsewhere(self, gardener_env):
+        """A memory already above the target is a success without an event."""
+        candidate = make_candidate()
+        gardener_env.session.rows = [
+            SimpleNamespace(
+                memory_id=candidate.memory_id, from_level=2, to_level=3, changed=False
+            )
+        ]
+
+        batch = await promote_memories_batch([candidate])
+
+        assert batch.results[0].success
+        assert batch.results[0].to_level == TemporalLevel.SEASONAL
+        assert batch.events_published == 0
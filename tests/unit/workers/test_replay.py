@@ -0,0 +1,144 @@
+"""Tests for the event replay engine."""
+
+import asyncio
+from types import SimpleNamespace
+from uuid import uuid4
+
+from mind.core.errors import ErrorCode
+from mind.core.events.base import EventEnvelope, EventType
+from mind.core.events.memory import MemorySalienceAdjusted
+from mind.workers.replay.engine import ReplayEngine, ReplaySink
+from tests.unit.fakes import FakeMsg
+
+
+class FakeSubscription:
+    def __init__(self, messages: list[FakeMsg]):
+        self._messages = messages
+
+    async def fetch(self, batch: int, timeout: float):
+        if not self._messages:
+            raise asyncio.TimeoutError
+        taken, self._messages = self._messages[:batch], self._messages[batch:]
+        return taken
+
+    async def unsubscribe(self):
+        pass
+
+
+class FakeJetStream:
+    def __init__(self, messages: list[FakeMsg]):
+        self._messages = messages
+        self.config = None
+
+    async def stream_info(self, name: str):
+        return SimpleNamespace(state=SimpleNamespace(last_seq=len(self._messages)))
+
+    async def pull_subscribe(self, subject: str, stream: str, config):
+        self.config = config
+        return FakeSubscription(list(self._messages))
+
+
+class RecordingSink(ReplaySink):
+    """Records adjustments per user and counts flushes."""
+
+    name = "recording"
+    event_types = frozenset({EventType.MEMORY_SALIENCE_ADJUSTED})
+
+    def __init__(self, fail_on: float | None = None):
+        self.seen: dict = {}
+        self.flushes = 0
+        self.verified = False
+        self._fail_on = fail_on
+
+    async def handle(self, envelope: EventEnvelope) -> None:
+        value = envelope.payload["new_adjustment"]
+        if value == self._fail_on:
+            raise RuntimeError("bad event")
+        await asyncio.sleep(0)  # Let other lanes interleave
+        self.seen.setdefault(envelope.user_id, []).append(value)
+
+    async def flush(self) -> None:
+        self.flushes += 1
+
+    async def verify(self) -> list[str]:
+        self.verified = True
+        return ["memory x: live 0.0, replayed 1.0"]
+
+
+def make_stream(users: int, per_user: int) -> tuple[list[FakeMsg], dict]:
+    user_ids = [uuid4() for _ in range(users)]
+    expected = {user_id: [] for user_id in user_ids}
+    envelopes = []
+    for i in range(per_user):
+        for user_id in user_ids:
+            event = MemorySalienceAdjusted(
+                memory_id=uuid4(),
+                trace_id=uuid4(),
+                previous_adjustment=0.0,
+                new_adjustment=float(i),
+                delta=1.0,
+                reason="positive_outcome",
+            )
+            envelopes.append(EventEnvelope.wrap(event=event, user_id=user_id))
+            expected[user_id].append(float(i))
+    total = len(envelopes)
+    messages = [
+        FakeMsg.wrap(env, sequence=seq, num_pending=total - seq)
+        for seq, env in enumerate(envelopes, start=1)
+    ]
+    return messages, expected
+
+
+class TestReplayEngine:
+    """Tests for ReplayEngine."""
+
+    async def test_replays_in_order_per_user(self):
+        """Every event should be applied, in stream order for each user."""
+        messages, expected = make_stream(users=6, per_user=20)
+        sink = RecordingSink()
+        client = SimpleNamespace(jetstream=FakeJetStream(messages))
+        engine = ReplayEngine(client, [sink], lanes=4, batch_size=16, flush_every=50)
+
+        result = await engine.run()
+
+        assert result.is_ok
+        assert result.value.progress.processed == len(messages)
+        assert sink.seen == expected
+        assert sink.flushes >= 2  # Periodic flushes plus the final one
+        assert not sink.verified
+
+    async def test_dry_run_verifies_instead_of_writing(self):
+        """A dry run should diff against live state and never flush."""
+        messages, _ = make_stream(users=2, per_user=5)
+        sink = RecordingSink()
+        client = SimpleNamespace(jetstream=FakeJetStream(messages))
+        engine = ReplayEngine(client, [sink], lanes=2, batch_size=4, flush_every=1)
+
+        result = await engine.run(dry_run=True)
+
+        assert result.is_ok
+        assert sink.flushes == 0
+        assert result.value.differences == {"recording": ["memory x: live 0.0, replayed 1.0"]}
+
+    async def test_start_sequence_used_for_consumer(self):
+        """Replaying from a sequence should configure the consumer start."""
+        messages, _ = make_stream(users=1, per_user=3)
+        jetstream = FakeJetStream(messages)
+        engine = ReplayEngine(SimpleNamespace(jetstream=jetstream), [RecordingSink()])
+
+        await engine.run(start_sequence=2)
+
+        assert jetstream.config.opt_start_seq == 2
+
+    async def test_sink_failure_fails_replay(self):
+        """A sink error should abort the replay with EVENT_REPLAY_FAILED."""
+        messages, _ = make_stream(users=3, per_user=5)
+        sink = RecordingSink(fail_on=2.0)
+        client = SimpleNamespace(jetstream=FakeJetStream(messages))
+        engine = ReplayEngine(client, [sink], lanes=2, batch_size=4)
+
+        result = await engine.run()
+
+        assert result.is_err
+        assert result.error.code == ErrorCode.EVENT_REPLAY_FAILED
+        assert sink.flushes == 0
@@ -0,0 +1,109 @@
+"""Tests for the aggregate snapshotter."""
+
+from contextlib import asynccontextmanager
+from uuid import uuid4
+
+from mind.core.events.aggregate import AggregateState
+from mind.workers.projector import snapshotter
+from mind.workers.projector.snapshotter import AggregateSnapshotter
+
+
+class FakeSession:
+    @asynccontextmanager
+    async def begin_nested(self):
+        yield
+
+
+class FakeDatabase:
+    @asynccontextmanager
+    async def session(self):
+        yield FakeSession()
+
+
+class FakeEventRepository:
+    """Event log with a settable allocated position."""
+
+    def __init__(self, candidates, failing=()):
+        self.allocated = 0
+        self.checkpoints: dict[str, dict[str, int]] = {}
+        self.candidates = sorted(candidates)
+        self.failing = set(failing)
+        self.saved: list[AggregateState] = []
+        self.scans: list[tuple[int, int]] = []
+
+    async def get_allocated_position(self) -> int:
+        return self.allocated
+
+    async def get_checkpoints(self, projector: str) -> dict[str, int]:
+        return dict(self.checkpoints.get(projector, {}))
+
+    async def save_checkpoint(self, projector: str, partition: str, sequence: int) -> None:
+        self.checkpoints.setdefault(projector, {})[partition] = sequence
+
+    async def find_snapshot_candidates(
+        self, threshold, after_position, up_to_position, after_id=None, limit=500
+    ):
+        self.scans.append((after_position, up_to_position))
+        return [c for c in self.candidates if after_id is None or c > after_id][:limit]
+
+    async def load_aggregate(self, aggregate_id, up_to_position=None):
+        if aggregate_id in self.failing:
+            raise KeyError("payload missing")
+        return AggregateState(aggregate_id=aggregate_id, version=1, position=up_to_position)
+
+    async def save_snapshot(self, aggregate: AggregateState) -> None:
+        self.saved.append(aggregate)
+
+
+def make_snapshotter(monkeypatch, repo: FakeEventRepository) -> AggregateSnapshotter:
+    monkeypatch.setattr(snapshotter, "EventRepository", lambda session: repo)
+    return AggregateSnapshotter(FakeDatabase(), threshold=1, interval=1, batch_size=2)
+
+
+class TestAggregateSnapshotter:
+    async def test_folds_only_positions_allocated_by_the_previous_run(self, monkeypatch):
+        """Each run should stop at the position seen by the run before it."""
+        repo = FakeEventRepository([uuid4()])
+        worker = make_snapshotter(monkeypatch, repo)
+
+        repo.allocated = 10
+        assert await worker.run_once() == 0
+        repo.allocated = 25
+        assert await worker.run_once() == 1
+        repo.allocated = 40
+        await worker.run_once()
+
+        assert repo.scans == [(0, 10), (10, 25)]
+        assert [a.position for a in repo.saved] == [10, 25]
+
+    async def test_resumes_from_stored_position(self, monkeypatch):
+        """A restarted snapshotter should not rescan positions already covered."""
+        repo = FakeEventRepository([uuid4()])
+        worker = make_snapshotter(monkeypatch, repo)
+        repo.allocated = 10
+        await worker.run_once()
+        repo.allocated = 25
+        await worker.run_once()
+        repo.scans.clear()
+
+        restarted = make_snapshotter(monkeypatch, repo)
+        repo.allocated = 40
+        await restarted.run_once()
+        repo.allocated = 50
+        await restarted.run_once()
+
+        assert repo.checkpoints == {"snapshotter": {"events": 40}}
+        assert repo.scans == [(10, 40)]
+
+    async def test_failing_aggregate_is_skipped(self, monkeypatch):
+        """One aggregate that cannot be folded should not block the others."""
+        ids = sorted(uuid4() for _ in range(5))
+        repo = FakeEventRepository(ids, failing=[ids[1]])
+        worker = make_snapshotter(monkeypatch, repo)
+
+        repo.allocated = 10
+        await worker.run_once()
+        written = await worker.run_once()
+
+        assert written == 4
+        assert {a.aggregate_id for a in repo.saved} == set(ids) - {ids[1]}